@@ -0,0 +1,3 @@
+"""
+게이트웨이 부하/지연 벤치마크 (요청 스트림 재생)
+"""
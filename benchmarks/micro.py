@@ -0,0 +1,311 @@
+"""
+요청마다 실행되는 provider/서버 함수 마이크로 벤치마크
+
+실제 응답 크기에 맞춘 합성 데이터(OpenAlex 80편, Google 40건 등)로 함수별 1회 호출 시간을 재고,
+benchmarks/baselines/micro.json의 기준값과 비교해 함수 단위 성능 저하를 보여준다.
+
+사용 예:
+    python -m benchmarks.micro                       # 측정 + 기준값 대비 배율 표시
+    python -m benchmarks.micro --filter google       # 이름에 google이 들어간 케이스만
+    python -m benchmarks.micro --check               # 기준값 대비 tolerance 초과 시 종료 코드 1
+    python -m benchmarks.micro --update-baseline     # 현재 측정값을 기준값으로 저장
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import platform
+import random
+import statistics
+import sys
+import timeit
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+from cap1_google_module.googlekit.models import GoogleResponse, GoogleSearchResult
+from cap1_google_module.googlekit.utils import (
+    deduplicate_results,
+    filter_excluded_urls,
+    heuristic_score as google_heuristic_score,
+    rerank_results,
+)
+from cap1_openalex_module.openalexkit.models import OpenAlexResponse, PaperInfo
+from cap1_openalex_module.openalexkit.utils.filters import deduplicate_papers, rerank_papers
+from cap1_openalex_module.openalexkit.utils.parser import parse_abstract_inverted_index
+from cap1_youtube_module.youtubekit.models import YouTubeResponse, YouTubeVideoInfo
+from cap1_youtube_module.youtubekit.utils import deduplicate_items, heuristic_score as youtube_heuristic_score, normalize_title
+from server.models import ResourceType
+from server.routes.rec import map_resources
+from server.utils import (
+    to_google_rag_chunks,
+    to_openalex_rag_chunks,
+    to_qa_rag_context,
+    to_wiki_rag_chunks,
+    to_youtube_rag_chunks,
+)
+
+from .stubs import StubWikiService
+
+BASELINE_PATH = Path(__file__).resolve().parent / "baselines" / "micro.json"
+
+# 강의 요약/검색 결과에 자주 나오는 단어 (초록·제목·스니펫 합성용)
+VOCABULARY = (
+    "stack queue linked list array hash table binary tree graph traversal breadth depth first search "
+    "algorithm complexity amortized analysis memory cache locality pointer recursion iteration scheduler "
+    "process thread interrupt context switch kernel operating system virtual paging buffer latency throughput "
+    "data structure priority heap sorting merge quick insertion network protocol concurrency lock"
+).split()
+KEYWORDS = ["stack", "queue", "data structure", "LIFO", "FIFO"]
+
+
+@dataclass
+class Case:
+    """측정 대상 하나 (func는 인자 없이 1회 실행)"""
+    name: str
+    func: Callable[[], Any]
+    payload: str
+
+
+def _words(rng: random.Random, count: int) -> List[str]:
+    return [rng.choice(VOCABULARY) for _ in range(count)]
+
+
+def _inverted_index(rng: random.Random, length: int) -> Dict[str, List[int]]:
+    index: Dict[str, List[int]] = {}
+    for position, word in enumerate(_words(rng, length)):
+        index.setdefault(word, []).append(position)
+    return index
+
+
+def _openalex_papers(rng: random.Random, count: int) -> List[Dict[str, Any]]:
+    papers = []
+    for i in range(count):
+        # 약 10%는 같은 DOI 중복, 약 10%는 DOI 없이 제목만 있는 논문
+        doi = i - 1 if i % 10 == 9 else i
+        papers.append({
+            "url": f"https://doi.org/10.1000/{doi}" if i % 10 != 5 else "",
+            "title": " ".join(_words(rng, 9)).title(),
+            "abstract": " ".join(_words(rng, 60)),
+            "relevance_score": rng.uniform(0, 200),
+            "cited_by_count": rng.randint(0, 5000),
+        })
+    return papers
+
+
+def _google_results(rng: random.Random, count: int) -> List[Dict[str, Any]]:
+    domains = ["velog.io", "tistory.com", "medium.com", "geeksforgeeks.org", "wikipedia.org", "naver.com"]
+    results = []
+    for i in range(count):
+        domain = domains[i % len(domains)]
+        prefix = "https://www." if i % 3 == 0 else "https://"
+        # 약 15%는 www 유무만 다른 중복 URL
+        path_id = i - 1 if i % 7 == 6 else i
+        results.append({
+            "title": " ".join(_words(rng, 8)),
+            "link": f"{prefix}{domain}/post/{path_id}",
+            "snippet": " ".join(_words(rng, 35)),
+            "displayLink": domain,
+        })
+    return results
+
+
+def _youtube_videos(rng: random.Random, count: int) -> List[Dict[str, Any]]:
+    return [
+        {
+            "title": f"[자료구조] {' '.join(_words(rng, 7))} #{i} | 강의",
+            "view_count": rng.randint(0, 3_000_000),
+            "publish_time": f"{rng.randint(2010, 2025)}-0{rng.randint(1, 9)}-15T00:00:00Z",
+        }
+        for i in range(count)
+    ]
+
+
+@dataclass
+class _Chunk:
+    text: str
+    score: float
+    metadata: Dict[str, Any]
+
+
+def build_cases(seed: int = 0) -> List[Case]:
+    """케이스 목록 생성 (seed가 같으면 같은 데이터)"""
+    rng = random.Random(seed)
+    cases: List[Case] = []
+
+    # ── OpenAlex: 검색 1회 응답(80편) 기준 ──
+    works = [_inverted_index(rng, 180) for _ in range(80)]
+    papers = _openalex_papers(rng, 80)
+    query = {"tokens": ["stack", "queue", "data", "structure"]}
+    cases.append(Case("openalex.parse_abstract_inverted_index", lambda: [parse_abstract_inverted_index(w) for w in works], "80 works x 180 words"))
+    cases.append(Case("openalex.deduplicate_papers", lambda: deduplicate_papers(papers), "80 papers"))
+    # rerank_papers는 입력을 제자리 정렬하므로 매번 원래 순서의 얕은 복사본 사용
+    cases.append(Case("openalex.rerank_papers", lambda: rerank_papers(list(papers), query), "80 papers, 4 tokens"))
+
+    # ── YouTube: 검색 결과 40개 기준 ──
+    videos = _youtube_videos(rng, 40)
+    section_query = "stack queue data structure LIFO FIFO"
+    keyed = [(normalize_title(v["title"]), v) for v in videos + videos[:20]]
+    cases.append(Case("youtube.normalize_title", lambda: [normalize_title(v["title"]) for v in videos], "40 titles"))
+    cases.append(Case("youtube.deduplicate_items", lambda: deduplicate_items(keyed), "60 items"))
+    cases.append(Case(
+        "youtube.heuristic_score",
+        lambda: [
+            youtube_heuristic_score(title=v["title"], query=section_query, view_count=v["view_count"], publish_time=v["publish_time"])
+            for v in videos
+        ],
+        "40 videos",
+    ))
+
+    # ── Google: 팬아웃 검색 결과 40건 기준 ──
+    results = _google_results(rng, 40)
+    excludes = [results[i]["link"] for i in range(0, 40, 4)]
+    cases.append(Case("google.deduplicate_results", lambda: deduplicate_results(results), "40 results"))
+    cases.append(Case("google.rerank_results", lambda: rerank_results(results, KEYWORDS), "40 results, 5 keywords"))
+    cases.append(Case("google.filter_excluded_urls", lambda: filter_excluded_urls(results, excludes), "40 results, 10 excludes"))
+    cases.append(Case(
+        "google.heuristic_score",
+        lambda: [google_heuristic_score(r["title"], r["snippet"], KEYWORDS, r["displayLink"]) for r in results],
+        "40 results",
+    ))
+
+    # ── 서버: REC 콜백 변환 (provider당 top_k 10개) ──
+    paper_items = [
+        OpenAlexResponse(
+            lecture_id="1", section_id=1, reason="관련 개념을 다룬다.", score=8.0, summary="요약",
+            paper_info=PaperInfo(url=p["url"] or "https://openalex.org/W1", title=p["title"], abstract=p["abstract"], year=2020, authors=["A", "B"]),
+        )
+        for p in papers[:10]
+    ]
+    video_items = [
+        YouTubeResponse(
+            lecture_id="1", section_id=1, reason="예제가 풍부하다.", score=7.5,
+            video_info=YouTubeVideoInfo(url=f"https://youtu.be/{i}", title=v["title"], extract="영상 요약 " * 10, lang="ko"),
+        )
+        for i, v in enumerate(videos[:10])
+    ]
+    blog_items = [
+        GoogleResponse(
+            lecture_id="1", section_id=1, reason="Heuristic", score=6.0,
+            search_result=GoogleSearchResult(url=r["link"], title=r["title"], snippet=r["snippet"], display_link=r["displayLink"], lang="ko"),
+        )
+        for r in results[:10]
+    ]
+    # 위키 모듈은 저장소에 없으므로 같은 필드 구조의 벤치마크 스텁 응답 사용
+    wiki_items = [StubWikiService(None)._build("1", 1, i) for i in range(10)]
+    cases.append(Case(
+        "server.map_resources",
+        lambda: (
+            map_resources(ResourceType.PAPER, paper_items),
+            map_resources(ResourceType.WIKI, wiki_items),
+            map_resources(ResourceType.VIDEO, video_items),
+            map_resources(ResourceType.BLOG, blog_items),
+        ),
+        "4 providers x 10 items",
+    ))
+
+    # ── 서버: RAG 청크 변환 (청크 5개, 약 800자) ──
+    chunks = [
+        _Chunk(text=" ".join(_words(rng, 120)), score=1.0 - i * 0.1, metadata={"lecture_id": "1", "section_id": str(i), "source": "summary"})
+        for i in range(5)
+    ]
+    cases.append(Case("server.to_qa_rag_context", lambda: to_qa_rag_context(chunks), "5 chunks"))
+    cases.append(Case("server.to_openalex_rag_chunks", lambda: to_openalex_rag_chunks(chunks), "5 chunks"))
+    cases.append(Case("server.to_wiki_rag_chunks", lambda: to_wiki_rag_chunks(chunks), "5 chunks"))
+    cases.append(Case("server.to_youtube_rag_chunks", lambda: to_youtube_rag_chunks(chunks), "5 chunks"))
+    cases.append(Case("server.to_google_rag_chunks", lambda: to_google_rag_chunks(chunks), "5 chunks"))
+    return cases
+
+
+def measure(case: Case, repeat: int = 7, min_time: float = 0.05) -> Dict[str, Any]:
+    """1회 호출 시간 (µs): 반복 측정 중 최소값과 중앙값"""
+    timer = timeit.Timer(case.func)
+    loops, _ = timer.autorange()
+    # autorange는 0.2초 기준이므로 min_time에 맞게 반복 횟수 조정
+    loops = max(1, int(loops * min_time / 0.2))
+    timings = [elapsed / loops * 1e6 for elapsed in timer.repeat(repeat=repeat, number=loops)]
+    return {
+        "min_us": round(min(timings), 2),
+        "median_us": round(statistics.median(timings), 2),
+        "loops": loops,
+        "payload": case.payload,
+    }
+
+
+def compare(results: Dict[str, Dict[str, Any]], baseline: Dict[str, Any], tolerance: float) -> Dict[str, Dict[str, Any]]:
+    """기준값 대비 배율 (min_us 기준, 잡음이 가장 적음)"""
+    base_results = baseline.get("results", {})
+    comparison = {}
+    for name, result in results.items():
+        base = base_results.get(name)
+        if not base or not base.get("min_us"):
+            comparison[name] = {"ratio": None, "regressed": False}
+            continue
+        ratio = result["min_us"] / base["min_us"]
+        comparison[name] = {"ratio": round(ratio, 3), "regressed": ratio > tolerance}
+    return comparison
+
+
+def _meta() -> Dict[str, Any]:
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="provider/서버 hot 함수 마이크로 벤치마크")
+    parser.add_argument("--filter", help="이름에 이 문자열이 포함된 케이스만 실행")
+    parser.add_argument("--repeat", type=int, default=7, help="반복 측정 횟수")
+    parser.add_argument("--min-time", type=float, default=0.05, help="측정 1회당 최소 시간 (초)")
+    parser.add_argument("--baseline", default=str(BASELINE_PATH), help="기준값 JSON 경로")
+    parser.add_argument("--tolerance", type=float, default=1.5, help="성능 저하로 볼 기준값 대비 배율")
+    parser.add_argument("--check", action="store_true", help="tolerance 초과 케이스가 있으면 종료 코드 1")
+    parser.add_argument("--update-baseline", action="store_true", help="현재 측정값을 기준값으로 저장")
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    args = parser.parse_args(argv)
+
+    # 함수 내부 INFO 로그는 출력하지 않음 (f-string 생성 비용은 그대로 측정됨)
+    logging.basicConfig(level=logging.WARNING)
+
+    cases = [case for case in build_cases() if not args.filter or args.filter in case.name]
+    results = {case.name: measure(case, args.repeat, args.min_time) for case in cases}
+
+    baseline_path = Path(args.baseline)
+    baseline = json.loads(baseline_path.read_text(encoding="utf-8")) if baseline_path.exists() else {}
+    comparison = compare(results, baseline, args.tolerance)
+
+    print(f"{'case':<42}{'payload':<26}{'min µs':>11}{'median µs':>12}{'vs base':>10}")
+    for name, result in results.items():
+        ratio = comparison[name]["ratio"]
+        marker = " !" if comparison[name]["regressed"] else ""
+        ratio_text = f"{ratio:.2f}x{marker}" if ratio is not None else "-"
+        print(f"{name:<42}{result['payload']:<26}{result['min_us']:>11}{result['median_us']:>12}{ratio_text:>10}")
+
+    report = {"meta": _meta(), "results": results}
+    if args.output:
+        Path(args.output).write_text(json.dumps({**report, "comparison": comparison}, ensure_ascii=False, indent=2), encoding="utf-8")
+    if args.update_baseline:
+        merged = {"meta": report["meta"], "results": {**baseline.get("results", {}), **results}}
+        baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        baseline_path.write_text(json.dumps(merged, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+        print(f"기준값 저장: {baseline_path}")
+
+    regressed = [name for name, item in comparison.items() if item["regressed"]]
+    if regressed:
+        print(f"기준값 대비 {args.tolerance}배 초과: {', '.join(regressed)}")
+        if args.check:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
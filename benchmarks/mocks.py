@@ -0,0 +1,510 @@
+"""
+외부 API 모의 서버 (OpenAI / OpenAlex / YouTube Data API / Google Custom Search)
+
+실제 provider 클라이언트(OpenAIClient, OpenAlexAPIClient, YouTubeAPIClient, GoogleSearchClient)가
+쓰는 요청/응답 형식을 그대로 흉내 내는 FastAPI 앱이다. 호출 종류별 지연 분포와
+오류(5xx)/429 비율을 설정할 수 있어 네트워크 없이 파이프라인 전체를 벤치마크/테스트할 수 있다.
+
+경로 (하나의 앱에서 모두 제공):
+    POST /v1/chat/completions        OpenAI (stream 포함)
+    GET  /openalex/works             OpenAlex
+    GET  /youtube/v3/search, /videos YouTube Data API v3
+    GET  /customsearch/v1            Google Custom Search
+    GET  /_mock/stats                서비스별 요청/오류/429 횟수
+
+사용 예:
+    python -m benchmarks.mocks --port 8900 --latency llm=0.8,0.2 --error-rate 0.02 --rate-limit openalex=0.1
+    # 출력된 export 줄을 적용한 뒤 서버 실행 → 모든 provider 호출이 모의 서버로 향함
+
+테스트에서는 httpx.ASGITransport(app=create_mock_app(...))로 프로세스 안에서 붙이거나,
+소켓이 필요한 클라이언트(aiohttp 사용하는 Google)는 MockServer로 localhost에 띄운다.
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import random
+import re
+import sys
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+from benchmarks.stubs import LatencyProfile, parse_latency_overrides
+
+# 호출 1회 기준 지연 (평균 초, 표준편차 초) - provider 전체 지연(stubs.DEFAULT_LATENCIES)보다 잘게 나눈 값
+MOCK_LATENCIES: Dict[str, Tuple[float, float]] = {
+    "llm": (1.8, 0.6),
+    "openalex_works": (0.6, 0.2),
+    "youtube_search": (0.4, 0.1),
+    "youtube_videos": (0.2, 0.05),
+    "google_search": (0.5, 0.15),
+}
+
+SERVICES = ("llm", "openalex", "youtube", "google")
+
+# 쿼리/키워드 생성 응답에 쓰는 어휘 (프롬프트 해시로 골라 요청마다 다른 검색어가 나오게 함)
+_VOCAB = (
+    "stack", "queue", "hash table", "binary tree", "graph traversal", "dynamic programming",
+    "sorting algorithm", "linked list", "heap", "recursion", "complexity analysis", "greedy algorithm",
+    "shortest path", "neural network", "gradient descent", "operating system", "scheduling",
+    "memory management", "concurrency", "database index", "transaction", "compiler", "parsing",
+)
+
+_ITEM_ID_PATTERN = re.compile(r"\[id=(\d+)\]")
+
+
+@dataclass
+class FaultProfile:
+    """서비스별 오류 주입 비율"""
+
+    error_rate: float = 0.0  # 5xx 응답 비율
+    rate_limit_rate: float = 0.0  # 429 응답 비율
+    retry_after: float = 1.0  # 429 응답의 Retry-After (초)
+
+
+def parse_rate_overrides(values: List[str]) -> Dict[str, float]:
+    """CLI 인자 "rate" 또는 "service=rate" 목록 → 서비스별 비율 (서비스 생략 시 전체 적용)"""
+    rates: Dict[str, float] = {}
+    for value in values:
+        name, sep, rate = value.rpartition("=")
+        targets = [name.strip()] if sep else list(SERVICES)
+        for target in targets:
+            if target not in SERVICES:
+                raise ValueError(f"알 수 없는 서비스: {target} (가능: {', '.join(SERVICES)})")
+            rates[target] = float(rate)
+    return rates
+
+
+def _seeded(*parts: Any) -> random.Random:
+    """요청 내용 기반 난수 (같은 요청이면 같은 응답)"""
+    digest = hashlib.sha256("|".join(str(part) for part in parts).encode("utf-8")).hexdigest()
+    return random.Random(int(digest[:16], 16))
+
+
+def _terms(seed_text: str, count: int) -> List[str]:
+    return _seeded(seed_text).sample(_VOCAB, count)
+
+
+def _video_id(seed_text: str, index: int) -> str:
+    return hashlib.sha256(f"{seed_text}:{index}".encode("utf-8")).hexdigest()[:11]
+
+
+def _inverted_index(text: str) -> Dict[str, List[int]]:
+    index: Dict[str, List[int]] = defaultdict(list)
+    for position, word in enumerate(text.split()):
+        index[word].append(position)
+    return dict(index)
+
+
+class MockState:
+    """지연/오류 주입과 서비스별 카운터"""
+
+    def __init__(
+        self,
+        profile: Optional[LatencyProfile] = None,
+        faults: Optional[Dict[str, FaultProfile]] = None,
+        seed: Optional[int] = 0,
+    ):
+        self.profile = profile or LatencyProfile(MOCK_LATENCIES, seed=seed)
+        self.faults = {service: (faults or {}).get(service) or FaultProfile() for service in SERVICES}
+        self._random = random.Random(seed)
+        self.counters: Dict[str, Dict[str, int]] = {
+            service: {"requests": 0, "errors": 0, "rate_limited": 0} for service in SERVICES
+        }
+
+    async def enter(self, service: str, latency: str) -> Optional[int]:
+        """지연 후 주입할 오류 상태 코드 반환 (정상이면 None)"""
+        counters = self.counters[service]
+        counters["requests"] += 1
+        await self.profile.sleep(latency)
+        fault = self.faults[service]
+        roll = self._random.random()
+        if roll < fault.rate_limit_rate:
+            counters["rate_limited"] += 1
+            return 429
+        if roll < fault.rate_limit_rate + fault.error_rate:
+            counters["errors"] += 1
+            return 500
+        return None
+
+    def retry_after(self, service: str) -> Dict[str, str]:
+        return {"retry-after": f"{self.faults[service].retry_after:g}"}
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "counters": self.counters,
+            "faults": {service: vars(fault) for service, fault in self.faults.items()},
+            **self.profile.describe(),
+        }
+
+
+# ───────────────────────────── 응답 생성 ─────────────────────────────
+
+
+def _openai_error(status: int, headers: Dict[str, str]) -> JSONResponse:
+    if status == 429:
+        error = {"message": "Rate limit reached (mock)", "type": "requests", "param": None, "code": "rate_limit_exceeded"}
+    else:
+        error = {"message": "The server had an error (mock)", "type": "server_error", "param": None, "code": None}
+    return JSONResponse({"error": error}, status_code=status, headers=headers)
+
+
+def _google_error(status: int, headers: Dict[str, str]) -> JSONResponse:
+    """Google API(YouTube Data/Custom Search) 공통 오류 형식"""
+    reason, state = ("rateLimitExceeded", "RESOURCE_EXHAUSTED") if status == 429 else ("backendError", "INTERNAL")
+    message = f"{reason} (mock)"
+    body = {"error": {"code": status, "message": message, "errors": [{"message": message, "reason": reason}], "status": state}}
+    return JSONResponse(body, status_code=status, headers=headers)
+
+
+def _chat_content(body: Dict[str, Any]) -> str:
+    """프롬프트 형식에 맞춘 가짜 LLM 응답
+
+    JSON 모드면 provider들이 읽는 키(tokens/queries/extract/score/reason/results)를 모두 담고,
+    일괄 검증 프롬프트의 [id=N] 항목마다 results를 만든다. 텍스트 모드면 줄 단위 키워드.
+    """
+    prompt = "\n".join(str(message.get("content") or "") for message in body.get("messages") or [])
+    rng = _seeded(prompt)
+    terms = _terms(prompt, 3)
+    if (body.get("response_format") or {}).get("type") != "json_object":
+        return "\n".join(terms)
+    ids = list(dict.fromkeys(int(item_id) for item_id in _ITEM_ID_PATTERN.findall(prompt)))
+    return json.dumps(
+        {
+            "tokens": terms,
+            "queries": [f"{term} explained" for term in terms],
+            "rationale": "mock rationale",
+            "extract": f"{terms[0].capitalize()} is introduced. It is compared with {terms[1]}.",
+            "score": round(rng.uniform(5.0, 9.5), 1),
+            "reason": "모의 응답 평가 문장",
+            "results": [
+                {
+                    "id": item_id,
+                    "extract": f"Item {item_id} covers {terms[item_id % len(terms)]}.",
+                    "score": round(rng.uniform(4.0, 9.5), 1),
+                    "reason": "모의 응답 평가 문장",
+                }
+                for item_id in ids
+            ],
+        },
+        ensure_ascii=False,
+    )
+
+
+def _chat_completion(body: Dict[str, Any], content: str) -> Dict[str, Any]:
+    prompt_tokens = sum(len(str(message.get("content") or "")) for message in body.get("messages") or []) // 4
+    completion_tokens = max(1, len(content) // 4)
+    return {
+        "id": f"chatcmpl-mock-{hashlib.sha256(content.encode('utf-8')).hexdigest()[:12]}",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": body.get("model", "mock"),
+        "choices": [{"index": 0, "finish_reason": "stop", "message": {"role": "assistant", "content": content}}],
+        "usage": {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+        },
+    }
+
+
+def _chat_stream(body: Dict[str, Any], content: str):
+    """chat.completion.chunk SSE 스트림 (단어 단위로 나눠 전송)"""
+    base = {
+        "id": f"chatcmpl-mock-{hashlib.sha256(content.encode('utf-8')).hexdigest()[:12]}",
+        "object": "chat.completion.chunk",
+        "created": int(time.time()),
+        "model": body.get("model", "mock"),
+    }
+    pieces = re.findall(r"\S+\s*", content) or [""]
+
+    async def events():
+        first = {"index": 0, "delta": {"role": "assistant", "content": ""}, "finish_reason": None}
+        yield f"data: {json.dumps({**base, 'choices': [first]}, ensure_ascii=False)}\n\n"
+        for piece in pieces:
+            choice = {"index": 0, "delta": {"content": piece}, "finish_reason": None}
+            yield f"data: {json.dumps({**base, 'choices': [choice]}, ensure_ascii=False)}\n\n"
+        last = {"index": 0, "delta": {}, "finish_reason": "stop"}
+        yield f"data: {json.dumps({**base, 'choices': [last]}, ensure_ascii=False)}\n\n"
+        yield "data: [DONE]\n\n"
+
+    return StreamingResponse(events(), media_type="text/event-stream")
+
+
+def _openalex_work(search: str, index: int) -> Dict[str, Any]:
+    rng = _seeded("openalex", search, index)
+    topic = search or "computer science"
+    abstract = (
+        f"This paper studies {topic} and proposes an efficient method. "
+        f"We evaluate the approach on standard benchmarks and analyse its complexity in detail."
+    )
+    work_id = int(hashlib.sha256(f"{search}:{index}".encode("utf-8")).hexdigest()[:8], 16)
+    return {
+        "id": f"https://openalex.org/W{work_id}",
+        "doi": f"https://doi.org/10.5555/mock.{work_id}",
+        "title": f"{topic.title()}: study {index + 1}",
+        "display_name": f"{topic.title()}: study {index + 1}",
+        "publication_year": rng.randint(1990, 2024),
+        "cited_by_count": rng.randint(0, 5000),
+        "relevance_score": round(100.0 / (index + 1), 3),
+        "type": "article",
+        "language": "en",
+        "abstract_inverted_index": _inverted_index(abstract),
+        "authorships": [
+            {"author_position": "first" if i == 0 else "middle", "author": {"display_name": f"Author {index}-{i}"}}
+            for i in range(rng.randint(1, 4))
+        ],
+    }
+
+
+def _youtube_search_item(query: str, index: int) -> Dict[str, Any]:
+    video_id = _video_id(query, index)
+    return {
+        "kind": "youtube#searchResult",
+        "id": {"kind": "youtube#video", "videoId": video_id},
+        "snippet": {
+            "title": f"{query} tutorial {index + 1}",
+            "description": f"Lecture video about {query}. Covers definitions, examples and exercises.",
+            "channelTitle": f"MockChannel{index % 3}",
+            "publishedAt": "2024-01-01T00:00:00Z",
+        },
+    }
+
+
+def _youtube_video(video_id: str) -> Dict[str, Any]:
+    rng = _seeded("youtube", video_id)
+    return {
+        "kind": "youtube#video",
+        "id": video_id,
+        "snippet": {
+            "title": f"Mock video {video_id}",
+            "description": "Step by step explanation with worked examples.",
+            "defaultAudioLanguage": "en",
+            "channelTitle": "MockChannel",
+            "publishedAt": "2024-01-01T00:00:00Z",
+        },
+        "contentDetails": {"duration": f"PT{rng.randint(3, 40)}M{rng.randint(0, 59)}S"},
+        "statistics": {"viewCount": str(rng.randint(100, 2_000_000))},
+    }
+
+
+def _google_item(query: str, index: int) -> Dict[str, Any]:
+    host = ("blog.example.com", "docs.example.org", "wiki.example.net")[index % 3]
+    slug = re.sub(r"[^a-z0-9]+", "-", query.lower()).strip("-") or "result"
+    return {
+        "kind": "customsearch#result",
+        "title": f"{query} - guide {index + 1}",
+        "link": f"https://{host}/{slug}/{index + 1}",
+        "displayLink": host,
+        "snippet": f"An introduction to {query} with diagrams and code samples.",
+    }
+
+
+# ───────────────────────────── 앱 ─────────────────────────────
+
+
+def create_mock_app(
+    profile: Optional[LatencyProfile] = None,
+    faults: Optional[Dict[str, FaultProfile]] = None,
+    seed: Optional[int] = 0,
+) -> FastAPI:
+    """모의 외부 API 앱 생성 (profile 미지정 시 MOCK_LATENCIES 사용, scale=0이면 지연 없음)"""
+    state = MockState(profile, faults, seed)
+    app = FastAPI(title="LiveNote external API mocks")
+    app.state.mock = state
+
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: Request):
+        if not request.headers.get("authorization"):
+            return JSONResponse(
+                {"error": {"message": "Missing API key (mock)", "type": "invalid_request_error", "code": None}},
+                status_code=401,
+            )
+        body = await request.json()
+        status = await state.enter("llm", "llm")
+        if status is not None:
+            return _openai_error(status, state.retry_after("llm") if status == 429 else {})
+        content = _chat_content(body)
+        if body.get("stream"):
+            return _chat_stream(body, content)
+        return _chat_completion(body, content)
+
+    @app.get("/openalex/works")
+    async def openalex_works(search: str = "", per_page: int = 25, page: int = 1):
+        status = await state.enter("openalex", "openalex_works")
+        if status is not None:
+            headers = state.retry_after("openalex") if status == 429 else {}
+            return JSONResponse({"error": "mock error", "message": f"HTTP {status} (mock)"}, status_code=status, headers=headers)
+        per_page = max(1, min(per_page, 200))
+        offset = (page - 1) * per_page
+        return {
+            "meta": {"count": per_page * 10, "page": page, "per_page": per_page},
+            "results": [_openalex_work(search, offset + i) for i in range(per_page)],
+        }
+
+    @app.get("/youtube/v3/search")
+    async def youtube_search(q: str = "", maxResults: int = 5, key: str = ""):
+        if not key:
+            return _google_error(403, {})
+        status = await state.enter("youtube", "youtube_search")
+        if status is not None:
+            return _google_error(status, state.retry_after("youtube") if status == 429 else {})
+        count = max(0, min(maxResults, 50))
+        return {
+            "kind": "youtube#searchListResponse",
+            "pageInfo": {"totalResults": 1000, "resultsPerPage": count},
+            "items": [_youtube_search_item(q, i) for i in range(count)],
+        }
+
+    @app.get("/youtube/v3/videos")
+    async def youtube_videos(id: str = "", key: str = ""):
+        if not key:
+            return _google_error(403, {})
+        status = await state.enter("youtube", "youtube_videos")
+        if status is not None:
+            return _google_error(status, state.retry_after("youtube") if status == 429 else {})
+        ids = [video_id for video_id in id.split(",") if video_id][:50]
+        return {
+            "kind": "youtube#videoListResponse",
+            "pageInfo": {"totalResults": len(ids), "resultsPerPage": len(ids)},
+            "items": [_youtube_video(video_id) for video_id in ids],
+        }
+
+    @app.get("/customsearch/v1")
+    async def google_search(q: str = "", num: int = 10, key: str = "", cx: str = ""):
+        if not key or not cx:
+            return _google_error(400, {})
+        status = await state.enter("google", "google_search")
+        if status is not None:
+            return _google_error(status, state.retry_after("google") if status == 429 else {})
+        count = max(1, min(num, 10))
+        return {
+            "kind": "customsearch#search",
+            "queries": {"request": [{"searchTerms": q, "count": count, "startIndex": 1}]},
+            "searchInformation": {"totalResults": "1000", "searchTime": 0.1},
+            "items": [_google_item(q, i) for i in range(count)],
+        }
+
+    @app.get("/_mock/stats")
+    async def stats():
+        return state.snapshot()
+
+    return app
+
+
+def mock_env(base_url: str) -> Dict[str, str]:
+    """모의 서버 주소 → provider/서버가 읽는 base URL 환경 변수"""
+    base_url = base_url.rstrip("/")
+    return {
+        "OPENAI_BASE_URL": f"{base_url}/v1",
+        "OPENALEX_BASE_URL": f"{base_url}/openalex",
+        "YOUTUBE_API_BASE_URL": f"{base_url}/youtube/v3",
+        "GOOGLE_SEARCH_BASE_URL": f"{base_url}/customsearch/v1",
+    }
+
+
+class MockServer:
+    """모의 앱을 별도 스레드의 uvicorn으로 localhost에 띄움 (port=0이면 빈 포트 자동 선택)
+
+    with MockServer(create_mock_app()) as server:
+        os.environ.update(server.env())
+    """
+
+    def __init__(self, app: FastAPI, host: str = "127.0.0.1", port: int = 0):
+        import uvicorn
+
+        self.app = app
+        self.host = host
+        self._server = uvicorn.Server(uvicorn.Config(app, host=host, port=port, log_level="warning", lifespan="off"))
+        self._thread: Optional[threading.Thread] = None
+        self.port = port
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    def env(self) -> Dict[str, str]:
+        return mock_env(self.base_url)
+
+    def start(self, timeout: float = 5.0) -> "MockServer":
+        self._thread = threading.Thread(target=self._server.run, name="mock-api-server", daemon=True)
+        self._thread.start()
+        deadline = time.monotonic() + timeout
+        while not self._server.started:
+            if not self._thread.is_alive() or time.monotonic() > deadline:
+                raise RuntimeError("모의 서버 시작 실패")
+            time.sleep(0.01)
+        self.port = self._server.servers[0].sockets[0].getsockname()[1]
+        return self
+
+    def stop(self):
+        self._server.should_exit = True
+        if self._thread is not None:
+            self._thread.join(timeout=5.0)
+            self._thread = None
+
+    def __enter__(self) -> "MockServer":
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="OpenAI/OpenAlex/YouTube/Google 모의 API 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8900)
+    parser.add_argument(
+        "--latency",
+        action="append",
+        default=[],
+        help=f"지연 설정 name=mean[,stddev] (초, 반복 가능, name: {', '.join(MOCK_LATENCIES)})",
+    )
+    parser.add_argument("--latency-scale", type=float, default=1.0, help="모든 지연 배율 (0이면 지연 없음)")
+    parser.add_argument("--error-rate", action="append", default=[], help="5xx 비율 [service=]rate (반복 가능)")
+    parser.add_argument("--rate-limit", action="append", default=[], help="429 비율 [service=]rate (반복 가능)")
+    parser.add_argument("--retry-after", type=float, default=1.0, help="429 응답의 Retry-After (초)")
+    parser.add_argument("--seed", type=int, default=0, help="지연/오류 난수 시드")
+    args = parser.parse_args(argv)
+
+    latencies = {**MOCK_LATENCIES, **parse_latency_overrides(args.latency)}
+    profile = LatencyProfile(latencies, scale=args.latency_scale, seed=args.seed)
+    error_rates = parse_rate_overrides(args.error_rate)
+    rate_limits = parse_rate_overrides(args.rate_limit)
+    faults = {
+        service: FaultProfile(
+            error_rate=error_rates.get(service, 0.0),
+            rate_limit_rate=rate_limits.get(service, 0.0),
+            retry_after=args.retry_after,
+        )
+        for service in SERVICES
+    }
+
+    env = mock_env(f"http://{args.host}:{args.port}")
+    print("# 서버 실행 전 적용 (API 키는 아무 값이나 가능)")
+    for name, value in env.items():
+        print(f"export {name}={value}")
+    print("export OPENAI_API_KEY=${OPENAI_API_KEY:-sk-mock} YOUTUBE_API_KEY=${YOUTUBE_API_KEY:-mock}")
+    print("export GOOGLE_SEARCH_API_KEY=${GOOGLE_SEARCH_API_KEY:-mock} GOOGLE_SEARCH_ENGINE_ID=${GOOGLE_SEARCH_ENGINE_ID:-mock}")
+    sys.stdout.flush()
+
+    import uvicorn
+
+    uvicorn.run(create_mock_app(profile, faults, args.seed), host=args.host, port=args.port, log_level="warning")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
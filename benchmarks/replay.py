@@ -0,0 +1,431 @@
+"""
+녹화된 요청 스트림 재생 부하 생성기
+
+create_app에 스텁 provider(지연 주입)를 넣고 ASGI로 직접 요청을 재생해
+엔드포인트별 응답/완료(마지막 콜백) 지연 p50/p95/p99, 처리량,
+이벤트 루프 지연, 최대 RSS를 측정하고 JSON으로 저장한다.
+
+사용 예:
+    python -m benchmarks.replay --stream benchmarks/streams/lecture_mix.jsonl --output bench.json
+    python -m benchmarks.replay --synthesize 5 --speed 4 --latency openalex=4.0,1.0
+    python -m benchmarks.replay --stream ... --compare bench_before.json
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import math
+import os
+import platform
+import re
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+from server.app import create_app
+from server.config import AppSettings
+
+from .stubs import (
+    LatencyProfile,
+    RecordingDispatcher,
+    StubGoogleService,
+    StubOpenAI,
+    StubOpenAlexService,
+    StubQAService,
+    StubRAGService,
+    StubWikiService,
+    StubYouTubeService,
+    parse_latency_overrides,
+)
+
+logger = logging.getLogger(__name__)
+
+CALLBACK_BASE = "http://bench.invalid/callback"
+_CALLBACK_ID = re.compile(r"/callback/(\d+)")
+
+TRANSCRIPT = [
+    "오늘은 자료구조 중 스택과 큐를 비교해 보겠습니다.",
+    "스택은 나중에 들어온 데이터가 먼저 나가는 LIFO 구조이고 함수 호출과 되돌리기 기능에 쓰입니다.",
+    "큐는 먼저 들어온 데이터가 먼저 나가는 FIFO 구조로 작업 대기열과 너비 우선 탐색에 사용됩니다.",
+    "두 구조 모두 배열이나 연결 리스트로 구현할 수 있으며 연산의 시간 복잡도는 O(1)입니다.",
+]
+
+
+def synthesize_stream(lectures: int = 2, sections: int = 4, interval: float = 30.0, pipeline: bool = False) -> List[Dict[str, Any]]:
+    """강의 진행을 흉내 낸 요청 스트림 생성
+
+    섹션마다 요약 → 요약 업서트 → QA/REC 순서로 호출하며 (pipeline=True면 /pipeline/section 한 번),
+    강의들은 interval 안에서 고르게 어긋나게 시작한다.
+    """
+    stream: List[Dict[str, Any]] = []
+    for lecture in range(lectures):
+        lecture_id = lecture + 1
+        offset = interval * lecture / max(lectures, 1)
+        for section in range(sections):
+            at = round(offset + section * interval, 3)
+            summary = f"강의 {lecture_id} 섹션 {section}: 스택과 큐의 차이와 활용 사례를 설명한다."
+            if pipeline:
+                stream.append({
+                    "at": at,
+                    "method": "POST",
+                    "path": "/pipeline/section",
+                    "body": {
+                        "lecture_id": lecture_id,
+                        "section_index": section,
+                        "transcript": TRANSCRIPT,
+                        "callback_url": CALLBACK_BASE,
+                        "qa_callback_url": CALLBACK_BASE,
+                        "rec_callback_url": CALLBACK_BASE,
+                    },
+                })
+                continue
+            stream.append({
+                "at": at,
+                "method": "POST",
+                "path": "/summary/generate",
+                "body": {"lecture_id": lecture_id, "section_index": section, "transcript": TRANSCRIPT, "callback_url": CALLBACK_BASE},
+            })
+            stream.append({
+                "at": round(at + 2.0, 3),
+                "method": "POST",
+                "path": "/rag/text-upsert",
+                "body": {"lecture_id": str(lecture_id), "items": [{"text": summary, "section_id": str(section)}]},
+            })
+            for path in ("/qa/generate", "/rec/recommend"):
+                stream.append({
+                    "at": round(at + 2.5, 3),
+                    "method": "POST",
+                    "path": path,
+                    "body": {"lecture_id": lecture_id, "section_index": section, "section_summary": summary, "callback_url": CALLBACK_BASE},
+                })
+    stream.sort(key=lambda item: item["at"])
+    return stream
+
+
+def load_stream(path: str) -> List[Dict[str, Any]]:
+    """JSONL 스트림 로드 (한 줄: {"at": 초, "method": ..., "path": ..., "body": {...}})"""
+    stream = []
+    with open(path, encoding="utf-8") as fp:
+        for line in fp:
+            line = line.strip()
+            if line:
+                stream.append(json.loads(line))
+    stream.sort(key=lambda item: item.get("at", 0.0))
+    return stream
+
+
+def percentile(values: List[float], q: float) -> float:
+    """nearest-rank 백분위수"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, min(len(ordered), math.ceil(q / 100 * len(ordered))))
+    return ordered[rank - 1]
+
+
+def _distribution(values: List[float]) -> Dict[str, float]:
+    """초 단위 값 → ms 단위 요약"""
+    if not values:
+        return {"count": 0}
+    return {
+        "count": len(values),
+        "p50": round(percentile(values, 50) * 1000, 2),
+        "p95": round(percentile(values, 95) * 1000, 2),
+        "p99": round(percentile(values, 99) * 1000, 2),
+        "max": round(max(values) * 1000, 2),
+        "mean": round(sum(values) / len(values) * 1000, 2),
+    }
+
+
+def _with_callback(body: Any, request_id: int) -> Any:
+    """콜백 URL을 요청별 URL로 바꿔 완료 시각을 추적"""
+    if not isinstance(body, dict):
+        return body
+    rewritten = dict(body)
+    for key in list(rewritten):
+        if key.endswith("callback_url") or key.endswith("CallbackUrl") or key == "callbackUrl":
+            if rewritten[key]:
+                rewritten[key] = f"{CALLBACK_BASE}/{request_id}"
+    return rewritten
+
+
+def _peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux는 KB, macOS는 byte 단위
+    return round(peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024, 1)
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT_DIR, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+class LoopLagMonitor:
+    """interval마다 깨어나 예정보다 늦어진 시간을 이벤트 루프 지연으로 기록"""
+
+    def __init__(self, interval: float = 0.01):
+        self.interval = interval
+        self.samples: List[float] = []
+        self._task: Optional[asyncio.Task] = None
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            self.samples.append(max(0.0, loop.time() - expected))
+
+    def start(self):
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+
+async def run_replay(
+    stream: List[Dict[str, Any]],
+    *,
+    profile: Optional[LatencyProfile] = None,
+    settings: Optional[AppSettings] = None,
+    speed: float = 1.0,
+    max_inflight: int = 0,
+) -> Dict[str, Any]:
+    """스트림을 재생하고 결과 리포트 반환
+
+    speed: 녹화 시간 배속 (2.0이면 두 배 빠르게, 0이면 간격 없이 모두 즉시 전송)
+    max_inflight: 동시 진행 요청 상한 (0이면 제한 없음, 녹화 간격 그대로 개방형 부하)
+    """
+    profile = profile or LatencyProfile()
+    settings = settings or AppSettings()
+    dispatcher = RecordingDispatcher(profile)
+    app = create_app(
+        settings,
+        rag_service=StubRAGService(profile),
+        qa_service=StubQAService(profile),
+        openalex_service=StubOpenAlexService(profile),
+        wiki_service=StubWikiService(profile),
+        youtube_service=StubYouTubeService(profile),
+        google_service=StubGoogleService(profile),
+    )
+    app.state.llm_registry.install_client(StubOpenAI(profile))
+    app.state.callback_dispatcher = dispatcher
+    app.state.callback_outbox.dispatcher = dispatcher
+
+    latencies: Dict[str, List[float]] = defaultdict(list)
+    statuses: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+    started_at: Dict[int, float] = {}
+    endpoint_of: Dict[int, str] = {}
+    limiter = asyncio.Semaphore(max_inflight) if max_inflight > 0 else None
+    monitor = LoopLagMonitor()
+    last_response = 0.0
+
+    async def send(client: httpx.AsyncClient, request_id: int, item: Dict[str, Any]):
+        nonlocal last_response
+        method = item.get("method", "POST").upper()
+        endpoint = f"{method} {item['path']}"
+        endpoint_of[request_id] = endpoint
+        body = _with_callback(item.get("body"), request_id)
+        if limiter is not None:
+            await limiter.acquire()
+        try:
+            started = time.perf_counter()
+            started_at[request_id] = started
+            try:
+                response = await client.request(method, item["path"], json=body)
+                status_code = str(response.status_code)
+            except Exception as exc:  # pragma: no cover - 앱 내부 예외
+                logger.warning("요청 실패 %s: %s", endpoint, exc)
+                status_code = type(exc).__name__
+            finished = time.perf_counter()
+            latencies[endpoint].append(finished - started)
+            statuses[endpoint][status_code] += 1
+            last_response = max(last_response, finished)
+        finally:
+            if limiter is not None:
+                limiter.release()
+
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+            monitor.start()
+            begin = time.perf_counter()
+            tasks = []
+            for request_id, item in enumerate(stream):
+                if speed > 0:
+                    delay = begin + float(item.get("at", 0.0)) / speed - time.perf_counter()
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                tasks.append(asyncio.create_task(send(client, request_id, item)))
+            await asyncio.gather(*tasks)
+        # lifespan 종료 시 스케줄러 drain → 남은 콜백까지 전송 완료
+    await monitor.stop()
+    end = time.perf_counter()
+
+    completion: Dict[str, List[float]] = defaultdict(list)
+    last_callback: Dict[int, float] = {}
+    for url, received_at in dispatcher.received:
+        match = _CALLBACK_ID.search(url)
+        if match:
+            request_id = int(match.group(1))
+            last_callback[request_id] = max(last_callback.get(request_id, 0.0), received_at)
+    for request_id, received_at in last_callback.items():
+        if request_id in started_at:
+            completion[endpoint_of[request_id]].append(received_at - started_at[request_id])
+
+    send_window = max(last_response - begin, 1e-9)
+    endpoints = {
+        endpoint: {
+            "requests": len(values),
+            "status": dict(statuses[endpoint]),
+            "latency_ms": _distribution(values),
+            "completion_ms": _distribution(completion.get(endpoint, [])),
+        }
+        for endpoint, values in sorted(latencies.items())
+    }
+    total = sum(len(values) for values in latencies.values())
+    errors = sum(
+        count for status_counts in statuses.values() for code, count in status_counts.items() if not code.startswith("2")
+    )
+    return {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "git_commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "speed": speed,
+            "max_inflight": max_inflight,
+            "stream_requests": len(stream),
+            "profile": profile.describe(),
+        },
+        "summary": {
+            "requests": total,
+            "errors": errors,
+            "callbacks": len(dispatcher.received),
+            "send_window_s": round(send_window, 3),
+            "total_s": round(end - begin, 3),
+            "requests_per_second": round(total / send_window, 2),
+            "loop_lag_ms": _distribution(monitor.samples),
+            "peak_rss_mb": _peak_rss_mb(),
+        },
+        "endpoints": endpoints,
+        "jobs": app.state.job_scheduler.snapshot(),
+    }
+
+
+def format_report(report: Dict[str, Any], baseline: Optional[Dict[str, Any]] = None) -> str:
+    """사람이 읽을 표 (baseline이 있으면 p95 변화율 표시)"""
+    summary = report["summary"]
+    lines = [
+        f"requests={summary['requests']} errors={summary['errors']} callbacks={summary['callbacks']} "
+        f"rps={summary['requests_per_second']} total={summary['total_s']}s "
+        f"loop_lag_p99={summary['loop_lag_ms'].get('p99', 0)}ms peak_rss={summary['peak_rss_mb']}MB",
+        f"{'endpoint':<32}{'n':>6}{'p50':>10}{'p95':>10}{'p99':>10}{'done p95':>12}{'Δp95':>9}",
+    ]
+    base_endpoints = (baseline or {}).get("endpoints", {})
+    for endpoint, stats in report["endpoints"].items():
+        latency = stats["latency_ms"]
+        done = stats["completion_ms"]
+        delta = ""
+        base_p95 = base_endpoints.get(endpoint, {}).get("latency_ms", {}).get("p95")
+        if base_p95:
+            delta = f"{(latency['p95'] - base_p95) / base_p95 * 100:+.1f}%"
+        lines.append(
+            f"{endpoint:<32}{stats['requests']:>6}{latency['p50']:>10}{latency['p95']:>10}{latency['p99']:>10}"
+            f"{done.get('p95', '-'):>12}{delta:>9}"
+        )
+    return "\n".join(lines)
+
+
+def _build_settings(path: Optional[str], workdir: str) -> AppSettings:
+    data: Dict[str, Any] = {}
+    if path:
+        with open(path, encoding="utf-8") as fp:
+            data = json.load(fp)
+    settings = AppSettings.model_validate(data)
+    # 측정 중 생기는 파일은 임시 디렉터리에만 기록
+    if "outbox" not in data:
+        settings.outbox.path = str(Path(workdir) / "callback_outbox.db")
+    if "pdf_upload" not in data.get("rag", {}):
+        settings.rag.pdf_upload.upload_dir = str(Path(workdir) / "uploads")
+        settings.rag.pdf_upload.registry_path = str(Path(workdir) / "pdf_ingests.db")
+    settings.tracing.export_path = str(Path(workdir) / "traces.jsonl")
+    return settings
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="요청 스트림 재생 부하/지연 벤치마크")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--stream", help="재생할 JSONL 스트림 경로")
+    source.add_argument("--synthesize", type=int, metavar="LECTURES", help="강의 N개 분량의 스트림 생성 후 재생")
+    parser.add_argument("--sections", type=int, default=4, help="--synthesize 시 강의당 섹션 수")
+    parser.add_argument("--interval", type=float, default=30.0, help="--synthesize 시 섹션 간격 (초)")
+    parser.add_argument("--pipeline", action="store_true", help="--synthesize 시 /pipeline/section 사용")
+    parser.add_argument("--save-stream", help="생성한 스트림을 JSONL로 저장")
+    parser.add_argument("--speed", type=float, default=1.0, help="재생 배속 (0이면 간격 없이 전송)")
+    parser.add_argument("--max-inflight", type=int, default=0, help="동시 진행 요청 상한 (0이면 제한 없음)")
+    parser.add_argument("--latency", action="append", default=[], help="지연 설정 name=mean[,stddev] (초, 반복 가능)")
+    parser.add_argument("--latency-scale", type=float, default=1.0, help="모든 지연 배율 (0이면 지연 없음)")
+    parser.add_argument("--seed", type=int, default=0, help="지연 난수 시드")
+    parser.add_argument("--settings", help="AppSettings JSON 파일 (미지정 시 기본값)")
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON")
+    parser.add_argument("--log-level", default="ERROR", help="서버 로그 레벨 (측정 중 로그 출력 비용 최소화)")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=args.log_level.upper())
+    # 요약 라우트의 키 검증 통과용 (스텁 클라이언트라 실제 호출 없음)
+    os.environ.setdefault("OPENAI_API_KEY", "sk-bench-" + "0" * 32)
+
+    if args.stream:
+        stream = load_stream(args.stream)
+    else:
+        stream = synthesize_stream(args.synthesize, args.sections, args.interval, pipeline=args.pipeline)
+        if args.save_stream:
+            with open(args.save_stream, "w", encoding="utf-8") as fp:
+                for item in stream:
+                    fp.write(json.dumps(item, ensure_ascii=False) + "\n")
+
+    profile = LatencyProfile(parse_latency_overrides(args.latency), scale=args.latency_scale, seed=args.seed)
+    with tempfile.TemporaryDirectory(prefix="livenote-bench-") as workdir:
+        settings = _build_settings(args.settings, workdir)
+        report = asyncio.run(
+            run_replay(stream, profile=profile, settings=settings, speed=args.speed, max_inflight=args.max_inflight)
+        )
+    report["meta"]["stream"] = args.stream or f"synthesized:{args.synthesize}x{args.sections}"
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as fp:
+            baseline = json.load(fp)
+    print(format_report(report, baseline))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as fp:
+            json.dump(report, fp, ensure_ascii=False, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,245 @@
+"""
+워커 부팅 시간 벤치마크 + import 시간 분석
+
+새 프로세스에서 server.app import → create_app → lifespan 시작 → 첫 /health 응답까지를
+단계별로 재고(서비스 지연 생성/즉시 생성 비교), `python -X importtime` 출력을 패키지별로 묶어
+부팅 경로에서 무거운 모듈(openai, chromadb, rapidfuzz, aiohttp 등)이 불리는지 보여준다.
+
+사용 예:
+    python -m benchmarks.startup                       # lazy/eager 각 5회 + import 분석
+    python -m benchmarks.startup --modes lazy --runs 10 --output startup.json
+    python -m benchmarks.startup --importtime-only --top 40
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+# 부팅 경로에서 불리면 안 되는(또는 비용을 따로 보고 싶은) 모듈
+HEAVY_MODULES = (
+    "openai",
+    "chromadb",
+    "rapidfuzz",
+    "aiohttp",
+    "youtube_transcript_api",
+    "httpx",
+    "fastapi",
+    "pydantic",
+    "prometheus_client",
+    "dotenv",
+)
+
+PHASES = ("import", "create_app", "lifespan", "first_request", "ready", "process")
+
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)\s*$")
+
+
+def parse_importtime(text: str) -> List[Dict[str, Any]]:
+    """`-X importtime` stderr → [{"name", "self_us", "cumulative_us", "depth"}, ...]"""
+    entries = []
+    for line in text.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match is None:
+            continue
+        self_us, cumulative_us, indent, name = match.groups()
+        entries.append(
+            {"name": name, "self_us": int(self_us), "cumulative_us": int(cumulative_us), "depth": len(indent) // 2}
+        )
+    return entries
+
+
+def summarize_importtime(entries: List[Dict[str, Any]], top: int = 25) -> Dict[str, Any]:
+    """최상위 패키지별 self 시간 합계, self 시간 상위 모듈, 무거운 모듈 누적 시간"""
+    packages: Dict[str, int] = defaultdict(int)
+    cumulative: Dict[str, int] = {}
+    for entry in entries:
+        packages[entry["name"].split(".", 1)[0]] += entry["self_us"]
+        cumulative[entry["name"]] = entry["cumulative_us"]
+    total_us = sum(entry["cumulative_us"] for entry in entries if entry["depth"] == 0)
+    slowest = sorted(entries, key=lambda entry: entry["self_us"], reverse=True)[:top]
+    return {
+        "total_ms": round(total_us / 1000, 1),
+        "modules": len(entries),
+        "packages": {
+            name: round(us / 1000, 1)
+            for name, us in sorted(packages.items(), key=lambda item: item[1], reverse=True)[:top]
+        },
+        "slowest": [
+            {"name": entry["name"], "self_ms": round(entry["self_us"] / 1000, 1), "cumulative_ms": round(entry["cumulative_us"] / 1000, 1)}
+            for entry in slowest
+        ],
+        "heavy": {
+            name: round(cumulative[name] / 1000, 1) if name in cumulative else None for name in HEAVY_MODULES
+        },
+    }
+
+
+def run_importtime(target: str = "server.main", top: int = 25) -> Dict[str, Any]:
+    """새 인터프리터에서 target import 시간 측정"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {target}"],
+        cwd=ROOT_DIR,
+        capture_output=True,
+        text=True,
+    )
+    report = summarize_importtime(parse_importtime(result.stderr), top)
+    report["target"] = target
+    if result.returncode != 0:
+        report["error"] = result.stderr.strip().splitlines()[-1] if result.stderr.strip() else f"exit {result.returncode}"
+    return report
+
+
+def _boot_once(lazy: bool, wait_warm_up: bool) -> Dict[str, Any]:
+    """(자식 프로세스) 앱 부팅 단계별 시간 측정"""
+    started = time.perf_counter()
+    import httpx
+
+    from server.app import create_app
+    from server.config import AppSettings
+
+    timings: Dict[str, float] = {"import": time.perf_counter() - started}
+    modules: Dict[str, bool] = {}
+    with tempfile.TemporaryDirectory(prefix="livenote-startup-") as workdir:
+        settings = AppSettings()
+        settings.outbox.path = str(Path(workdir) / "callback_outbox.db")
+        settings.tracing.export_path = str(Path(workdir) / "traces.jsonl")
+        settings.rag.pdf_upload.upload_dir = str(Path(workdir) / "uploads")
+        settings.rag.pdf_upload.registry_path = str(Path(workdir) / "pdf_ingests.db")
+        settings.services.lazy = lazy
+        mark = time.perf_counter()
+        app = create_app(settings)
+        timings["create_app"] = time.perf_counter() - mark
+
+        async def boot() -> Dict[str, Any]:
+            mark = time.perf_counter()
+            async with app.router.lifespan_context(app):
+                timings["lifespan"] = time.perf_counter() - mark
+                mark = time.perf_counter()
+                async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+                    (await client.get("/health")).raise_for_status()
+                timings["first_request"] = time.perf_counter() - mark
+                timings["ready"] = time.perf_counter() - started
+                # 첫 응답 시점에 불려 있던 모듈 (이후 워밍업이 provider 모듈을 import함)
+                modules.update({name: name in sys.modules for name in HEAVY_MODULES})
+                if wait_warm_up:
+                    await app.state.services.wait_warm_up()
+                return app.state.services.snapshot()
+
+        services = asyncio.run(boot())
+    return {"timings": timings, "services": services, "modules": modules}
+
+
+def measure_startup(mode: str, runs: int, wait_warm_up: bool) -> Dict[str, Any]:
+    """mode(lazy/eager)별로 새 프로세스를 runs번 띄워 단계별 시간 수집"""
+    samples: Dict[str, List[float]] = defaultdict(list)
+    last: Dict[str, Any] = {}
+    errors: List[str] = []
+    command = [sys.executable, "-m", "benchmarks.startup", "--child", mode]
+    if wait_warm_up:
+        command.append("--wait-warm-up")
+    for _ in range(runs):
+        mark = time.perf_counter()
+        result = subprocess.run(command, cwd=ROOT_DIR, capture_output=True, text=True)
+        wall = time.perf_counter() - mark
+        if result.returncode != 0 or not result.stdout.strip():
+            errors.append(result.stderr.strip().splitlines()[-1] if result.stderr.strip() else f"exit {result.returncode}")
+            continue
+        last = json.loads(result.stdout.strip().splitlines()[-1])
+        for phase, seconds in last["timings"].items():
+            samples[phase].append(seconds)
+        samples["process"].append(wall)
+    return {
+        "mode": mode,
+        "runs": runs,
+        "ok": runs - len(errors),
+        "errors": errors[:3],
+        "phases_ms": {
+            phase: {
+                "median": round(statistics.median(values) * 1000, 1),
+                "min": round(min(values) * 1000, 1),
+                "max": round(max(values) * 1000, 1),
+            }
+            for phase, values in samples.items()
+        },
+        "services": last.get("services"),
+        "modules_loaded": last.get("modules"),
+    }
+
+
+def format_report(report: Dict[str, Any]) -> str:
+    lines = []
+    for result in report.get("startup", []):
+        lines.append(f"[{result['mode']}] 성공 {result['ok']}/{result['runs']}회")
+        for error in result["errors"]:
+            lines.append(f"  ! {error}")
+        for phase in PHASES:
+            stats = result["phases_ms"].get(phase)
+            if stats:
+                lines.append(f"  {phase:<14} median {stats['median']:>8.1f}ms  min {stats['min']:>8.1f}ms  max {stats['max']:>8.1f}ms")
+        loaded = [name for name, present in (result.get("modules_loaded") or {}).items() if present]
+        if loaded:
+            lines.append(f"  첫 응답 시점 로드된 모듈: {', '.join(loaded)}")
+    importtime = report.get("importtime")
+    if importtime:
+        lines.append(f"[importtime] {importtime['target']}: {importtime['total_ms']}ms ({importtime['modules']}개 모듈)")
+        if importtime.get("error"):
+            lines.append(f"  ! {importtime['error']}")
+        lines.append("  패키지별 self 합계:")
+        for name, ms in list(importtime["packages"].items())[:15]:
+            lines.append(f"    {name:<28} {ms:>8.1f}ms")
+        lines.append("  self 시간 상위 모듈:")
+        for entry in importtime["slowest"][:15]:
+            lines.append(f"    {entry['name']:<48} {entry['self_ms']:>8.1f}ms (누적 {entry['cumulative_ms']}ms)")
+        heavy = [f"{name}={ms}ms" for name, ms in importtime["heavy"].items() if ms is not None]
+        lines.append(f"  무거운 모듈 누적: {', '.join(heavy) or '없음'}")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="워커 부팅 시간 + import 시간 분석")
+    parser.add_argument("--modes", default="lazy,eager", help="측정할 서비스 생성 방식 (lazy,eager)")
+    parser.add_argument("--runs", type=int, default=5, help="방식별 프로세스 기동 횟수")
+    parser.add_argument("--wait-warm-up", action="store_true", help="lazy 측정 시 워밍업 완료까지 대기 (소요 시간은 services에 기록)")
+    parser.add_argument("--target", default="server.main", help="importtime 분석 대상 모듈")
+    parser.add_argument("--top", type=int, default=25, help="importtime 상위 표시 개수")
+    parser.add_argument("--importtime-only", action="store_true", help="import 시간 분석만 실행")
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    parser.add_argument("--child", choices=("lazy", "eager"), help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        # 요약 라우트 키 검증 등 부팅에 필요한 환경 변수 (실제 호출 없음)
+        os.environ.setdefault("OPENAI_API_KEY", "sk-bench-" + "0" * 32)
+        print(json.dumps(_boot_once(args.child == "lazy", args.wait_warm_up)))
+        return 0
+
+    report: Dict[str, Any] = {"python": sys.version.split()[0]}
+    if not args.importtime_only:
+        modes = [mode.strip() for mode in args.modes.split(",") if mode.strip()]
+        report["startup"] = [measure_startup(mode, args.runs, args.wait_warm_up) for mode in modes]
+    report["importtime"] = run_importtime(args.target, args.top)
+
+    print(format_report(report))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as fp:
+            json.dump(report, fp, ensure_ascii=False, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,296 @@
+"""
+벤치마크용 provider 스텁 (설정한 지연을 주입해 외부 API 없이 파이프라인 부하 재현)
+"""
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from openai.types.chat import ChatCompletion
+
+# 이름 → (평균 지연 초, 표준편차 초), 운영에서 관측한 대략적인 값
+DEFAULT_LATENCIES: Dict[str, Tuple[float, float]] = {
+    "rag_retrieve": (0.05, 0.02),
+    "rag_upsert": (0.15, 0.05),
+    "qa_item": (1.2, 0.4),
+    "openalex": (2.5, 0.8),
+    "wiki": (1.5, 0.5),
+    "youtube": (3.0, 1.0),
+    "google": (2.0, 0.6),
+    "llm": (1.8, 0.6),
+    "callback": (0.03, 0.01),
+}
+
+
+class LatencyProfile:
+    """이름별 지연 분포 (정규분포, 0 미만은 0으로 자름)
+
+    seed를 고정하면 같은 스트림 재생 시 같은 지연 순서가 나온다.
+    scale로 모든 지연을 한꺼번에 줄이거나 늘릴 수 있다 (0이면 지연 없음).
+    """
+
+    def __init__(
+        self,
+        latencies: Optional[Dict[str, Tuple[float, float]]] = None,
+        scale: float = 1.0,
+        seed: Optional[int] = 0,
+    ):
+        self.latencies = {**DEFAULT_LATENCIES, **(latencies or {})}
+        self.scale = scale
+        self._random = random.Random(seed)
+
+    def sample(self, name: str) -> float:
+        mean, stddev = self.latencies.get(name, (0.0, 0.0))
+        if self.scale <= 0 or mean <= 0:
+            return 0.0
+        return max(0.0, self._random.gauss(mean, stddev)) * self.scale
+
+    async def sleep(self, name: str):
+        delay = self.sample(name)
+        if delay:
+            await asyncio.sleep(delay)
+
+    def block(self, name: str):
+        """동기 호출(스레드에서 실행되는 RAG) 지연"""
+        delay = self.sample(name)
+        if delay:
+            time.sleep(delay)
+
+    def describe(self) -> Dict[str, Any]:
+        return {
+            "scale": self.scale,
+            "latencies": {name: {"mean": mean, "stddev": stddev} for name, (mean, stddev) in self.latencies.items()},
+        }
+
+
+def parse_latency_overrides(values: List[str]) -> Dict[str, Tuple[float, float]]:
+    """CLI 인자 "name=mean[,stddev]" 목록 → 지연 설정"""
+    overrides: Dict[str, Tuple[float, float]] = {}
+    for value in values:
+        name, _, spec = value.partition("=")
+        if not name or not spec:
+            raise ValueError(f"지연 형식은 name=mean[,stddev] 입니다: {value}")
+        mean, _, stddev = spec.partition(",")
+        overrides[name.strip()] = (float(mean), float(stddev or 0.0))
+    return overrides
+
+
+@dataclass
+class _Model:
+    def model_dump(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+@dataclass
+class _PaperInfo(_Model):
+    url: str
+    title: str
+    abstract: str
+    year: Optional[int] = 2024
+    cited_by_count: int = 0
+    authors: List[str] = field(default_factory=list)
+
+
+@dataclass
+class _PageInfo(_Model):
+    url: str
+    title: str
+    extract: str
+    lang: str = "en"
+    page_id: int = 0
+
+
+@dataclass
+class _VideoInfo(_Model):
+    url: str
+    title: str
+    extract: str
+    lang: str = "en"
+
+
+@dataclass
+class _SearchResult(_Model):
+    url: str
+    title: str
+    snippet: str
+    display_link: str = ""
+    lang: str = "en"
+
+
+@dataclass
+class _Recommendation(_Model):
+    lecture_id: str
+    section_id: int
+    reason: str
+    score: float
+    paper_info: Optional[_PaperInfo] = None
+    page_info: Optional[_PageInfo] = None
+    video_info: Optional[_VideoInfo] = None
+    search_result: Optional[_SearchResult] = None
+
+
+@dataclass
+class _Chunk:
+    id: str
+    text: str
+    score: float
+    metadata: Dict[str, Any]
+
+
+class StubRAGService:
+    """RAG 서비스 스텁 (upsert_text/upsert_pdf/retrieve, 동기 API)"""
+
+    def __init__(self, profile: LatencyProfile, chunks: int = 5):
+        self.profile = profile
+        self.chunks = chunks
+
+    def upsert_text(self, collection_id: str, items: List[Any]):
+        self.profile.block("rag_upsert")
+        return {"count": len(items), "status": "ok"}
+
+    def upsert_pdf(self, collection_id: str, pdf_path: str, base_metadata: Optional[Dict[str, Any]] = None):
+        self.profile.block("rag_upsert")
+        return {"count": 1, "status": "ok"}
+
+    def retrieve(self, collection_id: str, query: str, top_k: int, filters=None):
+        self.profile.block("rag_retrieve")
+        return [
+            _Chunk(id=f"{collection_id}-{i}", text=f"{query[:40]} 관련 청크 {i}", score=1.0 - i * 0.05, metadata={})
+            for i in range(min(top_k, self.chunks))
+        ]
+
+
+class StubQAService:
+    """QA 서비스 스텁 (질문 유형마다 지연 후 1개씩 생성)"""
+
+    def __init__(self, profile: LatencyProfile):
+        self.profile = profile
+
+    async def stream_questions(self, request):
+        for q_type in getattr(request, "question_types", None) or []:
+            await self.profile.sleep("qa_item")
+            yield "qa", q_type, {"type": q_type, "question": f"{q_type} 질문", "answer": f"{q_type} 답변"}
+
+
+class _StubProvider:
+    name = ""
+
+    def __init__(self, profile: LatencyProfile, results: int = 3):
+        self.profile = profile
+        self.results = results
+
+    async def _recommend(self, request) -> List[_Recommendation]:
+        await self.profile.sleep(self.name)
+        lecture_id = str(getattr(request, "lecture_id", ""))
+        section_id = int(getattr(request, "section_id", 0) or 0)
+        return [self._build(lecture_id, section_id, i) for i in range(self.results)]
+
+    def _build(self, lecture_id: str, section_id: int, index: int) -> _Recommendation:
+        raise NotImplementedError
+
+
+class StubOpenAlexService(_StubProvider):
+    name = "openalex"
+
+    async def recommend_papers(self, request):
+        return await self._recommend(request)
+
+    def _build(self, lecture_id, section_id, index):
+        info = _PaperInfo(url=f"https://openalex.org/W{index}", title=f"Paper {index}", abstract="abstract")
+        return _Recommendation(lecture_id, section_id, "stub", 8.0 - index, paper_info=info)
+
+
+class StubWikiService(_StubProvider):
+    name = "wiki"
+
+    async def recommend_pages(self, request):
+        return await self._recommend(request)
+
+    def _build(self, lecture_id, section_id, index):
+        info = _PageInfo(url=f"https://en.wikipedia.org/wiki/Page_{index}", title=f"Page {index}", extract="extract")
+        return _Recommendation(lecture_id, section_id, "stub", 8.0 - index, page_info=info)
+
+
+class StubYouTubeService(_StubProvider):
+    name = "youtube"
+
+    async def recommend_videos(self, request):
+        return await self._recommend(request)
+
+    def _build(self, lecture_id, section_id, index):
+        info = _VideoInfo(url=f"https://youtu.be/video{index}", title=f"Video {index}", extract="extract")
+        return _Recommendation(lecture_id, section_id, "stub", 8.0 - index, video_info=info)
+
+
+class StubGoogleService(_StubProvider):
+    name = "google"
+
+    async def recommend_results(self, request):
+        return await self._recommend(request)
+
+    def _build(self, lecture_id, section_id, index):
+        info = _SearchResult(url=f"https://blog.example.com/{index}", title=f"Post {index}", snippet="snippet")
+        return _Recommendation(lecture_id, section_id, "stub", 8.0 - index, search_result=info)
+
+
+class _StubCompletions:
+    def __init__(self, profile: LatencyProfile):
+        self.profile = profile
+        self.calls = 0
+
+    async def create(self, **kwargs):
+        self.calls += 1
+        await self.profile.sleep("llm")
+        return ChatCompletion.model_validate(
+            {
+                "id": f"bench-{self.calls}",
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": kwargs.get("model", "stub"),
+                "choices": [
+                    {
+                        "index": 0,
+                        "finish_reason": "stop",
+                        "message": {"role": "assistant", "content": "벤치마크용 요약 문장입니다. 스택과 큐를 비교한다."},
+                    }
+                ],
+            }
+        )
+
+
+class _StubChat:
+    def __init__(self, profile: LatencyProfile):
+        self.completions = _StubCompletions(profile)
+
+
+class StubOpenAI:
+    """AsyncOpenAI 스텁 (chat.completions.create만 지원)"""
+
+    def __init__(self, profile: LatencyProfile):
+        self.chat = _StubChat(profile)
+
+    async def close(self):
+        return None
+
+
+class _Response:
+    status_code = 200
+
+
+class RecordingDispatcher:
+    """콜백 디스패처 스텁: 전송 대신 지연 후 수신 시각을 기록"""
+
+    def __init__(self, profile: LatencyProfile):
+        self.profile = profile
+        self.received: List[Tuple[str, float]] = []
+
+    async def post(self, url: str, payload: dict):
+        await self.profile.sleep("callback")
+        self.received.append((url, time.perf_counter()))
+        return _Response()
+
+    async def close(self):
+        return None
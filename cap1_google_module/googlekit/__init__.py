@@ -8,7 +8,6 @@ from .models import (
     GoogleRequest,
     GoogleResponse,
 )
-from .service import GoogleService
 
 __version__ = "0.1.0"
 
@@ -20,3 +19,11 @@ __all__ = [
     "GoogleResponse",
     "GoogleService",
 ]
+
+
+def __getattr__(name):
+    # 서비스는 openai/httpx 등 무거운 의존성을 끌어오므로 처음 접근할 때 import (models만 쓰는 쪽은 가볍게)
+    if name == "GoogleService":
+        from .service import GoogleService
+        return GoogleService
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,10 +2,12 @@
 Google Custom Search API 클라이언트
 """
 import aiohttp
+import asyncio
 import logging
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Set
 
 from ..config.google_config import GoogleConfig
+from ..utils.cache import SearchResultCache
 
 logger = logging.getLogger(__name__)
 
@@ -13,23 +15,37 @@ logger = logging.getLogger(__name__)
 class GoogleSearchClient:
     """Google Custom Search API 클라이언트"""
     
-    BASE_URL = "https://www.googleapis.com/customsearch/v1"
-    
-    def __init__(self, api_key: Optional[str] = None, engine_id: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        engine_id: Optional[str] = None,
+        base_url: Optional[str] = None,
+    ):
         """
         초기화
         
         Args:
             api_key: Google Search API 키 (None이면 환경 변수 사용)
             engine_id: Search Engine ID (None이면 환경 변수 사용)
+            base_url: Custom Search 엔드포인트 (None이면 GOOGLE_SEARCH_BASE_URL 또는 공식 주소)
         """
         self.api_key = api_key or GoogleConfig.GOOGLE_SEARCH_API_KEY
         self.engine_id = engine_id or GoogleConfig.GOOGLE_SEARCH_ENGINE_ID
+        self.base_url = base_url or GoogleConfig.SEARCH_BASE_URL
         
         if not self.api_key:
             raise ValueError("GOOGLE_SEARCH_API_KEY가 설정되지 않았습니다.")
         if not self.engine_id:
             raise ValueError("GOOGLE_SEARCH_ENGINE_ID가 설정되지 않았습니다.")
+        
+        self.cache = SearchResultCache(
+            ttl_seconds=GoogleConfig.SEARCH_CACHE_TTL,
+            stale_ttl_seconds=GoogleConfig.SEARCH_CACHE_STALE_TTL,
+            max_entries=GoogleConfig.SEARCH_CACHE_MAX_ENTRIES,
+            path=GoogleConfig.SEARCH_CACHE_PATH or None
+        ) if GoogleConfig.SEARCH_CACHE_TTL > 0 else None
+        self._refreshing: Set[str] = set()
+        self._refresh_tasks: Set[asyncio.Task] = set()
     
     async def search(
         self,
@@ -48,21 +64,100 @@ class GoogleSearchClient:
         Returns:
             검색 결과 리스트
         """
+        num = min(num, 10)  # 최대 10개
+        if self.cache is None:
+            return await self._fetch(query, lang, num) or []
+        
+        key = self.cache.make_key(query, lang, num)
+        cached = await self.cache.get_async(key)
+        if cached is not None:
+            results, fresh = cached
+            if fresh:
+                self.cache.counters["hits"] += 1
+                logger.info(f"⚡ Google 검색 캐시 적중: \"{query}\" ({len(results)}개)")
+            else:
+                self.cache.counters["stale_hits"] += 1
+                logger.info(f"♻️ Google 검색 캐시(stale) 반환 후 갱신: \"{query}\"")
+                self._schedule_refresh(key, query, lang, num)
+            return results
+        
+        self.cache.counters["misses"] += 1
+        results = await self._fetch(query, lang, num)
+        if results is None:
+            return []
+        await self.cache.set_async(key, results)
+        return results
+    
+    def _schedule_refresh(self, key: str, query: str, lang: str, num: int):
+        """stale 항목 백그라운드 갱신 (키당 1개만 실행)"""
+        if key in self._refreshing:
+            return
+        self._refreshing.add(key)
+        
+        async def refresh():
+            try:
+                results = await self._fetch(query, lang, num)
+                if results is not None:
+                    await self.cache.set_async(key, results)
+                    self.cache.counters["refreshes"] += 1
+            finally:
+                self._refreshing.discard(key)
+        
+        task = asyncio.create_task(refresh())
+        self._refresh_tasks.add(task)
+        task.add_done_callback(self._refresh_tasks.discard)
+    
+    def cache_stats(self) -> Dict[str, Any]:
+        """
+        검색 캐시 통계 (quota_saved 포함)
+        
+        Returns:
+            캐시 카운터 dict (캐시 비활성 시 {"enabled": False})
+        """
+        if self.cache is None:
+            return {"enabled": False}
+        return {"enabled": True, **self.cache.stats()}
+    
+    async def close(self):
+        """진행 중인 갱신 작업 정리 + 캐시 파일 닫기"""
+        for task in list(self._refresh_tasks):
+            task.cancel()
+        if self._refresh_tasks:
+            await asyncio.gather(*self._refresh_tasks, return_exceptions=True)
+        if self.cache is not None:
+            self.cache.close()
+    
+    async def _fetch(self, query: str, lang: str, num: int) -> Optional[List[Dict[str, Any]]]:
+        """
+        Google Custom Search API 호출
+        
+        Args:
+            query: 검색 쿼리
+            lang: 검색 언어
+            num: 결과 개수 (최대 10)
+            
+        Returns:
+            정규화된 검색 결과 리스트 (오류 시 None → 캐시하지 않음)
+        """
+        if self.cache is not None:
+            self.cache.counters["api_calls"] += 1
+        
         params = {
             "key": self.api_key,
             "cx": self.engine_id,
             "q": query,
             "lr": f"lang_{lang}",  # Language restrict
-            "num": min(num, 10),  # 최대 10개
+            "num": num,
         }
         
         try:
             async with aiohttp.ClientSession() as session:
-                async with session.get(self.BASE_URL, params=params) as response:
+                async with session.get(self.base_url, params=params) as response:
                     if response.status != 200:
                         error_text = await response.text()
                         logger.error(f"❌ Google API 오류 ({response.status}): {error_text}")
-                        return []
+                        self._count_error()
+                        return None
                     
                     data = await response.json()
                     items = data.get("items", [])
@@ -83,7 +178,13 @@ class GoogleSearchClient:
         
         except aiohttp.ClientError as e:
             logger.error(f"❌ Google API 호출 실패: {e}")
-            return []
+            self._count_error()
+            return None
         except Exception as e:
             logger.error(f"❌ Google API 예외 발생: {e}")
-            return []
+            self._count_error()
+            return None
+    
+    def _count_error(self):
+        if self.cache is not None:
+            self.cache.counters["api_errors"] += 1
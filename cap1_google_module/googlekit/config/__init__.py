@@ -4,6 +4,7 @@ Config 패키지 초기화
 from .flags import (
     NO_SCORING,
     VERIFY_GOOGLE_DEFAULT,
+    VERIFY_BATCH_DEFAULT,
     KEYWORD_MIN,
     KEYWORD_MAX,
     WEIGHT_TITLE_MATCH,
@@ -17,6 +18,7 @@ from . import prompts
 __all__ = [
     "NO_SCORING",
     "VERIFY_GOOGLE_DEFAULT",
+    "VERIFY_BATCH_DEFAULT",
     "KEYWORD_MIN",
     "KEYWORD_MAX",
     "WEIGHT_TITLE_MATCH",
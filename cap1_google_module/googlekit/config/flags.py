@@ -5,6 +5,7 @@ Google Provider 전용 플래그
 # ━━━ 검증 스위치 ━━━
 NO_SCORING = False  # True이면 검증 없이 검색 결과만 반환 (빠른 테스트용)
 VERIFY_GOOGLE_DEFAULT = True  # 기본값: LLM 검증
+VERIFY_BATCH_DEFAULT = False  # True이면 여러 결과를 한 번의 LLM 호출로 일괄 검증
 
 # ━━━ 키워드 생성 설정 ━━━
 KEYWORD_MIN = 1  # 최소 키워드 개수
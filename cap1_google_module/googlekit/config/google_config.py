@@ -13,6 +13,10 @@ class GoogleConfig:
     GOOGLE_SEARCH_ENGINE_ID: str = os.getenv("GOOGLE_SEARCH_ENGINE_ID", "")
     OPENAI_API_KEY: str = os.getenv("OPENAI_API_KEY", "")
     
+    # API 주소 (모의 서버/프록시 사용 시 지정, OpenAI는 비우면 공식 주소)
+    SEARCH_BASE_URL: str = os.getenv("GOOGLE_SEARCH_BASE_URL", "https://www.googleapis.com/customsearch/v1")
+    OPENAI_BASE_URL: str = os.getenv("OPENAI_BASE_URL", "")
+    
     # 검색 설정
     DEFAULT_TOP_K: int = 5
     DEFAULT_LANGUAGE: str = "ko"
@@ -31,9 +35,20 @@ class GoogleConfig:
     MAX_TOKENS_QUERY: int = 150
     MAX_TOKENS_SCORE: int = 120
     
+    # 검색 결과 캐시 (CSE 일일 quota 절약)
+    SEARCH_CACHE_TTL: int = 3 * 24 * 3600  # fresh 유지 시간 (초, 0이면 캐시 끔)
+    SEARCH_CACHE_STALE_TTL: int = 7 * 24 * 3600  # TTL 이후 stale 결과 반환 + 백그라운드 갱신 기간 (초)
+    SEARCH_CACHE_MAX_ENTRIES: int = 2048  # 메모리 캐시 최대 항목 수
+    SEARCH_CACHE_PATH: str = os.getenv("GOOGLE_SEARCH_CACHE_PATH", "")  # SQLite 파일 (비우면 메모리만)
+    
     # 병렬 처리
     VERIFY_CONCURRENCY: int = 15
     
+    # 일괄 검증 (verify_batch)
+    BATCH_MAX_ITEMS: int = 15  # LLM 호출 1회당 최대 결과 수 (CARD_LIMIT과 동일 → 보통 1회)
+    BATCH_TOKEN_BUDGET: int = 6000  # LLM 호출 1회당 결과 텍스트 토큰 예산 (초과 시 분할)
+    MAX_TOKENS_SCORE_PER_ITEM: int = 80  # 결과 1개당 응답 토큰 (score + reason)
+    
     @classmethod
     def validate(cls):
         """환경 변수 검증"""
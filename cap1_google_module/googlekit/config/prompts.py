@@ -55,3 +55,36 @@ Rate the relevance on a scale of 0-10 and provide a brief reason in {language}.
 {{"score": <float>, "reason": "<1-2 sentences in {language}>"}}
 
 **JSON Response:**"""
+
+
+# ━━━ 일괄 검증 프롬프트 (verify_batch) ━━━
+BATCH_RESULT_ITEM_TEMPLATE = """[id={id}]
+Title: {title}
+URL: {url}
+Snippet: {snippet}
+"""
+
+
+BATCH_SCORING_PROMPT = """You are evaluating the relevance of several search results to a lecture topic.
+
+**Lecture Summary:**
+{lecture_summary}
+
+**Search Results:**
+{results}
+
+**Task:**
+Rate EACH search result independently on a scale of 0-10 and provide a brief reason in {language}.
+
+**Scoring Guidelines:**
+- 10: Original authoritative source (official documentation, seminal papers, standard specifications)
+- 9: Highly relevant with comprehensive technical depth and accurate explanations
+- 7-8: Very relevant, covers key concepts with good technical details
+- 5-6: Moderately relevant, provides useful background or related information
+- 3-4: Somewhat relevant, mentions the topic but lacks depth
+- 0-2: Not relevant, off-topic or too general
+
+**Response Format (JSON only, one entry per id):**
+{{"results": [{{"id": <id>, "score": <float>, "reason": "<1-2 sentences in {language}>"}}, ...]}}
+
+**JSON Response:**"""
@@ -4,13 +4,14 @@ Google 검색을 위한 OpenAI LLM 클라이언트
 import asyncio
 import json
 import logging
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
 from openai import AsyncOpenAI
 
 from ..config.google_config import GoogleConfig
 from ..config import prompts
 from ..config import flags
+from ..utils.batching import split_by_token_budget
 
 logger = logging.getLogger(__name__)
 
@@ -18,18 +19,21 @@ logger = logging.getLogger(__name__)
 class GoogleLLMClient:
     """Google 검색을 위한 LLM 클라이언트"""
     
-    def __init__(self, api_key: str = None):
+    def __init__(self, api_key: str = None, client: Optional[AsyncOpenAI] = None):
         """
         초기화
         
         Args:
             api_key: OpenAI API 키 (None이면 환경 변수 사용)
+            client: 공유 AsyncOpenAI 클라이언트 (지정 시 api_key 무시)
         """
-        api_key = api_key or GoogleConfig.OPENAI_API_KEY
-        if not api_key:
-            raise ValueError("OPENAI_API_KEY가 설정되지 않았습니다.")
-        
-        self.client = AsyncOpenAI(api_key=api_key)
+        if client is not None:
+            self.client = client
+        else:
+            api_key = api_key or GoogleConfig.OPENAI_API_KEY
+            if not api_key:
+                raise ValueError("OPENAI_API_KEY가 설정되지 않았습니다.")
+            self.client = AsyncOpenAI(api_key=api_key, base_url=GoogleConfig.OPENAI_BASE_URL or None)
         self.model = GoogleConfig.LLM_MODEL
         self.temperature = GoogleConfig.LLM_TEMPERATURE
     
@@ -176,3 +180,116 @@ class GoogleLLMClient:
         except Exception as e:
             logger.error(f"❌ LLM 검증 실패: {e}")
             return {"score": 0.0, "reason": "검증 실패"}
+    
+    async def score_results_batch(
+        self,
+        lecture_summary: str,
+        results: List[Dict],
+        language: str
+    ) -> List[Dict[str, Any]]:
+        """
+        여러 검색 결과 일괄 검증 (LLM, listwise)
+        
+        결과 텍스트를 토큰 예산(BATCH_TOKEN_BUDGET)과 개수 상한(BATCH_MAX_ITEMS)에
+        맞춰 묶고, 묶음마다 한 번씩 병렬로 호출한다.
+        
+        Args:
+            lecture_summary: 강의 요약
+            results: 검색 결과 리스트 (title, link, snippet)
+            language: 응답 언어
+            
+        Returns:
+            [{"score": 8.5, "reason": "..."}, ...] (results와 같은 순서)
+        """
+        item_texts = [
+            prompts.BATCH_RESULT_ITEM_TEMPLATE.format(
+                id=idx,
+                title=item.get("title", ""),
+                url=item.get("link", ""),
+                snippet=item.get("snippet", "")
+            )
+            for idx, item in enumerate(results, 1)
+        ]
+        batches = split_by_token_budget(
+            list(range(len(results))),
+            item_texts,
+            token_budget=GoogleConfig.BATCH_TOKEN_BUDGET,
+            max_items=GoogleConfig.BATCH_MAX_ITEMS
+        )
+        
+        logger.info(f"📦 일괄 검증: 결과 {len(results)}개 → LLM 호출 {len(batches)}회")
+        
+        batch_scores = await asyncio.gather(*[
+            self._score_batch(
+                lecture_summary,
+                [(idx + 1, item_texts[idx]) for idx in batch],
+                language
+            )
+            for batch in batches
+        ])
+        
+        scores: Dict[int, Dict[str, Any]] = {}
+        for partial in batch_scores:
+            scores.update(partial)
+        
+        return [
+            scores.get(idx, {"score": 0.0, "reason": "검증 실패"})
+            for idx in range(1, len(results) + 1)
+        ]
+    
+    async def _score_batch(
+        self,
+        lecture_summary: str,
+        items: List[tuple],
+        language: str
+    ) -> Dict[int, Dict[str, Any]]:
+        """
+        검색 결과 묶음 1회 호출
+        
+        Args:
+            lecture_summary: 강의 요약
+            items: [(id, 결과 프롬프트 텍스트), ...]
+            language: 응답 언어
+            
+        Returns:
+            {id: {"score": float, "reason": str}} (실패 시 빈 dict)
+        """
+        prompt = prompts.BATCH_SCORING_PROMPT.format(
+            lecture_summary=lecture_summary,
+            results="\n".join(text for _, text in items),
+            language=language
+        )
+        
+        try:
+            response = await self.client.chat.completions.create(
+                model=self.model,
+                messages=[{"role": "user", "content": prompt}],
+                temperature=self.temperature,
+                max_tokens=GoogleConfig.MAX_TOKENS_SCORE_PER_ITEM * len(items) + 50,
+                response_format={"type": "json_object"}
+            )
+            
+            content = response.choices[0].message.content.strip()
+            entries = json.loads(content).get("results", [])
+            
+            valid_ids = {item_id for item_id, _ in items}
+            scores: Dict[int, Dict[str, Any]] = {}
+            for entry in entries:
+                try:
+                    item_id = int(entry.get("id"))
+                except (TypeError, ValueError):
+                    continue
+                if item_id in valid_ids:
+                    scores[item_id] = {
+                        "score": float(entry.get("score", 0.0)),
+                        "reason": entry.get("reason", "")
+                    }
+            
+            if len(scores) < len(items):
+                logger.warning(f"⚠️ 일괄 검증 응답 누락: {len(items) - len(scores)}개")
+            
+            return scores
+        
+        except Exception as e:
+            logger.error(f"❌ LLM 일괄 검증 실패: {e}")
+            return {}
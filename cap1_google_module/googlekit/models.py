@@ -54,6 +54,10 @@ class GoogleRequest(BaseModel):
         default=flags.VERIFY_GOOGLE_DEFAULT,
         description="LLM 검증 여부 (True: LLM, False: Heuristic)"
     )
+    verify_batch: bool = Field(
+        default=flags.VERIFY_BATCH_DEFAULT,
+        description="LLM 일괄 검증 여부 (True: 여러 결과를 한 번에 평가, False: 결과별 개별 호출)"
+    )
     
     # ━━━ 컨텍스트 필드 ━━━
     previous_summaries: List[PreviousSummary] = Field(
@@ -3,7 +3,7 @@ Google 검색 추천 서비스
 """
 import asyncio
 import logging
-from typing import List
+from typing import Any, List, Optional
 
 from .models import GoogleRequest, GoogleResponse, GoogleSearchResult
 from .api.google_client import GoogleSearchClient
@@ -14,6 +14,7 @@ from .utils import (
     filter_excluded_urls,
     heuristic_score,
     calculate_reason,
+    stage_timer,
 )
 from .config import flags
 from .config.google_config import GoogleConfig
@@ -24,13 +25,20 @@ logger = logging.getLogger(__name__)
 class GoogleService:
     """Google 검색 추천 서비스"""
     
-    def __init__(self):
-        """초기화"""
+    def __init__(self, openai_client: Optional[Any] = None, metrics: Optional[Any] = None):
+        """
+        초기화
+        
+        Args:
+            openai_client: 공유 AsyncOpenAI 클라이언트 (None이면 자체 생성)
+            metrics: 단계별 소요 시간 recorder (time_stage 제공, None이면 기록 안 함)
+        """
         GoogleConfig.validate()
         
         self.api_client = GoogleSearchClient()
-        self.llm_client = GoogleLLMClient()
+        self.llm_client = GoogleLLMClient(client=openai_client)
         self.config = GoogleConfig
+        self.metrics = metrics
     
     async def recommend_results(
         self,
@@ -49,7 +57,7 @@ class GoogleService:
         7. NO_SCORING 모드 체크
            - True: 검증 스킵, reason="search", score=10
            - False: 검증 단계 진행
-        8. 조건부 검증 (LLM or Heuristic)
+        8. 조건부 검증 (LLM 일괄 / LLM 개별 / Heuristic)
         9. min_score 필터링
         10. 점수 순 정렬 + top_k 반환
         
@@ -73,12 +81,13 @@ class GoogleService:
             for chunk in request.rag_context
         ]
         
-        keywords = await self.llm_client.generate_keywords(
-            lecture_summary=request.lecture_summary,
-            language=request.search_lang,
-            previous_summaries=prev_summaries,
-            rag_context=rag_chunks
-        )
+        with stage_timer(self.metrics, "google", "query_generation", self.config.LLM_MODEL):
+            keywords = await self.llm_client.generate_keywords(
+                lecture_summary=request.lecture_summary,
+                language=request.search_lang,
+                previous_summaries=prev_summaries,
+                rag_context=rag_chunks
+            )
         
         if not keywords:
             logger.warning("⚠️  키워드가 생성되지 않았습니다.")
@@ -98,7 +107,8 @@ class GoogleService:
             for keyword in keywords[:self.config.FANOUT]
         ]
         
-        search_results_list = await asyncio.gather(*search_tasks)
+        with stage_timer(self.metrics, "google", "search"):
+            search_results_list = await asyncio.gather(*search_tasks)
         
         # 결과 병합
         all_results = []
@@ -155,25 +165,37 @@ class GoogleService:
             return responses
         
         # 8. 검증 (LLM or Heuristic)
-        if request.verify_google:
+        if request.verify_google and request.verify_batch:
+            logger.info("📦 LLM 일괄 검증 시작")
+            with stage_timer(self.metrics, "google", "verification_batch", self.config.LLM_MODEL):
+                verified_results = await self._verify_with_llm_batch(
+                    top_results,
+                    request.lecture_summary,
+                    request.language,
+                    request.lecture_id,
+                    request.section_id
+                )
+        elif request.verify_google:
             logger.info("🤖 LLM 검증 시작")
-            verified_results = await self._verify_with_llm(
-                top_results,
-                request.lecture_summary,
-                request.language,
-                keywords,
-                request.lecture_id,
-                request.section_id
-            )
+            with stage_timer(self.metrics, "google", "verification", self.config.LLM_MODEL):
+                verified_results = await self._verify_with_llm(
+                    top_results,
+                    request.lecture_summary,
+                    request.language,
+                    keywords,
+                    request.lecture_id,
+                    request.section_id
+                )
         else:
             logger.info("📊 Heuristic 검증 시작")
-            verified_results = self._verify_with_heuristic(
-                top_results,
-                keywords,
-                request.language,
-                request.lecture_id,
-                request.section_id
-            )
+            with stage_timer(self.metrics, "google", "verification", "heuristic"):
+                verified_results = self._verify_with_heuristic(
+                    top_results,
+                    keywords,
+                    request.language,
+                    request.lecture_id,
+                    request.section_id
+                )
         
         logger.info(f"✅ 검증 완료: {len(verified_results)}개")
         
@@ -256,6 +278,53 @@ class GoogleService:
         
         return verified
     
+    async def _verify_with_llm_batch(
+        self,
+        results: List[dict],
+        lecture_summary: str,
+        language: str,
+        lecture_id: str,
+        section_id: int
+    ) -> List[GoogleResponse]:
+        """
+        LLM 일괄 검증 (토큰 예산 초과 시 여러 호출로 분할)
+        
+        Args:
+            results: 검색 결과 리스트
+            lecture_summary: 강의 요약
+            language: 응답 언어
+            lecture_id: 강의 ID
+            section_id: 섹션 ID
+            
+        Returns:
+            검증된 GoogleResponse 리스트
+        """
+        llm_results = await self.llm_client.score_results_batch(
+            lecture_summary=lecture_summary,
+            results=results,
+            language=language
+        )
+        
+        verified = []
+        for item, llm_result in zip(results, llm_results):
+            result_info = GoogleSearchResult(
+                url=item.get("link", ""),
+                title=item.get("title", ""),
+                snippet=item.get("snippet", "")[:300],
+                display_link=item.get("displayLink", ""),
+                lang=language
+            )
+            
+            verified.append(GoogleResponse(
+                lecture_id=lecture_id,
+                section_id=section_id,
+                search_result=result_info,
+                reason=llm_result["reason"],
+                score=llm_result["score"]
+            ))
+        
+        return verified
+    
     def _verify_with_heuristic(
         self,
         results: List[dict],
@@ -305,3 +374,11 @@ class GoogleService:
             ))
         
         return verified
+    
+    def cache_stats(self) -> dict:
+        """검색 결과 캐시 통계 (quota_saved 포함)"""
+        return {"search": self.api_client.cache_stats()}
+    
+    async def close(self):
+        """리소스 정리"""
+        await self.api_client.close()
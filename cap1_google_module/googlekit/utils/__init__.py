@@ -3,6 +3,8 @@ Utils 패키지 초기화
 """
 from .filters import deduplicate_results, rerank_results, filter_excluded_urls
 from .scoring import heuristic_score, calculate_reason
+from .batching import estimate_tokens, split_by_token_budget
+from .metrics import stage_timer
 
 __all__ = [
     "deduplicate_results",
@@ -10,4 +12,7 @@ __all__ = [
     "filter_excluded_urls",
     "heuristic_score",
     "calculate_reason",
+    "estimate_tokens",
+    "split_by_token_budget",
+    "stage_timer",
 ]
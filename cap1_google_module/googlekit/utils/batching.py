@@ -0,0 +1,57 @@
+"""
+일괄 검증용 후보 분할 유틸리티
+"""
+from typing import List, Sequence, TypeVar
+
+T = TypeVar("T")
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    프롬프트 토큰 수 추정 (tokenizer 없이 보수적으로 계산)
+    
+    영어는 약 4글자, 한글은 약 1~2글자가 1토큰이므로 3글자 ≈ 1토큰으로 본다.
+    
+    Args:
+        text: 프롬프트 텍스트
+        
+    Returns:
+        추정 토큰 수
+    """
+    return max(1, len(text) // 3)
+
+
+def split_by_token_budget(
+    items: Sequence[T],
+    item_texts: Sequence[str],
+    token_budget: int,
+    max_items: int
+) -> List[List[T]]:
+    """
+    후보 목록을 토큰 예산/개수 상한 안에서 묶음으로 분할 (순서 유지)
+    
+    Args:
+        items: 후보 리스트
+        item_texts: 후보별 프롬프트 텍스트 (items와 같은 순서)
+        token_budget: 묶음 하나의 후보 텍스트 토큰 예산
+        max_items: 묶음 하나의 최대 후보 수
+        
+    Returns:
+        List[List[T]]: 묶음 리스트 (예산을 넘는 단일 후보는 단독 묶음)
+    """
+    batches: List[List[T]] = []
+    current: List[T] = []
+    used = 0
+    
+    for item, text in zip(items, item_texts):
+        cost = estimate_tokens(text)
+        if current and (used + cost > token_budget or len(current) >= max_items):
+            batches.append(current)
+            current, used = [], 0
+        current.append(item)
+        used += cost
+    
+    if current:
+        batches.append(current)
+    
+    return batches
@@ -0,0 +1,211 @@
+"""
+Google 검색 결과 캐시 (TTL + stale-while-revalidate + 선택적 SQLite)
+"""
+import asyncio
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class SearchResultCache:
+    """
+    Google Custom Search 결과 캐시
+    
+    - fresh: 저장 후 ttl 초 이내 → 그대로 반환
+    - stale: ttl ~ ttl + stale_ttl 초 → 반환 후 백그라운드 갱신
+    - 그 이후: 미스
+    
+    path를 지정하면 SQLite(WAL) 파일에도 저장해 재시작 후에도 유지되고
+    여러 uvicorn 워커가 같은 결과를 공유한다.
+    """
+    
+    def __init__(
+        self,
+        ttl_seconds: float,
+        stale_ttl_seconds: float,
+        max_entries: int,
+        path: Optional[str] = None
+    ):
+        """
+        Args:
+            ttl_seconds: fresh 유지 시간 (초)
+            stale_ttl_seconds: ttl 이후 stale 결과를 반환할 추가 시간 (초)
+            max_entries: 메모리 캐시 최대 항목 수
+            path: SQLite 파일 경로 (None이면 메모리만 사용)
+        """
+        self.ttl_seconds = ttl_seconds
+        self.stale_ttl_seconds = stale_ttl_seconds
+        self.max_entries = max_entries
+        self.path = path
+        self._memory: "OrderedDict[str, Tuple[List[Dict[str, Any]], float]]" = OrderedDict()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self.counters: Dict[str, int] = {
+            "hits": 0,
+            "stale_hits": 0,
+            "misses": 0,
+            "api_calls": 0,
+            "api_errors": 0,
+            "refreshes": 0,
+        }
+    
+    @staticmethod
+    def make_key(query: str, lang: str, num: int) -> str:
+        """
+        캐시 키 생성 (검색어 공백/대소문자 정규화)
+        
+        Args:
+            query: 검색 쿼리
+            lang: 검색 언어
+            num: 결과 개수
+            
+        Returns:
+            캐시 키 문자열
+        """
+        normalized = " ".join(query.lower().split())
+        return json.dumps([normalized, lang, int(num)], ensure_ascii=False)
+    
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=10.0, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS google_search_cache "
+                "(key TEXT PRIMARY KEY, results TEXT NOT NULL, stored_at REAL NOT NULL)"
+            )
+            self._conn = conn
+        return self._conn
+    
+    def get(self, key: str) -> Optional[Tuple[List[Dict[str, Any]], bool]]:
+        """
+        캐시 조회 (메모리 → SQLite)
+        
+        Args:
+            key: make_key()로 만든 키
+            
+        Returns:
+            (결과 리스트, fresh 여부) 또는 None (미스/완전 만료)
+        """
+        entry = self._memory.get(key)
+        if entry is None and self.path:
+            entry = self._load(key)
+            if entry is not None:
+                self._remember(key, *entry)
+        return self._check(key, entry)
+    
+    async def get_async(self, key: str) -> Optional[Tuple[List[Dict[str, Any]], bool]]:
+        """
+        get()의 비동기 버전 (메모리 미스일 때만 SQLite 조회를 스레드에서 실행해 이벤트 루프를 막지 않음)
+        
+        Args:
+            key: make_key()로 만든 키
+            
+        Returns:
+            (결과 리스트, fresh 여부) 또는 None (미스/완전 만료)
+        """
+        entry = self._memory.get(key)
+        if entry is None and self.path:
+            entry = await asyncio.to_thread(self._load, key)
+            if entry is not None:
+                self._remember(key, *entry)
+        return self._check(key, entry)
+    
+    def _check(
+        self, key: str, entry: Optional[Tuple[List[Dict[str, Any]], float]]
+    ) -> Optional[Tuple[List[Dict[str, Any]], bool]]:
+        if entry is None:
+            return None
+        
+        results, stored_at = entry
+        age = time.time() - stored_at
+        if age > self.ttl_seconds + self.stale_ttl_seconds:
+            self._memory.pop(key, None)
+            return None
+        
+        self._memory.move_to_end(key)
+        return [dict(item) for item in results], age <= self.ttl_seconds
+    
+    def set(self, key: str, results: List[Dict[str, Any]]):
+        """
+        캐시 저장 (메모리 + SQLite)
+        
+        Args:
+            key: make_key()로 만든 키
+            results: 정규화된 검색 결과 리스트
+        """
+        stored_at = time.time()
+        self._remember(key, results, stored_at)
+        if self.path:
+            self._store(key, results, stored_at)
+    
+    async def set_async(self, key: str, results: List[Dict[str, Any]]):
+        """
+        set()의 비동기 버전 (SQLite 쓰기를 스레드에서 실행)
+        
+        Args:
+            key: make_key()로 만든 키
+            results: 정규화된 검색 결과 리스트
+        """
+        stored_at = time.time()
+        self._remember(key, results, stored_at)
+        if self.path:
+            await asyncio.to_thread(self._store, key, results, stored_at)
+    
+    def _store(self, key: str, results: List[Dict[str, Any]], stored_at: float):
+        try:
+            with self._lock:
+                self._connect().execute(
+                    "INSERT OR REPLACE INTO google_search_cache (key, results, stored_at) VALUES (?, ?, ?)",
+                    (key, json.dumps(results, ensure_ascii=False), stored_at)
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"⚠️ Google 검색 캐시 저장 실패: {e}")
+    
+    def _load(self, key: str) -> Optional[Tuple[List[Dict[str, Any]], float]]:
+        try:
+            with self._lock:
+                row = self._connect().execute(
+                    "SELECT results, stored_at FROM google_search_cache WHERE key = ?", (key,)
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"⚠️ Google 검색 캐시 조회 실패: {e}")
+            return None
+        if row is None:
+            return None
+        return json.loads(row[0]), row[1]
+    
+    def _remember(self, key: str, results: List[Dict[str, Any]], stored_at: float):
+        if self.max_entries <= 0:
+            return
+        self._memory[key] = (results, stored_at)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        캐시 통계
+        
+        Returns:
+            카운터 + quota_saved (캐시로 대신한 API 호출 수) + 메모리 항목 수
+        """
+        data: Dict[str, Any] = dict(self.counters)
+        data["quota_saved"] = self.counters["hits"] + self.counters["stale_hits"]
+        data["entries"] = len(self._memory)
+        data["persistent"] = bool(self.path)
+        return data
+    
+    def close(self):
+        """SQLite 연결 종료"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -4,7 +4,6 @@ OpenAlexKit - 학술 논문 검색 및 추천 모듈
 LiveNote 프로젝트를 위한 OpenAlex API 기반 논문 추천 시스템
 """
 
-from .service import OpenAlexService
 from .models import (
     OpenAlexRequest,
     OpenAlexResponse,
@@ -23,3 +22,11 @@ __all__ = [
     "RAGChunk",
     "PreviousSectionSummary",
 ]
+
+
+def __getattr__(name):
+    # 서비스는 openai/httpx 등 무거운 의존성을 끌어오므로 처음 접근할 때 import (models만 쓰는 쪽은 가볍게)
+    if name == "OpenAlexService":
+        from .service import OpenAlexService
+        return OpenAlexService
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,11 +2,12 @@
 OpenAlex API 클라이언트
 """
 import logging
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 import httpx
 
 from ..config.openalex_config import OpenAlexConfig
 from ..utils.parser import parse_abstract_inverted_index
+from ..utils.cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
@@ -14,9 +15,9 @@ logger = logging.getLogger(__name__)
 class OpenAlexAPIClient:
     """OpenAlex API 클라이언트"""
     
-    BASE_URL = "https://api.openalex.org"
-    
-    def __init__(self):
+    def __init__(self, base_url: Optional[str] = None):
+        # 모의 서버 등 다른 주소 사용 시 OPENALEX_BASE_URL 또는 base_url로 지정
+        self.base_url = (base_url or OpenAlexConfig.BASE_URL).rstrip("/")
         self.http_client = httpx.AsyncClient(
             timeout=OpenAlexConfig.TIMEOUT,
             limits=httpx.Limits(
@@ -25,6 +26,13 @@ class OpenAlexAPIClient:
             ),
             http2=True  # HTTP/2 활성화 (멀티플렉싱)
         )
+        # 검색 결과 캐시 (파싱된 논문, exclude_ids 적용 전)
+        self.search_cache = TTLCache(
+            ttl_seconds=OpenAlexConfig.SEARCH_CACHE_TTL,
+            max_entries=OpenAlexConfig.SEARCH_CACHE_MAX_ENTRIES if OpenAlexConfig.SEARCH_CACHE_TTL > 0 else 0,
+            path=OpenAlexConfig.SEARCH_CACHE_PATH or None,
+            table="openalex_search_cache"
+        )
     
     async def search_papers(
         self, 
@@ -65,6 +73,7 @@ class OpenAlexAPIClient:
             # 정렬 옵션 결정
             if sort_by == "cited_by_count":
                 sort_param = "cited_by_count:desc"
+                per_page = OpenAlexConfig.PER_PAGE
             elif sort_by == "hybrid":
                 # Hybrid 모드: 더 많은 논문 가져온 후 재정렬
                 sort_param = "relevance_score:desc"
@@ -73,32 +82,18 @@ class OpenAlexAPIClient:
                 sort_param = "relevance_score:desc"
                 per_page = OpenAlexConfig.PER_PAGE
             
-            # OpenAlex API 호출
-            params = {
-                "search": search_str,
-                "filter": ",".join(filters),
-                "sort": sort_param,
-                "per_page": per_page if sort_by == "hybrid" else OpenAlexConfig.PER_PAGE
-            }
-            
-            logger.info(f"🔍 OpenAlex API 요청:")
-            logger.info(f"   ├─ URL: {self.BASE_URL}/works")
-            logger.info(f"   ├─ search: \"{search_str}\"")
-            logger.info(f"   ├─ filters: {filters}")
-            logger.info(f"   ├─ sort: {sort_param}")
-            logger.info(f"   └─ per_page: {params['per_page']}")
-            
-            response = await self.http_client.get(
-                f"{self.BASE_URL}/works",
-                params=params
-            )
-            response.raise_for_status()
-            data = response.json()
-            
-            works = data.get("results", [])
-            logger.info(f"📄 OpenAlex 원본 검색: {len(works)}개")
+            # 캐시 조회 (exclude_ids는 요청마다 다르므로 조회 후 적용)
+            cache_key = self._search_cache_key(search_str, year_from, sort_param, per_page)
+            parsed = await self.search_cache.get_async(cache_key)
+            if parsed is not None:
+                logger.info(f"⚡ OpenAlex 검색 캐시 적중: \"{search_str}\" ({len(parsed)}개)")
+            else:
+                parsed = await self._fetch_papers(search_str, filters, sort_param, per_page)
+                if parsed is None:
+                    return []
+                await self.search_cache.set_async(cache_key, parsed)
             
-            if len(works) == 0:
+            if len(parsed) == 0:
                 logger.warning(f"⚠️  검색 결과 없음. 가능한 원인:")
                 logger.warning(f"   1. 검색어가 너무 구체적: \"{search_str}\"")
                 logger.warning(f"   2. TOKEN 수가 많음: {len(tokens)}개")
@@ -110,11 +105,9 @@ class OpenAlexAPIClient:
             papers = []
             exclude_tokens = [e.lower() for e in (exclude_ids or [])]
             
-            for work in works:
-                paper = self._parse_paper(work)
-                
-                if paper is None:
-                    continue
+            for cached_paper in parsed:
+                # 캐시 항목 보호 (재랭킹 단계에서 dict를 수정함)
+                paper = dict(cached_paper)
                 
                 # 제외 ID/URL/DOI 체크 (부분 포함 매칭)
                 if exclude_tokens:
@@ -141,15 +134,88 @@ class OpenAlexAPIClient:
             logger.info(f"✅ OpenAlex 파싱 완료: {len(papers)}개")
             return papers
             
+        except Exception as e:
+            logger.error(f"❌ OpenAlex API 호출 실패: {e}")
+            return []
+    
+    @staticmethod
+    def _search_cache_key(
+        search_str: str,
+        year_from: int,
+        sort_param: str,
+        per_page: int
+    ) -> Tuple[str, int, str, int]:
+        """
+        검색 캐시 키 생성 (공백/대소문자 정규화)
+        
+        Args:
+            search_str: 검색 문자열
+            year_from: 출판 연도 필터
+            sort_param: OpenAlex 정렬 파라미터
+            per_page: 페이지당 결과 수
+            
+        Returns:
+            (정규화된 검색 문자열, year_from, sort_param, per_page)
+        """
+        normalized = " ".join(search_str.lower().split())
+        return (normalized, int(year_from), sort_param, int(per_page))
+    
+    async def _fetch_papers(
+        self,
+        search_str: str,
+        filters: List[str],
+        sort_param: str,
+        per_page: int
+    ) -> Optional[List[Dict]]:
+        """
+        OpenAlex /works 호출 + 파싱
+        
+        Args:
+            search_str: 검색 문자열
+            filters: 필터 리스트
+            sort_param: 정렬 파라미터
+            per_page: 페이지당 결과 수
+            
+        Returns:
+            List[Dict]: 파싱된 논문 리스트 (API 오류 시 None → 캐시하지 않음)
+        """
+        params = {
+            "search": search_str,
+            "filter": ",".join(filters),
+            "sort": sort_param,
+            "per_page": per_page
+        }
+        
+        logger.info(f"🔍 OpenAlex API 요청:")
+        logger.info(f"   ├─ URL: {self.base_url}/works")
+        logger.info(f"   ├─ search: \"{search_str}\"")
+        logger.info(f"   ├─ filters: {filters}")
+        logger.info(f"   ├─ sort: {sort_param}")
+        logger.info(f"   └─ per_page: {per_page}")
+        
+        try:
+            response = await self.http_client.get(
+                f"{self.base_url}/works",
+                params=params
+            )
+            response.raise_for_status()
+            data = response.json()
         except httpx.TimeoutException:
             logger.error("❌ OpenAlex API 타임아웃")
-            return []
+            return None
         except httpx.HTTPStatusError as e:
             logger.error(f"❌ OpenAlex API HTTP 오류: {e.response.status_code}")
-            return []
-        except Exception as e:
-            logger.error(f"❌ OpenAlex API 호출 실패: {e}")
-            return []
+            return None
+        
+        works = data.get("results", [])
+        logger.info(f"📄 OpenAlex 원본 검색: {len(works)}개")
+        
+        papers = []
+        for work in works:
+            paper = self._parse_paper(work)
+            if paper is not None:
+                papers.append(paper)
+        return papers
     
     def _parse_paper(self, work: Dict) -> Optional[Dict]:
         """
@@ -211,5 +277,6 @@ class OpenAlexAPIClient:
             return None
     
     async def close(self):
-        """HTTP 클라이언트 종료"""
+        """HTTP 클라이언트/검색 캐시 종료"""
         await self.http_client.aclose()
+        self.search_cache.close()
@@ -13,10 +13,15 @@ class OpenAlexConfig:
     
     # ━━━ OpenAI API ━━━
     OPENAI_API_KEY: str = os.getenv("OPENAI_API_KEY", "")
+    OPENAI_BASE_URL: str = os.getenv("OPENAI_BASE_URL", "")  # 비우면 공식 주소 (모의 서버/프록시 사용 시 지정)
     
     # ━━━ OpenAlex API ━━━
+    BASE_URL: str = os.getenv("OPENALEX_BASE_URL", "https://api.openalex.org")
     TIMEOUT: int = 15  # HTTP 타임아웃 (초) - 20→15 (25% 감소)
     PER_PAGE: int = 40  # 페이지당 결과 수 - 50→40 (API 응답 속도 개선) 응답 속도 개선의 핵심
+    SEARCH_CACHE_TTL: int = 6 * 3600  # 검색 결과 캐시 유지 시간 (초, 0이면 캐시 끔)
+    SEARCH_CACHE_MAX_ENTRIES: int = 1024  # 검색 결과 캐시 최대 항목 수
+    SEARCH_CACHE_PATH: str = os.getenv("OPENALEX_SEARCH_CACHE_PATH", "")  # SQLite 파일 (비우면 메모리만, 워커 간 공유)
     
     # ━━━ 기본값 ━━━
     DEFAULT_LANGUAGE: str = "ko"
@@ -40,6 +45,11 @@ class OpenAlexConfig:
     # ━━━ 병렬 처리 ━━━
     VERIFY_CONCURRENCY: int = 20  # 15→20 (33% 증가, YouTube와 동일)
     
+    # ━━━ 일괄 검증 (verify_batch) ━━━
+    BATCH_MAX_ITEMS: int = 13          # LLM 호출 1회당 최대 논문 수 (CARD_LIMIT과 동일 → 보통 1회)
+    BATCH_TOKEN_BUDGET: int = 6000     # LLM 호출 1회당 논문 텍스트 토큰 예산 (초과 시 분할)
+    MAX_TOKENS_SCORE_PER_ITEM: int = 80  # 논문 1개당 응답 토큰 (score + reason)
+    
     @classmethod
     def validate(cls):
         """설정 검증"""
@@ -49,6 +59,9 @@ class OpenAlexConfig:
         if cls.CARD_LIMIT < 1:
             raise ValueError(f"CARD_LIMIT은 1 이상이어야 합니다: {cls.CARD_LIMIT}")
         
+        if cls.BATCH_MAX_ITEMS < 1:
+            raise ValueError(f"BATCH_MAX_ITEMS는 1 이상이어야 합니다: {cls.BATCH_MAX_ITEMS}")
+        
         if cls.VERIFY_CONCURRENCY < 1:
             raise ValueError(
                 f"VERIFY_CONCURRENCY는 1 이상이어야 합니다: {cls.VERIFY_CONCURRENCY}"
@@ -59,3 +59,37 @@ Return JSON (reason: one sentence, no line breaks, in {language}):
 {{"score": <number>, "reason": "clear one-sentence evaluation"}}
 """
 
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 프롬프트 3: 논문 일괄 검증 (verify_batch)
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+BATCH_PAPER_ITEM_TEMPLATE = """[id={id}]
+Title: {title}
+Abstract: {abstract}
+Publication year: {year}
+Citation count: {cited_by_count}
+"""
+
+BATCH_SCORE_PAPER_PROMPT = """Current section summary: {section_summary}
+
+Keywords: {keywords}
+
+Candidate papers:
+{papers}
+
+For EACH candidate paper, decide whether it directly covers the core concept discussed in the lecture.
+Evaluate every paper independently (do not rank them against each other).
+
+Scoring (strict criteria):
+- 10: Seminal/foundational paper that FIRST introduced the concept
+   - Highly cited (typically >10,000) AND matches core concept perfectly
+- 9: Directly addresses core concept with clear methodology/application
+- 7-8: Covers core concept but partially or indirectly
+- 4-6: Related background but slightly off-topic
+- 1-3: Only keyword overlap, content unrelated
+
+Return JSON with one entry per candidate id (reason: one sentence, no line breaks, in {language}):
+{{"results": [{{"id": <id>, "score": <number>, "reason": "clear one-sentence evaluation"}}, ...]}}
+"""
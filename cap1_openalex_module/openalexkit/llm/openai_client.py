@@ -1,14 +1,16 @@
 """
 OpenAI API 클라이언트 (LLM)
 """
+import asyncio
 import json
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
 import httpx
 from openai import AsyncOpenAI
 
 from ..config.openalex_config import OpenAlexConfig
 from ..config import prompts
+from ..utils.batching import split_by_token_budget
 
 logger = logging.getLogger(__name__)
 
@@ -16,7 +18,12 @@ logger = logging.getLogger(__name__)
 class OpenAIClient:
     """OpenAI API 클라이언트 (쿼리 생성 + 논문 검증)"""
     
-    def __init__(self):
+    def __init__(self, client: Optional[AsyncOpenAI] = None):
+        # 서버에서 공유 클라이언트를 주입하면 별도 연결 풀을 만들지 않음
+        if client is not None:
+            self.client = client
+            return
+        
         # HTTP 클라이언트 설정
         http_client = httpx.AsyncClient(
             http2=True,
@@ -26,6 +33,7 @@ class OpenAIClient:
         
         self.client = AsyncOpenAI(
             api_key=OpenAlexConfig.OPENAI_API_KEY,
+            base_url=OpenAlexConfig.OPENAI_BASE_URL or None,
             http_client=http_client
         )
     
@@ -182,3 +190,131 @@ class OpenAIClient:
         except Exception as e:
             logger.error(f"❌ LLM 논문 검증 실패: {e}")
             return {"score": 5.0, "reason": "검증 실패 (API 오류)"}
+    
+    async def score_papers_batch(
+        self,
+        papers: List[Dict],
+        section_summary: str,
+        keywords: str,
+        language: str = "Korean"
+    ) -> List[Dict[str, Any]]:
+        """
+        여러 논문 일괄 검증 (LLM, listwise)
+        
+        논문 텍스트를 토큰 예산(BATCH_TOKEN_BUDGET)과 개수 상한(BATCH_MAX_ITEMS)에
+        맞춰 묶고, 묶음마다 한 번씩 병렬로 호출한다.
+        
+        Args:
+            papers: 논문 리스트 (title, abstract, year, cited_by_count)
+            section_summary: 현재 섹션 요약
+            keywords: 검색 키워드
+            language: 응답 언어
+            
+        Returns:
+            List[{"score": float, "reason": str}]: papers와 같은 순서
+        """
+        item_texts = [
+            prompts.BATCH_PAPER_ITEM_TEMPLATE.format(
+                id=idx,
+                title=self._clean(paper.get("title", "")),
+                abstract=self._clean(paper.get("abstract", ""))[:OpenAlexConfig.ABSTRACT_MAX_LENGTH],
+                year=paper.get("year", "N/A"),
+                cited_by_count=paper.get("cited_by_count", 0)
+            )
+            for idx, paper in enumerate(papers, 1)
+        ]
+        batches = split_by_token_budget(
+            list(range(len(papers))),
+            item_texts,
+            token_budget=OpenAlexConfig.BATCH_TOKEN_BUDGET,
+            max_items=OpenAlexConfig.BATCH_MAX_ITEMS
+        )
+        
+        logger.info(f"📦 일괄 검증: 논문 {len(papers)}개 → LLM 호출 {len(batches)}회")
+        
+        section_clean = self._clean(section_summary)
+        batch_results = await asyncio.gather(*[
+            self._score_batch(
+                [(idx + 1, item_texts[idx]) for idx in batch],
+                section_clean,
+                keywords,
+                language
+            )
+            for batch in batches
+        ])
+        
+        scores: Dict[int, Dict[str, Any]] = {}
+        for result in batch_results:
+            scores.update(result)
+        
+        return [
+            scores.get(idx, {"score": 5.0, "reason": "검증 실패 (일괄 응답 누락)"})
+            for idx in range(1, len(papers) + 1)
+        ]
+    
+    async def _score_batch(
+        self,
+        items: List[tuple],
+        section_summary: str,
+        keywords: str,
+        language: str
+    ) -> Dict[int, Dict[str, Any]]:
+        """
+        논문 묶음 1회 호출
+        
+        Args:
+            items: [(id, 논문 프롬프트 텍스트), ...]
+            section_summary: 정제된 섹션 요약
+            keywords: 검색 키워드
+            language: 응답 언어
+            
+        Returns:
+            {id: {"score": float, "reason": str}} (실패 시 빈 dict)
+        """
+        prompt = prompts.BATCH_SCORE_PAPER_PROMPT.format(
+            section_summary=section_summary,
+            keywords=keywords,
+            papers="\n".join(text for _, text in items),
+            language=language
+        )
+        
+        try:
+            response = await self.client.chat.completions.create(
+                model=OpenAlexConfig.LLM_MODEL,
+                messages=[
+                    {"role": "user", "content": prompt}
+                ],
+                temperature=OpenAlexConfig.LLM_TEMPERATURE,
+                max_tokens=OpenAlexConfig.MAX_TOKENS_SCORE_PER_ITEM * len(items) + 50,
+                response_format={"type": "json_object"}
+            )
+            
+            content = response.choices[0].message.content.strip()
+            entries = json.loads(content).get("results", [])
+            
+            valid_ids = {item_id for item_id, _ in items}
+            results: Dict[int, Dict[str, Any]] = {}
+            for entry in entries:
+                try:
+                    item_id = int(entry.get("id"))
+                except (TypeError, ValueError):
+                    continue
+                if item_id in valid_ids:
+                    results[item_id] = {
+                        "score": float(entry.get("score", 5.0)),
+                        "reason": entry.get("reason", "검증 완료")
+                    }
+            
+            if len(results) < len(items):
+                logger.warning(f"⚠️  일괄 검증 응답 누락: {len(items) - len(results)}개")
+            
+            return results
+            
+        except Exception as e:
+            logger.error(f"❌ LLM 일괄 검증 실패: {e}")
+            return {}
+    
+    @staticmethod
+    def _clean(text: str) -> str:
+        """프롬프트용 텍스트 정제 (JSON 깨짐 방지)"""
+        return (text or "").replace("\n", " ").replace('"', "'").strip()
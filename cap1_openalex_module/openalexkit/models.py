@@ -34,6 +34,10 @@ class OpenAlexRequest(BaseModel):
         default=True, 
         description="LLM 검증 여부 (True: LLM, False: Heuristic)"
     )
+    verify_batch: bool = Field(
+        default=False,
+        description="LLM 일괄 검증 여부 (True: 여러 논문을 한 번에 평가, False: 논문별 개별 호출)"
+    )
     
     # ━━━ 컨텍스트 필드 ━━━
     previous_summaries: List[PreviousSectionSummary] = Field(
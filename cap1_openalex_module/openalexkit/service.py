@@ -3,7 +3,7 @@ OpenAlexKit 핵심 서비스
 """
 import asyncio
 import logging
-from typing import List
+from typing import Any, List, Optional
 
 from .models import OpenAlexRequest, OpenAlexResponse, PaperInfo
 from .config.openalex_config import OpenAlexConfig
@@ -11,6 +11,7 @@ from .config import flags
 from .api.openalex_client import OpenAlexAPIClient
 from .llm.openai_client import OpenAIClient
 from .utils.filters import deduplicate_papers, rerank_papers
+from .utils.metrics import stage_timer
 
 logger = logging.getLogger(__name__)
 
@@ -18,14 +19,21 @@ logger = logging.getLogger(__name__)
 class OpenAlexService:
     """OpenAlex 논문 추천 서비스"""
     
-    def __init__(self):
-        """서비스 초기화"""
+    def __init__(self, openai_client: Optional[Any] = None, metrics: Optional[Any] = None):
+        """
+        서비스 초기화
+        
+        Args:
+            openai_client: 공유 AsyncOpenAI 클라이언트 (None이면 자체 생성)
+            metrics: 단계별 소요 시간 recorder (time_stage 보유, None이면 기록 안 함)
+        """
         # 설정 검증
         OpenAlexConfig.validate()
         
         # 클라이언트 초기화
         self.api_client = OpenAlexAPIClient()
-        self.llm_client = OpenAIClient()
+        self.llm_client = OpenAIClient(client=openai_client)
+        self.metrics = metrics
     
     async def recommend_papers(
         self, 
@@ -40,6 +48,7 @@ class OpenAlexService:
         3. 논문 파싱 + 중복 제거 + 재랭킹
         4. 상위 N개 선택 (CARD_LIMIT)
         5. 조건부 검증:
+           - verify_openalex=True, verify_batch=True: LLM 일괄 검증
            - verify_openalex=True: LLM 병렬 검증
            - verify_openalex=False: Heuristic 스코어링
         6. 점수 순 정렬 → top_k 반환
@@ -62,7 +71,8 @@ class OpenAlexService:
             logger.info(f"   ├─ previous_summaries: {len(request.previous_summaries)}개")
             logger.info(f"   └─ rag_context: {len(request.rag_context)}개")
             
-            query = await self._generate_search_query(request)
+            with stage_timer(self.metrics, "openalex", "query_generation", OpenAlexConfig.LLM_MODEL):
+                query = await self._generate_search_query(request)
             
             tokens = query.get('tokens', [])
             logger.info(f"📝 생성된 쿼리:")
@@ -85,11 +95,12 @@ class OpenAlexService:
             logger.info(f"   ├─ sort_by: {request.sort_by}")
             logger.info(f"   └─ exclude_ids: {len(request.exclude_ids)}개")
             
-            papers = await self.api_client.search_papers(
-                query=query,
-                exclude_ids=request.exclude_ids,
-                sort_by=request.sort_by
-            )
+            with stage_timer(self.metrics, "openalex", "search"):
+                papers = await self.api_client.search_papers(
+                    query=query,
+                    exclude_ids=request.exclude_ids,
+                    sort_by=request.sort_by
+                )
             
             if not papers:
                 logger.warning(f"⚠️  검색된 논문이 없습니다 (tokens={tokens})")
@@ -141,17 +152,27 @@ class OpenAlexService:
                 return results
             
             # 5. 조건부 검증
-            if request.verify_openalex:
+            if request.verify_openalex and request.verify_batch:
+                # LLM 일괄 검증 (여러 논문을 한 번에 평가)
+                logger.info(f"📦 LLM 일괄 검증 시작:")
+                logger.info(f"   ├─ 대상: {len(papers)}개")
+                logger.info(f"   ├─ 호출당 최대: {OpenAlexConfig.BATCH_MAX_ITEMS}개")
+                logger.info(f"   └─ 모델: {OpenAlexConfig.LLM_MODEL}")
+                with stage_timer(self.metrics, "openalex", "verification_batch", OpenAlexConfig.LLM_MODEL):
+                    results = await self._verify_papers_batch(papers, request, query)
+            elif request.verify_openalex:
                 # LLM 병렬 검증
                 logger.info(f"✨ LLM 병렬 검증 시작:")
                 logger.info(f"   ├─ 대상: {len(papers)}개")
                 logger.info(f"   ├─ 동시성: {OpenAlexConfig.VERIFY_CONCURRENCY}")
                 logger.info(f"   └─ 모델: {OpenAlexConfig.LLM_MODEL}")
-                results = await self._verify_papers_parallel(papers, request, query)
+                with stage_timer(self.metrics, "openalex", "verification", OpenAlexConfig.LLM_MODEL):
+                    results = await self._verify_papers_parallel(papers, request, query)
             else:
                 # Heuristic 스코어링
                 logger.info(f"🔢 Heuristic 스코어링 시작 ({len(papers)}개)")
-                results = self._heuristic_score(papers, query, request)
+                with stage_timer(self.metrics, "openalex", "verification", "heuristic"):
+                    results = self._heuristic_score(papers, query, request)
             
             # 6. 점수 필터링 (min_score 이상만 선택)
             filtered_results = [r for r in results if r.score >= request.min_score]
@@ -276,6 +297,46 @@ class OpenAlexService:
         
         return verified
     
+    async def _verify_papers_batch(
+        self, 
+        papers: List[dict], 
+        request: OpenAlexRequest,
+        query: dict
+    ) -> List[OpenAlexResponse]:
+        """
+        일괄 LLM 검증 (토큰 예산 초과 시 여러 호출로 분할)
+        
+        Args:
+            papers: 논문 리스트
+            request: OpenAlexRequest
+            query: 검색 쿼리 (tokens 포함)
+            
+        Returns:
+            List[OpenAlexResponse]: 검증된 논문 리스트
+        """
+        keywords = ", ".join(query.get("tokens", []))
+        scores = await self.llm_client.score_papers_batch(
+            papers=papers,
+            section_summary=request.section_summary,
+            keywords=keywords,
+            language=request.language
+        )
+        
+        verified = [
+            OpenAlexResponse(
+                lecture_id=request.lecture_id,
+                section_id=request.section_id,
+                paper_info=self._parse_paper_info(paper),
+                reason=result.get("reason", "검증 완료"),
+                score=result.get("score", 5.0)
+            )
+            for paper, result in zip(papers, scores)
+        ]
+        
+        logger.info(f"✅ 일괄 검증 완료: {len(verified)}개")
+        
+        return verified
+    
     async def _verify_single_paper(
         self, 
         paper: dict, 
@@ -406,6 +467,10 @@ class OpenAlexService:
             authors=paper.get("authors", [])
         )
     
+    def cache_stats(self) -> dict:
+        """검색 결과 캐시 통계"""
+        return {"search": self.api_client.search_cache.stats()}
+    
     async def close(self):
         """리소스 정리"""
         await self.api_client.close()
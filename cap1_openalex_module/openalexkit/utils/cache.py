@@ -0,0 +1,207 @@
+"""
+검색 결과 TTL 캐시
+"""
+import asyncio
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class TTLCache:
+    """
+    TTL + 최대 항목 수 기반 메모리 캐시 (LRU 제거) + 선택적 SQLite 계층
+    
+    같은 토큰 조합이 여러 섹션/강의에서 반복되므로 OpenAlex 검색 결과를
+    짧게 보관해 API 호출을 줄인다. 단일 이벤트 루프에서만 사용한다.
+    path를 지정하면 SQLite(WAL) 파일에도 저장해 같은 파일을 쓰는 여러 uvicorn 워커가
+    결과를 공유한다 (메모리 미스 시 조회 후 메모리로 승격).
+    """
+    
+    def __init__(
+        self,
+        ttl_seconds: float,
+        max_entries: int,
+        path: Optional[str] = None,
+        table: str = "ttl_cache",
+        serialize: Callable[[Any], str] = json.dumps,
+        deserialize: Callable[[str], Any] = json.loads
+    ):
+        """
+        Args:
+            ttl_seconds: 항목 유지 시간 (초)
+            max_entries: 최대 항목 수 (초과 시 가장 오래 사용하지 않은 항목 제거, 0이면 캐시 끔)
+            path: SQLite 파일 경로 (None이면 메모리만 사용)
+            table: SQLite 테이블 이름 (한 파일에 캐시 여러 개를 둘 때 구분)
+            serialize: 값 → 문자열 (SQLite 저장용)
+            deserialize: 문자열 → 값
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.path = path if max_entries > 0 else None
+        self.table = table
+        self.serialize = serialize
+        self.deserialize = deserialize
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+    
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        캐시 조회 (메모리 → SQLite)
+        
+        Args:
+            key: 캐시 키
+            
+        Returns:
+            저장된 값 (없거나 만료되면 None)
+        """
+        found, value = self._memory_get(key)
+        if found:
+            return value
+        return self._promote(key, self._load(key) if self.path else None)
+    
+    async def get_async(self, key: Hashable) -> Optional[Any]:
+        """
+        get()의 비동기 버전 (메모리 미스일 때만 SQLite 조회를 스레드에서 실행해 이벤트 루프를 막지 않음)
+        
+        Args:
+            key: 캐시 키
+            
+        Returns:
+            저장된 값 (없거나 만료되면 None)
+        """
+        found, value = self._memory_get(key)
+        if found:
+            return value
+        return self._promote(key, await asyncio.to_thread(self._load, key) if self.path else None)
+    
+    def _memory_get(self, key: Hashable) -> tuple:
+        entry = self._entries.get(key)
+        if entry is not None and entry[1] > time.monotonic():
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return True, entry[0]
+        if entry is not None:
+            del self._entries[key]
+        return False, None
+    
+    def _promote(self, key: Hashable, loaded: Optional[tuple]) -> Optional[Any]:
+        if loaded is not None:
+            value, expires_at = loaded
+            self._remember(key, value, time.monotonic() + (expires_at - time.time()))
+            self.disk_hits += 1
+            return value
+        self.misses += 1
+        return None
+    
+    def set(self, key: Hashable, value: Any):
+        """
+        캐시 저장 (메모리 + SQLite)
+        
+        Args:
+            key: 캐시 키
+            value: 저장할 값
+        """
+        if self.max_entries <= 0:
+            return
+        self._remember(key, value, time.monotonic() + self.ttl_seconds)
+        if self.path:
+            self._store(key, value)
+    
+    async def set_async(self, key: Hashable, value: Any):
+        """
+        set()의 비동기 버전 (SQLite 저장을 스레드에서 실행)
+        
+        Args:
+            key: 캐시 키
+            value: 저장할 값
+        """
+        if self.max_entries <= 0:
+            return
+        self._remember(key, value, time.monotonic() + self.ttl_seconds)
+        if self.path:
+            await asyncio.to_thread(self._store, key, value)
+    
+    def _store(self, key: Hashable, value: Any):
+        try:
+            raw = self.serialize(value)
+            with self._lock:
+                self._connect().execute(
+                    f"INSERT OR REPLACE INTO {self.table} (key, value, expires_at) VALUES (?, ?, ?)",
+                    (self._disk_key(key), raw, time.time() + self.ttl_seconds)
+                )
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            logger.warning(f"⚠️ 캐시 저장 실패 ({self.table}): {e}")
+    
+    def _remember(self, key: Hashable, value: Any, expires_at: float):
+        self._entries[key] = (value, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+    
+    @staticmethod
+    def _disk_key(key: Hashable) -> str:
+        return json.dumps(list(key) if isinstance(key, tuple) else key, ensure_ascii=False)
+    
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=10.0, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.table} "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+            self._conn = conn
+        return self._conn
+    
+    def _load(self, key: Hashable) -> Optional[tuple]:
+        try:
+            with self._lock:
+                row = self._connect().execute(
+                    f"SELECT value, expires_at FROM {self.table} WHERE key = ?", (self._disk_key(key),)
+                ).fetchone()
+            if row is None or row[1] <= time.time():
+                return None
+            return self.deserialize(row[0]), row[1]
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            logger.warning(f"⚠️ 캐시 조회 실패 ({self.table}): {e}")
+            return None
+    
+    def clear(self):
+        """전체 항목 제거 (메모리만, 다른 워커와 공유하는 SQLite 항목은 TTL로 만료)"""
+        self._entries.clear()
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        적중/미스 통계
+        
+        Returns:
+            {"entries", "hits", "disk_hits", "misses", "hit_ratio", "persistent"}
+        """
+        lookups = self.hits + self.disk_hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_ratio": (self.hits + self.disk_hits) / lookups if lookups else 0.0,
+            "persistent": bool(self.path),
+        }
+    
+    def close(self):
+        """SQLite 연결 종료"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
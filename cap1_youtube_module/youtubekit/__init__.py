@@ -4,7 +4,6 @@ YouTubeKit - 강의 섹션 맞춤 유튜브 추천 모듈
 LiveNote 프로젝트를 위한 YouTube Data API 기반 동영상 추천 시스템
 """
 
-from .service import YouTubeService
 from .models import (
     YouTubeRequest,
     YouTubeResponse,
@@ -24,3 +23,10 @@ __all__ = [
     "RAGChunk",
 ]
 
+
+def __getattr__(name):
+    # 서비스는 openai/httpx 등 무거운 의존성을 끌어오므로 처음 접근할 때 import (models만 쓰는 쪽은 가볍게)
+    if name == "YouTubeService":
+        from .service import YouTubeService
+        return YouTubeService
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
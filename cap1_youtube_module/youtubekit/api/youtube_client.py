@@ -4,12 +4,17 @@ YouTube API 클라이언트 (Data API v3 + Transcript)
 from __future__ import annotations
 
 import asyncio
+import json
 import logging
+import threading
 import time
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
 from typing import Any, Dict, List, Optional
 
 from ..config.youtube_config import YouTubeConfig
+from ..utils.cache import TTLCache
+from ..utils.transcript_cache import TranscriptCache
 
 logger = logging.getLogger(__name__)
 
@@ -40,14 +45,114 @@ class YouTubeVideoDetail:
         return f"https://www.youtube.com/watch?v={self.video_id}"
 
 
+@dataclass
+class TranscriptMetrics:
+    """자막 조회 지표 (캐시 + 전용 스레드 풀)"""
+    cache_hits: int = 0
+    negative_hits: int = 0
+    cache_misses: int = 0
+    fetched: int = 0
+    not_found: int = 0
+    errors: int = 0
+    queued: int = 0
+    running: int = 0
+    fetch_time_total: float = 0.0
+    fetch_time_max: float = 0.0
+
+    def snapshot(self) -> Dict[str, Any]:
+        data = asdict(self)
+        finished = self.fetched + self.not_found + self.errors
+        data["fetch_time_avg"] = self.fetch_time_total / finished if finished else 0.0
+        return data
+
+
+class _TransientTranscriptError(Exception):
+    """네트워크 등 일시적 자막 조회 실패 (negative 캐시하지 않음)"""
+
+
 class YouTubeAPIClient:
     """YouTube Data API v3 클라이언트"""
     
-    BASE = "https://www.googleapis.com/youtube/v3"
+    # partial response: 사용하는 필드만 요청 (응답 크기 감소)
+    SEARCH_FIELDS = "items(id/videoId,snippet(title,description,channelTitle,publishedAt))"
+    VIDEO_FIELDS = (
+        "items(id,snippet(title,description,defaultLanguage,defaultAudioLanguage,channelTitle,publishedAt),"
+        "contentDetails/duration,statistics/viewCount)"
+    )
 
-    def __init__(self, api_key: Optional[str] = None, timeout: float | None = None):
+    def __init__(
+        self, api_key: Optional[str] = None, timeout: float | None = None, base_url: Optional[str] = None
+    ):
         self.api_key = api_key or YouTubeConfig.YOUTUBE_API_KEY
+        self.base_url = (base_url or YouTubeConfig.API_BASE_URL).rstrip("/")
         self.timeout = timeout or YouTubeConfig.TIMEOUT
+        self._http: Any = None  # 공유 httpx.AsyncClient (첫 호출 시 생성)
+        # TTL이 0이면 max_entries=0 → 저장하지 않음 (캐시 끔)
+        # API_CACHE_PATH 지정 시 SQLite 파일을 통해 워커 간 공유 (dataclass ↔ JSON)
+        self.search_cache = TTLCache(
+            YouTubeConfig.SEARCH_CACHE_TTL,
+            YouTubeConfig.SEARCH_CACHE_MAX_ENTRIES if YouTubeConfig.SEARCH_CACHE_TTL > 0 else 0,
+            path=YouTubeConfig.API_CACHE_PATH or None,
+            table="youtube_search_cache",
+            serialize=lambda items: json.dumps([asdict(item) for item in items], ensure_ascii=False),
+            deserialize=lambda raw: [YouTubeSearchItem(**item) for item in json.loads(raw)],
+        )
+        self.video_cache = TTLCache(
+            YouTubeConfig.VIDEO_CACHE_TTL,
+            YouTubeConfig.VIDEO_CACHE_MAX_ENTRIES if YouTubeConfig.VIDEO_CACHE_TTL > 0 else 0,
+            path=YouTubeConfig.API_CACHE_PATH or None,
+            table="youtube_video_cache",
+            serialize=lambda detail: json.dumps(asdict(detail), ensure_ascii=False),
+            deserialize=lambda raw: YouTubeVideoDetail(**json.loads(raw)),
+        )
+        # 자막 조회는 동기 라이브러리 → 크기 제한된 전용 스레드 풀에서 실행
+        self._transcript_pool: Optional[ThreadPoolExecutor] = None
+        self.transcript_cache = (
+            TranscriptCache(
+                YouTubeConfig.TRANSCRIPT_CACHE_PATH,
+                YouTubeConfig.TRANSCRIPT_CACHE_TTL,
+                YouTubeConfig.TRANSCRIPT_NEGATIVE_TTL,
+            )
+            if YouTubeConfig.TRANSCRIPT_CACHE_PATH
+            else None
+        )
+        self.transcript_metrics = TranscriptMetrics()
+        self._metrics_lock = threading.Lock()
+
+    def _client(self):
+        """연결 풀을 재사용하는 httpx.AsyncClient"""
+        if self._http is None:
+            from importlib import import_module
+            httpx = import_module("httpx")
+            self._http = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=httpx.Limits(
+                    max_connections=YouTubeConfig.MAX_CONNECTIONS,
+                    max_keepalive_connections=YouTubeConfig.MAX_CONNECTIONS,
+                ),
+            )
+        return self._http
+
+    async def close(self):
+        """HTTP 클라이언트/자막 스레드 풀/자막 캐시 종료"""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+        if self._transcript_pool is not None:
+            self._transcript_pool.shutdown(wait=False, cancel_futures=True)
+            self._transcript_pool = None
+        if self.transcript_cache is not None:
+            self.transcript_cache.close()
+        self.search_cache.close()
+        self.video_cache.close()
+
+    def cache_stats(self) -> Dict[str, Any]:
+        """검색/영상 상세 캐시 + 자막 조회 통계"""
+        return {
+            "search": self.search_cache.stats(),
+            "videos": self.video_cache.stats(),
+            "transcripts": self.transcript_metrics.snapshot(),
+        }
 
     async def search_videos(
         self, q: str, lang: str, max_results: int = 8
@@ -66,22 +171,25 @@ class YouTubeAPIClient:
                 for i in range(1, min(max_results, 5) + 1)
             ]
 
+        cache_key = (" ".join(q.lower().split()), lang, max_results)
+        cached = await self.search_cache.get_async(cache_key)
+        if cached is not None:
+            logger.info(f"⚡ YouTube 검색 캐시 적중: {q!r} ({len(cached)}개)")
+            return list(cached)
+
         params = {
             "part": "snippet",
             "type": "video",
             "q": q,
             "relevanceLanguage": lang,
             "maxResults": max_results,
+            "fields": self.SEARCH_FIELDS,
             "key": self.api_key,
         }
 
-        from importlib import import_module
-        httpx = import_module("httpx")
-        
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            resp = await client.get(f"{self.BASE}/search", params=params)
-            resp.raise_for_status()
-            data = resp.json()
+        resp = await self._client().get(f"{self.base_url}/search", params=params)
+        resp.raise_for_status()
+        data = resp.json()
 
         items: List[YouTubeSearchItem] = []
         for it in data.get("items", []):
@@ -98,7 +206,8 @@ class YouTubeAPIClient:
                     publish_time=sn.get("publishedAt", ""),
                 )
             )
-        return items
+        await self.search_cache.set_async(cache_key, items)
+        return list(items)
 
     async def get_videos(self, ids: List[str]) -> List[YouTubeVideoDetail]:
         """YouTube 동영상 상세 정보 조회"""
@@ -121,19 +230,43 @@ class YouTubeAPIClient:
                 for i, vid in enumerate(ids)
             ]
 
+        # 캐시에 없는 id만 50개 단위로 나눠 병렬 조회
+        unique_ids = list(dict.fromkeys(ids))
+        cached: Dict[str, YouTubeVideoDetail] = {}
+        missing: List[str] = []
+        lookups = await asyncio.gather(*[self.video_cache.get_async(vid) for vid in unique_ids])
+        for vid, detail in zip(unique_ids, lookups):
+            if detail is not None:
+                cached[vid] = detail
+            else:
+                missing.append(vid)
+
+        if missing:
+            size = YouTubeConfig.VIDEOS_BATCH_SIZE
+            chunks = [missing[i:i + size] for i in range(0, len(missing), size)]
+            fetched = await asyncio.gather(*[self._fetch_video_chunk(chunk) for chunk in chunks])
+            fresh = [detail for details in fetched for detail in details]
+            await asyncio.gather(*[self.video_cache.set_async(detail.video_id, detail) for detail in fresh])
+            for detail in fresh:
+                cached[detail.video_id] = detail
+            logger.info(
+                f"🎞️ videos.list: {len(missing)}개 조회 ({len(chunks)}회 호출), 캐시 적중 {len(unique_ids) - len(missing)}개"
+            )
+
+        return [cached[vid] for vid in unique_ids if vid in cached]
+
+    async def _fetch_video_chunk(self, ids: List[str]) -> List[YouTubeVideoDetail]:
+        """videos.list 1회 호출 (최대 50개 id)"""
         params = {
             "part": "snippet,contentDetails,statistics",
             "id": ",".join(ids),
+            "fields": self.VIDEO_FIELDS,
             "key": self.api_key,
         }
-        
-        from importlib import import_module
-        httpx = import_module("httpx")
-        
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            resp = await client.get(f"{self.BASE}/videos", params=params)
-            resp.raise_for_status()
-            data = resp.json()
+
+        resp = await self._client().get(f"{self.base_url}/videos", params=params)
+        resp.raise_for_status()
+        data = resp.json()
 
         details: List[YouTubeVideoDetail] = []
         for it in data.get("items", []):
@@ -163,24 +296,73 @@ class YouTubeAPIClient:
         """
         자막 가져오기 (youtube_transcript_api 사용)
         
+        (video_id, 언어 선호) 단위로 디스크 캐시를 먼저 확인하고, 자막이 없는 영상도
+        캐시한다. 실제 조회는 TRANSCRIPT_WORKERS 크기의 전용 스레드 풀에서 실행한다.
         실패하면 None 반환 (자막 없음/비공개/오류)
         """
         if YouTubeConfig.OFFLINE_MODE:
             return None
             
         preferred_langs = preferred_langs or ["en", "ko"]
-        
-        # 🔧 Sync 함수를 async로 변환 (run_in_executor 사용)
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            None, 
-            self._fetch_transcript_sync, 
-            video_id, 
-            preferred_langs
-        )
+        langs_key = ",".join(preferred_langs)
+        metrics = self.transcript_metrics
+
+        if self.transcript_cache is not None:
+            hit, transcript = await asyncio.to_thread(self.transcript_cache.get, video_id, langs_key)
+            if hit:
+                if transcript is None:
+                    metrics.negative_hits += 1
+                else:
+                    metrics.cache_hits += 1
+                return transcript
+            metrics.cache_misses += 1
+
+        if self._transcript_pool is None:
+            self._transcript_pool = ThreadPoolExecutor(
+                max_workers=YouTubeConfig.TRANSCRIPT_WORKERS, thread_name_prefix="yt-transcript"
+            )
+
+        with self._metrics_lock:
+            metrics.queued += 1
+
+        def run() -> str | None:
+            # 스레드에서 실행: 대기→실행 전환과 소요 시간 기록
+            with self._metrics_lock:
+                metrics.queued -= 1
+                metrics.running += 1
+            started = time.perf_counter()
+            try:
+                return self._fetch_transcript_sync(video_id, preferred_langs)
+            finally:
+                elapsed = time.perf_counter() - started
+                with self._metrics_lock:
+                    metrics.running -= 1
+                    metrics.fetch_time_total += elapsed
+                    metrics.fetch_time_max = max(metrics.fetch_time_max, elapsed)
+
+        loop = asyncio.get_running_loop()
+        try:
+            transcript = await loop.run_in_executor(self._transcript_pool, run)
+        except _TransientTranscriptError as e:
+            metrics.errors += 1
+            logger.warning(f"자막 가져오기 실패 ({video_id}): {e}")
+            return None
+
+        if transcript:
+            metrics.fetched += 1
+        else:
+            metrics.not_found += 1
+            transcript = None
+
+        if self.transcript_cache is not None:
+            await asyncio.to_thread(self.transcript_cache.set, video_id, langs_key, transcript)
+        return transcript
     
     def _fetch_transcript_sync(self, video_id: str, preferred_langs: List[str]) -> str | None:
-        """자막 가져오기 (동기 버전) - 버전 호환"""
+        """자막 가져오기 (동기 버전) - 버전 호환
+
+        자막이 없으면 None, 일시적 오류면 _TransientTranscriptError
+        """
         try:
             from youtube_transcript_api import YouTubeTranscriptApi
             from youtube_transcript_api._errors import (
@@ -221,7 +403,7 @@ class YouTubeAPIClient:
                         chunks = transcript.fetch()
                         texts = [c["text"] for c in chunks]
                         return " ".join(texts).strip()[:4000]
-                    except Exception:
+                    except NoTranscriptFound:
                         continue
 
                 # 자동 생성 자막
@@ -230,9 +412,10 @@ class YouTubeAPIClient:
                     chunks = transcript.fetch()
                     texts = [c["text"] for c in chunks]
                     return " ".join(texts).strip()[:4000]
-                except Exception:
+                except NoTranscriptFound:
                     pass
-            except Exception:
+            except (AttributeError, NoTranscriptFound, TranscriptsDisabled):
+                # 그 밖의 오류(네트워크 등)는 바깥에서 일시적 오류로 처리 (negative 캐시 금지)
                 pass
 
             # 모든 방법 실패
@@ -249,5 +432,5 @@ class YouTubeAPIClient:
             logger.debug(f"자막 비활성화: {video_id}")
             return None
         except Exception as e:
-            logger.warning(f"자막 가져오기 실패 ({video_id}): {e}")
-            return None
+            # 일시적 오류는 negative 캐시하지 않도록 구분
+            raise _TransientTranscriptError(str(e)) from e
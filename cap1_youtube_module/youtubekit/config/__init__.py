@@ -8,6 +8,8 @@ from .prompts import (
     SUMMARY_PROMPT,
     SUMMARY_NO_TRANSCRIPT_PROMPT,
     SCORE_VIDEO_PROMPT,
+    BATCH_VIDEO_ITEM_TEMPLATE,
+    BATCH_SUMMARY_SCORE_PROMPT,
 )
 
 __all__ = [
@@ -17,5 +19,7 @@ __all__ = [
     "SUMMARY_PROMPT",
     "SUMMARY_NO_TRANSCRIPT_PROMPT",
     "SCORE_VIDEO_PROMPT",
+    "BATCH_VIDEO_ITEM_TEMPLATE",
+    "BATCH_SUMMARY_SCORE_PROMPT",
 ]
 
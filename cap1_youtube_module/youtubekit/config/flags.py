@@ -6,6 +6,7 @@ YouTube Provider 전용 플래그
 #NO_SCORING = True  # True이면 검증 없이 검색 결과만 반환 (빠른 테스트용)
 NO_SCORING = False  # True이면 검증 없이 검색 결과만 반환 (빠른 테스트용)
 VERIFY_YT_DEFAULT = False  # 기본값: Heuristic (False), LLM (True)
+VERIFY_BATCH_DEFAULT = False  # True이면 여러 영상을 한 번의 LLM 호출로 요약+검증
 USE_TRANSCRIPT = False    # 자막 사용 여부 (False: 제목/설명만 사용)
 
 # ━━━ 쿼리 생성 설정 ━━━
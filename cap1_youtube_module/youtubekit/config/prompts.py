@@ -93,3 +93,45 @@ Return JSON (reason in {language}, one sentence, no line breaks):
   "reason": "명확한 한 문장 평가"
 }}
 """.strip()
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 영상 일괄 요약 + 점수 평가 프롬프트 (verify_batch)
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+BATCH_VIDEO_ITEM_TEMPLATE = """
+[id={id}]
+Title: "{title}"
+Channel: "{channel}"
+Content: "{content}"
+""".strip()
+
+
+BATCH_SUMMARY_SCORE_PROMPT = """
+Summarize and evaluate each video's relevance to the lecture section.
+
+Lecture Summary: {lecture_summary}
+
+Videos:
+{videos}
+
+For EACH video (evaluate independently, do not compare videos):
+1. extract: 2-3 sentences ({language}) so students understand the content without watching
+2. score: relevance to the lecture
+
+Scoring (엄격한 기준):
+- 10: 강의에서 다룬 개념의 **공식 튜토리얼** 또는 **창시자 직접 설명**
+     (Official tutorial OR creator's explanation of the concept)
+- 9: 강의 핵심 개념을 **직접** 다루고, 예제/실습 포함
+- 7-8: 핵심 개념 다루지만 **부분적** 또는 이론 위주
+- 5-6: 관련 배경지식이지만 강의 주제와 약간 벗어남
+- 3-4: 키워드만 겹치고 다른 맥락
+- 1-2: 거의 무관
+
+Return JSON with one entry per video id (extract and reason in {language}, reason one sentence, no line breaks):
+{{
+  "results": [
+    {{"id": <id>, "extract": "Sentence 1. Sentence 2.", "score": <number>, "reason": "명확한 한 문장 평가"}}
+  ]
+}}
+""".strip()
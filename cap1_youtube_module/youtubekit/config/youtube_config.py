@@ -13,10 +13,27 @@ class YouTubeConfig:
     
     # ━━━ OpenAI API ━━━
     OPENAI_API_KEY: str = os.getenv("OPENAI_API_KEY", "")
+    OPENAI_BASE_URL: str = os.getenv("OPENAI_BASE_URL", "")  # 비우면 공식 주소 (모의 서버/프록시 사용 시 지정)
     
     # ━━━ YouTube Data API v3 ━━━
     YOUTUBE_API_KEY: str = os.getenv("YOUTUBE_API_KEY") or os.getenv("KEY", "")
+    API_BASE_URL: str = os.getenv("YOUTUBE_API_BASE_URL", "https://www.googleapis.com/youtube/v3")
     TIMEOUT: int = 10  # HTTP 타임아웃 (초)
+    MAX_CONNECTIONS: int = 20  # 공유 HTTP 클라이언트 최대 연결 수
+    VIDEOS_BATCH_SIZE: int = 50  # videos.list 1회당 최대 id 수 (API 제한)
+    
+    # ━━━ API 응답 캐시 ━━━
+    SEARCH_CACHE_TTL: int = 6 * 3600  # search.list 결과 캐시 (초, 0이면 끔) - 호출당 100 quota
+    SEARCH_CACHE_MAX_ENTRIES: int = 1024
+    VIDEO_CACHE_TTL: int = 7 * 24 * 3600  # 영상 상세 캐시 (초, 0이면 끔) - 거의 바뀌지 않음
+    VIDEO_CACHE_MAX_ENTRIES: int = 20000
+    API_CACHE_PATH: str = os.getenv("YOUTUBE_API_CACHE_PATH", "")  # 검색/영상 상세 SQLite 파일 (비우면 메모리만, 워커 간 공유)
+    
+    # ━━━ 자막 (flags.USE_TRANSCRIPT) ━━━
+    TRANSCRIPT_WORKERS: int = 4  # 자막 조회 전용 스레드 수
+    TRANSCRIPT_CACHE_PATH: str = os.getenv("YT_TRANSCRIPT_CACHE_PATH", ".cache/youtubekit/transcripts.db")  # 비우면 캐시 끔
+    TRANSCRIPT_CACHE_TTL: int = 30 * 24 * 3600  # 자막 캐시 유지 시간 (초)
+    TRANSCRIPT_NEGATIVE_TTL: int = 24 * 3600  # '자막 없음' 캐시 유지 시간 (초)
     
     # ━━━ 기본값 ━━━
     DEFAULT_LANGUAGE: str = "ko"
@@ -41,6 +58,11 @@ class YouTubeConfig:
     # ━━━ 병렬 처리 ━━━
     VERIFY_CONCURRENCY: int = 20  # 동시 검증 수 (Semaphore 제한)
     
+    # ━━━ 일괄 검증 (verify_batch) ━━━
+    BATCH_MAX_ITEMS: int = 10  # LLM 호출 1회당 최대 영상 수 (MAX_SEARCH_RESULTS와 동일 → 보통 1회)
+    BATCH_TOKEN_BUDGET: int = 6000  # LLM 호출 1회당 영상 텍스트 토큰 예산 (초과 시 분할)
+    MAX_TOKENS_BATCH_PER_ITEM: int = 200  # 영상 1개당 응답 토큰 (extract + score + reason)
+    
     # ━━━ Offline 모드 ━━━
     OFFLINE_MODE: bool = os.getenv("YT_OFFLINE_MODE", "0") == "1"
     
@@ -59,6 +81,12 @@ class YouTubeConfig:
         if flags.MAX_SEARCH_RESULTS < 1:
             raise ValueError(f"MAX_SEARCH_RESULTS는 1 이상이어야 합니다: {flags.MAX_SEARCH_RESULTS}")
         
+        if cls.BATCH_MAX_ITEMS < 1:
+            raise ValueError(f"BATCH_MAX_ITEMS는 1 이상이어야 합니다: {cls.BATCH_MAX_ITEMS}")
+        
+        if cls.TRANSCRIPT_WORKERS < 1:
+            raise ValueError(f"TRANSCRIPT_WORKERS는 1 이상이어야 합니다: {cls.TRANSCRIPT_WORKERS}")
+        
         if cls.VERIFY_CONCURRENCY < 1:
             raise ValueError(
                 f"VERIFY_CONCURRENCY는 1 이상이어야 합니다: {cls.VERIFY_CONCURRENCY}"
@@ -3,8 +3,10 @@ YouTube LLM 클라이언트 (OpenAI)
 """
 from __future__ import annotations
 
+import asyncio
 import json
-from typing import Any, Dict
+import logging
+from typing import Any, Dict, List
 
 from ..config.youtube_config import YouTubeConfig
 from ..config import flags
@@ -13,20 +15,30 @@ from ..config import (
     SUMMARY_PROMPT,
     SUMMARY_NO_TRANSCRIPT_PROMPT,
     SCORE_VIDEO_PROMPT,
+    BATCH_VIDEO_ITEM_TEMPLATE,
+    BATCH_SUMMARY_SCORE_PROMPT,
 )
+from ..utils.batching import split_by_token_budget
+
+logger = logging.getLogger(__name__)
 
 
 class YouTubeLLMClient:
     """YouTube 추천을 위한 LLM 클라이언트"""
     
-    def __init__(self, api_key: str | None = None):
+    def __init__(self, api_key: str | None = None, client: Any | None = None):
         self.api_key = api_key or YouTubeConfig.OPENAI_API_KEY
         self.client = None
         
-        if not YouTubeConfig.OFFLINE_MODE and self.api_key:
+        if YouTubeConfig.OFFLINE_MODE:
+            return
+        if client is not None:
+            # 서버에서 주입한 공유 AsyncOpenAI 클라이언트 사용
+            self.client = client
+        elif self.api_key:
             try:
                 from openai import AsyncOpenAI
-                self.client = AsyncOpenAI(api_key=self.api_key)
+                self.client = AsyncOpenAI(api_key=self.api_key, base_url=YouTubeConfig.OPENAI_BASE_URL or None)
             except Exception:
                 # OpenAI SDK 없으면 stub 모드
                 self.client = None
@@ -136,3 +148,67 @@ class YouTubeLLMClient:
             language=language,
         )
         return await self._chat_json(prompt, YouTubeConfig.MAX_TOKENS_SCORE)
+
+    async def summarize_and_score_batch(
+        self, *, lecture_summary: str, videos: List[Dict[str, str]], language: str
+    ) -> List[Dict[str, Any]]:
+        """여러 영상 요약 + 관련도 점수를 일괄 계산 (LLM, listwise)
+
+        videos: [{"title", "channel", "content"}, ...]
+        반환: [{"extract", "score", "reason"}, ...] (videos와 같은 순서, 누락 시 빈 dict)
+        """
+        if YouTubeConfig.OFFLINE_MODE:
+            results = []
+            for video in videos:
+                summary = await self.summarize_content_no_transcript(
+                    title=video["title"], description=video["content"], channel=video["channel"], language=language
+                )
+                score = await self.score_video(
+                    lecture_summary=lecture_summary, title=video["title"], extract=summary["extract"], language=language
+                )
+                results.append({**summary, **score})
+            return results
+
+        item_texts = [
+            BATCH_VIDEO_ITEM_TEMPLATE.format(
+                id=idx,
+                title=video["title"],
+                channel=video["channel"],
+                content=video["content"][:YouTubeConfig.MAX_CONTENT_LENGTH],
+            )
+            for idx, video in enumerate(videos, 1)
+        ]
+        batches = split_by_token_budget(
+            list(range(len(videos))),
+            item_texts,
+            token_budget=YouTubeConfig.BATCH_TOKEN_BUDGET,
+            max_items=YouTubeConfig.BATCH_MAX_ITEMS,
+        )
+        logger.info(f"📦 일괄 요약+검증: 영상 {len(videos)}개 → LLM 호출 {len(batches)}회")
+
+        async def run_batch(batch: List[int]) -> Dict[int, Dict[str, Any]]:
+            prompt = BATCH_SUMMARY_SCORE_PROMPT.format(
+                lecture_summary=lecture_summary,
+                videos="\n\n".join(item_texts[idx] for idx in batch),
+                language=language,
+            )
+            try:
+                payload = await self._chat_json(prompt, YouTubeConfig.MAX_TOKENS_BATCH_PER_ITEM * len(batch) + 50)
+            except Exception as e:
+                logger.warning(f"일괄 요약+검증 실패 ({len(batch)}개): {e}")
+                return {}
+            valid_ids = {idx + 1 for idx in batch}
+            parsed: Dict[int, Dict[str, Any]] = {}
+            for entry in payload.get("results", []):
+                try:
+                    item_id = int(entry.get("id"))
+                except (TypeError, ValueError):
+                    continue
+                if item_id in valid_ids:
+                    parsed[item_id] = entry
+            return parsed
+
+        merged: Dict[int, Dict[str, Any]] = {}
+        for parsed in await asyncio.gather(*[run_batch(batch) for batch in batches]):
+            merged.update(parsed)
+        return [merged.get(idx, {}) for idx in range(1, len(videos) + 1)]
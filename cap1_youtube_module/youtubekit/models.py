@@ -60,6 +60,10 @@ class YouTubeRequest(BaseModel):
         default=flags.VERIFY_YT_DEFAULT, 
         description="LLM 검증 여부 (True: LLM, False: Heuristic)"
     )
+    verify_batch: bool = Field(
+        default=flags.VERIFY_BATCH_DEFAULT,
+        description="LLM 일괄 검증 여부 (True: 여러 영상을 한 번에 요약+평가, False: 영상별 개별 호출)"
+    )
     
     # ━━━ 컨텍스트 필드 ━━━
     previous_summaries: List[PreviousSummary] = Field(
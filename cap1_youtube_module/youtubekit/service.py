@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import List
+from typing import Any, List
 
 from .api import YouTubeAPIClient
 from .llm import YouTubeLLMClient
@@ -11,7 +11,7 @@ from .models import (
     YouTubeResponse,
     YouTubeVideoInfo,
 )
-from .utils import normalize_title, deduplicate_items, heuristic_score
+from .utils import normalize_title, deduplicate_items, heuristic_score, stage_timer
 from .config import flags
 
 logger = logging.getLogger(__name__)
@@ -20,25 +20,34 @@ logger = logging.getLogger(__name__)
 class YouTubeService:
     """High-level service for lecture-aware YouTube recommendations."""
 
-    def __init__(self, yt_client: YouTubeAPIClient | None = None, llm: YouTubeLLMClient | None = None):
+    def __init__(
+        self,
+        yt_client: YouTubeAPIClient | None = None,
+        llm: YouTubeLLMClient | None = None,
+        openai_client: Any | None = None,
+        metrics: Any | None = None,
+    ):
         from .config.youtube_config import YouTubeConfig
         self.yt = yt_client or YouTubeAPIClient(api_key=YouTubeConfig.YOUTUBE_API_KEY)
-        self.llm = llm or YouTubeLLMClient(api_key=YouTubeConfig.OPENAI_API_KEY)
+        self.llm = llm or YouTubeLLMClient(api_key=YouTubeConfig.OPENAI_API_KEY, client=openai_client)
+        # 단계별 소요 시간 recorder (서버 주입, None이면 기록 안 함)
+        self.metrics = metrics
 
     async def recommend_videos(self, request: YouTubeRequest) -> List[YouTubeResponse]:
         from .config.youtube_config import YouTubeConfig
         from .config import flags
         
         # 1) Build queries (LLM or stub)
-        q_payload = await self.llm.generate_queries(
-            {
-                "lecture_summary": request.lecture_summary,
-                "language": request.language,
-                "yt_lang": request.yt_lang,
-                "previous_summaries": [s.model_dump() for s in request.previous_summaries],
-                "rag_context": [c.model_dump() for c in request.rag_context],
-            }
-        )
+        with stage_timer(self.metrics, "youtube", "query_generation", YouTubeConfig.LLM_MODEL):
+            q_payload = await self.llm.generate_queries(
+                {
+                    "lecture_summary": request.lecture_summary,
+                    "language": request.language,
+                    "yt_lang": request.yt_lang,
+                    "previous_summaries": [s.model_dump() for s in request.previous_summaries],
+                    "rag_context": [c.model_dump() for c in request.rag_context],
+                }
+            )
         queries = list(dict.fromkeys([q.strip() for q in q_payload.get("queries", []) if q.strip()]))
         
         # 🔧 Query 개수 제한 (QUERY_MAX)
@@ -61,7 +70,8 @@ class YouTubeService:
             return [(normalize_title(it.title), it) for it in items]
         
         # Execute all searches in parallel
-        search_results = await asyncio.gather(*[search_single_query(q) for q in queries])
+        with stage_timer(self.metrics, "youtube", "search"):
+            search_results = await asyncio.gather(*[search_single_query(q) for q in queries])
         
         # Flatten results from all queries
         search_items = []
@@ -78,7 +88,8 @@ class YouTubeService:
             return []
 
         ids = [it.video_id for it in dedup]
-        details = await self.yt.get_videos(ids)
+        with stage_timer(self.metrics, "youtube", "video_details"):
+            details = await self.yt.get_videos(ids)
         detail_map = {d.video_id: d for d in details}
         best_scores: list[float] = []  # min_score 탈락 후보 점수 추적
 
@@ -163,7 +174,8 @@ class YouTubeService:
 
                 # 🔧 자막 사용 여부 결정
                 if flags.USE_TRANSCRIPT:
-                    transcript = await self.yt.fetch_transcript(d.video_id, preferred_langs=[request.yt_lang, "en", "ko"])  # type: ignore[arg-type]
+                    with stage_timer(self.metrics, "youtube", "transcript"):
+                        transcript = await self.yt.fetch_transcript(d.video_id, preferred_langs=[request.yt_lang, "en", "ko"])  # type: ignore[arg-type]
                     content_src = transcript or (d.description or d.title)
                     # 자막이 있으면 정상 요약
                     sum_payload = await self.llm.summarize_content(
@@ -219,15 +231,25 @@ class YouTubeService:
                     score=round(score, 2),
                 )
         
+        # 📦 verify_batch 모드: 상세 정보가 있는 영상은 한 번의 LLM 호출로 요약+검증
+        candidates: List[YouTubeResponse] = []
+        pending = dedup
+        if request.verify_yt and request.verify_batch:
+            batch_details = [detail_map[it.video_id] for it in dedup if it.video_id in detail_map]
+            with stage_timer(self.metrics, "youtube", "verification_batch", YouTubeConfig.LLM_MODEL):
+                candidates.extend(await self._verify_videos_batch(batch_details, request, best_scores))
+            pending = [it for it in dedup if it.video_id not in detail_map]
+
         # 🚀 Process all videos in parallel with asyncio.gather
-        candidate_results = await asyncio.gather(*[process_single_video(it) for it in dedup], return_exceptions=True)
+        verify_model = YouTubeConfig.LLM_MODEL if request.verify_yt else "heuristic"
+        with stage_timer(self.metrics, "youtube", "verification", verify_model):
+            candidate_results = await asyncio.gather(*[process_single_video(it) for it in pending], return_exceptions=True)
         
         # 🔧 Filter out None and exceptions (with error logging)
-        candidates: List[YouTubeResponse] = []
         for idx, result in enumerate(candidate_results):
             if isinstance(result, Exception):
                 logger.warning(
-                    f"영상 처리 실패 (idx={idx}, video_id={dedup[idx].video_id if idx < len(dedup) else 'unknown'}): {result}",
+                    f"영상 처리 실패 (idx={idx}, video_id={pending[idx].video_id if idx < len(pending) else 'unknown'}): {result}",
                     exc_info=result
                 )
             elif result is not None:
@@ -242,3 +264,73 @@ class YouTubeService:
             logger.info(f"🧊 YT 결과 없음: min_score={request.min_score}, best_score={best}")
 
         return final
+
+    def cache_stats(self) -> dict:
+        """YouTube API 캐시 통계"""
+        return self.yt.cache_stats()
+
+    async def close(self):
+        """리소스 정리"""
+        await self.yt.close()
+
+    async def _verify_videos_batch(
+        self, details: List[Any], request: YouTubeRequest, best_scores: List[float]
+    ) -> List[YouTubeResponse]:
+        """영상 상세 정보 목록을 일괄 요약+검증 (토큰 예산 초과 시 여러 호출로 분할)"""
+        if not details:
+            return []
+
+        if flags.USE_TRANSCRIPT:
+            transcripts = await asyncio.gather(
+                *[
+                    self.yt.fetch_transcript(d.video_id, preferred_langs=[request.yt_lang, "en", "ko"])  # type: ignore[arg-type]
+                    for d in details
+                ],
+                return_exceptions=True,
+            )
+        else:
+            transcripts = [None] * len(details)
+
+        videos = []
+        for d, transcript in zip(details, transcripts):
+            if isinstance(transcript, Exception):
+                transcript = None
+            videos.append(
+                {
+                    "title": d.title,
+                    "channel": d.channel_title,
+                    "content": transcript or d.description or d.title,
+                }
+            )
+
+        scored = await self.llm.summarize_and_score_batch(
+            lecture_summary=request.lecture_summary, videos=videos, language=request.language
+        )
+
+        results: List[YouTubeResponse] = []
+        for d, ver in zip(details, scored):
+            extract = ver.get("extract") or (d.description or d.title)[:300]
+            score = float(ver.get("score", 5.0) or 5.0)
+            reason = ver.get("reason") or ("LLM verification" if ver else "일괄 검증 응답 누락")
+
+            best_scores.append(score)
+            if score < request.min_score:
+                logger.info(f"🧊 YT 필터링(min_score): {score:.2f} < {request.min_score} (title={d.title[:60]!r})")
+                continue
+
+            vi = YouTubeVideoInfo(
+                url=d.url(),
+                title=d.title,
+                extract=extract,
+                lang=d.default_lang or request.yt_lang,
+            )
+            results.append(
+                YouTubeResponse(
+                    lecture_id=request.lecture_id,
+                    section_id=request.section_id,
+                    video_info=vi,
+                    reason=reason,
+                    score=round(score, 2),
+                )
+            )
+        return results
@@ -1,8 +1,15 @@
 from .filters import normalize_title, deduplicate_items, heuristic_score
+from .batching import estimate_tokens, split_by_token_budget
+from .cache import TTLCache
+from .metrics import stage_timer
 
 __all__ = [
     "normalize_title",
     "deduplicate_items",
     "heuristic_score",
+    "estimate_tokens",
+    "split_by_token_budget",
+    "TTLCache",
+    "stage_timer",
 ]
 
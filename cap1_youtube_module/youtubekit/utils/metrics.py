@@ -0,0 +1,19 @@
+"""
+단계별 소요 시간 기록
+
+서버가 주입한 recorder(time_stage 컨텍스트 매니저 보유)에 위임해
+지연 지표와 추적 span을 함께 남기며,
+주입받지 않은 경우(단독 실행, 테스트)에는 아무것도 하지 않는다.
+"""
+from contextlib import contextmanager
+from typing import Any, Iterator, Optional
+
+
+@contextmanager
+def stage_timer(metrics: Optional[Any], provider: str, stage: str, model: str = "") -> Iterator[None]:
+    """with 블록 소요 시간을 provider/stage/model 라벨로 기록 (예외 시 outcome=error)"""
+    if metrics is None:
+        yield
+        return
+    with metrics.time_stage(provider, stage, model=model):
+        yield
@@ -0,0 +1,79 @@
+"""
+자막 디스크 캐시 (SQLite)
+"""
+from __future__ import annotations
+
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class TranscriptCache:
+    """(video_id, 언어 선호) 단위 자막 캐시
+
+    자막이 없는 영상도 빈 값으로 저장해(negative caching) 같은 영상에 대해
+    youtube_transcript_api를 반복 호출하지 않는다. 자막은 나중에 추가될 수
+    있으므로 negative 항목은 더 짧은 TTL을 쓴다.
+    동기 API이므로 이벤트 루프에서는 asyncio.to_thread로 호출한다.
+    """
+
+    def __init__(self, path: str, ttl_seconds: float, negative_ttl_seconds: float):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=10.0, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS transcripts "
+                "(video_id TEXT NOT NULL, langs TEXT NOT NULL, transcript TEXT, stored_at REAL NOT NULL, "
+                "PRIMARY KEY (video_id, langs))"
+            )
+            self._conn = conn
+        return self._conn
+
+    def get(self, video_id: str, langs: str) -> Tuple[bool, Optional[str]]:
+        """(적중 여부, 자막) 반환 - 적중했지만 자막이 없으면 (True, None)"""
+        try:
+            with self._lock:
+                row = self._connect().execute(
+                    "SELECT transcript, stored_at FROM transcripts WHERE video_id = ? AND langs = ?",
+                    (video_id, langs),
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"자막 캐시 조회 실패 ({video_id}): {e}")
+            return False, None
+        if row is None:
+            return False, None
+        transcript, stored_at = row
+        ttl = self.ttl_seconds if transcript is not None else self.negative_ttl_seconds
+        if time.time() - stored_at > ttl:
+            return False, None
+        return True, transcript
+
+    def set(self, video_id: str, langs: str, transcript: Optional[str]):
+        """자막 저장 (None이면 '자막 없음'으로 기록)"""
+        try:
+            with self._lock:
+                self._connect().execute(
+                    "INSERT OR REPLACE INTO transcripts (video_id, langs, transcript, stored_at) VALUES (?, ?, ?, ?)",
+                    (video_id, langs, transcript, time.time()),
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"자막 캐시 저장 실패 ({video_id}): {e}")
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -0,0 +1,54 @@
+"""
+서버 실행 엔트리포인트 (멀티 워커 지원)
+
+사용 예:
+    python -m server --workers 4 --port 8003
+    WEB_CONCURRENCY=4 python -m server
+"""
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import sys
+from typing import List, Optional
+
+from .workers import DEFAULT_METRICS_DIR, DEFAULT_SHARED_CACHE_DIR, WORKERS_ENV, prepare_environment
+
+logger = logging.getLogger(__name__)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="LiveNote AI Gateway 멀티 워커 실행")
+    parser.add_argument(
+        "--workers", type=int, default=int(os.environ.get(WORKERS_ENV, "1")),
+        help=f"uvicorn 워커 프로세스 수 (기본: {WORKERS_ENV} 또는 1)",
+    )
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8003)
+    parser.add_argument(
+        "--shared-cache-dir",
+        help=f"워커 공용 SQLite 캐시 디렉터리 (기본: 워커 2개 이상이면 {DEFAULT_SHARED_CACHE_DIR})",
+    )
+    parser.add_argument("--metrics-dir", default=DEFAULT_METRICS_DIR, help="워커별 Prometheus 지표 파일 디렉터리")
+    parser.add_argument("--no-shared-cache", action="store_true", help="공유 캐시 없이 워커별 메모리 캐시만 사용")
+    args = parser.parse_args(argv)
+
+    if args.workers < 1:
+        parser.error("--workers는 1 이상이어야 합니다.")
+    shared_cache_dir = args.shared_cache_dir or (DEFAULT_SHARED_CACHE_DIR if args.workers > 1 else None)
+    applied = prepare_environment(
+        None if args.no_shared_cache else shared_cache_dir,
+        args.metrics_dir if args.workers > 1 else None,
+    )
+    logging.basicConfig(level=logging.INFO)
+    logger.info("워커 %d개로 시작 (%s)", args.workers, ", ".join(f"{k}={v}" for k, v in applied.items()) or "공유 설정 없음")
+
+    import uvicorn
+
+    uvicorn.run("server.main:app", host=args.host, port=args.port, workers=args.workers)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
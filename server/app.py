@@ -3,30 +3,34 @@ FastAPI 애플리케이션 생성
 """
 from __future__ import annotations
 
+import asyncio
 from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Any
 
 from dotenv import load_dotenv
 
 # Ensure .env is loaded even if the working directory differs (override stale env)
 load_dotenv(Path(__file__).resolve().parent.parent / ".env", override=True)
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, status
+from fastapi.responses import JSONResponse, Response
 
+from .callbacks import CallbackDispatcher
+from .coalescer import CallbackCoalescer
 from .config import AppSettings
-from .routes import qa_router, rag_router, rec_router, summary_router
-
-
-def _ensure_service(service: Any, factory_path: str):
-    """지연 로딩으로 서비스 인스턴스 확보"""
-    if service is not None:
-        return service
-    
-    module_name, attr = factory_path.rsplit(".", 1)
-    module = __import__(module_name, fromlist=[attr])
-    factory = getattr(module, attr)
-    return factory()
+from .embeddings import EmbeddingCache, install_embedding_cache
+from .extraction import ProcessPageExtractor
+from .ingest import PDFIngestJobs
+from .llm import LLMClientRegistry
+from .metrics import PipelineMetrics
+from .outbox import CallbackOutbox
+from .retrieval import RetrievalCache
+from .routes import admin_router, pipeline_router, qa_router, rag_router, rec_router, summary_router
+from .scheduler import JobQueueFullError, JobScheduler
+from .services import LazyService, ServiceRegistry
+from .tracing import Tracer, TracingMiddleware
+from .uploads import PDFIngestRegistry, UploadSizeLimitMiddleware
+from .workers import apply_shared_cache
 
 
 def create_app(
@@ -40,32 +44,104 @@ def create_app(
     google_service=None,
 ) -> FastAPI:
     """FastAPI 앱 생성"""
-    base_settings = settings or AppSettings()
+    # 멀티 워커 배포: LLM/임베딩/provider 검색 캐시를 공유 SQLite 파일로 연결
+    base_settings = apply_shared_cache(settings or AppSettings())
     
-    # 서비스 인스턴스를 한 번만 준비해 재사용
-    _rag = _ensure_service(rag_service, "cap1_RAG_module.ragkit.service.RAGService")
-    _qa = _ensure_service(qa_service, "cap1_QA_module.qakit.service.QAService")
-    _openalex = _ensure_service(openalex_service, "cap1_openalex_module.openalexkit.service.OpenAlexService")
-    _wiki = _ensure_service(wiki_service, "cap1_wiki_module.wikikit.service.WikiService")
-    _youtube = _ensure_service(youtube_service, "cap1_youtube_module.youtubekit.service.YouTubeService")
-    _google = _ensure_service(google_service, "cap1_google_module.googlekit.service.GoogleService")
-    _openalex_owned = openalex_service is None
+    # OpenAI 클라이언트(연결 풀)는 프로세스 전체에서 하나만 사용
+    # 요청 → 백그라운드 작업 → provider 단계 → LLM 호출을 같은 trace로 추적
+    _tracer = Tracer(base_settings.tracing)
+    _llm_registry = LLMClientRegistry(base_settings.llm, tracer=_tracer)
+    _metrics = PipelineMetrics(base_settings.metrics.enabled, tracer=_tracer)
+
+    # provider 모듈에 공유 OpenAI 클라이언트와 단계 지표 recorder 주입
+    def _shared_deps() -> dict:
+        return {"openai_client": _llm_registry.client, "metrics": _metrics}
+    
+    # 업서트에서 계산한 임베딩을 QA/REC 쿼리 임베딩으로 재사용 (RAG 서비스가 생성될 때 설치)
+    _embedding_cache = EmbeddingCache(base_settings.rag.embedding_cache) if base_settings.rag.embedding_cache.enabled else None
+
+    app: FastAPI | None = None
+
+    def _install_embedding_cache(rag) -> None:
+        nonlocal _embedding_cache
+        if _embedding_cache is not None and not install_embedding_cache(rag, _embedding_cache):
+            _embedding_cache = None
+            if app is not None:
+                app.state.embedding_cache = None
+
+    # 서비스는 첫 사용(또는 lifespan 워밍업) 때 import + 생성 → 워커 부팅 시 무거운 모듈을 불러오지 않음
+    _services = ServiceRegistry(base_settings.services)
+    _services.register(LazyService(
+        "rag", "cap1_RAG_module.ragkit.service.RAGService", instance=rag_service, on_create=_install_embedding_cache
+    ))
+    _services.register(LazyService("qa", "cap1_QA_module.qakit.service.QAService", instance=qa_service))
+    _services.register(LazyService(
+        "openalex", "cap1_openalex_module.openalexkit.service.OpenAlexService",
+        instance=openalex_service, factory_kwargs=_shared_deps,
+    ))
+    _services.register(LazyService("wiki", "cap1_wiki_module.wikikit.service.WikiService", instance=wiki_service))
+    _services.register(LazyService(
+        "youtube", "cap1_youtube_module.youtubekit.service.YouTubeService",
+        instance=youtube_service, factory_kwargs=_shared_deps,
+    ))
+    _services.register(LazyService(
+        "google", "cap1_google_module.googlekit.service.GoogleService",
+        instance=google_service, factory_kwargs=_shared_deps,
+    ))
+    _callback_dispatcher = CallbackDispatcher(base_settings.callback)
+    _callback_outbox = CallbackOutbox(_callback_dispatcher, base_settings.outbox, metrics=_metrics)
+    _callback_coalescer = CallbackCoalescer(_callback_outbox, base_settings.callback.coalesce_window)
+    _job_scheduler = JobScheduler(base_settings.scheduler, metrics=_metrics, tracer=_tracer)
+    _retrieval_cache = RetrievalCache(base_settings.rag.retrieval_cache, metrics=_metrics)
+    _pdf_registry = PDFIngestRegistry(base_settings.rag.pdf_upload.registry_path)
+    # pypdf 파싱은 GIL을 잡으므로 비동기 업서트의 페이지 추출은 프로세스 풀에서 (풀은 첫 작업 때 생성)
+    _pdf_extractor = ProcessPageExtractor(base_settings.rag.pdf_extraction) if base_settings.rag.pdf_extraction.enabled else None
+    _ingest_jobs = PDFIngestJobs(
+        _pdf_registry,
+        base_settings.rag.pdf_ingest,
+        metrics=_metrics,
+        page_source=_pdf_extractor.open_pages if _pdf_extractor is not None else None,
+    )
+    if rag_service is not None:
+        _install_embedding_cache(rag_service)
     
     @asynccontextmanager
     async def lifespan(app: FastAPI):
         app.state.app_settings = base_settings
-        app.state.rag_service = _rag
-        app.state.qa_service = _qa
-        app.state.openalex_service = _openalex
-        app.state.wiki_service = _wiki
-        app.state.youtube_service = _youtube
-        app.state.google_service = _google
+        app.state.services = _services
+        app.state.callback_dispatcher = _callback_dispatcher
+        app.state.callback_outbox = _callback_outbox
+        app.state.callback_coalescer = _callback_coalescer
+        app.state.job_scheduler = _job_scheduler
+        app.state.llm_registry = _llm_registry
+        app.state.retrieval_cache = _retrieval_cache
+        app.state.pdf_registry = _pdf_registry
+        app.state.ingest_jobs = _ingest_jobs
+        app.state.embedding_cache = _embedding_cache
+        app.state.metrics = _metrics
+        app.state.tracer = _tracer
+        await _callback_outbox.start()
+        await asyncio.to_thread(_pdf_registry.purge_jobs, base_settings.rag.pdf_ingest.job_ttl_seconds)
+        if base_settings.services.lazy and base_settings.services.warm_up:
+            _services.start_warm_up()
         
         try:
             yield
         finally:
-            if _openalex_owned and hasattr(_openalex, "close"):
-                await _openalex.close()
+            # 진행 중인 파이프라인이 콜백을 보낼 수 있도록 먼저 drain
+            await _job_scheduler.drain()
+            await _callback_coalescer.close()
+            await _callback_outbox.close()
+            await _callback_dispatcher.close()
+            await _services.close()
+            await _llm_registry.close()
+            _retrieval_cache.close()
+            _pdf_registry.close()
+            if _pdf_extractor is not None:
+                _pdf_extractor.close()
+            if _embedding_cache is not None:
+                _embedding_cache.close()
+            _metrics.close()
     
     app = FastAPI(
         title="LiveNote AI Gateway",
@@ -81,19 +157,54 @@ def create_app(
     app.include_router(qa_router)
     app.include_router(rec_router)
     app.include_router(summary_router)
+    app.include_router(pipeline_router)
+    app.include_router(admin_router)
+    app.add_middleware(
+        UploadSizeLimitMiddleware, paths=("/rag/pdf-upsert",), max_bytes=base_settings.rag.pdf_upload.max_bytes
+    )
+    app.add_middleware(TracingMiddleware, tracer=_tracer)
 
     # 테스트나 수동 호출 시 lifespan이 실행되지 않아도 안전하도록 기본 상태를 설정
     app.state.app_settings = base_settings
-    app.state.rag_service = _rag
-    app.state.qa_service = _qa
-    app.state.openalex_service = _openalex
-    app.state.wiki_service = _wiki
-    app.state.youtube_service = _youtube
-    app.state.google_service = _google
+    app.state.services = _services
+    app.state.callback_dispatcher = _callback_dispatcher
+    app.state.callback_outbox = _callback_outbox
+    app.state.callback_coalescer = _callback_coalescer
+    app.state.job_scheduler = _job_scheduler
+    app.state.llm_registry = _llm_registry
+    app.state.retrieval_cache = _retrieval_cache
+    app.state.pdf_registry = _pdf_registry
+    app.state.ingest_jobs = _ingest_jobs
+    app.state.embedding_cache = _embedding_cache
+    app.state.metrics = _metrics
+    app.state.tracer = _tracer
+    if not base_settings.services.lazy:
+        _services.build_all()
+
+    @app.exception_handler(JobQueueFullError)
+    async def job_queue_full_handler(request: Request, exc: JobQueueFullError):
+        """대기열 초과 시 429 + Retry-After"""
+        return JSONResponse(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            content={"detail": str(exc)},
+            headers={"Retry-After": str(exc.retry_after)},
+        )
     
     @app.get("/health")
     async def health_check():
         """간단한 헬스 체크"""
         return {"status": "ok"}
+
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics():
+        """Prometheus 지표 (단계별 지연, 콜백 전송, 작업 대기/실행)"""
+        rendered = _metrics.render()
+        if rendered is None:
+            return JSONResponse(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                content={"detail": "지표 수집이 비활성화되어 있습니다 (prometheus-client 필요)."},
+            )
+        body, content_type = rendered
+        return Response(content=body, media_type=content_type)
     
     return app
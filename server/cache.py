@@ -0,0 +1,272 @@
+"""
+공용 캐시 (메모리 LRU + 선택적 SQLite 디스크 계층 + single-flight)
+
+디스크 계층은 WAL 모드 SQLite 파일이라 같은 경로를 쓰는 여러 uvicorn 워커가 항목을 공유한다.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Generic, Optional, Protocol, Tuple, TypeVar, Union
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+CacheValue = Union[str, bytes]
+
+
+@dataclass
+class CacheStats:
+    """캐시 적중/미스 카운터"""
+    hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    inflight_joins: int = 0
+    evictions: int = 0
+    expirations: int = 0
+
+    def snapshot(self) -> Dict[str, Any]:
+        data = asdict(self)
+        lookups = self.hits + self.disk_hits + self.misses + self.inflight_joins
+        data["hit_ratio"] = (lookups - self.misses) / lookups if lookups else 0.0
+        return data
+
+
+class CacheTier(Protocol):
+    """프로세스 밖 캐시 계층 공통 인터페이스 (동기 API, 이벤트 루프에서는 스레드로 호출)"""
+
+    def get(self, key: str) -> Optional[Tuple[CacheValue, float]]: ...
+
+    def set(self, key: str, value: CacheValue, expires_at: float) -> None: ...
+
+    def delete_prefix(self, prefix: str) -> None: ...
+
+    def purge_expired(self) -> int: ...
+
+    def close(self) -> None: ...
+
+
+class SQLiteCacheTier:
+    """TTL을 지원하는 SQLite 키-값 저장소 (동기 API, 스레드 안전)
+
+    WAL 모드라 여러 프로세스가 같은 파일을 동시에 읽고, 쓰기는 busy timeout 안에서 순서대로 처리된다.
+    값은 문자열(JSON) 또는 바이트(임베딩 벡터)를 그대로 저장한다.
+    """
+
+    def __init__(self, path: str, table: str = "cache"):
+        self.path = path
+        self.table = table
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=10.0, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.table} "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+            self._conn = conn
+        return self._conn
+
+    def get(self, key: str) -> Optional[Tuple[CacheValue, float]]:
+        """(value, expires_at) 반환, 만료/미존재 시 None"""
+        with self._lock:
+            row = self._connect().execute(
+                f"SELECT value, expires_at FROM {self.table} WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None or row[1] <= time.time():
+            return None
+        return row[0], row[1]
+
+    def set(self, key: str, value: CacheValue, expires_at: float):
+        with self._lock:
+            self._connect().execute(
+                f"INSERT OR REPLACE INTO {self.table} (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, value, expires_at),
+            )
+
+    def delete_prefix(self, prefix: str):
+        with self._lock:
+            self._connect().execute(f"DELETE FROM {self.table} WHERE key LIKE ?", (prefix + "%",))
+
+    def purge_expired(self) -> int:
+        with self._lock:
+            cur = self._connect().execute(f"DELETE FROM {self.table} WHERE expires_at <= ?", (time.time(),))
+            return cur.rowcount
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+class ResponseCache(Generic[T]):
+    """크기 기반 LRU 메모리 캐시 + 선택적 디스크 계층
+
+    - 메모리: 직렬화 크기 합계가 max_bytes를 넘으면 오래된 항목부터 제거
+    - 디스크: CacheTier(SQLiteCacheTier) 지정 시 메모리 미스에서 조회, 결과를 메모리로 승격
+      (같은 파일을 쓰는 다른 워커가 저장한 항목도 적중)
+    - 동일 키 동시 요청은 하나만 계산하고 나머지는 결과를 공유 (single-flight)
+    """
+
+    def __init__(
+        self,
+        *,
+        name: str,
+        max_bytes: int,
+        ttl_seconds: float,
+        serialize: Callable[[T], str],
+        deserialize: Callable[[str], T],
+        disk: Optional[CacheTier] = None,
+    ):
+        self.name = name
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.serialize = serialize
+        self.deserialize = deserialize
+        self.disk = disk
+        self.stats = CacheStats()
+        self._entries: "OrderedDict[str, Tuple[T, int, float]]" = OrderedDict()
+        self._bytes = 0
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+    def _get_memory(self, key: str) -> Tuple[bool, Optional[T]]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+        value, size, expires_at = entry
+        if expires_at <= time.time():
+            self._remove(key)
+            self.stats.expirations += 1
+            return False, None
+        self._entries.move_to_end(key)
+        return True, value
+
+    def _put_memory(self, key: str, value: T, size: int, expires_at: float):
+        if size > self.max_bytes:
+            return
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = (value, size, expires_at)
+        self._bytes += size
+        while self._bytes > self.max_bytes and self._entries:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.stats.evictions += 1
+
+    def _remove(self, key: str):
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
+
+    async def get(self, key: str) -> Optional[T]:
+        """캐시 조회만 수행 (메모리 → 디스크)"""
+        found, value = self._get_memory(key)
+        if found:
+            self.stats.hits += 1
+            return value
+        if self.disk is not None:
+            row = await asyncio.to_thread(self.disk.get, key)
+            if row is not None:
+                raw, expires_at = row
+                value = self.deserialize(raw)
+                self._put_memory(key, value, len(raw), expires_at)
+                self.stats.disk_hits += 1
+                return value
+        return None
+
+    async def set(self, key: str, value: T, ttl_seconds: Optional[float] = None):
+        """캐시 저장 (메모리 + 디스크)"""
+        raw = self.serialize(value)
+        expires_at = time.time() + (self.ttl_seconds if ttl_seconds is None else ttl_seconds)
+        self._put_memory(key, value, len(raw), expires_at)
+        if self.disk is not None:
+            await asyncio.to_thread(self.disk.set, key, raw, expires_at)
+
+    async def get_or_create(
+        self,
+        key: str,
+        factory: Callable[[], Awaitable[T]],
+        should_cache: Callable[[T], bool] | None = None,
+    ) -> T:
+        """캐시 조회 후 미스면 factory 실행 (동일 키 동시 실행은 1회로 합침)"""
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            return await self._join(key, inflight, factory, should_cache)
+
+        cached = await self.get(key)
+        if cached is not None:
+            return cached
+
+        # 디스크 조회 중 다른 요청이 먼저 계산을 시작했을 수 있음
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            return await self._join(key, inflight, factory, should_cache)
+
+        self.stats.misses += 1
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await factory()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as exc:
+            future.set_exception(exc)
+            # 대기자가 없으면 "exception was never retrieved" 경고 방지
+            future.exception()
+            raise
+        else:
+            future.set_result(value)
+            if should_cache is None or should_cache(value):
+                try:
+                    await self.set(key, value)
+                except Exception as exc:  # pragma: no cover - 직렬화/디스크 예외
+                    logger.warning("%s 캐시 저장 실패: %s", self.name, exc)
+            return value
+        finally:
+            self._inflight.pop(key, None)
+
+    async def _join(
+        self,
+        key: str,
+        inflight: asyncio.Future,
+        factory: Callable[[], Awaitable[T]],
+        should_cache: Callable[[T], bool] | None,
+    ) -> T:
+        """먼저 시작한 요청의 결과를 기다림 (그 요청만 취소됐으면 이 요청이 다시 계산)"""
+        self.stats.inflight_joins += 1
+        try:
+            return await asyncio.shield(inflight)
+        except asyncio.CancelledError:
+            task = asyncio.current_task()
+            if inflight.cancelled() and (task is None or not task.cancelling()):
+                return await self.get_or_create(key, factory, should_cache)
+            raise
+
+    def invalidate(self, prefix: str = ""):
+        """prefix로 시작하는 키 제거 (빈 문자열이면 전체)"""
+        for key in [k for k in self._entries if k.startswith(prefix)]:
+            self._remove(key)
+        if self.disk is not None:
+            self.disk.delete_prefix(prefix)
+
+    def snapshot(self) -> Dict[str, Any]:
+        data = self.stats.snapshot()
+        data.update({"entries": len(self._entries), "bytes": self._bytes, "max_bytes": self.max_bytes})
+        return data
+
+    def close(self):
+        if self.disk is not None:
+            self.disk.close()
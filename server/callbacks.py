@@ -0,0 +1,64 @@
+"""
+백엔드 콜백 전송 디스패처
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+import httpx
+
+from .config import CallbackSettings
+
+logger = logging.getLogger(__name__)
+
+
+class CallbackDispatcher:
+    """keep-alive 연결 풀을 공유하는 콜백 전송기
+
+    QA/REC/요약 라우트가 하나의 httpx.AsyncClient를 재사용하므로
+    같은 백엔드 호스트로 가는 콜백마다 TCP/TLS 핸드셰이크를 반복하지 않는다.
+    클라이언트는 첫 전송 시점에 생성되고 앱 lifespan 종료 시 닫힌다.
+    """
+
+    def __init__(self, settings: CallbackSettings | None = None):
+        self.settings = settings or CallbackSettings()
+        self._client: Optional[httpx.AsyncClient] = None
+        self._host_limits: Dict[str, asyncio.Semaphore] = {}
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """공유 HTTP 클라이언트 확보 (지연 생성)"""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=httpx.Timeout(self.settings.timeout, connect=self.settings.connect_timeout),
+                limits=httpx.Limits(
+                    max_connections=self.settings.max_connections,
+                    max_keepalive_connections=self.settings.max_keepalive_connections,
+                    keepalive_expiry=self.settings.keepalive_expiry,
+                ),
+                http2=self.settings.http2,
+            )
+        return self._client
+
+    def _host_semaphore(self, url: str) -> asyncio.Semaphore:
+        """호스트별 동시 요청 제한"""
+        host = urlparse(url).netloc
+        semaphore = self._host_limits.get(host)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.settings.max_connections_per_host)
+            self._host_limits[host] = semaphore
+        return semaphore
+
+    async def post(self, url: str, payload: dict) -> httpx.Response:
+        """콜백 URL로 JSON 페이로드 전송 (네트워크 예외는 호출자에게 전파)"""
+        client = self._get_client()
+        async with self._host_semaphore(url):
+            return await client.post(url, json=payload)
+
+    async def close(self):
+        """연결 풀 정리"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
@@ -0,0 +1,140 @@
+"""
+섹션 단위 콜백 병합 (coalescing)
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from .outbox import CallbackOutbox
+
+logger = logging.getLogger(__name__)
+
+GroupKey = Tuple[str, str, Any, Any]
+
+
+@dataclass
+class _Group:
+    """같은 (lectureId, sectionIndex) 콜백 버퍼"""
+    kind: str
+    url: str
+    base_payload: Dict[str, Any]
+    list_field: str
+    expected: int = 0
+    reported: int = 0
+    sent: int = 0
+    items: List[dict] = field(default_factory=list)
+    timer: Optional[asyncio.Task] = None
+
+
+class CoalescedBatch:
+    """한 요청이 보고할 콜백 묶음 핸들"""
+
+    def __init__(self, coalescer: "CallbackCoalescer", key: GroupKey, expected: int):
+        self._coalescer = coalescer
+        self._key = key
+        self._remaining = expected
+
+    async def add(self, items: List[dict]):
+        """항목 보고 (provider 1개 또는 질문 1개 = 보고 1회)"""
+        if self._remaining <= 0:
+            return
+        self._remaining -= 1
+        await self._coalescer._add(self._key, items, reports=1)
+
+    async def finish(self):
+        """남은 보고를 빈 결과로 처리해 버퍼를 즉시 비움"""
+        if self._remaining <= 0:
+            return
+        remaining, self._remaining = self._remaining, 0
+        await self._coalescer._add(self._key, [], reports=remaining)
+
+
+class CallbackCoalescer:
+    """같은 섹션의 콜백을 짧은 시간 동안 모아 하나의 페이로드로 전송
+
+    예상 보고 수(provider 수, 질문 유형 수)가 모두 도착하거나
+    첫 항목 도착 후 window 초가 지나면 모은 항목을 한 번에 보낸다.
+    """
+
+    def __init__(self, outbox: CallbackOutbox, window: float):
+        self.outbox = outbox
+        self.window = window
+        self._groups: Dict[GroupKey, _Group] = {}
+        self._lock = asyncio.Lock()
+
+    def reserve(
+        self,
+        *,
+        kind: str,
+        url: str,
+        base_payload: Dict[str, Any],
+        list_field: str,
+        expected: int,
+    ) -> CoalescedBatch:
+        """섹션 버퍼에 예상 보고 수를 등록하고 핸들 반환"""
+        key: GroupKey = (kind, url, base_payload.get("lectureId"), base_payload.get("sectionIndex"))
+        group = self._groups.get(key)
+        if group is None:
+            group = _Group(kind=kind, url=url, base_payload=dict(base_payload), list_field=list_field)
+            self._groups[key] = group
+        group.expected += expected
+        return CoalescedBatch(self, key, expected)
+
+    async def _add(self, key: GroupKey, items: List[dict], reports: int):
+        async with self._lock:
+            group = self._groups.get(key)
+            if group is None:
+                return
+            group.items.extend(items)
+            group.reported += reports
+            if group.reported >= group.expected:
+                # 모든 보고 도착 → 즉시 전송 후 버퍼 제거
+                self._groups.pop(key, None)
+                if group.timer is not None:
+                    group.timer.cancel()
+                payload = self._take(group, final=True)
+            else:
+                if group.items and group.timer is None:
+                    group.timer = asyncio.create_task(self._flush_after_window(key, group))
+                payload = None
+        if payload is not None:
+            await self.outbox.send(group.url, payload, kind=group.kind)
+
+    async def _flush_after_window(self, key: GroupKey, group: _Group):
+        await asyncio.sleep(self.window)
+        async with self._lock:
+            group.timer = None
+            if self._groups.get(key) is not group or not group.items:
+                return
+            payload = self._take(group, final=False)
+        logger.debug("콜백 병합 window 만료: %s (%s건)", key, len(payload[group.list_field]))
+        await self.outbox.send(group.url, payload, kind=group.kind)
+
+    @staticmethod
+    def _take(group: _Group, final: bool) -> Optional[Dict[str, Any]]:
+        """버퍼를 비우고 전송할 페이로드 생성 (보낼 것이 없으면 None)"""
+        if not group.items and (not final or group.sent):
+            return None
+        items, group.items = group.items, []
+        group.sent += 1
+        payload = dict(group.base_payload)
+        payload[group.list_field] = items
+        return payload
+
+    async def close(self):
+        """종료 시 버퍼에 남은 항목 모두 전송"""
+        async with self._lock:
+            groups = list(self._groups.values())
+            self._groups.clear()
+            payloads = []
+            for group in groups:
+                if group.timer is not None:
+                    group.timer.cancel()
+                payload = self._take(group, final=False)
+                if payload is not None:
+                    payloads.append((group, payload))
+        for group, payload in payloads:
+            await self.outbox.send(group.url, payload, kind=group.kind)
@@ -3,13 +3,66 @@ FastAPI 서버 설정 정의
 """
 from __future__ import annotations
 
-from typing import List
+from typing import List, Optional
 
 from pydantic import BaseModel, Field, HttpUrl
 
 from .models import QnAType
 
 
+class RetrievalCacheSettings(BaseModel):
+    """RAG 검색 결과 캐시 설정"""
+
+    enabled: bool = Field(default=True, description="QA/REC 공용 검색 결과 캐시 사용 여부")
+    max_bytes: int = Field(default=16 * 1024 * 1024, ge=0, description="메모리 캐시 최대 크기(바이트, 직렬화 기준)")
+    ttl_seconds: float = Field(default=600.0, gt=0, description="캐시 항목 유지 시간(초)")
+    generation_path: str | None = Field(
+        default=None, description="업서트 세대 번호를 워커끼리 공유할 SQLite 경로 (미지정 시 프로세스 내부에서만 관리)"
+    )
+
+
+class EmbeddingCacheSettings(BaseModel):
+    """쿼리/업서트 임베딩 캐시 설정"""
+
+    enabled: bool = Field(default=True, description="업서트 임베딩을 retrieve 쿼리 임베딩에 재사용할지 여부")
+    max_bytes: int = Field(default=64 * 1024 * 1024, ge=0, description="메모리 캐시 최대 크기(바이트, float32 기준)")
+    disk_path: str | None = Field(default=None, description="SQLite 공유 캐시 경로 (미지정 시 메모리만 사용)")
+    disk_ttl_seconds: float = Field(default=30 * 24 * 3600, gt=0, description="디스크 항목 유지 시간(초)")
+
+
+class PDFUploadSettings(BaseModel):
+    """PDF 업로드 저장/중복 처리 설정"""
+
+    upload_dir: str = Field(default="server_storage/uploads", description="업로드 PDF 저장 디렉터리 (강의별 하위 폴더)")
+    max_bytes: int = Field(default=100 * 1024 * 1024, gt=0, description="PDF 최대 크기(바이트, 초과 시 413)")
+    chunk_size: int = Field(default=1024 * 1024, gt=0, description="디스크 저장 시 한 번에 복사할 크기(바이트)")
+    dedup: bool = Field(default=True, description="같은 컬렉션에 같은 내용(SHA-256)이 이미 업서트됐으면 다시 처리하지 않음")
+    registry_path: str = Field(default="server_storage/pdf_ingests.db", description="업서트한 PDF 해시 기록 SQLite 경로")
+
+
+class PDFIngestSettings(BaseModel):
+    """비동기 PDF 업서트 작업 설정 (페이지 추출 → 청크 분할 → 배치 임베딩 파이프라인)"""
+
+    chunk_chars: int = Field(default=1200, ge=100, description="청크 최대 글자 수")
+    chunk_overlap: int = Field(default=150, ge=0, description="이웃 청크와 겹치는 글자 수")
+    embed_batch_size: int = Field(default=64, ge=1, description="upsert_text(임베딩 API) 1회당 청크 수")
+    prefetch_pages: int = Field(default=16, ge=1, description="임베딩 중 미리 추출해 둘 최대 페이지 수")
+    progress_interval: float = Field(default=0.5, gt=0, description="진행 상황 저장 최소 간격(초)")
+    job_ttl_seconds: float = Field(default=24 * 3600, gt=0, description="끝난 작업 조회 가능 기간(초)")
+
+
+class PDFExtractionSettings(BaseModel):
+    """PDF 텍스트 추출 프로세스 풀 설정 (pypdf 파싱은 순수 Python CPU 작업이라 워커 GIL과 분리)"""
+
+    enabled: bool = Field(default=True, description="비동기 업서트 작업에서 프로세스 풀로 페이지 추출")
+    max_workers: Optional[int] = Field(
+        default=None, ge=1, description="추출 프로세스 수 (None이면 (CPU 코어 수 - 1) / 워커 수)"
+    )
+    pages_per_task: int = Field(default=8, ge=1, description="프로세스 작업 하나가 맡는 페이지 수")
+    task_timeout: float = Field(default=120.0, gt=0, description="페이지 범위 하나의 추출 제한 시간(초)")
+    start_method: str = Field(default="spawn", description="multiprocessing 시작 방식 (spawn/forkserver/fork)")
+
+
 class RAGSettings(BaseModel):
     """RAG 관련 설정"""
     
@@ -19,6 +72,15 @@ class RAGSettings(BaseModel):
     qa_retrieve_top_k: int = Field(default=2, ge=1, description="QA 컨텍스트로 사용할 청크 개수")
     # REC용 RAG 검색 개수
     rec_retrieve_top_k: int = Field(default=2, ge=1, description="REC 컨텍스트로 사용할 청크 개수")
+    # 검색 결과 캐시 (업서트 시 컬렉션 단위 무효화)
+    retrieval_cache: RetrievalCacheSettings = Field(default_factory=RetrievalCacheSettings)
+    # 임베딩 캐시 ((model, 텍스트 해시) 기준, 바이트 크기 LRU)
+    embedding_cache: EmbeddingCacheSettings = Field(default_factory=EmbeddingCacheSettings)
+    # PDF 업로드 (청크 단위 디스크 저장 + 내용 해시 중복 제거)
+    pdf_upload: PDFUploadSettings = Field(default_factory=PDFUploadSettings)
+    # 비동기 PDF 업서트 (202 + /rag/jobs/{id} 진행 상황)
+    pdf_ingest: PDFIngestSettings = Field(default_factory=PDFIngestSettings)
+    pdf_extraction: PDFExtractionSettings = Field(default_factory=PDFExtractionSettings)
 
 
 class QASettings(BaseModel):
@@ -43,6 +105,7 @@ class OpenAlexSettings(BaseModel):
     top_k: int = Field(default=1, ge=1, le=10, description="논문 추천 개수")
     verify: bool = Field(default=True, description="LLM 검증 여부")
     #verify: bool = Field(default=False, description="LLM 검증 여부")
+    verify_batch: bool = Field(default=False, description="여러 논문을 한 번의 LLM 호출로 일괄 검증할지 여부")
     year_from: int = Field(default=1960, description="검색 최소 연도")
     sort_by: str = Field(default="hybrid", description="정렬 기준")
     min_score: float = Field(default=5.0, ge=0.0, le=10.0, description="최소 점수")
@@ -67,6 +130,7 @@ class YouTubeSettings(BaseModel):
     top_k: int = Field(default=1, ge=1, le=10, description="YouTube 추천 개수")
     verify: bool = Field(default=True, description="LLM 검증 여부")
     #verify: bool = Field(default=False, description="LLM 검증 여부")
+    verify_batch: bool = Field(default=False, description="여러 영상을 한 번의 LLM 호출로 일괄 검증할지 여부")
     yt_lang: str = Field(default="en", description="YouTube 검색 언어")
     language: str = Field(default="ko", description="응답 언어")
     min_score: float = Field(default=7.0, ge=0.0, le=10.0, description="최소 점수")
@@ -78,6 +142,7 @@ class GoogleSettings(BaseModel):
     top_k: int = Field(default=1, ge=1, le=10, description="Google 추천 개수")
     verify: bool = Field(default=True, description="LLM 검증 여부")
     #verify: bool = Field(default=False, description="LLM 검증 여부")
+    verify_batch: bool = Field(default=False, description="여러 검색 결과를 한 번의 LLM 호출로 일괄 검증할지 여부")
     search_lang: str = Field(default="en", description="Google 검색 언어")
     language: str = Field(default="ko", description="응답 언어")
     min_score: float = Field(default=3.0, ge=0.0, le=10.0, description="최소 점수")
@@ -123,6 +188,122 @@ class SummarySettings(BaseModel):
     )
 
 
+class CallbackSettings(BaseModel):
+    """백엔드 콜백 전송 설정"""
+
+    timeout: float = Field(default=30.0, gt=0, description="콜백 요청 전체 타임아웃(초)")
+    connect_timeout: float = Field(default=5.0, gt=0, description="콜백 연결 타임아웃(초)")
+    http2: bool = Field(default=False, description="HTTP/2 사용 여부 (h2 패키지 필요)")
+    max_connections: int = Field(default=100, ge=1, description="전체 최대 동시 연결 수")
+    max_keepalive_connections: int = Field(default=20, ge=0, description="유지할 keep-alive 연결 수")
+    keepalive_expiry: float = Field(default=30.0, ge=0, description="유휴 keep-alive 연결 유지 시간(초)")
+    max_connections_per_host: int = Field(default=20, ge=1, description="호스트당 최대 동시 요청 수")
+    coalesce: bool = Field(default=False, description="같은 섹션의 QA/REC 콜백을 모아 한 번에 전송할지 여부")
+    coalesce_window: float = Field(default=2.0, gt=0, description="콜백 병합 대기 시간(초, 첫 항목 도착 기준)")
+
+
+class MetricsSettings(BaseModel):
+    """Prometheus 지표 설정"""
+
+    enabled: bool = Field(default=True, description="/metrics 지표 수집 여부 (prometheus-client 필요)")
+
+
+class TracingSettings(BaseModel):
+    """요청 단위 span 추적 설정"""
+
+    enabled: bool = Field(default=True, description="span 추적 여부")
+    export_path: str = Field(default="server_storage/traces.jsonl", description="span JSONL 출력 경로")
+    slow_threshold: float = Field(default=10.0, ge=0.0, description="전체 span 트리를 남길 느린 요청 기준 (초)")
+    sample_ratio: float = Field(default=0.0, ge=0.0, le=1.0, description="기준보다 빠른 요청의 무작위 기록 비율")
+    max_spans_per_trace: int = Field(default=2000, ge=1, description="요청 하나에서 보관할 최대 span 수")
+
+
+class StreamSettings(BaseModel):
+    """SSE 스트리밍 엔드포인트 설정"""
+
+    heartbeat_interval: float = Field(default=15.0, gt=0, description="결과가 없을 때 heartbeat 이벤트 전송 간격(초)")
+
+
+class LLMCacheSettings(BaseModel):
+    """LLM 응답 캐시 설정"""
+
+    enabled: bool = Field(default=True, description="동일 프롬프트 LLM 응답 캐시 사용 여부")
+    max_bytes: int = Field(default=64 * 1024 * 1024, ge=0, description="메모리 캐시 최대 크기(바이트, 직렬화 기준)")
+    ttl_seconds: float = Field(default=7 * 24 * 3600, gt=0, description="캐시 항목 유지 시간(초)")
+    disk_path: str | None = Field(default=None, description="SQLite 디스크 캐시 경로 (미지정 시 메모리만 사용)")
+
+
+class LLMSettings(BaseModel):
+    """공유 OpenAI 클라이언트 설정 (서버 + 모든 provider 모듈 공통)"""
+
+    base_url: Optional[str] = Field(
+        default=None, description="OpenAI API 주소 (모의 서버/프록시용, 미지정 시 OPENAI_BASE_URL 또는 공식 주소)"
+    )
+    timeout: float = Field(default=30.0, gt=0, description="OpenAI 요청 타임아웃(초)")
+    connect_timeout: float = Field(default=5.0, gt=0, description="OpenAI 연결 타임아웃(초)")
+    max_retries: int = Field(default=2, ge=0, description="OpenAI SDK 자동 재시도 횟수")
+    http2: bool = Field(default=True, description="HTTP/2 사용 여부 (h2 패키지 필요)")
+    max_connections: int = Field(default=100, ge=1, description="최대 동시 연결 수")
+    max_keepalive_connections: int = Field(default=40, ge=0, description="유지할 keep-alive 연결 수")
+    keepalive_expiry: float = Field(default=60.0, ge=0, description="유휴 keep-alive 연결 유지 시간(초)")
+    cache: LLMCacheSettings = Field(default_factory=LLMCacheSettings)
+
+
+class OutboxSettings(BaseModel):
+    """콜백 아웃박스(재시도/영속화) 설정"""
+
+    enabled: bool = Field(default=True, description="콜백을 SQLite 아웃박스에 기록 후 전송할지 여부")
+    path: str = Field(default="server_storage/callback_outbox.db", description="아웃박스 SQLite 파일 경로")
+    workers: int = Field(default=4, ge=1, description="재시도 워커 수")
+    max_attempts: int = Field(default=8, ge=1, description="dead-letter로 이동하기 전 최대 전송 시도 횟수")
+    base_backoff: float = Field(default=1.0, gt=0, description="재시도 기본 대기 시간(초)")
+    max_backoff: float = Field(default=300.0, gt=0, description="재시도 최대 대기 시간(초)")
+    poll_interval: float = Field(default=1.0, gt=0, description="워커가 재시도 대상을 조회하는 주기(초)")
+    lease_seconds: float = Field(default=60.0, gt=0, description="전송 중 항목 점유 시간(초, 만료 시 다른 워커가 재시도)")
+
+
+class JobPoolSettings(BaseModel):
+    """작업 종류별 워커 풀 설정"""
+
+    concurrency: int = Field(default=8, ge=1, description="동시에 실행할 최대 작업 수")
+    max_queue_depth: int = Field(default=64, ge=0, description="실행 대기 가능한 최대 작업 수 (초과 시 429)")
+
+
+class SchedulerSettings(BaseModel):
+    """백그라운드 작업 스케줄러 설정"""
+
+    qa: JobPoolSettings = Field(default_factory=lambda: JobPoolSettings(concurrency=8, max_queue_depth=64))
+    rec: JobPoolSettings = Field(default_factory=lambda: JobPoolSettings(concurrency=8, max_queue_depth=64))
+    summary: JobPoolSettings = Field(default_factory=lambda: JobPoolSettings(concurrency=16, max_queue_depth=128))
+    pipeline: JobPoolSettings = Field(default_factory=lambda: JobPoolSettings(concurrency=8, max_queue_depth=64))
+    ingest: JobPoolSettings = Field(default_factory=lambda: JobPoolSettings(concurrency=2, max_queue_depth=16))
+    retry_after: int = Field(default=5, ge=1, description="대기열 초과 시 Retry-After 헤더 값(초)")
+    drain_timeout: float = Field(default=30.0, ge=0, description="종료 시 진행 중 작업 완료를 기다릴 최대 시간(초)")
+
+
+class ServiceSettings(BaseModel):
+    """서비스(RAG/QA/provider) 생성 시점 설정"""
+
+    lazy: bool = Field(default=True, description="처음 사용할 때 서비스를 생성할지 여부 (False면 create_app에서 모두 생성)")
+    warm_up: bool = Field(default=True, description="서버 시작 직후 백그라운드에서 서비스를 미리 생성할지 여부")
+    warm_up_services: List[str] = Field(
+        default_factory=lambda: ["rag", "qa", "openalex", "wiki", "youtube", "google"],
+        description="워밍업 대상과 순서",
+    )
+
+
+class WorkerSettings(BaseModel):
+    """멀티 워커(uvicorn --workers) 배포 설정"""
+
+    shared_cache_dir: str | None = Field(
+        default=None,
+        description=(
+            "워커 공용 SQLite 캐시 디렉터리 (미지정 시 LIVENOTE_SHARED_CACHE_DIR 환경 변수). "
+            "지정하면 disk_path가 비어 있는 LLM/임베딩 캐시가 이 디렉터리의 파일을 공유한다"
+        ),
+    )
+
+
 class AppSettings(BaseModel):
     """서버 전체 설정"""
     
@@ -130,3 +311,12 @@ class AppSettings(BaseModel):
     qa: QASettings = Field(default_factory=QASettings)
     rec: RECSettings = Field(default_factory=RECSettings)
     summary: SummarySettings = Field(default_factory=SummarySettings)
+    callback: CallbackSettings = Field(default_factory=CallbackSettings)
+    stream: StreamSettings = Field(default_factory=StreamSettings)
+    metrics: MetricsSettings = Field(default_factory=MetricsSettings)
+    tracing: TracingSettings = Field(default_factory=TracingSettings)
+    outbox: OutboxSettings = Field(default_factory=OutboxSettings)
+    scheduler: SchedulerSettings = Field(default_factory=SchedulerSettings)
+    llm: LLMSettings = Field(default_factory=LLMSettings)
+    services: ServiceSettings = Field(default_factory=ServiceSettings)
+    workers: WorkerSettings = Field(default_factory=WorkerSettings)
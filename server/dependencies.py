@@ -6,37 +6,98 @@ from __future__ import annotations
 from fastapi import Request
 
 from .config import AppSettings
+from .services import ServiceRegistry
 
 async def get_settings(request: Request) -> AppSettings:
     """앱 설정 조회"""
     return request.app.state.app_settings
 
 
+async def get_service_registry(request: Request) -> ServiceRegistry:
+    """지연 생성 서비스 레지스트리 (필요한 provider만 골라 생성할 때 사용)"""
+    return request.app.state.services
+
+
 async def get_rag_service(request: Request):
-    """RAG 서비스 인스턴스"""
-    return request.app.state.rag_service
+    """RAG 서비스 인스턴스 (첫 호출 시 생성)"""
+    return await request.app.state.services.get("rag")
 
 
 async def get_qa_service(request: Request):
-    """QA 서비스 인스턴스"""
-    return request.app.state.qa_service
+    """QA 서비스 인스턴스 (첫 호출 시 생성)"""
+    return await request.app.state.services.get("qa")
 
 
 async def get_openalex_service(request: Request):
-    """OpenAlex 서비스 인스턴스"""
-    return request.app.state.openalex_service
+    """OpenAlex 서비스 인스턴스 (첫 호출 시 생성)"""
+    return await request.app.state.services.get("openalex")
 
 
 async def get_wiki_service(request: Request):
-    """Wikipedia 서비스 인스턴스"""
-    return request.app.state.wiki_service
+    """Wikipedia 서비스 인스턴스 (첫 호출 시 생성)"""
+    return await request.app.state.services.get("wiki")
 
 
 async def get_youtube_service(request: Request):
-    """YouTube 서비스 인스턴스"""
-    return request.app.state.youtube_service
+    """YouTube 서비스 인스턴스 (첫 호출 시 생성)"""
+    return await request.app.state.services.get("youtube")
 
 
 async def get_google_service(request: Request):
-    """Google 서비스 인스턴스"""
-    return request.app.state.google_service
+    """Google 서비스 인스턴스 (첫 호출 시 생성)"""
+    return await request.app.state.services.get("google")
+
+
+async def get_callback_dispatcher(request: Request):
+    """콜백 디스패처 인스턴스"""
+    return request.app.state.callback_dispatcher
+
+
+async def get_callback_outbox(request: Request):
+    """콜백 아웃박스 인스턴스"""
+    return request.app.state.callback_outbox
+
+
+async def get_callback_coalescer(request: Request):
+    """콜백 병합기 인스턴스"""
+    return request.app.state.callback_coalescer
+
+
+async def get_job_scheduler(request: Request):
+    """백그라운드 작업 스케줄러 인스턴스"""
+    return request.app.state.job_scheduler
+
+
+async def get_llm_registry(request: Request):
+    """공유 OpenAI 클라이언트 레지스트리"""
+    return request.app.state.llm_registry
+
+
+async def get_retrieval_cache(request: Request):
+    """RAG 검색 결과 캐시"""
+    return request.app.state.retrieval_cache
+
+
+async def get_pdf_registry(request: Request):
+    """PDF 업서트 이력 (내용 해시 중복 제거)"""
+    return request.app.state.pdf_registry
+
+
+async def get_ingest_jobs(request: Request):
+    """비동기 PDF 업서트 작업 실행/조회"""
+    return request.app.state.ingest_jobs
+
+
+async def get_embedding_cache(request: Request):
+    """임베딩 캐시 (비활성화 시 None)"""
+    return request.app.state.embedding_cache
+
+
+async def get_metrics(request: Request):
+    """Prometheus 지표 수집기"""
+    return request.app.state.metrics
+
+
+async def get_tracer(request: Request):
+    """요청 단위 span 추적기"""
+    return request.app.state.tracer
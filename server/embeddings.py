@@ -0,0 +1,189 @@
+"""
+임베딩 캐시 (text-upsert에서 계산한 벡터를 retrieve 쿼리 임베딩에 재사용)
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import threading
+import time
+from array import array
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .cache import CacheTier, SQLiteCacheTier
+from .config import EmbeddingCacheSettings
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_EMBEDDING_MODEL = "text-embedding-3-large"
+
+
+class EmbeddingCache:
+    """(model, 텍스트 해시) 기준 임베딩 LRU 캐시 (바이트 크기 제한, 스레드 안전)
+
+    RAG 서비스는 asyncio.to_thread 안에서 동기로 호출되므로 threading.Lock을 사용한다.
+    벡터는 float32 배열로 보관한다 (Chroma 저장 정밀도와 동일).
+    disk_path(또는 disk 계층)를 지정하면 메모리 미스에서 SQLite를 조회하므로
+    다른 워커가 업서트하며 계산한 벡터도 재사용된다.
+    """
+
+    def __init__(self, settings: EmbeddingCacheSettings | None = None, disk: Optional[CacheTier] = None):
+        self.settings = settings or EmbeddingCacheSettings()
+        self.max_bytes = self.settings.max_bytes
+        if disk is None and self.settings.disk_path:
+            disk = SQLiteCacheTier(self.settings.disk_path, table="embedding_cache")
+        self.disk = disk
+        self._entries: "OrderedDict[str, array]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.stored = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(model: str, text: str) -> str:
+        return f"{model}:{hashlib.sha256(text.encode('utf-8')).hexdigest()}"
+
+    def get(self, model: str, text: str) -> Optional[List[float]]:
+        key = self.make_key(model, text)
+        with self._lock:
+            vector = self._entries.get(key)
+            if vector is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return vector.tolist()
+        row = self._get_disk(key)
+        if row is None:
+            with self._lock:
+                self.misses += 1
+            return None
+        stored = array("f")
+        stored.frombytes(row)
+        with self._lock:
+            self.disk_hits += 1
+            self._put_memory(key, stored)
+        return stored.tolist()
+
+    def _get_disk(self, key: str) -> Optional[bytes]:
+        if self.disk is None:
+            return None
+        try:
+            row = self.disk.get(key)
+        except Exception as exc:  # pragma: no cover - 디스크 잠금/손상
+            logger.warning("임베딩 디스크 캐시 조회 실패: %s", exc)
+            return None
+        if row is None or not isinstance(row[0], bytes):
+            return None
+        return row[0]
+
+    def set(self, model: str, text: str, vector: Sequence[float]):
+        stored = array("f", vector)
+        key = self.make_key(model, text)
+        if self.disk is not None:
+            try:
+                self.disk.set(key, stored.tobytes(), time.time() + self.settings.disk_ttl_seconds)
+            except Exception as exc:  # pragma: no cover - 디스크 잠금/손상
+                logger.warning("임베딩 디스크 캐시 저장 실패: %s", exc)
+        with self._lock:
+            self.stored += 1
+            self._put_memory(key, stored)
+
+    def _put_memory(self, key: str, stored: array):
+        """메모리 LRU 저장 (self._lock 보유 상태에서 호출)"""
+        size = stored.itemsize * len(stored)
+        if size > self.max_bytes:
+            return
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._bytes -= previous.itemsize * len(previous)
+        self._entries[key] = stored
+        self._bytes += size
+        while self._bytes > self.max_bytes and self._entries:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= evicted.itemsize * len(evicted)
+            self.evictions += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """임베딩 캐시 적중/미스 지표"""
+        with self._lock:
+            lookups = self.hits + self.disk_hits + self.misses
+            return {
+                "enabled": True,
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "stored": self.stored,
+                "evictions": self.evictions,
+                "hit_ratio": (self.hits + self.disk_hits) / lookups if lookups else 0.0,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "shared": self.disk is not None,
+            }
+
+    def close(self):
+        if self.disk is not None:
+            self.disk.close()
+
+
+class CachedEmbeddingService:
+    """RAG embedding_service 프록시: embed_texts 결과를 텍스트 단위로 캐시
+
+    업서트 시 계산한 벡터가 캐시에 채워지므로, 같은 section_summary로 들어오는
+    QA/REC의 쿼리 임베딩은 OpenAI 호출 없이 처리된다.
+    캐시에 없는 텍스트만 묶어서 원래 서비스로 보낸다.
+    """
+
+    def __init__(self, service, cache: EmbeddingCache, model: str):
+        self._service = service
+        self._cache = cache
+        self.model = model
+
+    def embed_texts(self, texts: Sequence[str], *args, **kwargs) -> List[List[float]]:
+        texts = list(texts)
+        vectors: List[Optional[List[float]]] = [self._cache.get(self.model, text) for text in texts]
+        missing: List[Tuple[int, str]] = [(i, text) for i, text in enumerate(texts) if vectors[i] is None]
+        if missing:
+            computed = self._service.embed_texts([text for _, text in missing], *args, **kwargs)
+            for (i, text), vector in zip(missing, computed):
+                vectors[i] = list(vector)
+                self._cache.set(self.model, text, vector)
+        return vectors  # type: ignore[return-value]
+
+    def embed_query(self, text: str, *args, **kwargs) -> List[float]:
+        cached = self._cache.get(self.model, text)
+        if cached is not None:
+            return cached
+        if hasattr(self._service, "embed_query"):
+            vector = self._service.embed_query(text, *args, **kwargs)
+        else:
+            vector = self._service.embed_texts([text], *args, **kwargs)[0]
+        self._cache.set(self.model, text, vector)
+        return list(vector)
+
+    def __getattr__(self, name):
+        return getattr(self._service, name)
+
+
+def _resolve_model(service) -> str:
+    for attr in ("model", "model_name"):
+        value = getattr(service, attr, None)
+        if isinstance(value, str) and value:
+            return value
+    return os.getenv("RAG_EMBEDDING_MODEL", DEFAULT_EMBEDDING_MODEL)
+
+
+def install_embedding_cache(rag_service, cache: EmbeddingCache) -> bool:
+    """rag_service.embedding_service를 캐시 프록시로 교체 (지원하지 않는 서비스면 False)"""
+    service = getattr(rag_service, "embedding_service", None)
+    if service is None or not hasattr(service, "embed_texts"):
+        logger.info("임베딩 캐시 미적용: rag_service에 embedding_service.embed_texts가 없습니다.")
+        return False
+    if isinstance(service, CachedEmbeddingService):
+        return True
+    rag_service.embedding_service = CachedEmbeddingService(service, cache, _resolve_model(service))
+    return True
@@ -0,0 +1,189 @@
+"""
+PDF 텍스트 추출 프로세스 풀
+
+pypdf 파싱은 순수 Python CPU 작업이라 asyncio.to_thread로 돌려도 GIL을 잡고 같은 워커의
+다른 요청(REC/QA)을 느리게 만든다. 문서를 페이지 범위로 나눠 프로세스 풀에 분산하고,
+끝난 범위부터 페이지 순서대로 텍스트를 흘려보낸다 (PDFIngestJobs의 페이지 소스).
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+
+from .config import PDFExtractionSettings
+from .ingest import PageStream
+from .workers import WORKERS_ENV
+
+logger = logging.getLogger(__name__)
+
+# 추출 프로세스마다 최근 문서 하나의 reader를 재사용 (범위마다 xref를 다시 파싱하지 않음)
+_READER_CACHE: Dict[str, tuple] = {}
+
+# 다른 문서의 시간 초과로 풀이 재시작돼 중단된 범위를 새 풀에서 다시 실행하는 최대 횟수
+_RESUBMIT_LIMIT = 2
+
+
+class ExtractionTimeoutError(TimeoutError):
+    """페이지 범위 추출 제한 시간 초과"""
+
+    def __init__(self, start: int, stop: int, timeout: float):
+        super().__init__(f"PDF {start + 1}-{stop}페이지 추출이 {timeout:g}초 안에 끝나지 않았습니다.")
+        self.start = start
+        self.stop = stop
+
+
+def _reader(pdf_path: str):
+    from pypdf import PdfReader
+
+    mtime = os.stat(pdf_path).st_mtime_ns
+    cached = _READER_CACHE.get(pdf_path)
+    if cached is None or cached[0] != mtime:
+        _READER_CACHE.clear()
+        cached = (mtime, PdfReader(pdf_path))
+        _READER_CACHE[pdf_path] = cached
+    return cached[1]
+
+
+def count_pages(pdf_path: str) -> int:
+    """(추출 프로세스) 전체 페이지 수"""
+    return len(_reader(pdf_path).pages)
+
+
+def extract_range(pdf_path: str, start: int, stop: int) -> List[str]:
+    """(추출 프로세스) [start, stop) 페이지 텍스트"""
+    pages = _reader(pdf_path).pages
+    return [pages[index].extract_text() or "" for index in range(start, stop)]
+
+
+def resolve_pool_size(settings: PDFExtractionSettings) -> int:
+    """추출 프로세스 수 (미지정 시 이벤트 루프 몫으로 코어 하나를 남기고 워커 수로 나눔)"""
+    if settings.max_workers:
+        return settings.max_workers
+    cores = os.cpu_count() or 1
+    try:
+        workers = max(1, int(os.environ.get(WORKERS_ENV) or 1))
+    except ValueError:
+        workers = 1
+    return max(1, (cores - 1) // workers)
+
+
+class ProcessPageExtractor:
+    """프로세스 풀 PDF 페이지 추출기
+
+    pages_per_task 페이지씩 범위를 나눠 풀 크기의 두 배까지만 미리 제출하고(소비가 느리면 제출도 멈춤),
+    결과는 제출 순서대로 기다려 페이지 순서를 유지한다. 범위 하나가 task_timeout을 넘기면
+    실행 중인 작업은 취소할 수 없으므로 풀 프로세스를 종료하고 다음 사용 때 새로 만든다.
+    이때 함께 중단된 다른 문서의 범위는 실패로 보지 않고 새 풀에 다시 제출한다.
+    풀은 첫 추출 때 만든다 (워커 부팅 경로에서 제외).
+    """
+
+    def __init__(
+        self,
+        settings: PDFExtractionSettings | None = None,
+        count_pages_fn: Callable[[str], int] = count_pages,
+        extract_range_fn: Callable[[str, int, int], List[str]] = extract_range,
+    ):
+        self.settings = settings or PDFExtractionSettings()
+        self.pool_size = resolve_pool_size(self.settings)
+        # 풀에서 실행되므로 모듈 최상위 함수여야 함 (pickle)
+        self._count_pages = count_pages_fn
+        self._extract_range = extract_range_fn
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def _executor(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.pool_size,
+                mp_context=multiprocessing.get_context(self.settings.start_method),
+            )
+            logger.info("PDF 추출 프로세스 풀 시작: %d개 (%s)", self.pool_size, self.settings.start_method)
+        return self._pool
+
+    def _submit(self, fn: Callable, *args) -> Tuple[ProcessPoolExecutor, asyncio.Future]:
+        pool = self._executor()
+        return pool, asyncio.get_running_loop().run_in_executor(pool, fn, *args)
+
+    def _reset_pool(self, pool: ProcessPoolExecutor):
+        if pool is not self._pool:
+            return  # 이미 다른 작업이 재시작함
+        self._pool = None
+        for process in list((getattr(pool, "_processes", None) or {}).values()):
+            process.terminate()
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    def _interrupted_by_reset(self, pool: ProcessPoolExecutor, future: asyncio.Future) -> bool:
+        """다른 작업이 풀을 재시작해 중단(취소/BrokenProcessPool)된 결과인지"""
+        if pool is self._pool:
+            return False
+        if future.cancelled():
+            # 이 작업 자체가 취소된 경우는 제외
+            task = asyncio.current_task()
+            return task is None or not task.cancelling()
+        return isinstance(future.exception(), BrokenProcessPool)
+
+    async def _wait(
+        self, pool: ProcessPoolExecutor, future: asyncio.Future, start: int, stop: int, fn: Callable, *args
+    ):
+        """결과 대기 (다른 문서의 시간 초과로 중단되면 fn(*args)를 새 풀에서 다시 실행)"""
+        resubmits = 0
+        while True:
+            try:
+                return await asyncio.wait_for(future, self.settings.task_timeout)
+            except asyncio.TimeoutError as exc:
+                logger.warning("PDF 추출 시간 초과 (%d-%d페이지) → 추출 프로세스 재시작", start + 1, stop)
+                self._reset_pool(pool)
+                raise ExtractionTimeoutError(start, stop, self.settings.task_timeout) from exc
+            except (BrokenProcessPool, asyncio.CancelledError) as exc:
+                if resubmits >= _RESUBMIT_LIMIT or not self._interrupted_by_reset(pool, future):
+                    if isinstance(exc, BrokenProcessPool):
+                        self._reset_pool(pool)
+                    raise
+            resubmits += 1
+            logger.info("추출 프로세스 재시작으로 중단된 %d-%d페이지를 다시 추출", start + 1, stop)
+            pool, future = self._submit(fn, *args)
+
+    async def open_pages(self, pdf_path: str) -> Tuple[int, PageStream]:
+        """(전체 페이지 수, (페이지 번호, 텍스트)를 순서대로 내보내는 비동기 반복자)"""
+        pdf_path = os.path.abspath(pdf_path)
+        pool, future = self._submit(self._count_pages, pdf_path)
+        total = await self._wait(pool, future, 0, 0, self._count_pages, pdf_path)
+        step = self.settings.pages_per_task
+        ranges = deque((start, min(start + step, total)) for start in range(0, total, step))
+
+        async def pages() -> PageStream:
+            in_flight: Deque[Tuple[int, int, ProcessPoolExecutor, asyncio.Future]] = deque()
+
+            def submit_next():
+                start, stop = ranges.popleft()
+                in_flight.append((start, stop, *self._submit(self._extract_range, pdf_path, start, stop)))
+
+            try:
+                while ranges and len(in_flight) < self.pool_size * 2:
+                    submit_next()
+                started = time.perf_counter()
+                while in_flight:
+                    start, stop, pool, future = in_flight.popleft()
+                    texts = await self._wait(pool, future, start, stop, self._extract_range, pdf_path, start, stop)
+                    if ranges:
+                        submit_next()
+                    for offset, text in enumerate(texts):
+                        yield start + offset + 1, text
+                logger.debug("PDF 추출 완료: %s (%d페이지, %.2fs)", pdf_path, total, time.perf_counter() - started)
+            finally:
+                # 소비자가 중간에 멈추면 아직 시작 안 한 범위는 취소
+                for _, _, _, future in in_flight:
+                    future.cancel()
+
+        return total, pages()
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
@@ -0,0 +1,271 @@
+"""
+비동기 PDF 업서트 작업 (페이지 추출 → 청크 분할 → 배치 임베딩/저장 파이프라인)
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+import uuid
+from dataclasses import asdict, dataclass, field
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from .config import PDFIngestSettings
+from .metrics import PipelineMetrics
+from .uploads import PDFIngestRegistry
+
+logger = logging.getLogger(__name__)
+
+# 이 시간 동안 진행 상황 저장이 없으면 죽은 워커의 작업으로 보고 같은 내용을 새로 받음
+ACTIVE_JOB_STALE_SECONDS = 300.0
+
+PageStream = AsyncIterator[Tuple[int, str]]
+
+_DONE = object()
+
+
+def _open_reader(pdf_path: str):
+    # pypdf는 첫 PDF 작업 때만 import (워커 부팅 경로에서 제외)
+    from pypdf import PdfReader
+
+    return PdfReader(pdf_path)
+
+
+def _page_text(reader, index: int) -> str:
+    return reader.pages[index].extract_text() or ""
+
+
+async def open_pdf_pages(pdf_path: str) -> Tuple[int, PageStream]:
+    """(전체 페이지 수, (페이지 번호, 텍스트)를 순서대로 내보내는 비동기 반복자) - 추출은 스레드에서 실행"""
+    reader = await asyncio.to_thread(_open_reader, pdf_path)
+    total = len(reader.pages)
+
+    async def pages() -> PageStream:
+        for index in range(total):
+            yield index + 1, await asyncio.to_thread(_page_text, reader, index)
+
+    return total, pages()
+
+
+def split_text(text: str, chunk_chars: int, overlap: int) -> List[str]:
+    """공백을 정리한 뒤 chunk_chars 이하 청크로 분할 (가능하면 공백에서 자르고 overlap만큼 겹침)"""
+    text = " ".join(text.split())
+    chunks: List[str] = []
+    start = 0
+    while start < len(text):
+        end = min(start + chunk_chars, len(text))
+        if end < len(text):
+            cut = text.rfind(" ", start + chunk_chars // 2, end)
+            if cut > start:
+                end = cut
+        chunks.append(text[start:end].strip())
+        if end >= len(text):
+            break
+        start = max(end - overlap, start + 1)
+    return [chunk for chunk in chunks if chunk]
+
+
+@dataclass
+class IngestJob:
+    """PDF 업서트 작업 상태 (PDFIngestRegistry에 JSON으로 저장)"""
+    job_id: str
+    collection_id: str
+    sha256: str
+    filename: str
+    size: int = 0  # 업로드 파일 바이트 수
+    status: str = "queued"  # queued → running → succeeded / failed
+    pages_total: Optional[int] = None
+    pages_extracted: int = 0
+    pages_done: int = 0  # 청크가 모두 임베딩/저장된 페이지 수
+    chunks_embedded: int = 0
+    batches: int = 0
+    created_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    error: Optional[str] = None
+    result: Optional[Dict[str, Any]] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def describe_job(state: Dict[str, Any], now: Optional[float] = None) -> Dict[str, Any]:
+    """저장된 작업 상태 + 진행률/경과 시간/예상 남은 시간(완료 페이지 처리 속도 기준)"""
+    now = time.time() if now is None else now
+    data = dict(state)
+    started_at, finished_at = state.get("started_at"), state.get("finished_at")
+    total, done = state.get("pages_total"), state.get("pages_done") or 0
+    elapsed = ((finished_at or now) - started_at) if started_at else 0.0
+    data["elapsed_seconds"] = round(elapsed, 3)
+    data["progress"] = round(done / total, 4) if total else (1.0 if state["status"] == "succeeded" else 0.0)
+    if state["status"] == "succeeded":
+        data["eta_seconds"] = 0.0
+    elif state["status"] == "running" and total and done:
+        data["eta_seconds"] = round(elapsed * (total - done) / done, 1)
+    else:
+        data["eta_seconds"] = None
+    return data
+
+
+class PDFIngestJobs:
+    """비동기 PDF 업서트 실행기
+
+    페이지 추출(생산자)과 청크 임베딩/저장(소비자)을 크기 제한 큐로 연결해, 한 배치를 임베딩하는 동안
+    다음 페이지들을 미리 추출한다. 임베딩은 embed_batch_size 청크씩 rag_service.upsert_text로 보낸다.
+    상태는 PDFIngestRegistry(SQLite)에 저장되므로 다른 워커에서도 조회할 수 있다.
+    """
+
+    def __init__(
+        self,
+        registry: PDFIngestRegistry,
+        settings: PDFIngestSettings | None = None,
+        metrics: Optional[PipelineMetrics] = None,
+        page_source: Optional[Callable[[str], Awaitable[Tuple[int, PageStream]]]] = None,
+    ):
+        self.registry = registry
+        self.settings = settings or PDFIngestSettings()
+        self.metrics = metrics
+        # 페이지 소스: 기본은 스레드 추출, 프로세스 풀(ProcessPageExtractor.open_pages)로 교체 가능
+        self.open_pages = page_source or open_pdf_pages
+        self._saved_at: Dict[str, float] = {}
+
+    async def create(self, collection_id: str, sha256: str, filename: str, size: int) -> IngestJob:
+        job = IngestJob(
+            job_id=uuid.uuid4().hex, collection_id=collection_id, sha256=sha256, filename=filename, size=size
+        )
+        await self._save(job, force=True)
+        return job
+
+    async def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        state = await asyncio.to_thread(self.registry.get_job, job_id)
+        return describe_job(state) if state is not None else None
+
+    async def active(self, collection_id: str, sha256: str) -> Optional[Dict[str, Any]]:
+        """같은 내용을 처리 중인 작업 (어느 워커든)"""
+        state = await asyncio.to_thread(self.registry.active_job, collection_id, sha256, ACTIVE_JOB_STALE_SECONDS)
+        return describe_job(state) if state is not None else None
+
+    async def fail(self, job: IngestJob, error: str):
+        """실패로 기록 (종료 중 취소돼도 상태는 남김)"""
+        job.status = "failed"
+        job.error = error
+        job.finished_at = time.time()
+        await asyncio.shield(self._save(job, force=True))
+        self._saved_at.pop(job.job_id, None)
+
+    async def _save(self, job: IngestJob, force: bool = False):
+        now = time.monotonic()
+        if not force and now - self._saved_at.get(job.job_id, 0.0) < self.settings.progress_interval:
+            return
+        self._saved_at[job.job_id] = now
+        await asyncio.to_thread(self.registry.save_job, job.to_dict())
+
+    def _item(self, job: IngestJob, page_no: int, index: int, text: str, base_metadata: Optional[dict]) -> dict:
+        metadata = dict(base_metadata or {})
+        metadata.update({"source": job.filename, "page": page_no, "content_sha256": job.sha256})
+        # 같은 내용을 다시 처리해도 같은 ID로 덮어씀
+        return {"text": text, "id": f"{job.sha256[:16]}-p{page_no}-c{index}", "metadata": metadata, "section_id": None}
+
+    async def run(
+        self,
+        job: IngestJob,
+        rag_service,
+        pdf_path: str,
+        base_metadata: Optional[dict] = None,
+        on_upsert: Optional[Callable[[], Awaitable[None]]] = None,
+    ) -> Dict[str, Any]:
+        """작업 실행 (JobScheduler "ingest" 풀에서 호출, 실패 시 상태 기록 후 예외 전파)"""
+        job.status = "running"
+        job.started_at = time.time()
+        await self._save(job, force=True)
+        try:
+            result = await self._pipeline(job, rag_service, pdf_path, base_metadata, on_upsert)
+        except BaseException as exc:
+            await self.fail(job, "cancelled" if isinstance(exc, asyncio.CancelledError) else f"{type(exc).__name__}: {exc}")
+            raise
+        job.status = "succeeded"
+        job.result = result
+        job.finished_at = time.time()
+        await asyncio.to_thread(
+            self.registry.record, job.collection_id, job.sha256, job.filename, job.size, result, "async"
+        )
+        await self._save(job, force=True)
+        self._saved_at.pop(job.job_id, None)
+        logger.info(
+            "PDF 업서트 완료: %s %s (%d페이지, 청크 %d개, %.1fs)",
+            job.collection_id, job.filename, job.pages_total or 0, job.chunks_embedded, job.finished_at - job.started_at,
+        )
+        return result
+
+    async def _pipeline(
+        self,
+        job: IngestJob,
+        rag_service,
+        pdf_path: str,
+        base_metadata: Optional[dict],
+        on_upsert: Optional[Callable[[], Awaitable[None]]],
+    ) -> Dict[str, Any]:
+        total, pages = await self.open_pages(pdf_path)
+        job.pages_total = total
+        await self._save(job, force=True)
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.settings.prefetch_pages)
+
+        async def produce():
+            try:
+                async for page_no, text in pages:
+                    await queue.put((page_no, split_text(text, self.settings.chunk_chars, self.settings.chunk_overlap)))
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                await queue.put(exc)
+                return
+            await queue.put(_DONE)
+
+        async def flush(items: List[dict]):
+            def _run():
+                return rag_service.upsert_text(collection_id=job.collection_id, items=items)
+
+            if self.metrics is not None:
+                with self.metrics.time_stage("rag", "rag_upsert"):
+                    await asyncio.to_thread(_run)
+            else:
+                await asyncio.to_thread(_run)
+            job.chunks_embedded += len(items)
+            job.batches += 1
+            if on_upsert is not None:
+                await on_upsert()
+
+        producer = asyncio.create_task(produce())
+        pending: List[Tuple[int, dict]] = []
+        batch_size = self.settings.embed_batch_size
+        try:
+            while True:
+                item = await queue.get()
+                if item is _DONE:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                page_no, chunks = item
+                job.pages_extracted += 1
+                pending.extend(
+                    (page_no, self._item(job, page_no, index, chunk, base_metadata)) for index, chunk in enumerate(chunks)
+                )
+                while len(pending) >= batch_size:
+                    await flush([entry for _, entry in pending[:batch_size]])
+                    pending = pending[batch_size:]
+                # 남은 청크가 없으면 이 페이지까지 완료, 있으면 남은 첫 청크의 앞 페이지까지 완료
+                job.pages_done = pending[0][0] - 1 if pending else page_no
+                await self._save(job)
+            if pending:
+                await flush([entry for _, entry in pending])
+            job.pages_done = total
+        finally:
+            if not producer.done():
+                producer.cancel()
+            await asyncio.gather(producer, return_exceptions=True)
+        return {
+            "collection_id": job.collection_id,
+            "count": job.chunks_embedded,
+            "pages": total,
+            "batches": job.batches,
+        }
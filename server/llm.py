@@ -0,0 +1,179 @@
+"""
+프로세스 공용 OpenAI 클라이언트 레지스트리
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+import httpx
+
+from .cache import ResponseCache, SQLiteCacheTier
+from .config import LLMSettings
+from .tracing import Tracer, TracingTransport
+
+if TYPE_CHECKING:
+    # openai SDK는 import만 0.5초 가까이 걸려 클라이언트/캐시 항목을 처음 만들 때 불러온다
+    from openai import AsyncOpenAI
+    from openai.types.chat import ChatCompletion
+
+# 캐시 키에 포함할 요청 파라미터 (응답 내용에 영향을 주는 값만)
+_CACHE_KEY_FIELDS = ("model", "messages", "temperature", "max_tokens", "response_format", "top_p", "seed")
+
+
+def chat_cache_key(request: Dict[str, Any]) -> str:
+    """model/프롬프트/temperature/max_tokens 등으로 만든 내용 기반 캐시 키"""
+    material = {field: request.get(field) for field in _CACHE_KEY_FIELDS if request.get(field) is not None}
+    digest = hashlib.sha256(
+        json.dumps(material, sort_keys=True, ensure_ascii=False, default=str).encode("utf-8")
+    ).hexdigest()
+    return f"chat:{digest}"
+
+
+def _is_cacheable_response(response: ChatCompletion) -> bool:
+    return bool(response.choices) and all(choice.finish_reason == "stop" for choice in response.choices)
+
+
+def _load_chat_completion(data: str) -> ChatCompletion:
+    from openai.types.chat import ChatCompletion
+
+    return ChatCompletion.model_validate_json(data)
+
+
+class _CachedCompletions:
+    """chat.completions.create 캐시 래퍼"""
+
+    def __init__(self, completions, cache: ResponseCache[ChatCompletion]):
+        self._completions = completions
+        self._cache = cache
+
+    async def create(self, **kwargs):
+        # 스트리밍/다중 샘플은 그대로 통과
+        if kwargs.get("stream") or (kwargs.get("n") or 1) > 1:
+            return await self._completions.create(**kwargs)
+        return await self._cache.get_or_create(
+            chat_cache_key(kwargs),
+            lambda: self._completions.create(**kwargs),
+            should_cache=_is_cacheable_response,
+        )
+
+    def __getattr__(self, name):
+        return getattr(self._completions, name)
+
+
+class _CachedChat:
+    def __init__(self, chat, cache: ResponseCache[ChatCompletion]):
+        self._chat = chat
+        self.completions = _CachedCompletions(chat.completions, cache)
+
+    def __getattr__(self, name):
+        return getattr(self._chat, name)
+
+
+class CachedAsyncOpenAI:
+    """AsyncOpenAI 프록시: chat.completions.create 응답만 캐시, 나머지는 위임
+
+    provider 모듈은 주입받은 클라이언트의 chat.completions.create만 호출하므로
+    논문/영상/검색결과 점수화, 키워드·쿼리 생성, 요약이 모두 같은 캐시를 탄다.
+    """
+
+    def __init__(self, client: AsyncOpenAI, cache: ResponseCache[ChatCompletion]):
+        self._client = client
+        self.chat = _CachedChat(client.chat, cache)
+
+    def __getattr__(self, name):
+        return getattr(self._client, name)
+
+
+class LLMClientRegistry:
+    """서버와 provider 모듈이 함께 쓰는 AsyncOpenAI 클라이언트 보관소
+
+    하나의 httpx 연결 풀(HTTP/2, keep-alive)과 동일한 타임아웃/재시도 정책을
+    공유하도록 create_app에서 한 번만 만들어 각 서비스에 주입한다.
+    클라이언트는 처음 사용할 때 생성된다.
+    """
+
+    def __init__(
+        self,
+        settings: LLMSettings | None = None,
+        api_key: Optional[str] = None,
+        tracer: Optional[Tracer] = None,
+    ):
+        self.settings = settings or LLMSettings()
+        self._api_key = api_key
+        self.tracer = tracer
+        self._http_client: Optional[httpx.AsyncClient] = None
+        self._raw_client: Optional[AsyncOpenAI] = None
+        self._client: Optional[AsyncOpenAI | CachedAsyncOpenAI] = None
+        self.cache: Optional[ResponseCache[ChatCompletion]] = None
+        cache_settings = self.settings.cache
+        if cache_settings.enabled:
+            self.cache = ResponseCache(
+                name="llm",
+                max_bytes=cache_settings.max_bytes,
+                ttl_seconds=cache_settings.ttl_seconds,
+                serialize=lambda response: response.model_dump_json(),
+                deserialize=_load_chat_completion,
+                disk=SQLiteCacheTier(cache_settings.disk_path, table="llm_cache") if cache_settings.disk_path else None,
+            )
+
+    @property
+    def client(self) -> AsyncOpenAI | CachedAsyncOpenAI:
+        """공유 AsyncOpenAI 클라이언트 (캐시 사용 시 캐시 프록시)"""
+        if self._client is None:
+            from openai import AsyncOpenAI
+
+            limits = httpx.Limits(
+                max_connections=self.settings.max_connections,
+                max_keepalive_connections=self.settings.max_keepalive_connections,
+                keepalive_expiry=self.settings.keepalive_expiry,
+            )
+            # 추적 시 LLM HTTP 호출마다 client span 기록 (transport를 지정하면 http2/limits도 transport에 전달)
+            transport = None
+            if self.tracer is not None and self.tracer.enabled:
+                transport = TracingTransport(
+                    lambda: httpx.AsyncHTTPTransport(http2=self.settings.http2, limits=limits),
+                    self.tracer,
+                )
+            self._http_client = httpx.AsyncClient(
+                http2=self.settings.http2,
+                timeout=httpx.Timeout(self.settings.timeout, connect=self.settings.connect_timeout),
+                limits=limits,
+                transport=transport,
+            )
+            self._raw_client = AsyncOpenAI(
+                api_key=self._api_key or os.getenv("OPENAI_API_KEY", ""),
+                base_url=self.settings.base_url,
+                http_client=self._http_client,
+                max_retries=self.settings.max_retries,
+                timeout=self.settings.timeout,
+            )
+            self._client = (
+                CachedAsyncOpenAI(self._raw_client, self.cache) if self.cache is not None else self._raw_client
+            )
+        return self._client
+
+    def install_client(self, client: Any):
+        """외부에서 만든 AsyncOpenAI 호환 클라이언트 사용 (벤치마크/테스트용, 응답 캐시는 그대로 적용)"""
+        self._raw_client = client
+        self._client = CachedAsyncOpenAI(client, self.cache) if self.cache is not None else client
+
+    def cache_stats(self) -> Dict[str, Any]:
+        """LLM 응답 캐시 적중/미스 지표"""
+        if self.cache is None:
+            return {"enabled": False}
+        return {"enabled": True, **self.cache.snapshot()}
+
+    async def close(self):
+        """연결 풀 정리"""
+        if self._raw_client is not None:
+            await self._raw_client.close()
+            self._raw_client = None
+        self._client = None
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+        if self.cache is not None:
+            self.cache.close()
@@ -0,0 +1,169 @@
+"""
+Prometheus 지표 (단계별 지연 히스토그램, 콜백 전송, 작업 대기/실행)
+"""
+from __future__ import annotations
+
+import logging
+import os
+import time
+from contextlib import contextmanager, nullcontext
+from typing import TYPE_CHECKING, Iterator, Optional, Tuple
+
+try:
+    from prometheus_client import CONTENT_TYPE_LATEST, CollectorRegistry, Counter, Gauge, Histogram, generate_latest
+except ImportError:  # pragma: no cover - prometheus-client 미설치 환경
+    CollectorRegistry = None  # type: ignore[assignment]
+
+# 멀티 워커 배포에서 워커별 지표를 모으는 디렉터리 (prometheus_client multiprocess 모드)
+MULTIPROC_ENV = "PROMETHEUS_MULTIPROC_DIR"
+
+
+def multiprocess_dir() -> Optional[str]:
+    """multiprocess 모드 디렉터리 (없거나 prometheus_client import 뒤에 설정되어 적용되지 않았으면 None)"""
+    path = os.environ.get(MULTIPROC_ENV) or os.environ.get(MULTIPROC_ENV.lower())
+    if not path or CollectorRegistry is None:
+        return None
+    from prometheus_client import values
+
+    if values.ValueClass is values.MutexValue:
+        return None
+    return path
+
+if TYPE_CHECKING:
+    from .tracing import Tracer
+
+logger = logging.getLogger(__name__)
+
+# LLM 호출(수 초)과 외부 검색(수백 ms), 캐시 적중(수 ms)을 모두 구분할 수 있는 구간
+STAGE_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 40.0, 80.0)
+
+
+class PipelineMetrics:
+    """파이프라인 단계별 지표 수집기
+
+    앱마다 별도 CollectorRegistry를 사용한다 (테스트에서 앱을 여러 번 만들어도 충돌 없음).
+    provider 모듈에는 time_stage를 가진 recorder로 주입되어
+    쿼리 생성/외부 검색/검증 단계 시간을 provider·model 라벨과 함께 기록한다.
+    prometheus-client가 없으면 모든 기록은 무시된다.
+    tracer가 있으면 time_stage 구간마다 같은 이름의 span도 남긴다.
+
+    PROMETHEUS_MULTIPROC_DIR가 설정된 멀티 워커 배포에서는 각 워커가 mmap 파일에 기록하고
+    /metrics는 어느 워커가 받든 모든 워커의 값을 합쳐 응답한다 (게이지는 살아 있는 워커 합계).
+    """
+
+    def __init__(self, enabled: bool = True, tracer: Optional["Tracer"] = None):
+        self.tracer = tracer
+        self.enabled = enabled and CollectorRegistry is not None
+        if enabled and CollectorRegistry is None:
+            logger.warning("prometheus-client가 설치되지 않아 /metrics 지표를 수집하지 않습니다.")
+        self.multiprocess_dir = multiprocess_dir() if self.enabled else None
+        if not self.enabled:
+            return
+        self.registry = CollectorRegistry()
+        self.stage_seconds = Histogram(
+            "livenote_stage_duration_seconds",
+            "파이프라인 단계별 소요 시간",
+            ["stage", "provider", "model", "outcome"],
+            buckets=STAGE_BUCKETS,
+            registry=self.registry,
+        )
+        self.callback_seconds = Histogram(
+            "livenote_callback_delivery_seconds",
+            "콜백 전송 1회 소요 시간",
+            ["kind"],
+            buckets=STAGE_BUCKETS,
+            registry=self.registry,
+        )
+        self.callback_deliveries = Counter(
+            "livenote_callback_deliveries_total",
+            "콜백 전송 결과 (success/retry/dead_letter)",
+            ["kind", "outcome"],
+            registry=self.registry,
+        )
+        self.queue_wait_seconds = Histogram(
+            "livenote_job_queue_wait_seconds",
+            "백그라운드 작업 대기 시간",
+            ["kind"],
+            buckets=STAGE_BUCKETS,
+            registry=self.registry,
+        )
+        self.jobs_inflight = Gauge(
+            "livenote_jobs_inflight",
+            "실행 중인 백그라운드 작업 수",
+            ["kind"],
+            registry=self.registry,
+            multiprocess_mode="livesum",
+        )
+        self.jobs_queued = Gauge(
+            "livenote_jobs_queued",
+            "대기 중인 백그라운드 작업 수",
+            ["kind"],
+            registry=self.registry,
+            multiprocess_mode="livesum",
+        )
+
+    def observe_stage(self, provider: str, stage: str, seconds: float, model: str = "", outcome: str = "ok"):
+        """단계 소요 시간 기록"""
+        if not self.enabled:
+            return
+        self.stage_seconds.labels(stage=stage, provider=provider, model=model or "", outcome=outcome).observe(seconds)
+
+    @contextmanager
+    def time_stage(self, provider: str, stage: str, model: str = "") -> Iterator[None]:
+        """with 블록 소요 시간을 단계 지표로 기록 (provider 모듈 recorder 인터페이스, 예외 시 outcome=error)"""
+        span = (
+            self.tracer.start_span(
+                f"{provider}.{stage}",
+                {"livenote.provider": provider, "livenote.stage": stage, "livenote.model": model or None},
+            )
+            if self.tracer is not None
+            else nullcontext()
+        )
+        started = time.perf_counter()
+        outcome = "ok"
+        with span:
+            try:
+                yield
+            except BaseException:
+                outcome = "error"
+                raise
+            finally:
+                self.observe_stage(provider, stage, time.perf_counter() - started, model=model, outcome=outcome)
+
+    def observe_callback(self, kind: str, seconds: float, outcome: str):
+        if not self.enabled:
+            return
+        self.callback_seconds.labels(kind=kind).observe(seconds)
+        self.callback_deliveries.labels(kind=kind, outcome=outcome).inc()
+
+    def observe_queue_wait(self, kind: str, seconds: float):
+        if not self.enabled:
+            return
+        self.queue_wait_seconds.labels(kind=kind).observe(seconds)
+
+    def set_jobs(self, kind: str, queued: int, running: int):
+        if not self.enabled:
+            return
+        self.jobs_queued.labels(kind=kind).set(queued)
+        self.jobs_inflight.labels(kind=kind).set(running)
+
+    def render(self) -> Optional[Tuple[bytes, str]]:
+        """Prometheus 텍스트 포맷 (비활성화 시 None)"""
+        if not self.enabled:
+            return None
+        if self.multiprocess_dir is not None:
+            from prometheus_client import multiprocess
+
+            # 요청마다 새 레지스트리로 모든 워커 파일을 읽어 합산
+            registry = CollectorRegistry()
+            multiprocess.MultiProcessCollector(registry, path=self.multiprocess_dir)
+            return generate_latest(registry), CONTENT_TYPE_LATEST
+        return generate_latest(self.registry), CONTENT_TYPE_LATEST
+
+    def close(self):
+        """워커 종료 시 이 프로세스의 live 게이지 파일 정리 (카운터/히스토그램은 합계에 남음)"""
+        if self.multiprocess_dir is None:
+            return
+        from prometheus_client import multiprocess
+
+        multiprocess.mark_process_dead(os.getpid(), self.multiprocess_dir)
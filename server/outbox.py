@@ -0,0 +1,362 @@
+"""
+콜백 아웃박스 (SQLite 영속화 + 재시도 + dead-letter)
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import random
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .callbacks import CallbackDispatcher
+from .config import OutboxSettings
+from .metrics import PipelineMetrics
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    kind TEXT NOT NULL,
+    url TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at REAL NOT NULL,
+    leased_until REAL NOT NULL DEFAULT 0,
+    last_error TEXT,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_outbox_due ON outbox (next_attempt_at);
+CREATE TABLE IF NOT EXISTS dead_letter (
+    id INTEGER PRIMARY KEY,
+    kind TEXT NOT NULL,
+    url TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    attempts INTEGER NOT NULL,
+    last_error TEXT,
+    created_at REAL NOT NULL,
+    failed_at REAL NOT NULL
+);
+"""
+
+
+@dataclass
+class OutboxEntry:
+    """전송 대기 중인 콜백"""
+    id: int
+    kind: str
+    url: str
+    payload: Dict[str, Any]
+    attempts: int
+
+
+class OutboxStore:
+    """아웃박스 SQLite 저장소 (스레드 안전, 동기 API)"""
+
+    def __init__(self, path: str, lease_seconds: float):
+        self.path = path
+        self.lease_seconds = lease_seconds
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=10.0, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def add(self, kind: str, url: str, payload: Dict[str, Any]) -> int:
+        """새 항목 기록 (호출자가 즉시 전송하므로 점유 상태로 저장)"""
+        now = time.time()
+        with self._lock:
+            cur = self._connect().execute(
+                "INSERT INTO outbox (kind, url, payload, attempts, next_attempt_at, leased_until, created_at) "
+                "VALUES (?, ?, ?, 0, ?, ?, ?)",
+                (kind, url, json.dumps(payload, ensure_ascii=False), now, now + self.lease_seconds, now),
+            )
+            return int(cur.lastrowid)
+
+    def claim_due(self, limit: int) -> List[OutboxEntry]:
+        """재시도 시각이 지난 항목을 점유 후 반환 (다중 프로세스 안전)"""
+        now = time.time()
+        claimed: List[OutboxEntry] = []
+        with self._lock:
+            conn = self._connect()
+            rows = conn.execute(
+                "SELECT id, kind, url, payload, attempts FROM outbox "
+                "WHERE next_attempt_at <= ? AND leased_until <= ? ORDER BY next_attempt_at LIMIT ?",
+                (now, now, limit),
+            ).fetchall()
+            for row_id, kind, url, payload, attempts in rows:
+                cur = conn.execute(
+                    "UPDATE outbox SET leased_until = ? WHERE id = ? AND leased_until <= ?",
+                    (now + self.lease_seconds, row_id, now),
+                )
+                if cur.rowcount:
+                    claimed.append(OutboxEntry(row_id, kind, url, json.loads(payload), attempts))
+        return claimed
+
+    def renew_lease(self, entry_id: int):
+        """전송 중인 항목의 점유 연장 (느린 전송 중 다른 워커가 다시 가져가지 않도록)"""
+        with self._lock:
+            self._connect().execute(
+                "UPDATE outbox SET leased_until = ? WHERE id = ?", (time.time() + self.lease_seconds, entry_id)
+            )
+
+    def delete(self, entry_id: int):
+        """전송 완료 항목 삭제"""
+        with self._lock:
+            self._connect().execute("DELETE FROM outbox WHERE id = ?", (entry_id,))
+
+    def reschedule(self, entry_id: int, attempts: int, next_attempt_at: float, error: str):
+        """실패 항목의 다음 재시도 예약"""
+        with self._lock:
+            self._connect().execute(
+                "UPDATE outbox SET attempts = ?, next_attempt_at = ?, leased_until = 0, last_error = ? WHERE id = ?",
+                (attempts, next_attempt_at, error, entry_id),
+            )
+
+    def move_to_dead_letter(self, entry_id: int, attempts: int, error: str):
+        """재시도 한도를 넘은 항목을 dead-letter 테이블로 이동"""
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.execute(
+                    "INSERT OR REPLACE INTO dead_letter (id, kind, url, payload, attempts, last_error, created_at, failed_at) "
+                    "SELECT id, kind, url, payload, ?, ?, created_at, ? FROM outbox WHERE id = ?",
+                    (attempts, error, now, entry_id),
+                )
+                conn.execute("DELETE FROM outbox WHERE id = ?", (entry_id,))
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+
+    def replay(self, ids: Optional[List[int]] = None) -> int:
+        """dead-letter 항목을 아웃박스로 되돌림 (ids가 None이면 전체, 빈 목록이면 아무것도 안 함)"""
+        if ids is not None and not ids:
+            return 0
+        now = time.time()
+        where = ""
+        params: List[Any] = []
+        if ids is not None:
+            where = f" WHERE id IN ({','.join('?' for _ in ids)})"
+            params = list(ids)
+        with self._lock:
+            conn = self._connect()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                cur = conn.execute(
+                    "INSERT INTO outbox (kind, url, payload, attempts, next_attempt_at, leased_until, last_error, created_at) "
+                    f"SELECT kind, url, payload, 0, ?, 0, last_error, created_at FROM dead_letter{where}",
+                    [now, *params],
+                )
+                replayed = cur.rowcount
+                conn.execute(f"DELETE FROM dead_letter{where}", params)
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+        return replayed
+
+    def list_dead_letters(self, limit: int) -> List[Dict[str, Any]]:
+        """dead-letter 목록 조회 (최근 실패 순)"""
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT id, kind, url, payload, attempts, last_error, created_at, failed_at "
+                "FROM dead_letter ORDER BY failed_at DESC LIMIT ?",
+                (limit,),
+            ).fetchall()
+        return [
+            {
+                "id": row[0],
+                "kind": row[1],
+                "url": row[2],
+                "payload": json.loads(row[3]),
+                "attempts": row[4],
+                "last_error": row[5],
+                "created_at": row[6],
+                "failed_at": row[7],
+            }
+            for row in rows
+        ]
+
+    def stats(self) -> Dict[str, int]:
+        """대기/dead-letter 건수"""
+        with self._lock:
+            conn = self._connect()
+            pending = conn.execute("SELECT COUNT(*) FROM outbox").fetchone()[0]
+            dead = conn.execute("SELECT COUNT(*) FROM dead_letter").fetchone()[0]
+        return {"pending": pending, "dead_letter": dead}
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+class CallbackOutbox:
+    """콜백을 먼저 영속화한 뒤 전송하고, 실패 시 지수 백오프로 재시도
+
+    - send(): 아웃박스에 기록 후 즉시 1회 전송 (정상 경로 지연 최소화)
+    - 실패 항목은 워커 풀이 backoff(+jitter) 일정에 맞춰 재전송
+    - max_attempts 초과 시 dead_letter 테이블로 이동, 관리자 API로 재처리
+    - 프로세스가 재시작되어도 미전송 항목은 워커가 다시 전송
+    """
+
+    def __init__(
+        self,
+        dispatcher: CallbackDispatcher,
+        settings: OutboxSettings | None = None,
+        metrics: Optional[PipelineMetrics] = None,
+    ):
+        self.dispatcher = dispatcher
+        self.settings = settings or OutboxSettings()
+        self.metrics = metrics
+        self.store = OutboxStore(self.settings.path, self.settings.lease_seconds)
+        self._workers: List[asyncio.Task] = []
+        self._wakeup: Optional[asyncio.Event] = None
+
+    async def start(self):
+        """재시도 워커 시작 (lifespan 시작 시 호출)"""
+        if not self.settings.enabled or self._workers:
+            return
+        self._wakeup = asyncio.Event()
+        self._workers = [
+            asyncio.create_task(self._worker_loop(idx), name=f"callback-outbox-{idx}")
+            for idx in range(self.settings.workers)
+        ]
+        stats = await asyncio.to_thread(self.store.stats)
+        if stats["pending"]:
+            logger.info("콜백 아웃박스 복구: 미전송 %s건 재시도 예정", stats["pending"])
+
+    async def close(self):
+        """워커 종료 및 DB 정리 (미전송 항목은 파일에 남음)"""
+        for task in self._workers:
+            task.cancel()
+        if self._workers:
+            await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        await asyncio.to_thread(self.store.close)
+
+    async def send(self, url: str, payload: dict, kind: str = "callback") -> bool:
+        """콜백 전송 (전송 성공 여부 반환, 실패 시 재시도 예약)"""
+        if not self.settings.enabled:
+            started = time.perf_counter()
+            response = await self.dispatcher.post(url, payload)
+            success = _is_success(response)
+            self._observe(kind, time.perf_counter() - started, "success" if success else "failure")
+            return success
+
+        entry_id = await asyncio.to_thread(self.store.add, kind, url, payload)
+        entry = OutboxEntry(id=entry_id, kind=kind, url=url, payload=payload, attempts=0)
+        return await self._deliver(entry)
+
+    async def replay(self, ids: Optional[List[int]] = None) -> int:
+        """dead-letter 항목 재처리"""
+        replayed = await asyncio.to_thread(self.store.replay, ids)
+        if replayed and self._wakeup is not None:
+            self._wakeup.set()
+        return replayed
+
+    async def list_dead_letters(self, limit: int = 100) -> List[Dict[str, Any]]:
+        return await asyncio.to_thread(self.store.list_dead_letters, limit)
+
+    async def stats(self) -> Dict[str, int]:
+        return await asyncio.to_thread(self.store.stats)
+
+    async def _keep_leased(self, entry_id: int):
+        """전송이 끝날 때까지 점유 시간의 절반마다 점유 연장"""
+        while True:
+            await asyncio.sleep(self.settings.lease_seconds / 2)
+            try:
+                await asyncio.to_thread(self.store.renew_lease, entry_id)
+            except Exception as exc:  # pragma: no cover - DB 예외
+                logger.warning("콜백 아웃박스 점유 연장 실패 (id=%s): %s", entry_id, exc)
+
+    async def _deliver(self, entry: OutboxEntry) -> bool:
+        """단일 항목 전송 후 결과에 따라 삭제/재시도 예약/dead-letter 처리"""
+        error: Optional[str] = None
+        started = time.perf_counter()
+        # 호스트별 동시 전송 제한 대기 + 느린 응답이 점유 시간을 넘겨도 중복 전송되지 않게 점유 연장
+        heartbeat = asyncio.create_task(self._keep_leased(entry.id))
+        try:
+            response = await self.dispatcher.post(entry.url, entry.payload)
+            if not _is_success(response):
+                error = f"HTTP {response.status_code}"
+        except Exception as exc:  # pragma: no cover - 네트워크 예외
+            error = f"{type(exc).__name__}: {exc}"
+        finally:
+            heartbeat.cancel()
+            await asyncio.gather(heartbeat, return_exceptions=True)
+        elapsed = time.perf_counter() - started
+
+        if error is None:
+            self._observe(entry.kind, elapsed, "success")
+            await asyncio.to_thread(self.store.delete, entry.id)
+            return True
+
+        attempts = entry.attempts + 1
+        if attempts >= self.settings.max_attempts:
+            self._observe(entry.kind, elapsed, "dead_letter")
+            logger.error(
+                "콜백 전송 최종 실패 → dead-letter (id=%s, kind=%s, attempts=%s): %s",
+                entry.id, entry.kind, attempts, error,
+            )
+            await asyncio.to_thread(self.store.move_to_dead_letter, entry.id, attempts, error)
+            return False
+
+        self._observe(entry.kind, elapsed, "retry")
+        delay = self._backoff(attempts)
+        logger.warning(
+            "콜백 전송 실패, %.1fs 후 재시도 (id=%s, kind=%s, attempt=%s/%s): %s",
+            delay, entry.id, entry.kind, attempts, self.settings.max_attempts, error,
+        )
+        await asyncio.to_thread(self.store.reschedule, entry.id, attempts, time.time() + delay, error)
+        return False
+
+    def _observe(self, kind: str, elapsed: float, outcome: str):
+        if self.metrics is not None:
+            self.metrics.observe_callback(kind, elapsed, outcome)
+
+    def _backoff(self, attempts: int) -> float:
+        """지수 백오프 + jitter (상한의 50~100% 구간에서 무작위)"""
+        ceiling = min(self.settings.max_backoff, self.settings.base_backoff * (2 ** (attempts - 1)))
+        return random.uniform(ceiling / 2, ceiling)
+
+    async def _worker_loop(self, idx: int):
+        """재시도 대상이 생길 때마다 점유 후 전송"""
+        while True:
+            try:
+                entries = await asyncio.to_thread(self.store.claim_due, 1)
+                if entries:
+                    await self._deliver(entries[0])
+                    continue
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=self.settings.poll_interval)
+                    self._wakeup.clear()
+                except asyncio.TimeoutError:
+                    pass
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:  # pragma: no cover - DB 예외
+                logger.exception("콜백 아웃박스 워커 %s 오류: %s", idx, exc)
+                await asyncio.sleep(self.settings.poll_interval)
+
+
+def _is_success(response: Any) -> bool:
+    status_code = getattr(response, "status_code", 0)
+    return 200 <= status_code < 300
@@ -0,0 +1,135 @@
+"""
+RAG 검색 결과 캐시 (QA/REC 엔드포인트 공용)
+"""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import math
+import time
+from typing import Any, Dict, List, Optional
+
+from .cache import ResponseCache, SQLiteCacheTier
+from .config import RetrievalCacheSettings
+from .metrics import PipelineMetrics
+
+
+def _chunk_payload(chunk: Any) -> Dict[str, Any]:
+    metadata = getattr(chunk, "metadata", None) or {}
+    return {
+        "text": getattr(chunk, "text", ""),
+        "score": getattr(chunk, "score", 0.0),
+        "metadata": dict(metadata),
+    }
+
+
+def _serialize_chunks(chunks: List[Any]) -> str:
+    """크기 계산용 직렬화 (메모리 전용이라 역직렬화는 사용하지 않음)"""
+    return json.dumps([_chunk_payload(chunk) for chunk in chunks], ensure_ascii=False, default=str)
+
+
+class RetrievalCache:
+    """(collection_id, query 해시, top_k, filters) 기준 retrieve 결과 캐시
+
+    같은 section_summary로 /qa/generate와 /rec/recommend가 연달아 호출될 때
+    임베딩 API 호출과 벡터 검색을 한 번으로 줄인다.
+    컬렉션에 업서트가 일어나면 해당 컬렉션 항목을 모두 무효화한다.
+    멀티 워커 배포에서는 generation_path의 세대 번호를 공유해, 다른 워커에서 일어난
+    업서트 이후에는 이 워커의 메모리 항목도 키가 달라져 더 이상 쓰이지 않는다.
+    """
+
+    def __init__(self, settings: RetrievalCacheSettings | None = None, metrics: Optional[PipelineMetrics] = None):
+        self.settings = settings or RetrievalCacheSettings()
+        self.metrics = metrics
+        self.cache: Optional[ResponseCache[List[Any]]] = None
+        # 업서트마다 증가: 업서트 이전에 시작된 검색 결과가 새 세대 키로 저장되지 않도록 함
+        self._generations: Dict[str, int] = {}
+        self._shared_generations = (
+            SQLiteCacheTier(self.settings.generation_path, table="retrieval_generations")
+            if self.settings.enabled and self.settings.generation_path
+            else None
+        )
+        if self.settings.enabled:
+            self.cache = ResponseCache(
+                name="retrieval",
+                max_bytes=self.settings.max_bytes,
+                ttl_seconds=self.settings.ttl_seconds,
+                serialize=_serialize_chunks,
+                deserialize=json.loads,
+            )
+
+    @staticmethod
+    def _prefix(collection_id: str) -> str:
+        return f"{collection_id}|"
+
+    async def make_key(
+        self,
+        collection_id: str,
+        query: str,
+        top_k: int,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        query_hash = hashlib.sha256(query.strip().encode("utf-8")).hexdigest()
+        filters_part = json.dumps(filters or {}, sort_keys=True, ensure_ascii=False, default=str)
+        generation = await self._generation(collection_id)
+        return f"{self._prefix(collection_id)}{generation}|{query_hash}|{top_k}|{filters_part}"
+
+    async def _generation(self, collection_id: str) -> str:
+        local = str(self._generations.get(collection_id, 0))
+        if self._shared_generations is None:
+            return local
+        row = await asyncio.to_thread(self._shared_generations.get, collection_id)
+        return f"{local}.{row[0]}" if row is not None else local
+
+    async def retrieve(
+        self,
+        rag_service,
+        *,
+        collection_id: str,
+        query: str,
+        top_k: int,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[Any]:
+        """캐시를 거쳐 rag_service.retrieve 실행 (동기 호출은 스레드에서 수행)"""
+
+        def _run():
+            kwargs: Dict[str, Any] = {"collection_id": collection_id, "query": query, "top_k": top_k}
+            if filters:
+                kwargs["filters"] = filters
+            return rag_service.retrieve(**kwargs)
+
+        async def _factory():
+            # 실제 RAG 검색(임베딩 + 벡터 조회)만 단계 지표로 기록 (캐시 적중은 캐시 통계로 확인)
+            if self.metrics is None:
+                return list(await asyncio.to_thread(_run))
+            with self.metrics.time_stage("rag", "rag_retrieve"):
+                return list(await asyncio.to_thread(_run))
+
+        if self.cache is None:
+            return await _factory()
+        chunks = await self.cache.get_or_create(
+            await self.make_key(collection_id, query, top_k, filters),
+            _factory,
+        )
+        # 호출 측에서 리스트를 수정해도 캐시 항목은 유지
+        return list(chunks)
+
+    async def invalidate(self, collection_id: str):
+        """컬렉션 업서트 시 호출: 해당 컬렉션의 캐시 항목 제거"""
+        self._generations[collection_id] = self._generations.get(collection_id, 0) + 1
+        if self.cache is not None:
+            self.cache.invalidate(self._prefix(collection_id))
+        if self._shared_generations is not None:
+            # 워커마다 증가시키면 충돌하므로 시각(ns)을 세대 값으로 기록 (만료 없음)
+            await asyncio.to_thread(self._shared_generations.set, collection_id, str(time.time_ns()), math.inf)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """검색 캐시 적중/미스 지표"""
+        if self.cache is None:
+            return {"enabled": False}
+        return {"enabled": True, "shared_generations": self._shared_generations is not None, **self.cache.snapshot()}
+
+    def close(self):
+        if self._shared_generations is not None:
+            self._shared_generations.close()
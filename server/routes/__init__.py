@@ -6,5 +6,7 @@ from .rag import router as rag_router
 from .qa import router as qa_router
 from .rec import router as rec_router
 from .summary import router as summary_router
+from .admin import router as admin_router
+from .pipeline import router as pipeline_router
 
-__all__ = ["rag_router", "qa_router", "rec_router", "summary_router"]
+__all__ = ["rag_router", "qa_router", "rec_router", "summary_router", "admin_router", "pipeline_router"]
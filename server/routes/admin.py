@@ -0,0 +1,107 @@
+"""
+운영/관리용 API
+"""
+from __future__ import annotations
+
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, Query
+from pydantic import BaseModel, Field
+
+from ..dependencies import (
+    get_callback_outbox,
+    get_embedding_cache,
+    get_job_scheduler,
+    get_llm_registry,
+    get_retrieval_cache,
+    get_service_registry,
+    get_tracer,
+)
+from ..llm import LLMClientRegistry
+from ..outbox import CallbackOutbox
+from ..retrieval import RetrievalCache
+from ..scheduler import JobScheduler
+from ..services import ServiceRegistry
+from ..tracing import Tracer
+
+router = APIRouter(prefix="/admin", tags=["ADMIN"])
+
+
+class ReplayRequest(BaseModel):
+    """dead-letter 재처리 요청"""
+
+    ids: Optional[List[int]] = Field(default=None, description="재처리할 항목 ID (미지정 시 전체, 빈 목록이면 없음)")
+
+
+@router.get("/callbacks/stats")
+async def callback_stats(outbox: CallbackOutbox = Depends(get_callback_outbox)):
+    """아웃박스 대기/dead-letter 건수"""
+    return await outbox.stats()
+
+
+@router.get("/callbacks/dead-letters")
+async def list_dead_letters(
+    limit: int = Query(default=100, ge=1, le=1000, description="조회 개수"),
+    outbox: CallbackOutbox = Depends(get_callback_outbox),
+):
+    """전송에 최종 실패한 콜백 목록"""
+    return {"items": await outbox.list_dead_letters(limit)}
+
+
+@router.post("/callbacks/replay")
+async def replay_dead_letters(
+    request: ReplayRequest,
+    outbox: CallbackOutbox = Depends(get_callback_outbox),
+):
+    """dead-letter 콜백을 아웃박스로 되돌려 재전송"""
+    replayed = await outbox.replay(request.ids)
+    return {"replayed": replayed}
+
+
+@router.get("/jobs")
+async def job_stats(scheduler: JobScheduler = Depends(get_job_scheduler)):
+    """작업 종류별 대기/실행 수와 대기·실행 시간 지표"""
+    return scheduler.snapshot()
+
+
+@router.get("/llm-cache")
+async def llm_cache_stats(registry: LLMClientRegistry = Depends(get_llm_registry)):
+    """LLM 응답 캐시 적중/미스, 메모리 사용량"""
+    return registry.cache_stats()
+
+
+@router.get("/retrieval-cache")
+async def retrieval_cache_stats(cache: RetrievalCache = Depends(get_retrieval_cache)):
+    """RAG 검색 결과 캐시 적중/미스, 메모리 사용량"""
+    return cache.snapshot()
+
+
+@router.get("/embedding-cache")
+async def embedding_cache_stats(cache=Depends(get_embedding_cache)):
+    """임베딩 캐시 적중/미스 (업서트로 채워진 벡터 재사용 현황)"""
+    if cache is None:
+        return {"enabled": False}
+    return cache.snapshot()
+
+
+@router.get("/tracing")
+async def tracing_stats(tracer: Tracer = Depends(get_tracer)):
+    """span 추적 설정과 느린 요청 기록 현황"""
+    return tracer.snapshot()
+
+
+@router.get("/provider-caches")
+async def provider_cache_stats(services: ServiceRegistry = Depends(get_service_registry)):
+    """provider 모듈별 검색 캐시 적중/미스 (Google은 절약한 quota 포함, 아직 생성되지 않은 provider는 제외)"""
+    providers = {name: services.peek(name) for name in ("openalex", "youtube", "google")}
+    return {
+        name: service.cache_stats()
+        for name, service in providers.items()
+        if hasattr(service, "cache_stats")
+    }
+
+
+@router.get("/services")
+async def service_stats(services: ServiceRegistry = Depends(get_service_registry)):
+    """서비스별 생성 여부와 import/생성 소요 시간, 워밍업 진행 상태"""
+    return services.snapshot()
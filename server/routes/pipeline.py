@@ -0,0 +1,228 @@
+"""
+섹션 파이프라인 API (요약 → 업서트 → QA/REC 동시 실행, Callback)
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from pydantic import Field, HttpUrl
+
+from ..coalescer import CallbackCoalescer
+from ..config import AppSettings
+from ..dependencies import (
+    get_callback_coalescer,
+    get_callback_outbox,
+    get_job_scheduler,
+    get_llm_registry,
+    get_metrics,
+    get_rag_service,
+    get_retrieval_cache,
+    get_service_registry,
+    get_settings,
+)
+from ..llm import LLMClientRegistry
+from ..metrics import PipelineMetrics
+from ..models import QnAType, ResourceType
+from ..outbox import CallbackOutbox
+from ..retrieval import RetrievalCache
+from ..scheduler import JobScheduler
+from ..services import ServiceRegistry
+from ..utils import build_collection_id
+from .qa import PreviousQAItem, QAGenerateRequest, prepare_qa_job, resolve_question_types
+from .rag import TextUpsertItem, build_text_upsert_items
+from .rec import PreviousSummary, RECRequest, prepare_rec_job, resolve_provider_services, select_resource_types
+from .summary import (
+    SummaryGenerateRequest,
+    _build_callback_payload,
+    _generate_summary_text,
+    _is_too_short,
+    _post_summary_callback,
+    _resolve_api_key,
+    _resolve_callback_url,
+    _to_transcript_text,
+)
+
+router = APIRouter(prefix="/pipeline", tags=["PIPELINE"])
+logger = logging.getLogger(__name__)
+
+# QA/REC 요청의 section_summary 최소 길이와 동일
+MIN_SECTION_SUMMARY_LENGTH = 10
+
+
+class PipelineSectionRequest(SummaryGenerateRequest):
+    """섹션 파이프라인 입력 (callback_url은 요약 콜백 URL)"""
+
+    subject: Optional[str] = Field(default=None, description="선택 과목 정보 (QA)")
+    qa_callback_url: Optional[HttpUrl] = Field(default=None, description="QA 콜백 URL (미지정 시 QA 생략)")
+    rec_callback_url: Optional[HttpUrl] = Field(default=None, description="REC 콜백 URL (미지정 시 REC 생략)")
+    question_types: Optional[List[QnAType]] = Field(default=None, description="생성할 질문 유형 (미지정 시 설정값 사용)")
+    previous_qa: List[PreviousQAItem] = Field(default_factory=list, description="중복 방지를 위한 이전 QA 목록")
+    previous_summaries: List[PreviousSummary] = Field(default_factory=list, description="이전 요약")
+    yt_exclude: List[str] = Field(default_factory=list, description="제외할 유튜브 제목")
+    wiki_exclude: List[str] = Field(default_factory=list, description="제외할 위키 제목")
+    paper_exclude: List[str] = Field(default_factory=list, description="제외할 논문 ID")
+    google_exclude: List[str] = Field(default_factory=list, description="제외할 구글 URL")
+    resource_types: Optional[List[ResourceType]] = Field(default=None, description="요청 리소스 유형 (미지정 시 모든 유형)")
+    verify_batch: Optional[bool] = Field(default=None, description="LLM 일괄 검증 여부 (미지정 시 provider별 설정값)")
+
+
+@router.post("/section", status_code=status.HTTP_202_ACCEPTED)
+async def run_section_pipeline(
+    request: PipelineSectionRequest,
+    rag_service=Depends(get_rag_service),
+    retrieval_cache: RetrievalCache = Depends(get_retrieval_cache),
+    services: ServiceRegistry = Depends(get_service_registry),
+    settings: AppSettings = Depends(get_settings),
+    outbox: CallbackOutbox = Depends(get_callback_outbox),
+    coalescer: CallbackCoalescer = Depends(get_callback_coalescer),
+    scheduler: JobScheduler = Depends(get_job_scheduler),
+    llm_registry: LLMClientRegistry = Depends(get_llm_registry),
+    metrics: PipelineMetrics = Depends(get_metrics),
+):
+    """전사 한 번으로 요약 생성 → 요약 업서트 → QA/REC 동시 실행
+
+    각 결과는 기존 /summary, /qa, /rec 콜백과 같은 포맷으로 전송된다.
+    QA/REC는 요약 기준 검색 결과 하나를 함께 사용한다.
+    """
+    scheduler.ensure_capacity("pipeline")
+    transcript_text = _to_transcript_text(request.transcript)
+    if not transcript_text:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="전사 내용이 비어 있습니다.",
+        )
+
+    # 요약 이후 단계에서 실패하지 않도록 입력 검증은 작업 등록 전에 수행
+    _resolve_api_key()
+    summary_callback_url = _resolve_callback_url(request.callback_url, settings)
+    qa_question_types = resolve_question_types(request.question_types, settings) if request.qa_callback_url else []
+    selected_resource_types = select_resource_types(request.resource_types) if request.rec_callback_url else []
+    if request.rec_callback_url and not selected_resource_types:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="요청된 리소스 유형이 없습니다."
+        )
+    collection_id = build_collection_id(settings.rag.collection_prefix, str(request.lecture_id))
+
+    if _is_too_short(transcript_text, settings.summary.min_transcript_length):
+        logger.info(
+            "파이프라인 요약 건너뜀: lectureId=%s section=%s 이유=too_short",
+            request.lecture_id,
+            request.section_index,
+        )
+        payload = _build_callback_payload(request, settings.summary.short_transcript_message, status="TOO_SHORT")
+
+        async def send_skip():
+            await _post_summary_callback(outbox, summary_callback_url, payload)
+
+        scheduler.submit("pipeline", send_skip)
+        return {"status": "skipped", "reason": "too_short", "collection_id": collection_id}
+
+    # 이번 요청에 필요한 서비스만 생성 (QA 생략 시 QA 모듈, 요청하지 않은 provider 모듈은 import하지 않음)
+    qa_service = await services.get("qa") if request.qa_callback_url else None
+    provider_services = await resolve_provider_services(services, selected_resource_types)
+
+    async def run_pipeline():
+        # 1) 요약 생성 + 요약 콜백
+        try:
+            with metrics.time_stage("summary", "summary_generation", model=settings.summary.model):
+                summary_text = await _generate_summary_text(llm_registry.client, transcript_text, settings)
+        except Exception as exc:  # pragma: no cover - 외부 API 예외
+            logger.exception("파이프라인 요약 생성 실패: %s", exc)
+            return
+        await _post_summary_callback(
+            outbox,
+            summary_callback_url,
+            _build_callback_payload(request, summary_text, status="COMPLETED"),
+        )
+        if not (request.qa_callback_url or request.rec_callback_url):
+            return
+        if len(summary_text.strip()) < MIN_SECTION_SUMMARY_LENGTH:
+            logger.warning("파이프라인 QA/REC 생략: 요약이 너무 짧습니다 (len=%d)", len(summary_text.strip()))
+            return
+
+        # 2) 요약 업서트 (실패해도 기존 컬렉션으로 QA/REC 진행)
+        upsert_items = build_text_upsert_items(
+            [TextUpsertItem(text=summary_text, section_id=str(request.section_index))]
+        )
+        try:
+            with metrics.time_stage("rag", "rag_upsert"):
+                await asyncio.to_thread(rag_service.upsert_text, collection_id=collection_id, items=upsert_items)
+        except Exception as exc:  # pragma: no cover - 벡터 DB 예외
+            logger.exception("파이프라인 요약 업서트 실패: %s", exc)
+        finally:
+            await retrieval_cache.invalidate(collection_id)
+
+        # 3) QA/REC가 함께 쓸 검색 결과 한 번 조회 (score 내림차순이므로 앞에서 잘라 사용)
+        qa_top_k = settings.rag.qa_retrieve_top_k
+        rec_top_k = settings.rag.rec_retrieve_top_k
+        try:
+            rag_chunks = await retrieval_cache.retrieve(
+                rag_service,
+                collection_id=collection_id,
+                query=summary_text,
+                top_k=max(qa_top_k, rec_top_k),
+            )
+        except Exception as exc:  # pragma: no cover - 벡터 DB 예외
+            logger.exception("파이프라인 RAG 검색 실패: %s", exc)
+            rag_chunks = []
+
+        # 4) QA/REC 동시 실행
+        jobs = []
+        if request.qa_callback_url:
+            qa_request = QAGenerateRequest(
+                lecture_id=request.lecture_id,
+                summary_id=request.summary_id,
+                section_index=request.section_index,
+                section_summary=summary_text,
+                subject=request.subject,
+                callback_url=request.qa_callback_url,
+                question_types=request.question_types,
+                previous_qa=request.previous_qa,
+            )
+            jobs.append(
+                prepare_qa_job(
+                    qa_request,
+                    rag_chunks[:qa_top_k],
+                    qa_question_types,
+                    qa_service,
+                    settings,
+                    outbox,
+                    coalescer,
+                    metrics,
+                )()
+            )
+        if request.rec_callback_url:
+            rec_request = RECRequest(
+                lecture_id=request.lecture_id,
+                summary_id=request.summary_id,
+                section_index=request.section_index,
+                section_summary=summary_text,
+                callback_url=request.rec_callback_url,
+                previous_summaries=request.previous_summaries,
+                yt_exclude=request.yt_exclude,
+                wiki_exclude=request.wiki_exclude,
+                paper_exclude=request.paper_exclude,
+                google_exclude=request.google_exclude,
+                resource_types=request.resource_types,
+                verify_batch=request.verify_batch,
+            )
+            jobs.append(
+                prepare_rec_job(
+                    rec_request,
+                    rag_chunks[:rec_top_k],
+                    selected_resource_types,
+                    **provider_services,
+                    settings=settings,
+                    outbox=outbox,
+                    coalescer=coalescer,
+                    metrics=metrics,
+                )()
+            )
+        await asyncio.gather(*jobs)
+
+    scheduler.submit("pipeline", run_pipeline)
+    return {"status": "accepted", "collection_id": collection_id}
@@ -3,19 +3,32 @@ QA 생성 API (Callback)
 """
 from __future__ import annotations
 
-import asyncio
 import logging
-from typing import Optional, List
+from typing import AsyncIterator, Awaitable, Callable, List, Optional
 
-import httpx
 from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import Field, HttpUrl, validator
 
 from cap1_QA_module.qakit.models import QARequest, PreviousQA
 
+from ..coalescer import CallbackCoalescer, CoalescedBatch
 from ..config import AppSettings
-from ..dependencies import get_qa_service, get_rag_service, get_settings
+from ..dependencies import (
+    get_callback_coalescer,
+    get_callback_outbox,
+    get_job_scheduler,
+    get_metrics,
+    get_qa_service,
+    get_rag_service,
+    get_retrieval_cache,
+    get_settings,
+)
+from ..metrics import PipelineMetrics
 from ..models import QnAType
+from ..outbox import CallbackOutbox
+from ..retrieval import RetrievalCache
+from ..scheduler import JobScheduler
+from ..streaming import sse_response
 from ..utils import CamelModel, build_collection_id, to_qa_rag_context
 
 router = APIRouter(prefix="/qa", tags=["QA"])
@@ -62,34 +75,93 @@ class QAGenerateRequest(CamelModel):
         return value
 
 
+class QAStreamRequest(QAGenerateRequest):
+    """QA 스트리밍 입력 (콜백 URL 불필요)"""
+
+    callback_url: Optional[HttpUrl] = Field(default=None, description="사용하지 않음 (SSE로 직접 응답)")
+
+
 @router.post("/generate", status_code=status.HTTP_202_ACCEPTED)
 async def generate_qa(
     request: QAGenerateRequest,
     rag_service=Depends(get_rag_service),
+    retrieval_cache: RetrievalCache = Depends(get_retrieval_cache),
     qa_service=Depends(get_qa_service),
     settings: AppSettings = Depends(get_settings),
+    outbox: CallbackOutbox = Depends(get_callback_outbox),
+    coalescer: CallbackCoalescer = Depends(get_callback_coalescer),
+    scheduler: JobScheduler = Depends(get_job_scheduler),
+    metrics: PipelineMetrics = Depends(get_metrics),
 ):
     """QA 생성 콜백 엔드포인트"""
+    scheduler.ensure_capacity("qa")
     lecture_id_str = str(request.lecture_id)
     collection_id = build_collection_id(settings.rag.collection_prefix, lecture_id_str)
-    section_id_for_provider = request.section_index + 1  # QA 모듈은 1-base
 
-    def _retrieve():
-        return rag_service.retrieve(
+    try:
+        # 같은 섹션 요약으로 QA/REC가 연달아 호출되면 캐시된 검색 결과를 재사용
+        rag_chunks = await retrieval_cache.retrieve(
+            rag_service,
             collection_id=collection_id,
             query=request.section_summary,
-            top_k=settings.rag.qa_retrieve_top_k
+            top_k=settings.rag.qa_retrieve_top_k,
         )
+    except Exception as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"RAG 검색 실패: {exc}"
+        ) from exc
+
+    qa_question_types = resolve_question_types(request.question_types, settings)
+    run_and_callback = prepare_qa_job(
+        request, rag_chunks, qa_question_types, qa_service, settings, outbox, coalescer, metrics
+    )
+    scheduler.submit("qa", run_and_callback)
+    return {"status": "accepted", "collection_id": collection_id}
+
+
+@router.post("/generate/stream")
+async def generate_qa_stream(
+    request: QAStreamRequest,
+    rag_service=Depends(get_rag_service),
+    retrieval_cache: RetrievalCache = Depends(get_retrieval_cache),
+    qa_service=Depends(get_qa_service),
+    settings: AppSettings = Depends(get_settings),
+    scheduler: JobScheduler = Depends(get_job_scheduler),
+):
+    """QA 생성 SSE 엔드포인트 (QA 항목이 생성되는 즉시 qa 이벤트로 전송)"""
+    scheduler.ensure_capacity("qa")
+    collection_id = build_collection_id(settings.rag.collection_prefix, str(request.lecture_id))
 
     try:
-        rag_chunks = await asyncio.to_thread(_retrieve)
+        rag_chunks = await retrieval_cache.retrieve(
+            rag_service,
+            collection_id=collection_id,
+            query=request.section_summary,
+            top_k=settings.rag.qa_retrieve_top_k,
+        )
     except Exception as exc:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"RAG 검색 실패: {exc}"
         ) from exc
 
-    requested_types = list(request.question_types) if request.question_types is not None else list(settings.qa.question_types)
+    qa_question_types = resolve_question_types(request.question_types, settings)
+    qa_request = build_qa_request(request, rag_chunks, qa_question_types, settings)
+
+    async def events():
+        # 비동기 QA 작업과 같은 qa 풀의 슬롯을 잡고 생성
+        async with scheduler.slot("qa"):
+            async for item in iter_qna_items(qa_service, qa_request):
+                # 콜백과 같은 페이로드 포맷 (qnaList에 항목 1개)
+                yield "qa", _build_qna_payload(request, [item])
+
+    return sse_response(events(), settings.stream.heartbeat_interval)
+
+
+def resolve_question_types(question_types: Optional[List[QnAType]], settings: AppSettings) -> List[str]:
+    """요청/설정 기반 질문 유형을 QA 모듈용 문자열로 변환 (qa_top_k 개까지)"""
+    requested_types = list(question_types) if question_types is not None else list(settings.qa.question_types)
     qa_question_types_enum: List[QnAType] = requested_types[: settings.qa.qa_top_k]
     if not qa_question_types_enum:
         raise HTTPException(
@@ -103,10 +175,19 @@ async def generate_qa(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="생성할 질문 유형이 설정되지 않았습니다."
         )
+    return qa_question_types
 
-    qa_request = QARequest(
-        lecture_id=lecture_id_str,
-        section_id=section_id_for_provider,
+
+def build_qa_request(
+    request: QAGenerateRequest,
+    rag_chunks: List,
+    qa_question_types: List[str],
+    settings: AppSettings,
+) -> QARequest:
+    """API 요청 + 검색 결과를 QA 모듈 요청으로 변환"""
+    return QARequest(
+        lecture_id=str(request.lecture_id),
+        section_id=request.section_index + 1,  # QA 모듈은 1-base
         section_summary=request.section_summary,
         subject=request.subject,
         language=settings.qa.language,
@@ -119,41 +200,86 @@ async def generate_qa(
         ]
     )
 
+
+def prepare_qa_job(
+    request: QAGenerateRequest,
+    rag_chunks: List,
+    qa_question_types: List[str],
+    qa_service,
+    settings: AppSettings,
+    outbox: CallbackOutbox,
+    coalescer: CallbackCoalescer,
+    metrics: PipelineMetrics,
+) -> Callable[[], Awaitable[None]]:
+    """검색 결과로 QA 생성 + 콜백 작업을 구성 (/qa/generate, /pipeline/section 공용)"""
+    qa_request = build_qa_request(request, rag_chunks, qa_question_types, settings)
+
     async def run_and_callback():
+        # 병합 모드: 질문 유형 수만큼 보고를 기다렸다가 한 번에 전송
+        # (작업이 실제로 실행될 때 예약 → 등록에 실패하거나 대기 중 취소된 작업이 섹션 버퍼를 붙잡지 않음)
+        batch: Optional[CoalescedBatch] = None
+        if settings.callback.coalesce:
+            batch = coalescer.reserve(
+                kind="qa",
+                url=str(request.callback_url),
+                base_payload=_build_qna_payload(request, []),
+                list_field="qnaList",
+                expected=len(qa_question_types),
+            )
         try:
-            async for event_type, q_type, payload in qa_service.stream_questions(qa_request):
-                if event_type == "qa":
-                    enum_type = _to_qna_enum(payload.get("type") or q_type)
-                    if enum_type is None:
-                        logger.warning("알 수 없는 QA 유형 무시: %s", q_type)
-                        continue
-                    item = {
-                        "type": enum_type.value,
-                        "question": payload.get("question"),
-                        "answer": payload.get("answer"),
-                    }
-                    # 먼저 도착한 QA부터 즉시 콜백 전송
-                    await post_qna_callback(request, [item])
+            with metrics.time_stage("qa", "qa_generation"):
+                async for item in iter_qna_items(qa_service, qa_request):
+                    # 먼저 도착한 QA부터 즉시 콜백 전송 (병합 모드에서는 버퍼에 적재)
+                    await post_qna_callback(outbox, request, [item], batch=batch)
         except Exception as exc:  # pragma: no cover - 외부 모듈 예외
             logger.exception("QA 생성 실패: %s", exc)
+        finally:
+            if batch is not None:
+                await batch.finish()
 
-    asyncio.create_task(run_and_callback())
-    return {"status": "accepted", "collection_id": collection_id}
+    return run_and_callback
+
+
+async def iter_qna_items(qa_service, qa_request: QARequest) -> AsyncIterator[dict]:
+    """QA 모듈 이벤트를 콜백/SSE 공용 항목 포맷으로 변환하며 순서대로 반환"""
+    async for event_type, q_type, payload in qa_service.stream_questions(qa_request):
+        if event_type != "qa":
+            continue
+        enum_type = _to_qna_enum(payload.get("type") or q_type)
+        if enum_type is None:
+            logger.warning("알 수 없는 QA 유형 무시: %s", q_type)
+            continue
+        yield {
+            "type": enum_type.value,
+            "question": payload.get("question"),
+            "answer": payload.get("answer"),
+        }
 
 
-async def post_qna_callback(request: QAGenerateRequest, qna_items: List[dict]):
-    """콜백 URL로 QA 결과 전송"""
-    payload = {
+async def post_qna_callback(
+    outbox: CallbackOutbox,
+    request: QAGenerateRequest,
+    qna_items: List[dict],
+    batch: Optional[CoalescedBatch] = None,
+):
+    """콜백 URL로 QA 결과 전송 (batch 지정 시 섹션 버퍼에 적재)"""
+    try:
+        if batch is not None:
+            await batch.add(qna_items)
+            return
+        await outbox.send(str(request.callback_url), _build_qna_payload(request, qna_items), kind="qa")
+    except Exception as exc:  # pragma: no cover - 네트워크 예외
+        logger.exception("QA 콜백 전송 실패: %s", exc)
+
+
+def _build_qna_payload(request: QAGenerateRequest, qna_items: List[dict]) -> dict:
+    """QA 콜백 페이로드 생성"""
+    return {
         "lectureId": request.lecture_id,
         "summaryId": request.summary_id,
         "sectionIndex": request.section_index,
         "qnaList": qna_items,
     }
-    try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            await client.post(str(request.callback_url), json=payload)
-    except Exception as exc:  # pragma: no cover - 네트워크 예외
-        logger.exception("QA 콜백 전송 실패: %s", exc)
 
 
 def _to_internal_qna_type(q_type: QnAType | str) -> str:
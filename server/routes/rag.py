@@ -9,16 +9,28 @@ from pathlib import Path
 from typing import Any, List, Optional
 
 from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile, status
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel, Field, validator
 
 from ..config import AppSettings
-from ..dependencies import get_rag_service, get_settings
+from ..dependencies import (
+    get_ingest_jobs,
+    get_job_scheduler,
+    get_metrics,
+    get_pdf_registry,
+    get_rag_service,
+    get_retrieval_cache,
+    get_settings,
+)
+from ..ingest import PDFIngestJobs
+from ..metrics import PipelineMetrics
+from ..retrieval import RetrievalCache
+from ..scheduler import JobQueueFullError, JobScheduler
+from ..uploads import PDFIngestRegistry, UploadTooLargeError, save_upload
 from ..utils import build_collection_id
 
 router = APIRouter(prefix="/rag", tags=["RAG"])
 
-UPLOAD_ROOT = Path("server_storage/uploads")
-
 
 class TextUpsertItem(BaseModel):
     """텍스트 업서트 입력 청크"""
@@ -42,22 +54,55 @@ class TextUpsertRequest(BaseModel):
         return value
 
 
-async def _ensure_upload_dir(lecture_id: str) -> Path:
+async def _ensure_upload_dir(upload_root: str, lecture_id: str) -> Path:
     """업로드 디렉터리 생성"""
-    target_dir = UPLOAD_ROOT / lecture_id
-    target_dir.mkdir(parents=True, exist_ok=True)
+    target_dir = Path(upload_root) / lecture_id
+    await asyncio.to_thread(target_dir.mkdir, parents=True, exist_ok=True)
     return target_dir
 
 
+def build_text_upsert_items(items: List[TextUpsertItem]) -> List[dict]:
+    """RAG 서비스 upsert_text 입력으로 변환 (빈 메타데이터는 Chroma 제약 때문에 source 채움)"""
+    upsert_items = []
+    for item in items:
+        metadata = dict(item.metadata or {})
+        if item.section_id:
+            metadata.setdefault("section_id", item.section_id)
+        if not metadata:
+            metadata["source"] = "text"
+        upsert_items.append(
+            {
+                "text": item.text,
+                "id": item.id,
+                "metadata": metadata,
+                "section_id": item.section_id,
+            }
+        )
+    return upsert_items
+
+
 @router.post("/pdf-upsert", status_code=status.HTTP_200_OK)
 async def upsert_pdf(
     lecture_id: str = Form(..., description="강의 ID"),
     file: UploadFile = File(..., description="업로드할 PDF 파일"),
     base_metadata: str | None = Form(None, description="PDF 전체에 적용할 메타데이터(JSON)"),
+    force: bool = Form(False, description="같은 내용이 이미 업서트됐어도 다시 처리"),
+    run_async: bool = Form(False, alias="async", description="작업으로 등록하고 바로 202 + job_id 반환"),
     rag_service=Depends(get_rag_service),
+    retrieval_cache: RetrievalCache = Depends(get_retrieval_cache),
+    pdf_registry: PDFIngestRegistry = Depends(get_pdf_registry),
+    ingest_jobs: PDFIngestJobs = Depends(get_ingest_jobs),
+    scheduler: JobScheduler = Depends(get_job_scheduler),
+    metrics: PipelineMetrics = Depends(get_metrics),
     settings: AppSettings = Depends(get_settings),
 ):
-    """PDF 문서를 업서트"""
+    """PDF 문서를 업서트 (같은 컬렉션에 같은 내용이 이미 있으면 이전 결과 반환)
+
+    async=true면 페이지 추출과 배치 임베딩을 파이프라인으로 실행하는 작업을 등록하고
+    202와 job_id를 돌려준다. 진행 상황은 GET /rag/jobs/{job_id}로 조회한다.
+    """
+    if run_async:
+        scheduler.ensure_capacity("ingest")
     if file.content_type != "application/pdf":
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -81,58 +126,128 @@ async def upsert_pdf(
                 detail=f"base_metadata JSON 파싱 실패: {exc}"
             ) from exc
     
-    upload_dir = await _ensure_upload_dir(lecture_id)
+    upload_settings = settings.rag.pdf_upload
+    upload_dir = await _ensure_upload_dir(upload_settings.upload_dir, lecture_id)
     safe_name = Path(file.filename or "uploaded.pdf").name
-    pdf_path = upload_dir / safe_name
     
-    content = await file.read()
-    if not content:
+    # 스풀 파일 → 디스크 복사와 SHA-256 계산은 청크 단위로 스레드에서 수행
+    try:
+        # 비동기 작업은 나중에 파일을 읽으므로 같은 이름의 다른 업로드에 덮어써지지 않게 해시를 붙여 저장
+        stored = await save_upload(file, upload_dir / safe_name, upload_settings, prefix_hash=run_async)
+    except UploadTooLargeError as exc:
+        raise HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail=str(exc)) from exc
+    if not stored.size:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="빈 파일은 업로드할 수 없습니다."
         )
-    pdf_path.write_bytes(content)
     
     collection_id = build_collection_id(settings.rag.collection_prefix, lecture_id)
     
     def _run():
         return rag_service.upsert_pdf(
             collection_id=collection_id,
-            pdf_path=str(pdf_path),
+            pdf_path=str(stored.path),
             base_metadata=metadata_dict
         )
     
-    result = await asyncio.to_thread(_run)
-    return {"collection_id": collection_id, "result": result}
+    mode = "async" if run_async else "sync"
+    # 같은 내용이 동시에 올라오면 먼저 온 요청의 업서트가 끝난 뒤 이력을 보고 건너뜀
+    async with pdf_registry.ingest_lock(collection_id, stored.sha256):
+        if upload_settings.dedup and not force:
+            # 비동기 작업과 RAG 모듈 upsert_pdf는 청크 분할/결과 형태가 달라 방식별 기록만 확인
+            previous = await asyncio.to_thread(pdf_registry.get, collection_id, stored.sha256, mode)
+            if previous is not None:
+                return {
+                    "collection_id": collection_id,
+                    "result": previous["result"],
+                    "sha256": stored.sha256,
+                    "deduplicated": True,
+                }
+        
+        if run_async:
+            return await _submit_ingest_job(
+                ingest_jobs, scheduler, rag_service, retrieval_cache, collection_id, stored, safe_name, metadata_dict
+            )
+        
+        try:
+            with metrics.time_stage("rag", "rag_upsert"):
+                result = await asyncio.to_thread(_run)
+        finally:
+            # 일부만 저장되고 실패했을 수도 있으므로 성공 여부와 관계없이 무효화
+            await retrieval_cache.invalidate(collection_id)
+        await asyncio.to_thread(pdf_registry.record, collection_id, stored.sha256, safe_name, stored.size, result, mode)
+    return {"collection_id": collection_id, "result": result, "sha256": stored.sha256, "deduplicated": False}
+
+
+async def _submit_ingest_job(
+    ingest_jobs: PDFIngestJobs,
+    scheduler: JobScheduler,
+    rag_service,
+    retrieval_cache: RetrievalCache,
+    collection_id: str,
+    stored,
+    filename: str,
+    base_metadata: Optional[dict[str, Any]],
+) -> JSONResponse:
+    """업서트 작업 등록 → 202 (같은 내용을 처리 중인 작업이 있으면 그 작업을 돌려줌)"""
+    state = await ingest_jobs.active(collection_id, stored.sha256)
+    if state is None:
+        job = await ingest_jobs.create(collection_id, stored.sha256, filename, stored.size)
+
+        async def invalidate():
+            await retrieval_cache.invalidate(collection_id)
+
+        async def run():
+            await ingest_jobs.run(job, rag_service, str(stored.path), base_metadata, on_upsert=invalidate)
+
+        try:
+            scheduler.submit("ingest", run)
+        except JobQueueFullError:
+            # 등록 직전에 대기열이 찬 경우: 처리 중으로 남지 않게 정리
+            await ingest_jobs.fail(job, "작업 대기열이 가득 찼습니다.")
+            raise
+        state = job.to_dict()
+    return JSONResponse(
+        status_code=status.HTTP_202_ACCEPTED,
+        content={
+            "job_id": state["job_id"],
+            "status": state["status"],
+            "collection_id": collection_id,
+            "sha256": stored.sha256,
+            "status_url": f"{router.prefix}/jobs/{state['job_id']}",
+        },
+    )
+
+
+@router.get("/jobs/{job_id}")
+async def get_ingest_job(job_id: str, ingest_jobs: PDFIngestJobs = Depends(get_ingest_jobs)):
+    """비동기 PDF 업서트 작업 상태 (페이지/청크 진행 상황, 예상 남은 시간)"""
+    job = await ingest_jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="작업을 찾을 수 없습니다.")
+    return job
 
 
 @router.post("/text-upsert", status_code=status.HTTP_200_OK)
 async def upsert_text(
     request: TextUpsertRequest,
     rag_service=Depends(get_rag_service),
+    retrieval_cache: RetrievalCache = Depends(get_retrieval_cache),
+    metrics: PipelineMetrics = Depends(get_metrics),
     settings: AppSettings = Depends(get_settings),
 ):
     """텍스트 요약본 업서트"""
     collection_id = build_collection_id(settings.rag.collection_prefix, request.lecture_id)
-    
-    upsert_items = []
-    for item in request.items:
-        metadata = dict(item.metadata or {})
-        if item.section_id:
-            metadata.setdefault("section_id", item.section_id)
-        if not metadata:
-            metadata["source"] = "text"
-        upsert_items.append(
-            {
-                "text": item.text,
-                "id": item.id,
-                "metadata": metadata,
-                "section_id": item.section_id,
-            }
-        )
+    upsert_items = build_text_upsert_items(request.items)
     
     def _run():
         return rag_service.upsert_text(collection_id=collection_id, items=upsert_items)
     
-    result = await asyncio.to_thread(_run)
+    try:
+        with metrics.time_stage("rag", "rag_upsert"):
+            result = await asyncio.to_thread(_run)
+    finally:
+        # 일부만 저장되고 실패했을 수도 있으므로 성공 여부와 관계없이 무효화
+        await retrieval_cache.invalidate(collection_id)
     return {"collection_id": collection_id, "result": result}
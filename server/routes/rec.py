@@ -5,9 +5,8 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import List, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional
 
-import httpx
 from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import Field, HttpUrl, validator
 
@@ -32,16 +31,25 @@ from cap1_google_module.googlekit.models import (
     GoogleResponse,
 )
 
+from ..coalescer import CallbackCoalescer, CoalescedBatch
 from ..config import AppSettings
 from ..dependencies import (
-    get_openalex_service,
+    get_callback_coalescer,
+    get_callback_outbox,
+    get_job_scheduler,
+    get_metrics,
     get_rag_service,
+    get_retrieval_cache,
+    get_service_registry,
     get_settings,
-    get_wiki_service,
-    get_youtube_service,
-    get_google_service,
 )
+from ..metrics import PipelineMetrics
 from ..models import ResourceType
+from ..outbox import CallbackOutbox
+from ..retrieval import RetrievalCache
+from ..scheduler import JobScheduler
+from ..services import ServiceRegistry
+from ..streaming import sse_response
 from ..utils import (
     CamelModel,
     build_collection_id,
@@ -54,6 +62,14 @@ from ..utils import (
 router = APIRouter(prefix="/rec", tags=["REC"])
 logger = logging.getLogger(__name__)
 
+# 지표 provider 라벨 (provider 모듈 내부 단계 지표와 동일한 이름)
+PROVIDER_NAMES = {
+    ResourceType.PAPER: "openalex",
+    ResourceType.WIKI: "wiki",
+    ResourceType.VIDEO: "youtube",
+    ResourceType.BLOG: "google",
+}
+
 
 class PreviousSummary(CamelModel):
     """이전 섹션 요약 정보"""
@@ -80,6 +96,10 @@ class RECRequest(CamelModel):
         default=None,
         description="요청 리소스 유형 (미지정 시 모든 유형)"
     )
+    verify_batch: Optional[bool] = Field(
+        default=None,
+        description="LLM 일괄 검증 여부 (미지정 시 provider별 설정값)"
+    )
 
     @validator("section_summary")
     def validate_section_summary(cls, value: str) -> str:
@@ -88,43 +108,157 @@ class RECRequest(CamelModel):
         return value
 
 
+class RECStreamRequest(RECRequest):
+    """REC 스트리밍 입력 (콜백 URL 불필요)"""
+
+    callback_url: Optional[HttpUrl] = Field(default=None, description="사용하지 않음 (SSE로 직접 응답)")
+
+
 @router.post("/recommend", status_code=status.HTTP_202_ACCEPTED)
 async def recommend_resources(
     request: RECRequest,
     rag_service=Depends(get_rag_service),
-    openalex_service=Depends(get_openalex_service),
-    wiki_service=Depends(get_wiki_service),
-    youtube_service=Depends(get_youtube_service),
-    google_service=Depends(get_google_service),
+    retrieval_cache: RetrievalCache = Depends(get_retrieval_cache),
+    services: ServiceRegistry = Depends(get_service_registry),
     settings: AppSettings = Depends(get_settings),
+    outbox: CallbackOutbox = Depends(get_callback_outbox),
+    coalescer: CallbackCoalescer = Depends(get_callback_coalescer),
+    scheduler: JobScheduler = Depends(get_job_scheduler),
+    metrics: PipelineMetrics = Depends(get_metrics),
 ):
     """논문/위키/유튜브/구글 추천 콜백 엔드포인트"""
+    scheduler.ensure_capacity("rec")
     lecture_id_str = str(request.lecture_id)
     collection_id = build_collection_id(settings.rag.collection_prefix, lecture_id_str)
-    section_id_for_provider = request.section_index + 1  # 외부 모듈은 1-base
 
-    def _retrieve():
-        return rag_service.retrieve(
+    try:
+        rag_chunks = await retrieval_cache.retrieve(
+            rag_service,
             collection_id=collection_id,
             query=request.section_summary,
             top_k=settings.rag.rec_retrieve_top_k,
         )
+    except Exception as exc:  # pragma: no cover - 파라미터 검증
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"RAG 검색 실패: {exc}",
+        ) from exc
+
+    selected_resource_types = select_resource_types(request.resource_types)
+    if not selected_resource_types:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="요청된 리소스 유형이 없습니다."
+        )
+
+    run_providers = prepare_rec_job(
+        request,
+        rag_chunks,
+        selected_resource_types,
+        **await resolve_provider_services(services, selected_resource_types),
+        settings=settings,
+        outbox=outbox,
+        coalescer=coalescer,
+        metrics=metrics,
+    )
+    scheduler.submit("rec", run_providers)
+
+    return {"status": "accepted", "collection_id": collection_id}
+
+
+@router.post("/recommend/stream")
+async def recommend_resources_stream(
+    request: RECStreamRequest,
+    rag_service=Depends(get_rag_service),
+    retrieval_cache: RetrievalCache = Depends(get_retrieval_cache),
+    services: ServiceRegistry = Depends(get_service_registry),
+    settings: AppSettings = Depends(get_settings),
+    scheduler: JobScheduler = Depends(get_job_scheduler),
+    metrics: PipelineMetrics = Depends(get_metrics),
+):
+    """추천 SSE 엔드포인트 (provider 결과가 나오는 즉시 resources 이벤트로 전송)"""
+    scheduler.ensure_capacity("rec")
+    collection_id = build_collection_id(settings.rag.collection_prefix, str(request.lecture_id))
 
     try:
-        rag_chunks = await asyncio.to_thread(_retrieve)
+        rag_chunks = await retrieval_cache.retrieve(
+            rag_service,
+            collection_id=collection_id,
+            query=request.section_summary,
+            top_k=settings.rag.rec_retrieve_top_k,
+        )
     except Exception as exc:  # pragma: no cover - 파라미터 검증
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"RAG 검색 실패: {exc}",
         ) from exc
 
-    selected_resource_types = _select_resource_types(request.resource_types)
+    selected_resource_types = select_resource_types(request.resource_types)
     if not selected_resource_types:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="요청된 리소스 유형이 없습니다."
         )
 
+    providers = build_provider_calls(
+        request,
+        rag_chunks,
+        **await resolve_provider_services(services, selected_resource_types),
+        settings=settings,
+    )
+
+    async def run_provider(res_type: ResourceType):
+        try:
+            with metrics.time_stage(PROVIDER_NAMES[res_type], "provider_total"):
+                result = await providers[res_type]()
+            return res_type, map_resources(res_type, result), None
+        except Exception as exc:  # pragma: no cover - 외부 서비스 예외
+            logger.exception("REC provider %s 실패: %s", res_type.value, exc)
+            return res_type, [], exc
+
+    async def events():
+        # 비동기 추천 작업과 같은 rec 풀의 슬롯을 잡고 실행
+        async with scheduler.slot("rec"):
+            tasks = [asyncio.create_task(run_provider(res_type)) for res_type in selected_resource_types]
+            try:
+                # 완료 순서대로 전송
+                for finished in asyncio.as_completed(tasks):
+                    res_type, mapped, error = await finished
+                    if error is not None:
+                        yield "error", {"resourceType": res_type.value, "detail": str(error)}
+                        continue
+                    yield "resources", {**_build_resources_payload(request, mapped), "resourceType": res_type.value}
+            finally:
+                for task in tasks:
+                    task.cancel()
+
+    return sse_response(events(), settings.stream.heartbeat_interval)
+
+
+async def resolve_provider_services(
+    services: ServiceRegistry,
+    resource_types: List[ResourceType],
+) -> Dict[str, Any]:
+    """요청한 리소스 유형의 provider 서비스만 조회/생성 (나머지는 None → import하지 않음)
+
+    build_provider_calls/prepare_rec_job의 *_service 키워드 인자로 그대로 넘긴다.
+    """
+    instances = await services.get_many(PROVIDER_NAMES[res_type] for res_type in resource_types)
+    return {f"{name}_service": instances.get(name) for name in PROVIDER_NAMES.values()}
+
+
+def build_provider_calls(
+    request: RECRequest,
+    rag_chunks: List,
+    *,
+    openalex_service,
+    wiki_service,
+    youtube_service,
+    google_service,
+    settings: AppSettings,
+) -> Dict[ResourceType, Callable[[], Awaitable[List]]]:
+    """리소스 유형별 provider 호출 함수 구성 (콜백/SSE 공용)"""
+    section_id = request.section_index + 1  # 외부 모듈은 1-base
     openalex_prev = [
         OpenAlexPreviousSummary(
             section_id=ps.section_index + 1,
@@ -159,12 +293,13 @@ async def recommend_resources(
     ]
 
     openalex_request = OpenAlexRequest(
-        lecture_id=lecture_id_str,
-        section_id=section_id_for_provider,
+        lecture_id=str(request.lecture_id),
+        section_id=section_id,
         section_summary=request.section_summary,
         language=settings.rec.openalex.language,
         top_k=settings.rec.openalex.top_k,
         verify_openalex=settings.rec.openalex.verify,
+        verify_batch=_resolve_verify_batch(request, settings.rec.openalex.verify_batch),
         previous_summaries=openalex_prev,
         rag_context=to_openalex_rag_chunks(rag_chunks),
         year_from=settings.rec.openalex.year_from,
@@ -174,8 +309,8 @@ async def recommend_resources(
     )
 
     wiki_request = WikiRequest(
-        lecture_id=lecture_id_str,
-        section_id=section_id_for_provider,
+        lecture_id=str(request.lecture_id),
+        section_id=section_id,
         lecture_summary=request.section_summary,
         language=settings.rec.wiki.language,
         top_k=settings.rec.wiki.top_k,
@@ -189,12 +324,13 @@ async def recommend_resources(
     )
 
     youtube_request = YouTubeRequest(
-        lecture_id=lecture_id_str,
-        section_id=section_id_for_provider,
+        lecture_id=str(request.lecture_id),
+        section_id=section_id,
         lecture_summary=request.section_summary,
         language=settings.rec.youtube.language,
         top_k=settings.rec.youtube.top_k,
         verify_yt=settings.rec.youtube.verify,
+        verify_batch=_resolve_verify_batch(request, settings.rec.youtube.verify_batch),
         previous_summaries=youtube_prev,
         rag_context=to_youtube_rag_chunks(rag_chunks),
         yt_lang=settings.rec.youtube.yt_lang,
@@ -203,12 +339,13 @@ async def recommend_resources(
     )
 
     google_request = GoogleRequest(
-        lecture_id=lecture_id_str,
-        section_id=section_id_for_provider,
+        lecture_id=str(request.lecture_id),
+        section_id=section_id,
         lecture_summary=request.section_summary,
         language=settings.rec.google.language,
         top_k=settings.rec.google.top_k,
         verify_google=settings.rec.google.verify,
+        verify_batch=_resolve_verify_batch(request, settings.rec.google.verify_batch),
         previous_summaries=google_prev,
         rag_context=to_google_rag_chunks(rag_chunks),
         search_lang=settings.rec.google.search_lang,
@@ -216,9 +353,44 @@ async def recommend_resources(
         min_score=settings.rec.google.min_score,
     )
 
-    async def provider_task(res_type: ResourceType, coro):
+    return {
+        ResourceType.PAPER: lambda: openalex_service.recommend_papers(openalex_request),
+        ResourceType.WIKI: lambda: wiki_service.recommend_pages(wiki_request),
+        ResourceType.VIDEO: lambda: youtube_service.recommend_videos(youtube_request),
+        ResourceType.BLOG: lambda: google_service.recommend_results(google_request),
+    }
+
+
+def prepare_rec_job(
+    request: RECRequest,
+    rag_chunks: List,
+    selected_resource_types: List[ResourceType],
+    *,
+    openalex_service,
+    wiki_service,
+    youtube_service,
+    google_service,
+    settings: AppSettings,
+    outbox: CallbackOutbox,
+    coalescer: CallbackCoalescer,
+    metrics: PipelineMetrics,
+) -> Callable[[], Awaitable[None]]:
+    """검색 결과로 provider 추천 + 콜백 작업을 구성 (/rec/recommend, /pipeline/section 공용)"""
+    providers = build_provider_calls(
+        request,
+        rag_chunks,
+        openalex_service=openalex_service,
+        wiki_service=wiki_service,
+        youtube_service=youtube_service,
+        google_service=google_service,
+        settings=settings,
+    )
+
+    async def provider_task(res_type: ResourceType, coro, batch: Optional[CoalescedBatch]):
         try:
-            result = await coro
+            # provider 전체 소요 시간 (Wikipedia처럼 내부 계측이 없는 provider 포함)
+            with metrics.time_stage(PROVIDER_NAMES[res_type], "provider_total"):
+                result = await coro
             mapped = map_resources(res_type, result)
             titles = [item.get("title") for item in mapped if item.get("title")]
             # INFO 레벨에서 보이지 않는 환경을 위해 WARNING으로 남김
@@ -228,26 +400,32 @@ async def recommend_resources(
                 len(mapped),
                 ", ".join(titles[:5]) if titles else "none",
             )
-            await post_resources_callback(request, mapped)
+            await post_resources_callback(outbox, request, mapped, batch=batch)
         except Exception as exc:  # pragma: no cover - 외부 서비스 예외
             logger.exception("REC provider %s 실패: %s", res_type.value, exc)
-            await post_resources_callback(request, [])
-
-    providers = {
-        ResourceType.PAPER: lambda: openalex_service.recommend_papers(openalex_request),
-        ResourceType.WIKI: lambda: wiki_service.recommend_pages(wiki_request),
-        ResourceType.VIDEO: lambda: youtube_service.recommend_videos(youtube_request),
-        ResourceType.BLOG: lambda: google_service.recommend_results(google_request),
-    }
+            await post_resources_callback(outbox, request, [], batch=batch)
+
+    async def run_providers():
+        # 병합 모드: 요청한 provider 수만큼 보고를 기다렸다가 한 번에 전송
+        # (작업이 실제로 실행될 때 예약 → 등록에 실패하거나 대기 중 취소된 작업이 섹션 버퍼를 붙잡지 않음)
+        batch: Optional[CoalescedBatch] = None
+        if settings.callback.coalesce:
+            batch = coalescer.reserve(
+                kind="rec",
+                url=str(request.callback_url),
+                base_payload=_build_resources_payload(request, []),
+                list_field="resources",
+                expected=len(selected_resource_types),
+            )
+        # provider별 결과는 완료되는 대로 각각 콜백
+        await asyncio.gather(
+            *(provider_task(res_type, providers[res_type](), batch) for res_type in selected_resource_types)
+        )
 
-    for res_type in selected_resource_types:
-        task_coro = providers[res_type]()
-        asyncio.create_task(provider_task(res_type, task_coro))
+    return run_providers
 
-    return {"status": "accepted", "collection_id": collection_id}
 
-
-def _select_resource_types(resource_types: Optional[List[ResourceType]]) -> List[ResourceType]:
+def select_resource_types(resource_types: Optional[List[ResourceType]]) -> List[ResourceType]:
     """요청된 리소스 유형을 정규화 (중복 제거 포함)"""
     if resource_types is None:
         return [
@@ -332,16 +510,32 @@ def map_resources(res_type: ResourceType, result: List) -> List[dict]:
     return mapped
 
 
-async def post_resources_callback(request: RECRequest, resources: List[dict]):
-    """콜백 URL로 추천 자료 전송"""
-    payload = {
+def _resolve_verify_batch(request: RECRequest, default: bool) -> bool:
+    """요청에 verify_batch가 있으면 우선 사용, 없으면 provider 설정값"""
+    return request.verify_batch if request.verify_batch is not None else default
+
+
+def _build_resources_payload(request: RECRequest, resources: List[dict]) -> dict:
+    """REC 콜백 페이로드 생성"""
+    return {
         "lectureId": request.lecture_id,
         "summaryId": request.summary_id,
         "sectionIndex": request.section_index,
         "resources": resources,
     }
+
+
+async def post_resources_callback(
+    outbox: CallbackOutbox,
+    request: RECRequest,
+    resources: List[dict],
+    batch: Optional[CoalescedBatch] = None,
+):
+    """콜백 URL로 추천 자료 전송 (batch 지정 시 섹션 버퍼에 적재)"""
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            await client.post(str(request.callback_url), json=payload)
+        if batch is not None:
+            await batch.add(resources)
+            return
+        await outbox.send(str(request.callback_url), _build_resources_payload(request, resources), kind="rec")
     except Exception as exc:  # pragma: no cover - 네트워크 예외
         logger.exception("콜백 전송 실패: %s", exc)
@@ -3,21 +3,25 @@
 """
 from __future__ import annotations
 
-import asyncio
 import logging
 import os
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional
 from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
 
-import httpx
 from fastapi import APIRouter, Depends, HTTPException, status
-from openai import AsyncOpenAI
 from pydantic import Field, HttpUrl, validator
 
 from ..config import AppSettings
-from ..dependencies import get_settings
+from ..llm import LLMClientRegistry
+from ..dependencies import get_callback_outbox, get_job_scheduler, get_llm_registry, get_metrics, get_settings
+from ..metrics import PipelineMetrics
+from ..outbox import CallbackOutbox
+from ..scheduler import JobScheduler
 from ..utils import CamelModel
 
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI
+
 router = APIRouter(prefix="/summary", tags=["SUMMARY"])
 logger = logging.getLogger(__name__)
 
@@ -57,8 +61,13 @@ class SummaryGenerateRequest(CamelModel):
 async def generate_summary(
     request: SummaryGenerateRequest,
     settings: AppSettings = Depends(get_settings),
+    outbox: CallbackOutbox = Depends(get_callback_outbox),
+    scheduler: JobScheduler = Depends(get_job_scheduler),
+    llm_registry: LLMClientRegistry = Depends(get_llm_registry),
+    metrics: PipelineMetrics = Depends(get_metrics),
 ):
     """요약 생성 콜백 엔드포인트"""
+    scheduler.ensure_capacity("summary")
     transcript_text = _to_transcript_text(request.transcript)
     if not transcript_text:
         raise HTTPException(
@@ -66,7 +75,8 @@ async def generate_summary(
             detail="전사 내용이 비어 있습니다.",
         )
 
-    api_key = _resolve_api_key()
+    # 키가 없으면 작업을 등록하기 전에 500으로 응답 (공유 클라이언트도 같은 키 사용)
+    _resolve_api_key()
     callback_url = _resolve_callback_url(request.callback_url, settings)
 
     if _is_too_short(transcript_text, settings.summary.min_transcript_length):
@@ -83,21 +93,21 @@ async def generate_summary(
         )
 
         async def send_skip():
-            await _post_summary_callback(callback_url, payload)
+            await _post_summary_callback(outbox, callback_url, payload)
 
-        asyncio.create_task(send_skip())
+        scheduler.submit("summary", send_skip)
         return {"status": "skipped", "reason": "too_short"}
 
     async def run_and_callback():
         try:
-            client = AsyncOpenAI(api_key=api_key, timeout=30.0)
-            summary_text = await _generate_summary_text(client, transcript_text, settings)
+            with metrics.time_stage("summary", "summary_generation", model=settings.summary.model):
+                summary_text = await _generate_summary_text(llm_registry.client, transcript_text, settings)
             payload = _build_callback_payload(request, summary_text, status="COMPLETED")
-            await _post_summary_callback(callback_url, payload)
+            await _post_summary_callback(outbox, callback_url, payload)
         except Exception as exc:  # pragma: no cover - 네트워크/외부 API 예외
             logger.exception("요약 생성 실패: %s", exc)
 
-    asyncio.create_task(run_and_callback())
+    scheduler.submit("summary", run_and_callback)
     return {"status": "accepted"}
 
 
@@ -116,11 +126,10 @@ async def _generate_summary_text(client: AsyncOpenAI, transcript_text: str, sett
     return content.strip()
 
 
-async def _post_summary_callback(callback_url: str, payload: dict):
+async def _post_summary_callback(outbox: CallbackOutbox, callback_url: str, payload: dict):
     """콜백 URL로 요약 결과 전송"""
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            await client.post(callback_url, json=payload)
+        await outbox.send(callback_url, payload, kind="summary")
     except Exception as exc:  # pragma: no cover - 네트워크 예외
         logger.exception("요약 콜백 전송 실패: %s", exc)
 
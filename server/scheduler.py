@@ -0,0 +1,201 @@
+"""
+백그라운드 작업 스케줄러 (종류별 동시성 제한 + 대기열 상한)
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Optional, Set
+
+from .config import JobPoolSettings, SchedulerSettings
+from .metrics import PipelineMetrics
+from .tracing import Tracer
+
+logger = logging.getLogger(__name__)
+
+
+class JobQueueFullError(Exception):
+    """대기열이 가득 차 작업을 받을 수 없음"""
+
+    def __init__(self, kind: str, retry_after: int):
+        super().__init__(f"{kind} 작업 대기열이 가득 찼습니다.")
+        self.kind = kind
+        self.retry_after = retry_after
+
+
+@dataclass
+class JobMetrics:
+    """작업 종류별 누적 지표"""
+    submitted: int = 0
+    rejected: int = 0
+    completed: int = 0
+    failed: int = 0
+    queued: int = 0
+    running: int = 0
+    queue_time_total: float = 0.0
+    queue_time_max: float = 0.0
+    run_time_total: float = 0.0
+    run_time_max: float = 0.0
+
+    def snapshot(self) -> Dict[str, Any]:
+        finished = self.completed + self.failed
+        return {
+            "submitted": self.submitted,
+            "rejected": self.rejected,
+            "completed": self.completed,
+            "failed": self.failed,
+            "queued": self.queued,
+            "running": self.running,
+            "queue_time_avg": self.queue_time_total / finished if finished else 0.0,
+            "queue_time_max": self.queue_time_max,
+            "run_time_avg": self.run_time_total / finished if finished else 0.0,
+            "run_time_max": self.run_time_max,
+        }
+
+
+@dataclass
+class _JobPool:
+    settings: JobPoolSettings
+    semaphore: asyncio.Semaphore
+    metrics: JobMetrics = field(default_factory=JobMetrics)
+
+
+class JobScheduler:
+    """QA/REC/요약 파이프라인 실행기
+
+    작업 종류마다 concurrency 만큼만 동시에 실행하고, 나머지는
+    max_queue_depth 까지 대기시킨다. 대기열이 가득 차면
+    JobQueueFullError를 던져 라우트가 429 + Retry-After로 응답하게 한다.
+    """
+
+    def __init__(
+        self,
+        settings: SchedulerSettings | None = None,
+        metrics: Optional[PipelineMetrics] = None,
+        tracer: Optional[Tracer] = None,
+    ):
+        self.settings = settings or SchedulerSettings()
+        self.metrics = metrics
+        self.tracer = tracer
+        self._pools: Dict[str, _JobPool] = {}
+        self._tasks: Set[asyncio.Task] = set()
+
+    def _pool(self, kind: str) -> _JobPool:
+        pool = self._pools.get(kind)
+        if pool is None:
+            pool_settings = getattr(self.settings, kind, None) or JobPoolSettings()
+            pool = _JobPool(settings=pool_settings, semaphore=asyncio.Semaphore(pool_settings.concurrency))
+            self._pools[kind] = pool
+        return pool
+
+    def ensure_capacity(self, kind: str):
+        """작업을 더 받을 수 있는지 확인 (무거운 전처리 전에 빠르게 거절)"""
+        pool = self._pool(kind)
+        capacity = pool.settings.concurrency + pool.settings.max_queue_depth
+        if pool.metrics.queued + pool.metrics.running >= capacity:
+            pool.metrics.rejected += 1
+            logger.warning(
+                "%s 작업 거절: 실행 %s / 대기 %s (한도 %s)",
+                kind, pool.metrics.running, pool.metrics.queued, capacity,
+            )
+            raise JobQueueFullError(kind, self.settings.retry_after)
+
+    def submit(self, kind: str, job: Callable[[], Awaitable[Any]]) -> asyncio.Task:
+        """작업 등록 (대기열 초과 시 JobQueueFullError)"""
+        self.ensure_capacity(kind)
+        pool = self._pool(kind)
+        pool.metrics.submitted += 1
+        pool.metrics.queued += 1
+        self._publish(kind, pool)
+        task = asyncio.create_task(self._run(kind, pool, job, time.perf_counter()))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    @asynccontextmanager
+    async def slot(self, kind: str) -> AsyncIterator[None]:
+        """요청 안에서 직접 실행되는 작업(SSE 생산자 등)의 실행 슬롯
+
+        submit과 같은 풀의 동시성/대기열 한도와 지표를 공유한다 (대기열 초과 시 JobQueueFullError).
+        """
+        self.ensure_capacity(kind)
+        pool = self._pool(kind)
+        pool.metrics.submitted += 1
+        pool.metrics.queued += 1
+        self._publish(kind, pool)
+        async with self._running(kind, pool, time.perf_counter()):
+            yield
+
+    async def _run(self, kind: str, pool: _JobPool, job: Callable[[], Awaitable[Any]], enqueued_at: float):
+        try:
+            async with self._running(kind, pool, enqueued_at) as queue_time:
+                await self._run_job(kind, job, queue_time)
+        except Exception as exc:  # pragma: no cover - 작업 내부 예외
+            logger.exception("%s 작업 실패: %s", kind, exc)
+
+    @asynccontextmanager
+    async def _running(self, kind: str, pool: _JobPool, enqueued_at: float) -> AsyncIterator[float]:
+        """세마포어를 잡고 대기 → 실행으로 집계, 끝나면 완료/실패 집계 (대기 시간을 넘겨줌)"""
+        metrics = pool.metrics
+        try:
+            await pool.semaphore.acquire()
+        except asyncio.CancelledError:
+            metrics.queued -= 1
+            self._publish(kind, pool)
+            raise
+        started_at = time.perf_counter()
+        queue_time = started_at - enqueued_at
+        metrics.queued -= 1
+        metrics.running += 1
+        metrics.queue_time_total += queue_time
+        metrics.queue_time_max = max(metrics.queue_time_max, queue_time)
+        if self.metrics is not None:
+            self.metrics.observe_queue_wait(kind, queue_time)
+        self._publish(kind, pool)
+        try:
+            yield queue_time
+            metrics.completed += 1
+        except Exception:
+            metrics.failed += 1
+            raise
+        finally:
+            pool.semaphore.release()
+            run_time = time.perf_counter() - started_at
+            metrics.running -= 1
+            metrics.run_time_total += run_time
+            metrics.run_time_max = max(metrics.run_time_max, run_time)
+            self._publish(kind, pool)
+
+    async def _run_job(self, kind: str, job: Callable[[], Awaitable[Any]], queue_time: float):
+        """작업 실행 (요청 span을 부모로 하는 별도 local root span으로 추적)"""
+        if self.tracer is None:
+            await job()
+            return
+        with self.tracer.start_span(f"job.{kind}", {"livenote.queue_wait": round(queue_time, 6)}, new_root=True):
+            await job()
+
+    def _publish(self, kind: str, pool: _JobPool):
+        """대기/실행 중 작업 수를 Prometheus gauge로 반영"""
+        if self.metrics is not None:
+            self.metrics.set_jobs(kind, pool.metrics.queued, pool.metrics.running)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """종류별 지표 스냅샷"""
+        return {kind: pool.metrics.snapshot() for kind, pool in self._pools.items()}
+
+    async def drain(self, timeout: float | None = None):
+        """진행 중/대기 중 작업 완료 대기 후 남은 작업 취소 (lifespan 종료 시)"""
+        if not self._tasks:
+            return
+        timeout = self.settings.drain_timeout if timeout is None else timeout
+        pending = set(self._tasks)
+        logger.info("작업 스케줄러 drain: %s개 작업 대기 (timeout=%ss)", len(pending), timeout)
+        done, not_done = await asyncio.wait(pending, timeout=timeout)
+        for task in not_done:
+            task.cancel()
+        if not_done:
+            logger.warning("drain 시간 초과로 %s개 작업 취소", len(not_done))
+            await asyncio.gather(*not_done, return_exceptions=True)
@@ -0,0 +1,192 @@
+"""
+provider/RAG/QA 서비스 지연 생성 + 백그라운드 워밍업
+"""
+from __future__ import annotations
+
+import asyncio
+import importlib
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from .config import ServiceSettings
+
+logger = logging.getLogger(__name__)
+
+
+class LazyService:
+    """서비스 하나의 지연 생성기 (첫 사용 시 import + 생성, 이후 같은 인스턴스 반환)
+
+    모듈 import(chromadb/openai/rapidfuzz 등, 수백 ms~수 초)는 스레드에서 실행해
+    첫 요청이나 워밍업 중에도 이벤트 루프가 다른 요청을 처리하게 한다.
+    생성자는 이벤트 루프 스레드에서 호출한다.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        factory_path: str,
+        *,
+        instance: Any = None,
+        factory_kwargs: Optional[Callable[[], dict]] = None,
+        on_create: Optional[Callable[[Any], None]] = None,
+    ):
+        self.name = name
+        self.factory_path = factory_path
+        self.instance = instance
+        # 외부에서 주입한 인스턴스는 닫지 않음
+        self.owned = instance is None
+        self._factory_kwargs = factory_kwargs
+        self._on_create = on_create
+        self._lock = asyncio.Lock()
+        self._sync_lock = threading.Lock()
+        self.import_seconds: Optional[float] = None
+        self.build_seconds: Optional[float] = None
+        self.error: Optional[str] = None
+
+    @property
+    def created(self) -> bool:
+        return self.instance is not None
+
+    def _import_factory(self):
+        module_name, attr = self.factory_path.rsplit(".", 1)
+        started = time.perf_counter()
+        module = importlib.import_module(module_name)
+        self.import_seconds = time.perf_counter() - started
+        return getattr(module, attr)
+
+    def _build(self, factory) -> Any:
+        started = time.perf_counter()
+        kwargs = self._factory_kwargs() if self._factory_kwargs is not None else {}
+        instance = factory(**kwargs)
+        if self._on_create is not None:
+            self._on_create(instance)
+        self.build_seconds = time.perf_counter() - started
+        self.instance = instance
+        logger.info(
+            "서비스 생성: %s (import %.3fs, 생성 %.3fs)", self.name, self.import_seconds or 0.0, self.build_seconds
+        )
+        return instance
+
+    def get_sync(self) -> Any:
+        """동기 생성 (lazy=False일 때 create_app에서 사용)"""
+        if self.instance is not None:
+            return self.instance
+        with self._sync_lock:
+            if self.instance is None:
+                self._build(self._import_factory())
+        return self.instance
+
+    async def get(self) -> Any:
+        """인스턴스 조회 (없으면 생성, 동시 호출은 한 번만 생성)"""
+        if self.instance is not None:
+            return self.instance
+        async with self._lock:
+            if self.instance is None:
+                try:
+                    factory = await asyncio.to_thread(self._import_factory)
+                    self._build(factory)
+                except Exception as exc:
+                    self.error = f"{type(exc).__name__}: {exc}"
+                    raise
+                self.error = None
+        return self.instance
+
+    async def close(self):
+        if self.owned and self.instance is not None and hasattr(self.instance, "close"):
+            await self.instance.close()
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "created": self.created,
+            "owned": self.owned,
+            "factory": self.factory_path,
+            "import_seconds": self.import_seconds,
+            "build_seconds": self.build_seconds,
+            "error": self.error,
+        }
+
+
+class ServiceRegistry:
+    """이름별 LazyService 보관 + lifespan 워밍업
+
+    라우트는 필요한 서비스만 get()으로 꺼내므로 요청하지 않은 provider 모듈은 import되지 않는다.
+    """
+
+    def __init__(self, settings: ServiceSettings | None = None):
+        self.settings = settings or ServiceSettings()
+        self._services: Dict[str, LazyService] = {}
+        self._warm_up_task: Optional[asyncio.Task] = None
+        self.warm_up_seconds: Optional[float] = None
+
+    def register(self, service: LazyService) -> LazyService:
+        self._services[service.name] = service
+        return service
+
+    def __getitem__(self, name: str) -> LazyService:
+        return self._services[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._services
+
+    def peek(self, name: str) -> Any:
+        """생성된 인스턴스만 반환 (생성하지 않음, 없으면 None)"""
+        service = self._services.get(name)
+        return service.instance if service is not None else None
+
+    async def get(self, name: str) -> Any:
+        return await self._services[name].get()
+
+    async def get_many(self, names: Iterable[str]) -> Dict[str, Any]:
+        """여러 서비스를 동시에 조회/생성"""
+        names = list(dict.fromkeys(names))
+        instances = await asyncio.gather(*(self.get(name) for name in names))
+        return dict(zip(names, instances))
+
+    def build_all(self):
+        """모든 서비스를 즉시 생성 (lazy=False)"""
+        for service in self._services.values():
+            service.get_sync()
+
+    def start_warm_up(self, names: Optional[List[str]] = None) -> Optional[asyncio.Task]:
+        """백그라운드에서 서비스 순차 생성 (서버는 바로 요청을 받음, 실패는 로그만 남김)"""
+        names = [name for name in (names if names is not None else self.settings.warm_up_services) if name in self]
+        pending = [name for name in names if not self._services[name].created]
+        if not pending:
+            self.warm_up_seconds = 0.0
+            return None
+
+        async def warm_up():
+            started = time.perf_counter()
+            # 순차 실행: import는 GIL을 잡으므로 병렬로 돌려도 빨라지지 않고 요청 처리만 늦어진다
+            for name in pending:
+                try:
+                    await self.get(name)
+                except Exception as exc:  # pragma: no cover - provider 모듈 설정 오류
+                    logger.warning("서비스 워밍업 실패: %s (%s)", name, exc)
+            self.warm_up_seconds = time.perf_counter() - started
+            logger.info("서비스 워밍업 완료: %s (%.3fs)", ", ".join(pending), self.warm_up_seconds)
+
+        self._warm_up_task = asyncio.create_task(warm_up())
+        return self._warm_up_task
+
+    async def wait_warm_up(self):
+        if self._warm_up_task is not None:
+            await self._warm_up_task
+
+    async def close(self):
+        """워밍업 취소 + 직접 만든 서비스 정리 (생성 역순)"""
+        if self._warm_up_task is not None and not self._warm_up_task.done():
+            self._warm_up_task.cancel()
+            await asyncio.gather(self._warm_up_task, return_exceptions=True)
+        for service in reversed(list(self._services.values())):
+            await service.close()
+
+    def snapshot(self) -> Dict[str, Any]:
+        warming = self._warm_up_task is not None and not self._warm_up_task.done()
+        return {
+            "lazy": self.settings.lazy,
+            "warm_up": {"running": warming, "seconds": self.warm_up_seconds},
+            "services": {name: service.snapshot() for name, service in self._services.items()},
+        }
@@ -0,0 +1,87 @@
+"""
+SSE 스트리밍 헬퍼 (결과 이벤트 + heartbeat + 완료 이벤트)
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import AsyncIterator, Tuple
+
+from fastapi.responses import StreamingResponse
+
+from .utils import format_sse
+
+logger = logging.getLogger(__name__)
+
+_DONE = object()
+
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "Connection": "keep-alive",
+    # nginx 등 프록시 버퍼링 비활성화 (이벤트 즉시 전달)
+    "X-Accel-Buffering": "no",
+}
+
+
+async def sse_events(
+    source: AsyncIterator[Tuple[str, dict]],
+    heartbeat_interval: float,
+) -> AsyncIterator[bytes]:
+    """(event, data) 비동기 이터레이터를 SSE 바이트 스트림으로 변환
+
+    - 결과는 생성되는 즉시 전송
+    - heartbeat_interval 동안 결과가 없으면 heartbeat 이벤트 전송 (프록시 유휴 타임아웃 방지)
+    - 종료 시 done 이벤트, 예외 시 error 이벤트 후 done 이벤트 전송
+    - 클라이언트 연결이 끊기면 생산 작업을 취소
+    """
+    queue: asyncio.Queue = asyncio.Queue()
+    started = time.perf_counter()
+
+    async def produce():
+        try:
+            async for event, data in source:
+                await queue.put((event, data))
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:  # pragma: no cover - 외부 모듈 예외
+            logger.exception("SSE 생성 실패: %s", exc)
+            await queue.put(("error", {"detail": str(exc)}))
+        finally:
+            queue.put_nowait(_DONE)
+
+    producer = asyncio.create_task(produce())
+    sent = 0
+    try:
+        while True:
+            try:
+                item = await asyncio.wait_for(queue.get(), timeout=heartbeat_interval)
+            except asyncio.TimeoutError:
+                yield format_sse({"elapsed": round(time.perf_counter() - started, 3)}, event="heartbeat")
+                continue
+            if item is _DONE:
+                break
+            event, data = item
+            if event != "error":
+                sent += 1
+            yield format_sse(data, event=event)
+        yield format_sse(
+            {"events": sent, "elapsed": round(time.perf_counter() - started, 3)},
+            event="done",
+        )
+    finally:
+        if not producer.done():
+            producer.cancel()
+            try:
+                await producer
+            except asyncio.CancelledError:
+                pass
+
+
+def sse_response(source: AsyncIterator[Tuple[str, dict]], heartbeat_interval: float) -> StreamingResponse:
+    """SSE StreamingResponse 생성"""
+    return StreamingResponse(
+        sse_events(source, heartbeat_interval),
+        media_type="text/event-stream",
+        headers=SSE_HEADERS,
+    )
@@ -0,0 +1,337 @@
+"""
+요청 단위 span 추적 (W3C traceparent 전파 + OTLP JSON 형식 JSONL 출력 + 느린 요청 샘플링)
+"""
+from __future__ import annotations
+
+import json
+import logging
+import random
+import secrets
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import httpx
+
+from .config import TracingSettings
+
+logger = logging.getLogger(__name__)
+
+SERVICE_NAME = "livenote-ai-gateway"
+
+SPAN_KIND_INTERNAL = "SPAN_KIND_INTERNAL"
+SPAN_KIND_SERVER = "SPAN_KIND_SERVER"
+SPAN_KIND_CLIENT = "SPAN_KIND_CLIENT"
+
+_current_span: ContextVar[Optional["Span"]] = ContextVar("livenote_current_span", default=None)
+
+
+def current_span() -> Optional["Span"]:
+    """현재 컨텍스트의 span (asyncio 태스크/to_thread로 자동 전파)"""
+    return _current_span.get()
+
+
+def parse_traceparent(header: Optional[str]) -> Optional[Tuple[str, str]]:
+    """W3C traceparent 헤더 → (trace_id, parent span_id), 형식이 틀리면 None"""
+    if not header:
+        return None
+    parts = header.strip().split("-")
+    if len(parts) < 4 or len(parts[1]) != 32 or len(parts[2]) != 16:
+        return None
+    trace_id, span_id = parts[1].lower(), parts[2].lower()
+    try:
+        int(trace_id, 16)
+        int(span_id, 16)
+    except ValueError:
+        return None
+    if trace_id == "0" * 32 or span_id == "0" * 16:
+        return None
+    return trace_id, span_id
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        # OTLP JSON은 int64를 문자열로 표현
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+class Span:
+    """추적 단위 하나
+
+    프로세스 안에서 부모가 없는 span(HTTP 요청, 백그라운드 작업)이 local root가 되고,
+    하위 span은 종료 시 local root에 모였다가 root 종료 시 샘플링 여부가 결정된다.
+    """
+
+    __slots__ = (
+        "name", "kind", "trace_id", "span_id", "parent_span_id", "attributes",
+        "start_ns", "end_ns", "status", "status_message", "root", "_started", "_children", "_dropped",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        trace_id: str,
+        parent_span_id: Optional[str],
+        root: Optional["Span"],
+        kind: str = SPAN_KIND_INTERNAL,
+        attributes: Optional[Dict[str, Any]] = None,
+    ):
+        self.name = name
+        self.kind = kind
+        self.trace_id = trace_id
+        self.span_id = secrets.token_hex(8)
+        self.parent_span_id = parent_span_id
+        self.attributes: Dict[str, Any] = {k: v for k, v in (attributes or {}).items() if v is not None}
+        self.start_ns = time.time_ns()
+        self.end_ns: Optional[int] = None
+        self.status = "STATUS_CODE_UNSET"
+        self.status_message = ""
+        self.root = root or self
+        self._started = time.perf_counter_ns()
+        self._children: List[Span] = []
+        self._dropped = 0
+
+    @property
+    def is_root(self) -> bool:
+        return self.root is self
+
+    @property
+    def duration(self) -> float:
+        """소요 시간 (초, 종료 전이면 현재까지)"""
+        end = self.end_ns if self.end_ns is not None else self.start_ns + (time.perf_counter_ns() - self._started)
+        return (end - self.start_ns) / 1e9
+
+    @property
+    def traceparent(self) -> str:
+        return f"00-{self.trace_id}-{self.span_id}-01"
+
+    def set_attribute(self, key: str, value: Any):
+        if value is not None:
+            self.attributes[key] = value
+
+    def set_error(self, exc: BaseException):
+        self.status = "STATUS_CODE_ERROR"
+        self.status_message = f"{type(exc).__name__}: {exc}"
+
+    def end(self):
+        if self.end_ns is None:
+            self.end_ns = self.start_ns + (time.perf_counter_ns() - self._started)
+
+    def to_otlp(self) -> Dict[str, Any]:
+        """OTLP/JSON Span 형식 (collector로 그대로 재전송 가능)"""
+        record: Dict[str, Any] = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": self.kind,
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns or self.start_ns),
+            "attributes": [{"key": key, "value": _otlp_value(value)} for key, value in self.attributes.items()],
+            "status": {"code": self.status},
+            "resource": {"service.name": SERVICE_NAME},
+        }
+        if self.parent_span_id:
+            record["parentSpanId"] = self.parent_span_id
+        if self.status_message:
+            record["status"]["message"] = self.status_message
+        return record
+
+
+class JsonlSpanExporter:
+    """span을 한 줄에 하나씩 JSON으로 파일에 추가
+
+    느린 요청의 span 트리만 기록하므로 동기 append로 충분하다.
+    """
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+    def export(self, spans: List[Span]):
+        lines = "".join(json.dumps(span.to_otlp(), ensure_ascii=False) + "\n" for span in spans)
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open("a", encoding="utf-8") as fp:
+                fp.write(lines)
+
+
+class SlowRequestSampler:
+    """local root 종료 시 span 트리 전체를 남길지 결정
+
+    기준 시간 이상 걸렸거나 오류로 끝난 요청은 항상 남기고,
+    나머지는 sample_ratio 비율로만 남긴다.
+    """
+
+    def __init__(self, slow_threshold: float, sample_ratio: float = 0.0):
+        self.slow_threshold = slow_threshold
+        self.sample_ratio = sample_ratio
+
+    def should_export(self, root: Span) -> bool:
+        if root.duration >= self.slow_threshold or root.status == "STATUS_CODE_ERROR":
+            return True
+        return self.sample_ratio > 0 and random.random() < self.sample_ratio
+
+
+class Tracer:
+    """contextvars 기반 span 생성기
+
+    라우트 → 스케줄러 작업 → provider 단계 → LLM HTTP 호출까지
+    같은 trace_id로 이어지며, 샘플링된 트리만 exporter로 내보낸다.
+    """
+
+    def __init__(self, settings: TracingSettings | None = None, exporter: Optional[JsonlSpanExporter] = None):
+        self.settings = settings or TracingSettings()
+        self.enabled = self.settings.enabled
+        self.exporter = exporter or JsonlSpanExporter(self.settings.export_path)
+        self.sampler = SlowRequestSampler(self.settings.slow_threshold, self.settings.sample_ratio)
+        self.counters: Dict[str, int] = {"exported_traces": 0, "sampled_out": 0, "exported_spans": 0, "dropped_spans": 0}
+
+    @contextmanager
+    def start_span(
+        self,
+        name: str,
+        attributes: Optional[Dict[str, Any]] = None,
+        *,
+        kind: str = SPAN_KIND_INTERNAL,
+        new_root: bool = False,
+        remote_parent: Optional[Tuple[str, str]] = None,
+    ) -> Iterator[Optional[Span]]:
+        """span 시작 (비활성화 시 None을 yield)
+
+        new_root=True면 현재 span을 부모로 두되 별도 local root로 샘플링한다
+        (요청 응답 후에도 계속 실행되는 백그라운드 작업용).
+        remote_parent는 상위 서비스가 보낸 traceparent의 (trace_id, span_id).
+        """
+        if not self.enabled:
+            yield None
+            return
+        parent = _current_span.get()
+        if parent is not None:
+            span = Span(name, parent.trace_id, parent.span_id, None if new_root else parent.root, kind, attributes)
+        elif remote_parent is not None:
+            span = Span(name, remote_parent[0], remote_parent[1], None, kind, attributes)
+        else:
+            span = Span(name, secrets.token_hex(16), None, None, kind, attributes)
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as exc:
+            span.set_error(exc)
+            raise
+        finally:
+            _current_span.reset(token)
+            span.end()
+            self._finish(span)
+
+    def _finish(self, span: Span):
+        root = span.root
+        if not span.is_root:
+            if len(root._children) < self.settings.max_spans_per_trace:
+                root._children.append(span)
+            else:
+                root._dropped += 1
+            return
+        if not self.sampler.should_export(span):
+            self.counters["sampled_out"] += 1
+            return
+        spans = [span, *span._children]
+        if span._dropped:
+            span.set_attribute("livenote.dropped_spans", span._dropped)
+            self.counters["dropped_spans"] += span._dropped
+        try:
+            self.exporter.export(spans)
+        except OSError as exc:
+            logger.warning("span 기록 실패: %s", exc)
+            return
+        self.counters["exported_traces"] += 1
+        self.counters["exported_spans"] += len(spans)
+        logger.info("느린 요청 span 기록: %s %.3fs trace_id=%s spans=%d", span.name, span.duration, span.trace_id, len(spans))
+
+    def snapshot(self) -> Dict[str, Any]:
+        """추적 설정과 기록 현황"""
+        return {
+            "enabled": self.enabled,
+            "export_path": str(self.exporter.path),
+            "slow_threshold": self.sampler.slow_threshold,
+            "sample_ratio": self.sampler.sample_ratio,
+            **self.counters,
+        }
+
+
+class TracingTransport(httpx.AsyncBaseTransport):
+    """httpx 전송 계층 래퍼: 진행 중인 trace 안의 HTTP 호출마다 client span 기록
+
+    공유 OpenAI 클라이언트에 끼워 두면 provider 모듈의 LLM 호출이 모두 span으로 남는다.
+    trace 밖의 호출(워밍업 등)은 그대로 통과시킨다.
+    실제 transport는 첫 요청 시 생성한다 (HTTP/2 모듈 로딩을 클라이언트 생성 시점에서 분리).
+    """
+
+    def __init__(self, transport_factory: Callable[[], httpx.AsyncBaseTransport], tracer: Tracer):
+        self._transport_factory = transport_factory
+        self._transport: Optional[httpx.AsyncBaseTransport] = None
+        self._tracer = tracer
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if self._transport is None:
+            self._transport = self._transport_factory()
+        if not self._tracer.enabled or current_span() is None:
+            return await self._transport.handle_async_request(request)
+        attributes = {
+            "http.request.method": request.method,
+            "server.address": request.url.host,
+            "url.path": request.url.path,
+        }
+        with self._tracer.start_span(f"{request.method} {request.url.path}", attributes, kind=SPAN_KIND_CLIENT) as span:
+            response = await self._transport.handle_async_request(request)
+            span.set_attribute("http.response.status_code", response.status_code)
+            return response
+
+    async def aclose(self):
+        if self._transport is not None:
+            await self._transport.aclose()
+            self._transport = None
+
+
+class TracingMiddleware:
+    """HTTP 요청마다 server span을 열고 응답에 traceparent 헤더를 붙이는 ASGI 미들웨어
+
+    SSE처럼 본문을 오래 보내는 응답도 전송이 끝날 때까지 같은 span으로 잰다.
+    """
+
+    def __init__(self, app, tracer: Tracer):
+        self.app = app
+        self.tracer = tracer
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self.tracer.enabled:
+            await self.app(scope, receive, send)
+            return
+        headers = dict(scope.get("headers") or [])
+        remote_parent = parse_traceparent(headers.get(b"traceparent", b"").decode("latin-1"))
+        method = scope.get("method", "GET")
+        path = scope.get("path", "")
+        attributes = {"http.request.method": method, "url.path": path}
+        with self.tracer.start_span(
+            f"{method} {path}", attributes, kind=SPAN_KIND_SERVER, remote_parent=remote_parent
+        ) as span:
+
+            async def send_with_trace(message):
+                if message["type"] == "http.response.start":
+                    span.set_attribute("http.response.status_code", message["status"])
+                    if message["status"] >= 500:
+                        span.status = "STATUS_CODE_ERROR"
+                    message["headers"] = [
+                        *message.get("headers", []),
+                        (b"traceparent", span.traceparent.encode("latin-1")),
+                    ]
+                await send(message)
+
+            await self.app(scope, receive, send_with_trace)
@@ -0,0 +1,250 @@
+"""
+PDF 업로드 저장 (청크 단위 스트리밍 + SHA-256) + 업서트 이력(중복 제거)
+"""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import weakref
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Optional
+
+from .config import PDFUploadSettings
+
+_INGESTS_TABLE = """
+CREATE TABLE IF NOT EXISTS pdf_ingests (
+    collection_id TEXT NOT NULL,
+    sha256 TEXT NOT NULL,
+    mode TEXT NOT NULL DEFAULT 'sync',
+    filename TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    result TEXT NOT NULL,
+    ingested_at REAL NOT NULL,
+    PRIMARY KEY (collection_id, sha256, mode)
+)"""
+
+_SCHEMA = _INGESTS_TABLE + """;
+CREATE TABLE IF NOT EXISTS ingest_jobs (
+    id TEXT PRIMARY KEY,
+    collection_id TEXT NOT NULL,
+    sha256 TEXT NOT NULL,
+    status TEXT NOT NULL,
+    state TEXT NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_ingest_jobs_content ON ingest_jobs (collection_id, sha256, status);
+"""
+
+ACTIVE_JOB_STATUSES = ("queued", "running")
+
+
+class UploadTooLargeError(Exception):
+    """업로드 크기 제한 초과"""
+
+    def __init__(self, max_bytes: int):
+        super().__init__(f"PDF 파일은 {max_bytes:,}바이트 이하만 업로드할 수 있습니다.")
+        self.max_bytes = max_bytes
+
+
+@dataclass
+class StoredUpload:
+    """디스크에 저장된 업로드 파일"""
+    path: Path
+    sha256: str
+    size: int
+
+
+def _copy_stream(
+    source: BinaryIO, target: Path, max_bytes: int, chunk_size: int, prefix_hash: bool = False
+) -> StoredUpload:
+    """source를 chunk_size씩 임시 파일에 복사하며 해시 계산 → 완료 시 target으로 교체 (동기)
+
+    prefix_hash면 파일 이름 앞에 해시 일부를 붙여 저장한다 (작업 대기 중 같은 이름 업로드에 덮어써지지 않음).
+    """
+    digest = hashlib.sha256()
+    size = 0
+    partial = target.with_name(f".{target.name}.{os.getpid()}.{threading.get_ident()}.partial")
+    try:
+        with open(partial, "wb") as out:
+            while True:
+                chunk = source.read(chunk_size)
+                if not chunk:
+                    break
+                size += len(chunk)
+                if size > max_bytes:
+                    raise UploadTooLargeError(max_bytes)
+                digest.update(chunk)
+                out.write(chunk)
+        if prefix_hash:
+            target = target.with_name(f"{digest.hexdigest()[:12]}_{target.name}")
+        # 같은 이름으로 동시에 올라와도 반쯤 쓰인 파일을 읽지 않도록 완성된 파일만 교체 (빈 파일은 버림)
+        if size:
+            os.replace(partial, target)
+    finally:
+        partial.unlink(missing_ok=True)
+    return StoredUpload(path=target, sha256=digest.hexdigest(), size=size)
+
+
+async def save_upload(upload, target: Path, settings: PDFUploadSettings, prefix_hash: bool = False) -> StoredUpload:
+    """UploadFile을 target에 저장 (복사/해시/쓰기는 스레드에서 실행해 이벤트 루프를 막지 않음)
+
+    Starlette가 받아 둔 스풀 파일(upload.file)을 그대로 읽으므로 전체 내용을 메모리에 올리지 않는다.
+    """
+    await upload.seek(0)
+    return await asyncio.to_thread(
+        _copy_stream, upload.file, target, settings.max_bytes, settings.chunk_size, prefix_hash
+    )
+
+
+class PDFIngestRegistry:
+    """(collection_id, SHA-256)별 PDF 업서트 결과 기록 (SQLite, 스레드 안전 동기 API)
+
+    같은 슬라이드를 다시 올리면 기록된 결과를 돌려주고 파싱/임베딩을 건너뛴다.
+    기록은 업서트 방식(mode)별로 따로 둔다: sync는 RAG 모듈 upsert_pdf 결과, async는 작업 파이프라인
+    (split_text 청크 + upsert_text) 결과. 청크 분할과 결과 형태가 달라 서로의 기록으로 건너뛰지 않는다.
+    비동기 업서트 작업 상태(ingest_jobs)도 함께 저장한다.
+    파일이 WAL 모드라 멀티 워커 배포에서도 같은 기록을 공유한다 (어느 워커든 작업 상태 조회 가능).
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        # 같은 내용이 동시에 올라오면 한 요청만 업서트 (프로세스 내부)
+        self._ingest_locks: "weakref.WeakValueDictionary[tuple, asyncio.Lock]" = weakref.WeakValueDictionary()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=10.0, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._migrate(conn)
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    @staticmethod
+    def _migrate(conn: sqlite3.Connection):
+        """mode 열이 없는 이전 기록 파일 → 기존 기록은 sync로 옮김"""
+        columns = [row[1] for row in conn.execute("PRAGMA table_info(pdf_ingests)")]
+        if not columns or "mode" in columns:
+            return
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute("ALTER TABLE pdf_ingests RENAME TO pdf_ingests_old")
+            conn.execute(_INGESTS_TABLE)
+            conn.execute(
+                "INSERT INTO pdf_ingests (collection_id, sha256, mode, filename, size, result, ingested_at) "
+                "SELECT collection_id, sha256, 'sync', filename, size, result, ingested_at FROM pdf_ingests_old"
+            )
+            conn.execute("DROP TABLE pdf_ingests_old")
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+    def ingest_lock(self, collection_id: str, sha256: str) -> asyncio.Lock:
+        key = (collection_id, sha256)
+        lock = self._ingest_locks.get(key)
+        if lock is None:
+            lock = asyncio.Lock()
+            self._ingest_locks[key] = lock
+        return lock
+
+    def get(self, collection_id: str, sha256: str, mode: str = "sync") -> Optional[Dict[str, Any]]:
+        """mode 방식으로 기록된 업서트 정보 (없으면 None)"""
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT filename, size, result, ingested_at FROM pdf_ingests "
+                "WHERE collection_id = ? AND sha256 = ? AND mode = ?",
+                (collection_id, sha256, mode),
+            ).fetchone()
+        if row is None:
+            return None
+        filename, size, result, ingested_at = row
+        return {"filename": filename, "size": size, "result": json.loads(result), "ingested_at": ingested_at}
+
+    def record(self, collection_id: str, sha256: str, filename: str, size: int, result: Any, mode: str = "sync"):
+        with self._lock:
+            self._connect().execute(
+                "INSERT OR REPLACE INTO pdf_ingests (collection_id, sha256, mode, filename, size, result, ingested_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    collection_id, sha256, mode, filename, size,
+                    json.dumps(result, ensure_ascii=False, default=str), time.time(),
+                ),
+            )
+
+    def save_job(self, state: Dict[str, Any]):
+        """작업 상태 저장 (state: IngestJob.to_dict())"""
+        with self._lock:
+            self._connect().execute(
+                "INSERT OR REPLACE INTO ingest_jobs (id, collection_id, sha256, status, state, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    state["job_id"], state["collection_id"], state["sha256"], state["status"],
+                    json.dumps(state, ensure_ascii=False, default=str), time.time(),
+                ),
+            )
+
+    def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._connect().execute("SELECT state FROM ingest_jobs WHERE id = ?", (job_id,)).fetchone()
+        return json.loads(row[0]) if row is not None else None
+
+    def active_job(self, collection_id: str, sha256: str, stale_after: float) -> Optional[Dict[str, Any]]:
+        """같은 내용을 처리 중인 작업 (stale_after초 동안 갱신이 없으면 죽은 워커의 작업으로 보고 무시)"""
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT state FROM ingest_jobs WHERE collection_id = ? AND sha256 = ? AND status IN (?, ?) "
+                "AND updated_at > ? ORDER BY updated_at DESC LIMIT 1",
+                (collection_id, sha256, *ACTIVE_JOB_STATUSES, time.time() - stale_after),
+            ).fetchone()
+        return json.loads(row[0]) if row is not None else None
+
+    def purge_jobs(self, older_than: float) -> int:
+        """older_than초보다 오래된 작업 기록 삭제"""
+        with self._lock:
+            cur = self._connect().execute("DELETE FROM ingest_jobs WHERE updated_at < ?", (time.time() - older_than,))
+            return cur.rowcount
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+class UploadSizeLimitMiddleware:
+    """Content-Length가 한도를 넘는 업로드 요청을 본문을 받기 전에 413으로 거절하는 ASGI 미들웨어
+
+    multipart 경계/폼 필드 몫으로 overhead_bytes만큼 여유를 둔다.
+    Content-Length가 없는(chunked) 요청은 통과시키고 저장 단계(save_upload)에서 크기를 검사한다.
+    """
+
+    def __init__(self, app, paths: tuple, max_bytes: int, overhead_bytes: int = 64 * 1024):
+        self.app = app
+        self.paths = paths
+        self.limit = max_bytes + overhead_bytes
+        self.max_bytes = max_bytes
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope.get("path") in self.paths:
+            for name, value in scope.get("headers") or []:
+                if name == b"content-length" and value.isdigit() and int(value) > self.limit:
+                    body = json.dumps({"detail": str(UploadTooLargeError(self.max_bytes))}, ensure_ascii=False).encode()
+                    await send({
+                        "type": "http.response.start",
+                        "status": 413,
+                        "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())],
+                    })
+                    await send({"type": "http.response.body", "body": body})
+                    return
+        await self.app(scope, receive, send)
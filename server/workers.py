@@ -0,0 +1,87 @@
+"""
+멀티 워커 배포 (uvicorn --workers N)
+
+워커 프로세스마다 메모리 캐시가 따로 생기므로 LLM 응답/임베딩/provider 검색 캐시는
+공유 디렉터리의 SQLite(WAL) 파일을 함께 쓰고, Prometheus 지표는 multiprocess 모드로 합산한다.
+
+실행은 `python -m server --workers 4` (server/__main__.py)로 한다.
+"""
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Dict, Optional
+
+from .config import AppSettings
+from .metrics import MULTIPROC_ENV
+
+SHARED_CACHE_ENV = "LIVENOTE_SHARED_CACHE_DIR"
+WORKERS_ENV = "WEB_CONCURRENCY"
+
+DEFAULT_SHARED_CACHE_DIR = "server_storage/shared_cache"
+DEFAULT_METRICS_DIR = "server_storage/prometheus_multiproc"
+
+LLM_CACHE_FILE = "llm_cache.db"
+EMBEDDING_CACHE_FILE = "embedding_cache.db"
+RETRIEVAL_GENERATION_FILE = "retrieval_generations.db"
+
+# provider 모듈 설정은 import 시 환경 변수를 읽으므로 서비스 생성 전에 채워 둔다
+# (쓰기 잠금이 캐시끼리 겹치지 않도록 파일을 나눔)
+PROVIDER_CACHE_FILES: Dict[str, str] = {
+    "OPENALEX_SEARCH_CACHE_PATH": "openalex_search.db",
+    "YOUTUBE_API_CACHE_PATH": "youtube_api.db",
+    "GOOGLE_SEARCH_CACHE_PATH": "google_search.db",
+}
+
+
+def resolve_shared_cache_dir(settings: AppSettings) -> Optional[str]:
+    """공유 캐시 디렉터리 (설정 → LIVENOTE_SHARED_CACHE_DIR, 둘 다 없으면 None)"""
+    return settings.workers.shared_cache_dir or os.environ.get(SHARED_CACHE_ENV) or None
+
+
+def provider_cache_env(shared_dir: str) -> Dict[str, str]:
+    """provider 모듈 검색 캐시 경로 환경 변수"""
+    return {name: str(Path(shared_dir) / filename) for name, filename in PROVIDER_CACHE_FILES.items()}
+
+
+def apply_shared_cache(settings: AppSettings) -> AppSettings:
+    """공유 캐시 디렉터리가 있으면 경로가 빈 캐시 설정에 공유 파일을 지정한 사본 반환
+
+    provider 검색 캐시 경로 환경 변수도 비어 있을 때만 채운다 (직접 지정한 값 우선).
+    """
+    shared_dir = resolve_shared_cache_dir(settings)
+    if not shared_dir:
+        return settings
+    settings = settings.model_copy(deep=True)
+    if settings.llm.cache.enabled and not settings.llm.cache.disk_path:
+        settings.llm.cache.disk_path = str(Path(shared_dir) / LLM_CACHE_FILE)
+    if settings.rag.embedding_cache.enabled and not settings.rag.embedding_cache.disk_path:
+        settings.rag.embedding_cache.disk_path = str(Path(shared_dir) / EMBEDDING_CACHE_FILE)
+    # 검색 결과는 워커별 메모리에만 두고 업서트 세대 번호만 공유 (다른 워커의 업서트 후 stale 결과 방지)
+    if settings.rag.retrieval_cache.enabled and not settings.rag.retrieval_cache.generation_path:
+        settings.rag.retrieval_cache.generation_path = str(Path(shared_dir) / RETRIEVAL_GENERATION_FILE)
+    for name, path in provider_cache_env(shared_dir).items():
+        os.environ.setdefault(name, path)
+    return settings
+
+
+def _reset_metrics_dir(path: str):
+    """이전 실행의 워커 지표 파일 제거 (워커를 띄우기 전 부모 프로세스에서만 호출)"""
+    directory = Path(path)
+    directory.mkdir(parents=True, exist_ok=True)
+    for stale in directory.glob("*.db"):
+        stale.unlink()
+
+
+def prepare_environment(shared_cache_dir: Optional[str], metrics_dir: Optional[str]) -> Dict[str, str]:
+    """워커 프로세스가 물려받을 환경 변수 설정 (이미 지정된 값은 유지) → 적용된 값 반환"""
+    applied: Dict[str, str] = {}
+    if shared_cache_dir:
+        Path(shared_cache_dir).mkdir(parents=True, exist_ok=True)
+        applied[SHARED_CACHE_ENV] = os.environ.setdefault(SHARED_CACHE_ENV, shared_cache_dir)
+        for name, path in provider_cache_env(applied[SHARED_CACHE_ENV]).items():
+            applied[name] = os.environ.setdefault(name, path)
+    if metrics_dir:
+        applied[MULTIPROC_ENV] = os.environ.setdefault(MULTIPROC_ENV, metrics_dir)
+        _reset_metrics_dir(applied[MULTIPROC_ENV])
+    return applied
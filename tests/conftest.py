@@ -245,9 +245,13 @@ class TestContext:
 
 
 @pytest.fixture
-def test_context() -> TestContext:
+def test_context(tmp_path) -> TestContext:
     ctx = TestContext()
     # 기본 설정 조정
+    ctx.settings.outbox.path = str(tmp_path / "callback_outbox.db")
+    ctx.settings.tracing.export_path = str(tmp_path / "traces.jsonl")
+    ctx.settings.rag.pdf_upload.upload_dir = str(tmp_path / "uploads")
+    ctx.settings.rag.pdf_upload.registry_path = str(tmp_path / "pdf_ingests.db")
     ctx.settings.rag.collection_prefix = "test"
     ctx.settings.rag.qa_retrieve_top_k = 2
     ctx.settings.rag.rec_retrieve_top_k = 3
@@ -292,7 +296,7 @@ async def async_client(fastapi_app: FastAPI):
 @pytest.fixture
 def callback_recorder(monkeypatch):
     """
-    httpx.AsyncClient을 대체해 콜백 요청을 캡처합니다.
+    콜백 디스패처의 httpx.AsyncClient을 대체해 콜백 요청을 캡처합니다.
     """
     captured: List[Dict[str, Any]] = []
 
@@ -310,8 +314,10 @@ def callback_recorder(monkeypatch):
             captured.append({"url": url, "json": json})
             return type("Resp", (), {"status_code": 200})
 
-    monkeypatch.setattr("server.routes.qa.httpx.AsyncClient", _RecorderClient)
-    monkeypatch.setattr("server.routes.rec.httpx.AsyncClient", _RecorderClient)
+        async def aclose(self):
+            return None
+
+    monkeypatch.setattr("server.callbacks.httpx.AsyncClient", _RecorderClient)
     return captured
 
 
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import json
+from types import SimpleNamespace
+from typing import List
+
+import pytest
+
+pytestmark = pytest.mark.anyio("asyncio")
+
+from cap1_openalex_module.openalexkit.config.openalex_config import OpenAlexConfig
+from cap1_openalex_module.openalexkit.llm.openai_client import OpenAIClient
+from cap1_openalex_module.openalexkit.utils.batching import split_by_token_budget
+
+
+class ListwiseCompletions:
+    """프롬프트의 [id=N] 항목마다 점수 N을 돌려주는 가짜 chat.completions"""
+
+    def __init__(self, skip_ids: tuple = ()):
+        self.prompts: List[str] = []
+        self.skip_ids = skip_ids
+
+    async def create(self, **kwargs):
+        prompt = kwargs["messages"][0]["content"]
+        self.prompts.append(prompt)
+        ids = [int(part.split("]", 1)[0]) for part in prompt.split("[id=")[1:]]
+        results = [{"id": i, "score": i, "reason": f"paper {i}"} for i in ids if i not in self.skip_ids]
+        message = SimpleNamespace(content=json.dumps({"results": results}))
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+def _client(completions: ListwiseCompletions) -> OpenAIClient:
+    return OpenAIClient(client=SimpleNamespace(chat=SimpleNamespace(completions=completions)))
+
+
+def test_split_by_token_budget_respects_budget_and_max_items():
+    texts = ["x" * 30] * 5  # 항목당 약 10토큰
+
+    assert split_by_token_budget(list(range(5)), texts, token_budget=25, max_items=10) == [[0, 1], [2, 3], [4]]
+    assert split_by_token_budget(list(range(5)), texts, token_budget=1000, max_items=3) == [[0, 1, 2], [3, 4]]
+
+
+@pytest.mark.anyio("asyncio")
+async def test_score_papers_batch_splits_calls_and_keeps_order(monkeypatch):
+    monkeypatch.setattr(OpenAlexConfig, "BATCH_MAX_ITEMS", 2)
+    completions = ListwiseCompletions(skip_ids=(3,))
+    papers = [{"title": f"Paper {i}", "abstract": "abstract"} for i in range(1, 6)]
+
+    results = await _client(completions).score_papers_batch(papers, "section summary", "kw", "Korean")
+
+    assert len(completions.prompts) == 3
+    assert [r["score"] for r in results] == [1.0, 2.0, 5.0, 4.0, 5.0]
+    assert results[2]["reason"] == "검증 실패 (일괄 응답 누락)"
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import pytest
+
+pytestmark = pytest.mark.anyio("asyncio")
+
+from benchmarks.micro import build_cases, compare, measure
+from benchmarks.replay import _build_settings, percentile, run_replay, synthesize_stream
+from benchmarks.startup import parse_importtime, summarize_importtime
+from benchmarks.stubs import LatencyProfile, parse_latency_overrides
+
+
+def test_percentile_uses_nearest_rank():
+    values = [float(v) for v in range(1, 101)]
+    assert percentile(values, 50) == 50.0
+    assert percentile(values, 99) == 99.0
+    assert percentile([3.0], 95) == 3.0
+    assert parse_latency_overrides(["openalex=2.5,0.5", "llm=1"]) == {"openalex": (2.5, 0.5), "llm": (1.0, 0.0)}
+
+
+@pytest.mark.anyio("asyncio")
+async def test_replay_reports_latency_and_completion_per_endpoint(test_context, monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test-" + "x" * 32)
+    stream = synthesize_stream(lectures=1, sections=2, interval=1.0)
+
+    report = await run_replay(
+        stream,
+        profile=LatencyProfile(scale=0),
+        settings=test_context.settings,
+        speed=0,
+    )
+
+    assert report["summary"]["requests"] == len(stream)
+    assert report["summary"]["errors"] == 0
+    assert report["summary"]["peak_rss_mb"] > 0
+    endpoints = report["endpoints"]
+    assert set(endpoints) == {
+        "POST /summary/generate",
+        "POST /rag/text-upsert",
+        "POST /qa/generate",
+        "POST /rec/recommend",
+    }
+    for endpoint in ("POST /summary/generate", "POST /qa/generate", "POST /rec/recommend"):
+        assert endpoints[endpoint]["latency_ms"]["count"] == 2
+        # 비동기 엔드포인트는 마지막 콜백까지의 완료 지연도 기록
+        assert endpoints[endpoint]["completion_ms"]["count"] == 2
+    assert endpoints["POST /rag/text-upsert"]["completion_ms"] == {"count": 0}
+
+
+def test_micro_cases_run_and_flag_regressions():
+    cases = {case.name: case for case in build_cases()}
+    assert {"openalex.parse_abstract_inverted_index", "google.filter_excluded_urls", "server.map_resources"} <= set(cases)
+    for case in cases.values():
+        case.func()
+
+    result = measure(cases["youtube.deduplicate_items"], repeat=1, min_time=0.001)
+    baseline = {"results": {"youtube.deduplicate_items": {"min_us": result["min_us"] / 3}}}
+    comparison = compare({"youtube.deduplicate_items": result}, baseline, tolerance=1.5)
+    assert comparison["youtube.deduplicate_items"]["regressed"] is True
+
+
+def test_importtime_summary_groups_packages_and_flags_heavy_modules():
+    stderr = """import time: self [us] | cumulative | imported package
+import time:       100 |        100 |     openai._types
+import time:      2000 |       2100 |   openai
+import time:       300 |       2400 | server.llm
+import time:        50 |         50 | json
+"""
+    entries = parse_importtime(stderr)
+    assert [entry["depth"] for entry in entries] == [2, 1, 0, 0]
+
+    summary = summarize_importtime(entries, top=2)
+    assert summary["total_ms"] == 2.5
+    assert summary["packages"] == {"openai": 2.1, "server": 0.3}
+    assert summary["slowest"][0]["name"] == "openai"
+    assert summary["heavy"]["openai"] == 2.1 and summary["heavy"]["chromadb"] is None
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any, Dict, List
+
+import pytest
+
+pytestmark = pytest.mark.anyio("asyncio")
+
+from server.config import OutboxSettings
+from server.outbox import CallbackOutbox
+
+
+class FlakyDispatcher:
+    """지정한 횟수만큼 실패한 뒤 성공하는 디스패처"""
+
+    def __init__(self, failures: int = 0, status_code: int = 200):
+        self.failures = failures
+        self.status_code = status_code
+        self.calls: List[Dict[str, Any]] = []
+
+    async def post(self, url: str, payload: dict):
+        self.calls.append({"url": url, "json": payload})
+        if len(self.calls) <= self.failures:
+            raise ConnectionError("backend down")
+        return type("Resp", (), {"status_code": self.status_code})
+
+
+def _outbox(tmp_path, dispatcher, **overrides) -> CallbackOutbox:
+    settings = OutboxSettings(path=str(tmp_path / "outbox.db"), base_backoff=0.01, max_backoff=0.02, **overrides)
+    return CallbackOutbox(dispatcher, settings)
+
+
+@pytest.mark.anyio("asyncio")
+async def test_send_success_leaves_no_pending(tmp_path):
+    dispatcher = FlakyDispatcher()
+    outbox = _outbox(tmp_path, dispatcher)
+
+    assert await outbox.send("http://example.com/cb", {"a": 1}, kind="qa") is True
+    assert await outbox.stats() == {"pending": 0, "dead_letter": 0}
+    await outbox.close()
+
+
+@pytest.mark.anyio("asyncio")
+async def test_failed_send_survives_restart_and_is_retried(tmp_path):
+    outbox = _outbox(tmp_path, FlakyDispatcher(failures=1))
+    assert await outbox.send("http://example.com/cb", {"a": 1}, kind="rec") is False
+    assert (await outbox.stats())["pending"] == 1
+    await outbox.close()
+
+    # 새 프로세스를 흉내: 같은 파일로 아웃박스를 다시 열어 재시도
+    dispatcher = FlakyDispatcher()
+    restarted = _outbox(tmp_path, dispatcher)
+    time.sleep(0.03)
+    entries = restarted.store.claim_due(10)
+    assert len(entries) == 1 and entries[0].attempts == 1
+    assert await restarted._deliver(entries[0]) is True
+    assert dispatcher.calls[-1]["json"] == {"a": 1}
+    assert (await restarted.stats())["pending"] == 0
+    await restarted.close()
+
+
+@pytest.mark.anyio("asyncio")
+async def test_exhausted_attempts_go_to_dead_letter_and_replay(tmp_path):
+    outbox = _outbox(tmp_path, FlakyDispatcher(status_code=503), max_attempts=1)
+    assert await outbox.send("http://example.com/cb", {"a": 1}, kind="summary") is False
+
+    dead = await outbox.list_dead_letters()
+    assert len(dead) == 1
+    assert dead[0]["kind"] == "summary"
+    assert dead[0]["last_error"] == "HTTP 503"
+
+    # 빈 목록은 전체 재전송이 아님
+    assert await outbox.replay([]) == 0
+    assert await outbox.stats() == {"pending": 0, "dead_letter": 1}
+
+    assert await outbox.replay([dead[0]["id"]]) == 1
+    assert await outbox.stats() == {"pending": 1, "dead_letter": 0}
+    await outbox.close()
+
+
+@pytest.mark.anyio("asyncio")
+async def test_slow_post_longer_than_lease_is_not_claimed_again(tmp_path):
+    class SlowDispatcher(FlakyDispatcher):
+        async def post(self, url: str, payload: dict):
+            self.calls.append({"url": url, "json": payload})
+            await asyncio.sleep(0.5)
+            return type("Resp", (), {"status_code": 200})
+
+    dispatcher = SlowDispatcher()
+    outbox = _outbox(tmp_path, dispatcher, lease_seconds=0.1)
+    sending = asyncio.create_task(outbox.send("http://example.com/cb", {"a": 1}, kind="qa"))
+
+    # 전송 중 점유 시간이 여러 번 지나도 재시도 워커가 같은 항목을 가져가지 않음
+    claimed = []
+    for _ in range(8):
+        await asyncio.sleep(0.05)
+        claimed.extend(outbox.store.claim_due(10))
+
+    assert await sending is True
+    assert claimed == []
+    assert len(dispatcher.calls) == 1
+    assert await outbox.stats() == {"pending": 0, "dead_letter": 0}
+    await outbox.close()
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import asyncio
+import json
+
+import pytest
+
+pytestmark = pytest.mark.anyio("asyncio")
+
+from server.cache import ResponseCache, SQLiteCacheTier
+from server.llm import chat_cache_key
+
+
+def _cache(**overrides) -> ResponseCache[dict]:
+    options = {"name": "test", "max_bytes": 1024, "ttl_seconds": 60, "serialize": json.dumps, "deserialize": json.loads}
+    options.update(overrides)
+    return ResponseCache(**options)
+
+
+@pytest.mark.anyio("asyncio")
+async def test_concurrent_misses_share_one_call():
+    cache = _cache()
+    calls = 0
+
+    async def factory():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return {"score": 7}
+
+    results = await asyncio.gather(*(cache.get_or_create("k", factory) for _ in range(5)))
+
+    assert results == [{"score": 7}] * 5
+    assert calls == 1
+    assert await cache.get_or_create("k", factory) == {"score": 7}
+    stats = cache.snapshot()
+    assert stats["misses"] == 1 and stats["inflight_joins"] == 4 and stats["hits"] == 1
+
+
+@pytest.mark.anyio("asyncio")
+async def test_leader_cancellation_does_not_cancel_joiners():
+    cache = _cache()
+    calls = 0
+    started = asyncio.Event()
+
+    async def factory():
+        nonlocal calls
+        calls += 1
+        started.set()
+        await asyncio.sleep(0.05)
+        return {"score": calls}
+
+    leader = asyncio.create_task(cache.get_or_create("k", factory))
+    await started.wait()
+    joiner = asyncio.create_task(cache.get_or_create("k", factory))
+    await asyncio.sleep(0)
+    # 예: SSE 클라이언트 연결 끊김으로 먼저 시작한 요청만 취소
+    leader.cancel()
+
+    assert await joiner == {"score": 2}
+    assert leader.cancelled()
+    assert calls == 2
+
+    # 대기자 자신이 취소되면 그대로 전파
+    started.clear()
+    leader = asyncio.create_task(cache.get_or_create("other", factory))
+    await started.wait()
+    joiner = asyncio.create_task(cache.get_or_create("other", factory))
+    await asyncio.sleep(0)
+    joiner.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await joiner
+    assert await leader == {"score": 3}
+
+
+@pytest.mark.anyio("asyncio")
+async def test_lru_evicts_by_size_and_disk_tier_refills(tmp_path):
+    disk = SQLiteCacheTier(str(tmp_path / "cache.db"))
+    cache = _cache(max_bytes=60, disk=disk)
+    for i in range(3):
+        await cache.set(f"k{i}", {"text": "x" * 10, "i": i})
+
+    assert cache.snapshot()["evictions"] >= 1
+    assert await cache.get("k0") == {"text": "x" * 10, "i": 0}
+    assert cache.snapshot()["disk_hits"] == 1
+    cache.close()
+
+
+def test_chat_cache_key_depends_on_prompt_and_sampling():
+    base = {"model": "gpt-4o", "messages": [{"role": "user", "content": "hi"}], "temperature": 0.2, "max_tokens": 10}
+
+    assert chat_cache_key(base) == chat_cache_key(dict(base))
+    assert chat_cache_key(base) != chat_cache_key({**base, "temperature": 0.3})
+    assert chat_cache_key(base) != chat_cache_key({**base, "messages": [{"role": "user", "content": "hey"}]})
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+pytestmark = pytest.mark.anyio("asyncio")
+
+from server.metrics import PipelineMetrics
+from tests.conftest import StubRetrievedChunk
+
+
+def test_stage_timer_records_error_outcome():
+    metrics = PipelineMetrics(True)
+    with pytest.raises(RuntimeError):
+        with metrics.time_stage("openalex", "search"):
+            raise RuntimeError("boom")
+    metrics.observe_stage("openalex", "verification", 0.2, model="gpt-4o")
+
+    body, content_type = metrics.render()
+    text = body.decode()
+    assert content_type.startswith("text/plain")
+    assert 'livenote_stage_duration_seconds_count{model="",outcome="error",provider="openalex",stage="search"} 1.0' in text
+    assert 'model="gpt-4o",outcome="ok",provider="openalex",stage="verification"' in text
+
+
+def test_disabled_metrics_render_nothing():
+    metrics = PipelineMetrics(False)
+    metrics.observe_stage("wiki", "search", 0.1)
+    assert metrics.render() is None
+
+
+@pytest.mark.anyio("asyncio")
+async def test_metrics_endpoint_exposes_stage_and_job_metrics(async_client, test_context, callback_recorder):
+    test_context.rag.retrieve_result = [StubRetrievedChunk(id="c0", text="청크", score=0.9, metadata={})]
+    test_context.qa.events = [("qa", "응용", {"type": "응용", "question": "Q", "answer": "A"})]
+    payload = {
+        "lecture_id": 1,
+        "section_index": 0,
+        "section_summary": "스택과 큐의 차이를 설명한다.",
+        "callback_url": "http://example.com/qa",
+    }
+    response = await async_client.post("/qa/generate", json=payload)
+    assert response.status_code == 202
+    await asyncio.sleep(0.05)
+
+    response = await async_client.get("/metrics")
+    assert response.status_code == 200
+    text = response.text
+    assert 'provider="rag",stage="rag_retrieve"' in text
+    assert 'provider="qa",stage="qa_generation"' in text
+    assert 'livenote_job_queue_wait_seconds_count{kind="qa"} 1.0' in text
+    assert 'livenote_callback_deliveries_total{kind="qa",outcome="success"}' in text
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import json
+
+import httpx
+import openai
+import pytest
+
+pytestmark = pytest.mark.anyio("asyncio")
+
+from benchmarks.mocks import MOCK_LATENCIES, FaultProfile, MockServer, create_mock_app, parse_rate_overrides
+from benchmarks.stubs import LatencyProfile
+from cap1_google_module.googlekit.api.google_client import GoogleSearchClient
+from cap1_openalex_module.openalexkit.api.openalex_client import OpenAlexAPIClient
+from cap1_youtube_module.youtubekit.api.youtube_client import YouTubeAPIClient
+
+MOCK_BASE = "http://mock.invalid"
+
+
+def _mock_app(**faults):
+    return create_mock_app(LatencyProfile(MOCK_LATENCIES, scale=0), faults={k: FaultProfile(**v) for k, v in faults.items()})
+
+
+def _openai(app) -> openai.AsyncOpenAI:
+    http_client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app))
+    return openai.AsyncOpenAI(api_key="sk-mock", base_url=f"{MOCK_BASE}/v1", http_client=http_client, max_retries=0)
+
+
+def test_parse_rate_overrides_applies_bare_rate_to_all_services():
+    rates = parse_rate_overrides(["0.1", "openalex=0.5"])
+    assert rates == {"llm": 0.1, "openalex": 0.5, "youtube": 0.1, "google": 0.1}
+    with pytest.raises(ValueError):
+        parse_rate_overrides(["wiki=0.1"])
+
+
+async def test_mock_openai_speaks_chat_completions_wire_format():
+    app = _mock_app()
+    client = _openai(app)
+    prompt = "Score these items.\n[id=1]\nTitle: A\n\n[id=2]\nTitle: B"
+    response = await client.chat.completions.create(
+        model="gpt-4o", messages=[{"role": "user", "content": prompt}], response_format={"type": "json_object"}
+    )
+    payload = json.loads(response.choices[0].message.content)
+    assert [entry["id"] for entry in payload["results"]] == [1, 2]
+    assert payload["tokens"] and 0 <= payload["score"] <= 10
+
+    stream = await client.chat.completions.create(
+        model="gpt-4o", messages=[{"role": "user", "content": "keywords"}], stream=True
+    )
+    text = "".join([chunk.choices[0].delta.content or "" async for chunk in stream])
+    assert len(text.splitlines()) == 3
+    await client.close()
+
+
+async def test_mock_rate_limit_surfaces_as_sdk_error_with_retry_after():
+    app = _mock_app(llm={"rate_limit_rate": 1.0, "retry_after": 2.0})
+    client = _openai(app)
+    with pytest.raises(openai.RateLimitError) as excinfo:
+        await client.chat.completions.create(model="gpt-4o", messages=[{"role": "user", "content": "hi"}])
+    assert excinfo.value.response.headers["retry-after"] == "2"
+    assert app.state.mock.counters["llm"] == {"requests": 1, "errors": 0, "rate_limited": 1}
+    await client.close()
+
+
+async def test_kit_clients_parse_mock_openalex_and_youtube_responses():
+    transport = httpx.ASGITransport(app=_mock_app())
+
+    openalex = OpenAlexAPIClient(base_url=f"{MOCK_BASE}/openalex/")
+    await openalex.http_client.aclose()
+    openalex.http_client = httpx.AsyncClient(transport=transport)
+    papers = await openalex.search_papers({"tokens": ["stack", "queue"], "year_from": 2000}, sort_by="relevance")
+    assert papers and papers[0]["abstract"].startswith("This paper studies stack queue")
+    await openalex.close()
+
+    youtube = YouTubeAPIClient(api_key="mock", base_url=f"{MOCK_BASE}/youtube/v3")
+    youtube._http = httpx.AsyncClient(transport=transport)
+    items = await youtube.search_videos("binary tree", "en", max_results=4)
+    details = await youtube.get_videos([item.video_id for item in items])
+    assert [detail.video_id for detail in details] == [item.video_id for item in items]
+    assert details[0].view_count > 0 and details[0].duration_iso8601.startswith("PT")
+    await youtube.close()
+
+
+async def test_google_client_against_localhost_mock_server():
+    with MockServer(_mock_app(google={"error_rate": 1.0})) as server:
+        failing = GoogleSearchClient(api_key="mock", engine_id="cx", base_url=server.env()["GOOGLE_SEARCH_BASE_URL"])
+        assert await failing.search("heap", lang="en", num=3) == []
+        await failing.close()
+
+    with MockServer(_mock_app()) as server:
+        client = GoogleSearchClient(api_key="mock", engine_id="cx", base_url=server.env()["GOOGLE_SEARCH_BASE_URL"])
+        results = await client.search("heap sort", lang="en", num=3)
+        assert [result["displayLink"] for result in results] == ["blog.example.com", "docs.example.org", "wiki.example.net"]
+        await client.close()
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from pathlib import Path
+
+import pytest
+
+pytestmark = pytest.mark.anyio("asyncio")
+
+from server.config import PDFExtractionSettings
+from server.extraction import ExtractionTimeoutError, ProcessPageExtractor, resolve_pool_size
+from server.workers import WORKERS_ENV
+
+
+# 추출 프로세스에서 실행되므로 모듈 최상위 함수 (pypdf 대신 \f로 페이지를 나눈 텍스트 파일)
+def fake_count_pages(path: str) -> int:
+    return len(Path(path).read_text().split("\f"))
+
+
+def fake_extract_range(path: str, start: int, stop: int):
+    pages = Path(path).read_text().split("\f")
+    if "stuck" in pages[start:stop]:
+        time.sleep(30)
+    if "slow" in pages[start:stop]:
+        time.sleep(1.0)
+    # 앞 범위가 늦게 끝나도 순서가 유지되는지 확인
+    time.sleep(0.2 if start == 0 else 0)
+    return [f"{page}@{index}" for index, page in enumerate(pages[start:stop], start=start)]
+
+
+def _extractor(**overrides) -> ProcessPageExtractor:
+    settings = PDFExtractionSettings(max_workers=2, pages_per_task=3, **overrides)
+    return ProcessPageExtractor(settings, count_pages_fn=fake_count_pages, extract_range_fn=fake_extract_range)
+
+
+async def test_process_extractor_streams_pages_in_order(tmp_path):
+    deck = tmp_path / "deck.txt"
+    deck.write_text("\f".join(f"slide{i}" for i in range(10)))
+    extractor = _extractor()
+    try:
+        total, pages = await extractor.open_pages(str(deck))
+        received = [item async for item in pages]
+    finally:
+        extractor.close()
+
+    assert total == 10
+    assert received == [(i + 1, f"slide{i}@{i}") for i in range(10)]
+
+
+async def test_process_extractor_times_out_and_restarts_pool(tmp_path):
+    deck = tmp_path / "deck.txt"
+    deck.write_text("\f".join(["a", "b", "c", "stuck", "e"]))
+    extractor = _extractor(task_timeout=2.0)
+    try:
+        _, pages = await extractor.open_pages(str(deck))
+        received = []
+        with pytest.raises(ExtractionTimeoutError):
+            async for item in pages:
+                received.append(item)
+        assert [page for page, _ in received] == [1, 2, 3]
+        assert extractor._pool is None
+
+        deck.write_text("\f".join(["a", "b"]))
+        total, pages = await extractor.open_pages(str(deck))
+        assert (total, [text async for _, text in pages]) == (2, ["a@0", "b@1"])
+    finally:
+        extractor.close()
+
+
+async def test_process_extractor_timeout_does_not_break_other_documents(tmp_path):
+    stuck = tmp_path / "stuck.txt"
+    stuck.write_text("\f".join(["a", "b", "c", "stuck", "e"]))
+    slow = tmp_path / "slow.txt"
+    slow.write_text("\f".join(["slow"] * 9))
+    extractor = _extractor(task_timeout=2.0)
+
+    async def read(path):
+        _, pages = await extractor.open_pages(str(path))
+        return [item async for item in pages]
+
+    try:
+        timed_out, other = await asyncio.gather(read(stuck), read(slow), return_exceptions=True)
+    finally:
+        extractor.close()
+
+    assert isinstance(timed_out, ExtractionTimeoutError)
+    # 같은 풀에서 돌던 다른 문서의 범위는 재시작된 풀에서 다시 추출
+    assert other == [(i + 1, f"slow@{i}") for i in range(9)]
+
+
+def test_pool_size_leaves_a_core_and_splits_between_workers(monkeypatch):
+    monkeypatch.setattr("os.cpu_count", lambda: 9)
+    monkeypatch.setenv(WORKERS_ENV, "2")
+
+    assert resolve_pool_size(PDFExtractionSettings()) == 4
+    assert resolve_pool_size(PDFExtractionSettings(max_workers=3)) == 3
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+pytestmark = pytest.mark.anyio("asyncio")
+
+from server.models import ResourceType
+from tests.conftest import StubRetrievedChunk
+from tests.test_rec_stream import build_default_responses
+
+SUMMARY_TEXT = "스택과 큐의 차이와 활용 사례를 설명한다."
+
+
+@pytest.fixture
+def fake_summary(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test-" + "x" * 32)
+
+    async def _fake_generate(client, transcript_text, settings):
+        return SUMMARY_TEXT
+
+    monkeypatch.setattr("server.routes.pipeline._generate_summary_text", _fake_generate)
+
+
+@pytest.mark.anyio("asyncio")
+async def test_pipeline_section_runs_summary_upsert_and_shares_retrieval(
+    async_client, test_context, callback_recorder, fake_summary
+):
+    test_context.rag.retrieve_result = [
+        StubRetrievedChunk(id=f"c{i}", text=f"청크 {i}", score=1.0 - i * 0.1, metadata={}) for i in range(3)
+    ]
+    test_context.qa.events = [("qa", "응용", {"type": "응용", "question": "Q", "answer": "A"})]
+    oa_items, wiki_items, yt_items, google_items = build_default_responses()
+    test_context.openalex.responses = oa_items
+    test_context.wiki.responses = wiki_items
+    test_context.youtube.responses = yt_items
+    test_context.google.responses = google_items
+
+    payload = {
+        "lecture_id": 1,
+        "summary_id": 5,
+        "section_index": 2,
+        "transcript": ["오늘은 스택과 큐를 비교합니다.", "두 자료구조의 활용 사례를 살펴봅니다."],
+        "callback_url": "http://example.com/summary",
+        "qa_callback_url": "http://example.com/qa",
+        "rec_callback_url": "http://example.com/rec",
+        "resource_types": [ResourceType.PAPER.value, ResourceType.WIKI.value],
+    }
+    response = await async_client.post("/pipeline/section", json=payload)
+    assert response.status_code == 202
+    await asyncio.sleep(0.1)
+
+    # 요약 → 업서트 → 검색 1회 (QA/REC 공용, 큰 top_k 기준)
+    assert test_context.rag.text_calls[-1]["items"][0]["text"] == SUMMARY_TEXT
+    assert len(test_context.rag.retrieve_calls) == 1
+    assert test_context.rag.retrieve_calls[0]["query"] == SUMMARY_TEXT
+    assert test_context.rag.retrieve_calls[0]["top_k"] == 3
+
+    qa_request = test_context.qa.request_payloads[-1]
+    assert qa_request.section_summary == SUMMARY_TEXT
+    assert len(qa_request.rag_context.chunks) == test_context.settings.rag.qa_retrieve_top_k
+    assert test_context.openalex.requests[-1].section_summary == SUMMARY_TEXT
+    assert not test_context.youtube.requests
+
+    urls = [item["url"] for item in callback_recorder]
+    assert urls[0].startswith("http://example.com/summary") and "type=summary" in urls[0]
+    assert callback_recorder[0]["json"]["text"] == SUMMARY_TEXT
+    assert "http://example.com/qa" in urls
+    assert urls.count("http://example.com/rec") == 2
+
+
+@pytest.mark.anyio("asyncio")
+async def test_pipeline_section_without_qa_rec_urls_only_summarizes(
+    async_client, test_context, callback_recorder, fake_summary
+):
+    payload = {
+        "lecture_id": 1,
+        "section_index": 0,
+        "transcript": "오늘은 스택과 큐를 비교하고 두 자료구조의 활용 사례를 살펴봅니다.",
+        "callback_url": "http://example.com/summary",
+    }
+    response = await async_client.post("/pipeline/section", json=payload)
+    assert response.status_code == 202
+    await asyncio.sleep(0.05)
+
+    assert len(callback_recorder) == 1
+    assert not test_context.rag.text_calls
+    assert not test_context.rag.retrieve_calls
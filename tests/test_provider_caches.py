@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+
+import httpx
+import pytest
+
+pytestmark = pytest.mark.anyio("asyncio")
+
+from cap1_google_module.googlekit.api.google_client import GoogleSearchClient
+from cap1_google_module.googlekit.config.google_config import GoogleConfig
+from cap1_openalex_module.openalexkit.api.openalex_client import OpenAlexAPIClient
+from cap1_youtube_module.youtubekit.api.youtube_client import YouTubeAPIClient, _TransientTranscriptError
+from cap1_youtube_module.youtubekit.config.youtube_config import YouTubeConfig
+
+
+def _openalex_works(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, json={"results": [
+        {"id": "https://openalex.org/W1", "title": "A", "publication_year": 2020, "cited_by_count": 500, "relevance_score": 3.0},
+        {"id": "https://openalex.org/W2", "title": "B", "publication_year": 2021, "cited_by_count": 900, "relevance_score": 2.5},
+    ]})
+
+
+@pytest.mark.anyio("asyncio")
+async def test_openalex_search_cache_applies_exclude_ids_after_lookup():
+    calls = []
+    client = OpenAlexAPIClient()
+    await client.http_client.aclose()
+    client.http_client = httpx.AsyncClient(
+        transport=httpx.MockTransport(lambda request: calls.append(request) or _openalex_works(request))
+    )
+
+    first = await client.search_papers({"tokens": ["Neural", "Nets"], "year_from": 2015}, sort_by="relevance")
+    first[0]["match_score"] = 1.0
+    second = await client.search_papers(
+        {"tokens": ["neural ", "nets"], "year_from": 2015}, exclude_ids=["W2"], sort_by="relevance"
+    )
+
+    assert len(calls) == 1
+    assert [p["id"] for p in second] == ["https://openalex.org/W1"]
+    assert "match_score" not in second[0]
+    assert client.search_cache.stats()["hits"] == 1
+    await client.close()
+
+
+def _google_client(calls: list) -> GoogleSearchClient:
+    client = GoogleSearchClient(api_key="test-key", engine_id="test-cx")
+
+    async def fake_fetch(query, lang, num):
+        client.cache.counters["api_calls"] += 1
+        calls.append(query)
+        return [{"title": f"{query} #{len(calls)}", "link": "https://example.com", "snippet": "", "displayLink": ""}]
+
+    client._fetch = fake_fetch
+    return client
+
+
+@pytest.mark.anyio("asyncio")
+async def test_google_search_cache_persists_and_revalidates_stale(tmp_path, monkeypatch):
+    monkeypatch.setattr(GoogleConfig, "SEARCH_CACHE_PATH", str(tmp_path / "google_cache.db"))
+    calls: list = []
+
+    first = _google_client(calls)
+    assert (await first.search("Binary Search", lang="en"))[0]["title"] == "Binary Search #1"
+    await first.search("binary  search", lang="en")
+    await first.close()
+
+    # 다른 인스턴스(재시작/다른 워커)도 SQLite에서 결과를 읽음
+    second = _google_client(calls)
+    assert (await second.search("binary search", lang="en"))[0]["title"] == "Binary Search #1"
+    assert len(calls) == 1
+
+    # TTL 경과 → stale 반환 + 백그라운드 갱신
+    second.cache.ttl_seconds = 0
+    assert (await second.search("binary search", lang="en"))[0]["title"] == "Binary Search #1"
+    await asyncio.gather(*second._refresh_tasks)
+    assert len(calls) == 2
+
+    stats = second.cache_stats()
+    assert stats["stale_hits"] == 1 and stats["refreshes"] == 1 and stats["quota_saved"] == 2
+    await second.close()
+
+
+@pytest.mark.anyio("asyncio")
+async def test_google_search_cache_disk_io_runs_off_event_loop(tmp_path, monkeypatch):
+    monkeypatch.setattr(GoogleConfig, "SEARCH_CACHE_PATH", str(tmp_path / "google_cache.db"))
+    client = _google_client([])
+    threads = []
+    for name in ("_load", "_store"):
+        original = getattr(client.cache, name)
+
+        def spy(*args, _original=original, _name=name):
+            threads.append((_name, threading.current_thread() is threading.main_thread()))
+            return _original(*args)
+
+        setattr(client.cache, name, spy)
+
+    await client.search("heap sort", lang="en")
+
+    assert threads == [("_load", False), ("_store", False)]
+    await client.close()
+
+
+@pytest.mark.anyio("asyncio")
+async def test_youtube_get_videos_chunks_by_50_and_caches_details():
+    requested: list = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        ids = request.url.params["id"].split(",")
+        requested.append(ids)
+        return httpx.Response(200, json={"items": [
+            {"id": vid, "snippet": {"title": vid}, "statistics": {"viewCount": "10"}} for vid in ids
+        ]})
+
+    client = YouTubeAPIClient(api_key="test-key")
+    client._http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    ids = [f"v{i}" for i in range(120)]
+
+    details = await client.get_videos(ids)
+    again = await client.get_videos(ids[:10] + ["v200"])
+
+    assert [d.video_id for d in details] == ids
+    assert sorted(len(chunk) for chunk in requested[:3]) == [20, 50, 50]
+    assert requested[3] == ["v200"]
+    assert [d.video_id for d in again] == ids[:10] + ["v200"]
+    await client.close()
+
+
+@pytest.mark.anyio("asyncio")
+async def test_youtube_transcript_cache_stores_negative_results_but_not_errors(tmp_path, monkeypatch):
+    monkeypatch.setattr(YouTubeConfig, "OFFLINE_MODE", False)
+    monkeypatch.setattr(YouTubeConfig, "TRANSCRIPT_CACHE_PATH", str(tmp_path / "transcripts.db"))
+    outcomes = {"has": "hello world", "none": None}
+    calls: list = []
+
+    def fake_fetch(video_id, preferred_langs):
+        calls.append(video_id)
+        if video_id == "flaky":
+            raise _TransientTranscriptError("timeout")
+        return outcomes[video_id]
+
+    client = YouTubeAPIClient(api_key="test-key")
+    client._fetch_transcript_sync = fake_fetch
+    for _ in range(2):
+        assert await client.fetch_transcript("has", ["en"]) == "hello world"
+        assert await client.fetch_transcript("none", ["en"]) is None
+        assert await client.fetch_transcript("flaky", ["en"]) is None
+
+    assert calls == ["has", "none", "flaky", "flaky"]
+    metrics = client.cache_stats()["transcripts"]
+    assert metrics["cache_hits"] == 1 and metrics["negative_hits"] == 1 and metrics["errors"] == 2
+    assert metrics["queued"] == 0 and metrics["running"] == 0
+    await client.close()
+
+
+async def test_youtube_api_cache_disk_io_runs_off_event_loop(tmp_path, monkeypatch):
+    monkeypatch.setattr(YouTubeConfig, "API_CACHE_PATH", str(tmp_path / "youtube_api.db"))
+    monkeypatch.setattr(YouTubeConfig, "OFFLINE_MODE", False)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/search"):
+            return httpx.Response(200, json={"items": [{"id": {"videoId": "v1"}, "snippet": {"title": "T"}}]})
+        return httpx.Response(200, json={"items": [{"id": "v1", "snippet": {"title": "T"}, "statistics": {}}]})
+
+    client = YouTubeAPIClient(api_key="test-key", base_url="http://yt.test")
+    client._http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    threads = []
+    for cache in (client.search_cache, client.video_cache):
+        for name in ("_load", "_store"):
+            original = getattr(cache, name)
+
+            def spy(*args, _original=original, _name=f"{cache.table}.{name}"):
+                threads.append((_name, threading.current_thread() is threading.main_thread()))
+                return _original(*args)
+
+            setattr(cache, name, spy)
+
+    await client.search_videos("heap sort", "en", 5)
+    await client.get_videos(["v1"])
+
+    assert len(threads) == 4
+    assert not any(on_main for _, on_main in threads)
+    await client.close()
+
+
+def test_youtube_transcript_list_fallback_network_error_is_transient(monkeypatch):
+    import youtube_transcript_api
+
+    class FakeApi:
+        # 인스턴스 fetch/get_transcript가 없는 버전 → list_transcripts 경로까지 진행
+        @staticmethod
+        def list_transcripts(video_id):
+            raise ConnectionError("connection reset")
+
+    monkeypatch.setattr(youtube_transcript_api, "YouTubeTranscriptApi", FakeApi)
+    client = YouTubeAPIClient(api_key="test-key")
+
+    with pytest.raises(_TransientTranscriptError):
+        client._fetch_transcript_sync("v1", ["en"])
+
+
+async def test_youtube_api_cache_is_shared_through_sqlite(tmp_path, monkeypatch):
+    monkeypatch.setattr(YouTubeConfig, "API_CACHE_PATH", str(tmp_path / "youtube_api.db"))
+    monkeypatch.setattr(YouTubeConfig, "OFFLINE_MODE", False)
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        return httpx.Response(200, json={"items": [
+            {"id": {"videoId": "v1"}, "snippet": {"title": "T", "description": "D", "channelTitle": "C", "publishedAt": "2024"}},
+        ]})
+
+    workers = [YouTubeAPIClient(api_key="test-key", base_url="http://yt.test") for _ in range(2)]
+    for client in workers:
+        client._http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    first = await workers[0].search_videos("Neural Nets", "en", 5)
+    second = await workers[1].search_videos("neural  nets", "en", 5)
+
+    assert len(calls) == 1
+    assert second == first and second[0].video_id == "v1"
+    assert workers[1].search_cache.stats()["disk_hits"] == 1
+    for client in workers:
+        await client.close()
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import asyncio
+import json
+import time
 from typing import List
 
 import pytest
@@ -106,3 +108,132 @@ async def test_qa_generate_handles_rag_failure(async_client, test_context, monke
     response = await async_client.post("/qa/generate", json=payload)
     assert response.status_code == 400
     assert "RAG" in response.json()["detail"]
+
+
+@pytest.mark.anyio("asyncio")
+async def test_qa_generate_rejects_when_queue_full(async_client, test_context, callback_recorder):
+    test_context.settings.scheduler.qa.concurrency = 1
+    test_context.settings.scheduler.qa.max_queue_depth = 0
+    test_context.rag.retrieve_result = _prepare_chunks()
+    test_context.qa.events = [
+        ("qa", "응용", {"type": "응용", "question": "Q", "answer": "A", "_delay": 0.1}),
+    ]
+    payload = {
+        "lecture_id": 5,
+        "summary_id": 5,
+        "section_index": 0,
+        "section_summary": "스택과 큐의 차이를 자세히 설명한다.",
+        "callback_url": "http://example.com/qa",
+    }
+    first = await async_client.post("/qa/generate", json=payload)
+    assert first.status_code == 202
+
+    second = await async_client.post("/qa/generate", json=payload)
+    assert second.status_code == 429
+    assert second.headers["Retry-After"] == str(test_context.settings.scheduler.retry_after)
+
+    await asyncio.sleep(0.15)
+    assert len(callback_recorder) == 1
+
+
+@pytest.mark.anyio("asyncio")
+async def test_qa_generate_rejected_after_capacity_check_does_not_hold_coalesced_group(
+    async_client, fastapi_app, test_context, callback_recorder
+):
+    test_context.settings.callback.coalesce = True
+    test_context.settings.scheduler.qa.concurrency = 1
+    test_context.settings.scheduler.qa.max_queue_depth = 0
+    test_context.qa.events = [
+        ("qa", "응용", {"type": "응용", "question": "Q", "answer": "A", "_delay": 0.05}),
+    ]
+    retrieve = test_context.rag.retrieve
+
+    def slow_retrieve(*args, **kwargs):
+        # 두 요청 모두 용량 확인을 통과한 뒤 검색 중에 대기열이 참
+        time.sleep(0.05)
+        return _prepare_chunks()
+
+    test_context.rag.retrieve = slow_retrieve
+    payload = {
+        "lecture_id": 6,
+        "summary_id": 6,
+        "section_index": 2,
+        "section_summary": "스택과 큐의 차이를 자세히 설명한다.",
+        "callback_url": "http://example.com/qa",
+    }
+    first, second = await asyncio.gather(
+        async_client.post("/qa/generate", json=payload),
+        async_client.post("/qa/generate", json={**payload, "section_summary": "다른 요약으로 검색을 나눈다."}),
+    )
+    test_context.rag.retrieve = retrieve
+
+    assert sorted([first.status_code, second.status_code]) == [202, 429]
+    # 병합 window(2초)를 기다리지 않고 실행된 작업의 보고만으로 최종 콜백 전송
+    await asyncio.sleep(0.2)
+    assert len(callback_recorder) == 1
+    assert [item["question"] for item in callback_recorder[0]["json"]["qnaList"]] == ["Q"]
+    assert not fastapi_app.state.callback_coalescer._groups
+
+
+def _parse_sse(body: str) -> List[tuple]:
+    events = []
+    for block in body.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.splitlines() if ": " in line)
+        events.append((lines.get("event"), json.loads(lines["data"])))
+    return events
+
+
+@pytest.mark.anyio("asyncio")
+async def test_qa_generate_stream_emits_items_and_done(async_client, test_context):
+    test_context.rag.retrieve_result = _prepare_chunks()
+    test_context.qa.events = [
+        ("qa", "응용", {"type": "응용", "question": "응용Q", "answer": "응용A"}),
+        ("qa", "비교", {"type": "비교", "question": "비교Q", "answer": "비교A", "_delay": 0.02}),
+    ]
+    payload = {
+        "lecture_id": 7,
+        "summary_id": 7,
+        "section_index": 0,
+        "section_summary": "스택과 큐의 차이를 자세히 설명한다.",
+    }
+    response = await async_client.post("/qa/generate/stream", json=payload)
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+
+    events = _parse_sse(response.text)
+    assert [event for event, _ in events] == ["qa", "qa", "done"]
+    assert events[0][1]["qnaList"][0]["type"] == QnAType.APPLICATION.value
+    assert events[1][1]["lectureId"] == 7
+    assert events[-1][1]["events"] == 2
+
+
+@pytest.mark.anyio("asyncio")
+async def test_qa_generate_stream_holds_qa_slot(async_client, fastapi_app, test_context, callback_recorder):
+    test_context.settings.scheduler.qa.concurrency = 1
+    test_context.settings.scheduler.qa.max_queue_depth = 0
+    test_context.rag.retrieve_result = _prepare_chunks()
+    test_context.qa.events = [
+        ("qa", "응용", {"type": "응용", "question": "Q", "answer": "A", "_delay": 0.2}),
+    ]
+    payload = {
+        "lecture_id": 8,
+        "summary_id": 8,
+        "section_index": 0,
+        "section_summary": "스택과 큐의 차이를 자세히 설명한다.",
+    }
+
+    async def submit_while_streaming():
+        await asyncio.sleep(0.05)
+        return await async_client.post("/qa/generate", json={**payload, "callback_url": "http://example.com/qa"})
+
+    stream, queued = await asyncio.gather(
+        async_client.post("/qa/generate/stream", json=payload),
+        submit_while_streaming(),
+    )
+
+    assert stream.status_code == 200
+    assert [event for event, _ in _parse_sse(stream.text)] == ["qa", "done"]
+    # 스트림이 qa 풀의 유일한 슬롯을 잡고 있어 비동기 작업은 거절
+    assert queued.status_code == 429
+    qa_jobs = fastapi_app.state.job_scheduler.snapshot()["qa"]
+    assert qa_jobs["running"] == 0 and qa_jobs["queued"] == 0 and qa_jobs["completed"] == 1
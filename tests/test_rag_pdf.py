@@ -1,10 +1,16 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import json
+import sqlite3
 from pathlib import Path
 
 import pytest
 
+from server.ingest import describe_job, split_text
+from server.uploads import PDFIngestRegistry
+
 
 @pytest.mark.anyio
 async def test_pdf_upsert_success(async_client, test_context):
@@ -67,3 +73,175 @@ async def test_pdf_upsert_blank_lecture_id(async_client):
     )
     assert response.status_code == 400
     assert "lecture_id" in response.json()["detail"]
+
+
+PDF_BYTES = b"%PDF-1.4\n" + b"slide deck " * 5000 + b"\n%%EOF\n"
+
+
+@pytest.mark.anyio
+async def test_pdf_upsert_streams_to_disk_and_skips_same_content(async_client, test_context):
+    test_context.settings.rag.pdf_upload.chunk_size = 4096
+
+    async def upload(name: str, **data):
+        return await async_client.post(
+            "/rag/pdf-upsert",
+            files={"file": (name, PDF_BYTES, "application/pdf")},
+            data={"lecture_id": "lecture123", **data},
+        )
+
+    first = await upload("deck.pdf")
+    second = await upload("deck-v2.pdf")
+    forced = await upload("deck.pdf", force="true")
+
+    assert [r.status_code for r in (first, second, forced)] == [200, 200, 200]
+    assert first.json()["sha256"] == hashlib.sha256(PDF_BYTES).hexdigest()
+    assert [r.json()["deduplicated"] for r in (first, second, forced)] == [False, True, False]
+    assert second.json()["result"] == test_context.rag.upsert_pdf_result
+    assert len(test_context.rag.pdf_calls) == 2
+    stored = Path(test_context.rag.pdf_calls[0]["pdf_path"])
+    assert stored.read_bytes() == PDF_BYTES
+    assert not list(stored.parent.glob("*.partial"))
+
+
+@pytest.mark.anyio
+async def test_pdf_upsert_rejects_oversized_file(async_client, test_context):
+    test_context.settings.rag.pdf_upload.max_bytes = 1024
+
+    response = await async_client.post(
+        "/rag/pdf-upsert",
+        files={"file": ("big.pdf", PDF_BYTES, "application/pdf")},
+        data={"lecture_id": "lecture123"},
+    )
+
+    assert response.status_code == 413
+    assert not test_context.rag.pdf_calls
+    assert not list((Path(test_context.settings.rag.pdf_upload.upload_dir) / "lecture123").iterdir())
+
+
+def _fake_pages(pages, delay: float = 0.0):
+    async def open_pages(pdf_path: str):
+        assert Path(pdf_path).exists()
+
+        async def stream():
+            for number, text in enumerate(pages, start=1):
+                await asyncio.sleep(delay)
+                yield number, text
+
+        return len(pages), stream()
+
+    return open_pages
+
+
+async def _wait_for_job(async_client, status_url: str) -> dict:
+    for _ in range(200):
+        job = (await async_client.get(status_url)).json()
+        if job["status"] not in ("queued", "running"):
+            return job
+        await asyncio.sleep(0.01)
+    raise AssertionError(f"작업이 끝나지 않음: {job}")
+
+
+@pytest.mark.anyio
+async def test_pdf_upsert_async_job_embeds_in_batches(async_client, fastapi_app, test_context):
+    ingest = test_context.settings.rag.pdf_ingest
+    ingest.chunk_chars, ingest.chunk_overlap, ingest.embed_batch_size = 100, 0, 4
+    # 페이지당 청크 3개 x 5페이지 = 15개 → 4개씩 4배치
+    fastapi_app.state.ingest_jobs.open_pages = _fake_pages([" ".join(["word"] * 50)] * 5, delay=0.001)
+
+    response = await async_client.post(
+        "/rag/pdf-upsert",
+        files={"file": ("deck.pdf", PDF_BYTES, "application/pdf")},
+        data={"lecture_id": "lecture123", "async": "true", "base_metadata": json.dumps({"course": "os"})},
+    )
+
+    assert response.status_code == 202
+    accepted = response.json()
+    assert accepted["status_url"] == f"/rag/jobs/{accepted['job_id']}"
+    job = await _wait_for_job(async_client, accepted["status_url"])
+
+    assert job["status"] == "succeeded", job
+    assert (job["pages_total"], job["pages_done"], job["chunks_embedded"], job["batches"]) == (5, 5, 15, 4)
+    assert (job["progress"], job["eta_seconds"]) == (1.0, 0.0)
+    assert [len(call["items"]) for call in test_context.rag.text_calls] == [4, 4, 4, 3]
+    first = test_context.rag.text_calls[0]["items"][0]
+    assert first["metadata"] == {"course": "os", "source": "deck.pdf", "page": 1, "content_sha256": accepted["sha256"]}
+    assert not test_context.rag.pdf_calls
+
+    # 끝난 작업의 결과가 중복 제거 이력에 남음
+    again = await async_client.post(
+        "/rag/pdf-upsert",
+        files={"file": ("deck.pdf", PDF_BYTES, "application/pdf")},
+        data={"lecture_id": "lecture123", "async": "true"},
+    )
+    assert again.status_code == 200
+    assert again.json()["deduplicated"] is True
+    assert again.json()["result"]["count"] == 15
+    assert job["size"] == len(PDF_BYTES)
+    recorded = fastapi_app.state.pdf_registry.get(accepted["collection_id"], accepted["sha256"], "async")
+    assert recorded["size"] == len(PDF_BYTES)
+
+    # 동기 업서트는 청크 분할/결과 형태가 달라 비동기 기록으로 건너뛰지 않음
+    sync = await async_client.post(
+        "/rag/pdf-upsert",
+        files={"file": ("deck.pdf", PDF_BYTES, "application/pdf")},
+        data={"lecture_id": "lecture123"},
+    )
+    assert sync.json()["deduplicated"] is False
+    assert sync.json()["result"] == test_context.rag.upsert_pdf_result
+    assert len(test_context.rag.pdf_calls) == 1
+
+
+@pytest.mark.anyio
+async def test_pdf_upsert_async_job_records_failure(async_client, fastapi_app, test_context):
+    def failing_upsert(collection_id, items):
+        raise RuntimeError("embedding quota exceeded")
+
+    test_context.rag.upsert_text = failing_upsert
+    fastapi_app.state.ingest_jobs.open_pages = _fake_pages(["slide text"] * 3)
+
+    response = await async_client.post(
+        "/rag/pdf-upsert",
+        files={"file": ("deck.pdf", PDF_BYTES, "application/pdf")},
+        data={"lecture_id": "lecture123", "async": "true"},
+    )
+    job = await _wait_for_job(async_client, response.json()["status_url"])
+
+    assert job["status"] == "failed"
+    assert "embedding quota exceeded" in job["error"]
+    assert (await async_client.get("/rag/jobs/unknown")).status_code == 404
+
+
+def test_split_text_respects_chunk_size_and_overlap():
+    text = " ".join(f"w{i:03d}" for i in range(100))
+
+    chunks = split_text(text, chunk_chars=50, overlap=10)
+
+    assert all(len(chunk) <= 50 for chunk in chunks)
+    assert chunks[0].startswith("w000") and chunks[-1].endswith("w099")
+    assert chunks[1][:5] in chunks[0]
+    assert split_text(" \n ", 50, 10) == []
+
+
+def test_describe_job_estimates_remaining_time():
+    state = {"status": "running", "pages_total": 10, "pages_done": 4, "started_at": 100.0, "finished_at": None}
+
+    described = describe_job(state, now=108.0)
+
+    assert (described["progress"], described["elapsed_seconds"], described["eta_seconds"]) == (0.4, 8.0, 12.0)
+
+
+def test_pdf_registry_migrates_records_without_mode(tmp_path):
+    path = tmp_path / "pdf_ingests.db"
+    with sqlite3.connect(path) as conn:
+        conn.execute(
+            "CREATE TABLE pdf_ingests (collection_id TEXT NOT NULL, sha256 TEXT NOT NULL, filename TEXT NOT NULL, "
+            "size INTEGER NOT NULL, result TEXT NOT NULL, ingested_at REAL NOT NULL, PRIMARY KEY (collection_id, sha256))"
+        )
+        conn.execute("INSERT INTO pdf_ingests VALUES ('lecture_1', 'abc', 'deck.pdf', 10, '{\"count\": 3}', 1.0)")
+    registry = PDFIngestRegistry(str(path))
+
+    assert registry.get("lecture_1", "abc")["result"] == {"count": 3}
+    assert registry.get("lecture_1", "abc", "async") is None
+    registry.record("lecture_1", "abc", "deck.pdf", 10, {"count": 5}, "async")
+    assert registry.get("lecture_1", "abc")["result"] == {"count": 3}
+    registry.close()
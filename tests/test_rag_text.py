@@ -2,6 +2,9 @@ from __future__ import annotations
 
 import pytest
 
+from server.config import EmbeddingCacheSettings
+from server.embeddings import EmbeddingCache, install_embedding_cache
+
 
 @pytest.mark.anyio
 async def test_text_upsert_success(async_client, test_context):
@@ -54,3 +57,51 @@ async def test_text_upsert_returns_stub_result(async_client, test_context):
     response = await async_client.post("/rag/text-upsert", json=payload)
     assert response.status_code == 200
     assert response.json()["result"] == test_context.rag.upsert_text_result
+
+
+@pytest.mark.anyio
+async def test_text_upsert_invalidates_retrieval_cache(async_client, test_context, fastapi_app):
+    from tests.conftest import StubRetrievedChunk
+
+    test_context.rag.retrieve_result = [StubRetrievedChunk(id="c1", text="스택", score=0.9, metadata={})]
+    cache = fastapi_app.state.retrieval_cache
+
+    async def _retrieve():
+        return await cache.retrieve(test_context.rag, collection_id="test_lec-cache", query="스택 요약", top_k=2)
+
+    first = await _retrieve()
+    second = await _retrieve()
+    assert [chunk.text for chunk in second] == [chunk.text for chunk in first]
+    assert len(test_context.rag.retrieve_calls) == 1
+
+    await async_client.post("/rag/text-upsert", json={"lecture_id": "lec-cache", "items": [{"text": "새 요약"}]})
+    await _retrieve()
+    assert len(test_context.rag.retrieve_calls) == 2
+
+
+def test_upsert_embeddings_seed_query_embedding_cache():
+    class _Embedder:
+        model = "text-embedding-3-large"
+
+        def __init__(self):
+            self.calls = []
+
+        def embed_texts(self, texts):
+            self.calls.append(list(texts))
+            return [[float(len(text)), 0.5] for text in texts]
+
+    class _RAG:
+        def __init__(self):
+            self.embedding_service = _Embedder()
+
+    rag = _RAG()
+    embedder = rag.embedding_service
+    cache = EmbeddingCache(EmbeddingCacheSettings(max_bytes=1024))
+    assert install_embedding_cache(rag, cache)
+
+    # 업서트 시 계산한 벡터가 retrieve 쿼리 임베딩에 재사용됨
+    rag.embedding_service.embed_texts(["요약 A", "요약 B"])
+    assert rag.embedding_service.embed_texts(["요약 A"]) == [[4.0, 0.5]]
+    assert rag.embedding_service.embed_texts(["요약 B", "새 쿼리"]) == [[4.0, 0.5], [4.0, 0.5]]
+    assert embedder.calls == [["요약 A", "요약 B"], ["새 쿼리"]]
+    assert cache.snapshot()["hits"] == 2
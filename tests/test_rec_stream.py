@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import json
 from typing import List, Tuple
 
 import pytest
@@ -232,3 +233,65 @@ async def test_rec_recommend_requires_rag(async_client, test_context, monkeypatc
     response = await async_client.post("/rec/recommend", json=payload)
     assert response.status_code == 400
     assert "RAG" in response.json()["detail"]
+
+
+@pytest.mark.anyio("asyncio")
+async def test_rec_recommend_coalesces_callbacks_per_section(async_client, test_context, callback_recorder):
+    test_context.settings.callback.coalesce = True
+    test_context.rag.retrieve_result = prepare_chunks()
+    oa_items, wiki_items, yt_items, google_items = build_default_responses()
+    test_context.openalex.responses = oa_items
+    test_context.wiki.responses = wiki_items
+    test_context.youtube.responses = yt_items
+    test_context.google.responses = google_items
+    test_context.youtube.delay = 0.02
+
+    payload = {
+        "lecture_id": 6,
+        "summary_id": 15,
+        "section_index": 5,
+        "section_summary": "자료구조와 알고리즘을 설명하는 강의",
+        "callback_url": "http://example.com/rec",
+        "previous_summaries": [],
+    }
+    response = await async_client.post("/rec/recommend", json=payload)
+    assert response.status_code == 202
+    await asyncio.sleep(0.1)
+
+    # 모든 provider 결과가 하나의 콜백으로 합쳐져 전송
+    assert len(callback_recorder) == 1
+    types = {item["type"] for item in callback_recorder[0]["json"]["resources"]}
+    assert types == {
+        ResourceType.PAPER.value,
+        ResourceType.WIKI.value,
+        ResourceType.VIDEO.value,
+        ResourceType.BLOG.value,
+    }
+
+
+@pytest.mark.anyio("asyncio")
+async def test_rec_recommend_stream_emits_results_in_completion_order(async_client, test_context):
+    test_context.settings.stream.heartbeat_interval = 0.01
+    test_context.rag.retrieve_result = prepare_chunks()
+    oa_items, wiki_items, _, _ = build_default_responses()
+    test_context.openalex.responses = oa_items
+    test_context.openalex.delay = 0.05
+    test_context.wiki.responses = wiki_items
+
+    payload = {
+        "lecture_id": 3,
+        "section_index": 1,
+        "section_summary": "자료구조와 알고리즘을 설명하는 강의",
+        "resource_types": [ResourceType.PAPER.value, ResourceType.WIKI.value],
+    }
+    response = await async_client.post("/rec/recommend/stream", json=payload)
+    assert response.status_code == 200
+
+    events = []
+    for block in response.text.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.splitlines())
+        events.append((lines.get("event"), json.loads(lines["data"])))
+    results = [data["resourceType"] for event, data in events if event == "resources"]
+    assert results == [ResourceType.WIKI.value, ResourceType.PAPER.value]
+    assert "heartbeat" in [event for event, _ in events]
+    assert events[-1][0] == "done" and events[-1][1]["events"] == 2
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+
+pytestmark = pytest.mark.anyio("asyncio")
+
+from server.app import create_app
+from server.config import ServiceSettings
+from server.models import ResourceType
+from server.routes.rec import resolve_provider_services
+from server.services import LazyService, ServiceRegistry
+
+
+def _registry(**paths) -> ServiceRegistry:
+    registry = ServiceRegistry(ServiceSettings(warm_up_services=list(paths)))
+    for name, path in paths.items():
+        registry.register(LazyService(name, path))
+    return registry
+
+
+async def test_lazy_service_builds_once_on_concurrent_first_use():
+    built = []
+    service = LazyService("ns", "types.SimpleNamespace", factory_kwargs=lambda: {"n": 1}, on_create=built.append)
+    assert not service.created
+
+    first, second = await asyncio.gather(service.get(), service.get())
+
+    assert first is second and built == [first]
+    assert service.snapshot()["import_seconds"] is not None
+
+
+async def test_rec_resolves_only_requested_providers():
+    registry = _registry(
+        openalex="types.SimpleNamespace",
+        wiki="types.SimpleNamespace",
+        youtube="types.SimpleNamespace",
+        google="types.SimpleNamespace",
+    )
+
+    services = await resolve_provider_services(registry, [ResourceType.PAPER])
+
+    assert services["openalex_service"] is registry.peek("openalex")
+    assert services["wiki_service"] is None and services["google_service"] is None
+    assert not registry["youtube"].created
+
+
+async def test_warm_up_continues_after_failing_service():
+    registry = _registry(broken="livenote_missing_module.Service", ok="types.SimpleNamespace")
+
+    await registry.start_warm_up()
+
+    assert registry["ok"].created
+    assert registry.snapshot()["services"]["broken"]["error"].startswith("ModuleNotFoundError")
+    with pytest.raises(ModuleNotFoundError):
+        await registry.get("broken")
+
+
+async def test_admin_reports_injected_and_pending_services(test_context):
+    test_context.settings.services.warm_up = False
+    app = create_app(test_context.settings, openalex_service=test_context.openalex)
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.get("/admin/services")
+
+    services = response.json()["services"]
+    assert services["openalex"]["created"] and not services["openalex"]["owned"]
+    assert not services["youtube"]["created"] and services["youtube"]["owned"]
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+pytestmark = pytest.mark.anyio("asyncio")
+
+from server.config import TracingSettings
+from server.metrics import PipelineMetrics
+from server.tracing import Tracer, TracingTransport, parse_traceparent
+from tests.conftest import StubRetrievedChunk
+
+REMOTE_TRACE_ID = "4bf92f3577b34da6a3ce929d0e0e4736"
+REMOTE_PARENT = f"00-{REMOTE_TRACE_ID}-00f067aa0ba902b7-01"
+
+
+def _read_spans(path):
+    with open(path, encoding="utf-8") as fp:
+        return [json.loads(line) for line in fp]
+
+
+def test_parse_traceparent_rejects_invalid_headers():
+    assert parse_traceparent(REMOTE_PARENT) == (REMOTE_TRACE_ID, "00f067aa0ba902b7")
+    assert parse_traceparent("00-xyz-00f067aa0ba902b7-01") is None
+    assert parse_traceparent(f"00-{'0' * 32}-00f067aa0ba902b7-01") is None
+    assert parse_traceparent(None) is None
+
+
+def test_sampler_keeps_only_slow_or_failed_trees(tmp_path):
+    path = tmp_path / "traces.jsonl"
+    tracer = Tracer(TracingSettings(export_path=str(path), slow_threshold=60.0))
+    metrics = PipelineMetrics(False, tracer=tracer)
+
+    with tracer.start_span("fast"):
+        with metrics.time_stage("openalex", "search"):
+            pass
+    assert not path.exists()
+    assert tracer.counters["sampled_out"] == 1
+
+    with pytest.raises(RuntimeError):
+        with tracer.start_span("failing"):
+            with metrics.time_stage("openalex", "verification", model="gpt-4o"):
+                raise RuntimeError("boom")
+
+    spans = _read_spans(path)
+    root, child = spans
+    assert root["name"] == "failing" and root["status"]["code"] == "STATUS_CODE_ERROR"
+    assert child["name"] == "openalex.verification"
+    assert child["parentSpanId"] == root["spanId"] and child["traceId"] == root["traceId"]
+    assert {"key": "livenote.model", "value": {"stringValue": "gpt-4o"}} in child["attributes"]
+
+
+async def test_tracing_transport_records_client_spans_only_inside_trace(tmp_path):
+    path = tmp_path / "traces.jsonl"
+    tracer = Tracer(TracingSettings(export_path=str(path), slow_threshold=0.0))
+    transport = TracingTransport(lambda: httpx.MockTransport(lambda request: httpx.Response(200, json={})), tracer)
+
+    async with httpx.AsyncClient(transport=transport) as client:
+        await client.get("https://api.openai.com/v1/models")
+        assert not path.exists()
+        with tracer.start_span("job.rec", new_root=True):
+            await client.post("https://api.openai.com/v1/chat/completions", json={})
+
+    root, client_span = _read_spans(path)
+    assert client_span["kind"] == "SPAN_KIND_CLIENT"
+    assert client_span["name"] == "POST /v1/chat/completions"
+    assert {"key": "http.response.status_code", "value": {"intValue": "200"}} in client_span["attributes"]
+    assert client_span["parentSpanId"] == root["spanId"]
+
+
+@pytest.mark.anyio("asyncio")
+async def test_request_trace_continues_into_background_job(
+    async_client, fastapi_app, test_context, callback_recorder
+):
+    fastapi_app.state.tracer.sampler.slow_threshold = 0.0
+    test_context.rag.retrieve_result = [StubRetrievedChunk(id="c0", text="청크", score=0.9, metadata={})]
+    test_context.qa.events = [("qa", "응용", {"type": "응용", "question": "Q", "answer": "A"})]
+    payload = {
+        "lecture_id": 1,
+        "section_index": 0,
+        "section_summary": "스택과 큐의 차이를 설명한다.",
+        "callback_url": "http://example.com/qa",
+    }
+    response = await async_client.post("/qa/generate", json=payload, headers={"traceparent": REMOTE_PARENT})
+    assert response.status_code == 202
+    assert parse_traceparent(response.headers["traceparent"])[0] == REMOTE_TRACE_ID
+    await asyncio.sleep(0.05)
+
+    spans = {span["name"]: span for span in _read_spans(test_context.settings.tracing.export_path)}
+    request_span = spans["POST /qa/generate"]
+    job_span = spans["job.qa"]
+    assert {span["traceId"] for span in spans.values()} == {REMOTE_TRACE_ID}
+    assert request_span["parentSpanId"] == "00f067aa0ba902b7"
+    assert job_span["parentSpanId"] == request_span["spanId"]
+    assert spans["qa.qa_generation"]["parentSpanId"] == job_span["spanId"]
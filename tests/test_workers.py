@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+pytestmark = pytest.mark.anyio("asyncio")
+
+from server.cache import ResponseCache, SQLiteCacheTier
+from server.config import AppSettings, EmbeddingCacheSettings, RetrievalCacheSettings
+from server.embeddings import EmbeddingCache
+from server.retrieval import RetrievalCache
+from server.workers import PROVIDER_CACHE_FILES, SHARED_CACHE_ENV, apply_shared_cache, prepare_environment
+from tests.conftest import ROOT_DIR
+
+
+def _json_cache(path: Path) -> ResponseCache:
+    return ResponseCache(
+        name="llm",
+        max_bytes=1024 * 1024,
+        ttl_seconds=60,
+        serialize=json.dumps,
+        deserialize=json.loads,
+        disk=SQLiteCacheTier(str(path), table="llm_cache"),
+    )
+
+
+async def test_response_cache_shares_hits_through_sqlite_file(tmp_path):
+    # 같은 파일을 쓰는 두 캐시 = 서로 다른 워커
+    first, second = _json_cache(tmp_path / "llm.db"), _json_cache(tmp_path / "llm.db")
+    calls = []
+
+    async def factory():
+        calls.append(1)
+        return {"answer": 42}
+
+    assert await first.get_or_create("k", factory) == {"answer": 42}
+    assert await second.get_or_create("k", factory) == {"answer": 42}
+    assert len(calls) == 1
+    assert second.snapshot()["disk_hits"] == 1
+    first.close()
+    second.close()
+
+
+def test_embedding_cache_reads_vectors_written_by_other_worker(tmp_path):
+    settings = EmbeddingCacheSettings(disk_path=str(tmp_path / "embeddings.db"))
+    writer, reader = EmbeddingCache(settings), EmbeddingCache(settings)
+
+    writer.set("m", "섹션 요약", [0.5, -1.25, 2.0])
+    assert reader.get("m", "섹션 요약") == [0.5, -1.25, 2.0]
+    assert reader.get("m", "섹션 요약") == [0.5, -1.25, 2.0]
+    assert reader.get("m", "다른 텍스트") is None
+
+    stats = reader.snapshot()
+    assert (stats["disk_hits"], stats["hits"], stats["misses"], stats["shared"]) == (1, 1, 1, True)
+    writer.close()
+    reader.close()
+
+
+async def test_retrieval_generation_is_shared_across_workers(tmp_path):
+    settings = RetrievalCacheSettings(generation_path=str(tmp_path / "generations.db"))
+    upserting, other = RetrievalCache(settings), RetrievalCache(settings)
+    before = await other.make_key("lecture_1", "q", 2)
+
+    await upserting.invalidate("lecture_1")
+
+    assert await other.make_key("lecture_1", "q", 2) != before
+    assert await other.make_key("lecture_2", "q", 2) == await RetrievalCache(settings).make_key("lecture_2", "q", 2)
+    upserting.close()
+    other.close()
+
+
+def test_apply_shared_cache_fills_empty_paths_only(tmp_path, monkeypatch):
+    for name in PROVIDER_CACHE_FILES:
+        monkeypatch.setenv(name, "")
+    monkeypatch.delenv(SHARED_CACHE_ENV, raising=False)
+    settings = AppSettings()
+    assert apply_shared_cache(settings) is settings
+
+    settings.workers.shared_cache_dir = str(tmp_path)
+    settings.llm.cache.disk_path = "custom/llm.db"
+    applied = apply_shared_cache(settings)
+
+    assert applied is not settings and settings.rag.embedding_cache.disk_path is None
+    assert applied.llm.cache.disk_path == "custom/llm.db"
+    assert applied.rag.embedding_cache.disk_path == str(tmp_path / "embedding_cache.db")
+    assert applied.rag.retrieval_cache.generation_path == str(tmp_path / "retrieval_generations.db")
+    # 직접 지정한 provider 캐시 경로는 유지
+    assert os.environ["GOOGLE_SEARCH_CACHE_PATH"] == ""
+
+
+def test_prepare_environment_sets_defaults_and_resets_metrics_dir(tmp_path, monkeypatch):
+    names = (SHARED_CACHE_ENV, "PROMETHEUS_MULTIPROC_DIR", *PROVIDER_CACHE_FILES)
+    monkeypatch.setattr(os, "environ", {k: v for k, v in os.environ.items() if k not in names})
+    metrics_dir = tmp_path / "metrics"
+    metrics_dir.mkdir()
+    (metrics_dir / "counter_123.db").write_bytes(b"stale")
+
+    applied = prepare_environment(str(tmp_path / "shared"), str(metrics_dir))
+
+    assert applied[SHARED_CACHE_ENV] == str(tmp_path / "shared")
+    assert applied["OPENALEX_SEARCH_CACHE_PATH"] == str(tmp_path / "shared" / "openalex_search.db")
+    assert os.environ["PROMETHEUS_MULTIPROC_DIR"] == str(metrics_dir)
+    assert list(metrics_dir.iterdir()) == []
+
+
+_RECORD_STAGE = textwrap.dedent(
+    """
+    import sys
+    from server.metrics import PipelineMetrics
+    metrics = PipelineMetrics(True)
+    metrics.observe_stage("openalex", "search", 0.2)
+    metrics.set_jobs("qa", queued=int(sys.argv[1]), running=1)
+    if sys.argv[2] == "render":
+        print(metrics.render()[0].decode())
+    """
+)
+
+
+def test_metrics_are_aggregated_across_worker_processes(tmp_path):
+    env = {**os.environ, "PROMETHEUS_MULTIPROC_DIR": str(tmp_path)}
+
+    def run(queued: int, mode: str) -> str:
+        result = subprocess.run(
+            [sys.executable, "-c", _RECORD_STAGE, str(queued), mode],
+            cwd=ROOT_DIR, env=env, capture_output=True, text=True, check=True,
+        )
+        return result.stdout
+
+    run(2, "record")
+    text = run(3, "render")
+
+    assert 'livenote_stage_duration_seconds_count{model="",outcome="ok",provider="openalex",stage="search"} 2.0' in text
+    # livesum 게이지: 종료되지 않은(mark_process_dead 미호출) 워커 값 합계
+    assert 'livenote_jobs_queued{kind="qa"} 5.0' in text